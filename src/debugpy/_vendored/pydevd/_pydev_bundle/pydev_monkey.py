@@ -12,6 +12,7 @@ from _pydevd_bundle.pydevd_constants import (
     IS_WINDOWS,
     IS_JYTHON,
     get_current_thread_id,
+    unregister_thread_id,
     sorted_dict_repr,
     set_global_debugger,
     DebugInfoHolder,
@@ -1155,6 +1156,7 @@ class _NewThreadStartupWithTrace:
                     # be tracked).
                     py_db.disable_tracing()
                     py_db.notify_thread_not_alive(thread_id)
+                unregister_thread_id(thread_id)
 
         return ret
 
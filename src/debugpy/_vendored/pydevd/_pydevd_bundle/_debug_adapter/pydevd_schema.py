@@ -14753,28 +14753,37 @@ class PydevdInfo(BaseSchema):
     __props__ = {
         "usingCython": {"type": "boolean", "description": "Specifies whether the cython native module is being used."},
         "usingFrameEval": {"type": "boolean", "description": "Specifies whether the frame eval native module is being used."},
+        "inheritedStateOnFork": {
+            "type": "boolean",
+            "description": "Specifies whether the debugger was forked from a parent process and inherited its configuration (in which case it may be running user code before a client is attached).",
+        },
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, usingCython=None, usingFrameEval=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, usingCython=None, usingFrameEval=None, inheritedStateOnFork=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
         :param boolean usingCython: Specifies whether the cython native module is being used.
         :param boolean usingFrameEval: Specifies whether the frame eval native module is being used.
+        :param boolean inheritedStateOnFork: Specifies whether the debugger was forked from a parent process and inherited its configuration (in which case it may be running user code before a client is attached).
         """
         self.usingCython = usingCython
         self.usingFrameEval = usingFrameEval
+        self.inheritedStateOnFork = inheritedStateOnFork
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
         usingCython = self.usingCython
         usingFrameEval = self.usingFrameEval
+        inheritedStateOnFork = self.inheritedStateOnFork
         dct = {}
         if usingCython is not None:
             dct["usingCython"] = usingCython
         if usingFrameEval is not None:
             dct["usingFrameEval"] = usingFrameEval
+        if inheritedStateOnFork is not None:
+            dct["inheritedStateOnFork"] = inheritedStateOnFork
         dct.update(self.kwargs)
         return dct
 
@@ -14956,1633 +14965,2196 @@ class PydevdAuthorizeResponse(BaseSchema):
         return dct
 
 
+@register_request("pydevdEvaluateMany")
 @register
-class ErrorResponseBody(BaseSchema):
+class PydevdEvaluateManyRequest(BaseSchema):
     """
-    "body" of ErrorResponse
+    Evaluates a list of expressions in the context of the same stack frame (i.e.: to update all the
+    watches of the IDE in a single round trip).
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {"error": {"description": "A structured error message.", "type": "Message"}}
-    __refs__ = set(["error"])
+    __props__ = {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["request"]},
+        "command": {"type": "string", "enum": ["pydevdEvaluateMany"]},
+        "arguments": {"type": "PydevdEvaluateManyArguments"},
+    }
+    __refs__ = set(["arguments"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, error=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param Message error: A structured error message.
+        :param string type:
+        :param string command:
+        :param PydevdEvaluateManyArguments arguments:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
         """
-        if error is None:
-            self.error = Message()
+        self.type = "request"
+        self.command = "pydevdEvaluateMany"
+        if arguments is None:
+            self.arguments = PydevdEvaluateManyArguments()
         else:
-            self.error = Message(update_ids_from_dap=update_ids_from_dap, **error) if error.__class__ != Message else error
+            self.arguments = (
+                PydevdEvaluateManyArguments(update_ids_from_dap=update_ids_from_dap, **arguments)
+                if arguments.__class__ != PydevdEvaluateManyArguments
+                else arguments
+            )
+        self.seq = seq
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        error = self.error
-        dct = {}
-        if error is not None:
-            dct["error"] = error.to_dict(update_ids_to_dap=update_ids_to_dap)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
+        dct = {
+            "type": type,
+            "command": command,
+            "arguments": arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
+        }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class StoppedEventBody(BaseSchema):
+class PydevdEvaluateManyArguments(BaseSchema):
     """
-    "body" of StoppedEvent
+    Arguments for 'pydevdEvaluateMany' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {
-            "type": "string",
-            "description": "The reason for the event.\nFor backward compatibility this string is shown in the UI if the `description` attribute is missing (but it must not be translated).",
-            "_enum": [
-                "step",
-                "breakpoint",
-                "exception",
-                "pause",
-                "entry",
-                "goto",
-                "function breakpoint",
-                "data breakpoint",
-                "instruction breakpoint",
-            ],
-        },
-        "description": {
-            "type": "string",
-            "description": "The full reason for the event, e.g. 'Paused on exception'. This string is shown in the UI as is and can be translated.",
-        },
-        "threadId": {"type": "integer", "description": "The thread which was stopped."},
-        "preserveFocusHint": {
-            "type": "boolean",
-            "description": "A value of True hints to the client that this event should not change the focus.",
-        },
-        "text": {
+        "expressions": {"type": "array", "items": {"type": "string"}, "description": "The expressions to evaluate."},
+        "frameId": {"type": "integer", "description": "Evaluate the expressions in the scope of this stack frame."},
+        "context": {
             "type": "string",
-            "description": "Additional information. E.g. if reason is `exception`, text contains the exception name. This string is shown in the UI.",
-        },
-        "allThreadsStopped": {
-            "type": "boolean",
-            "description": "If `allThreadsStopped` is True, a debug adapter can announce that all threads have stopped.\n- The client should use this information to enable that all threads can be expanded to access their stacktraces.\n- If the attribute is missing or false, only the thread with the given `threadId` can be expanded.",
-        },
-        "hitBreakpointIds": {
-            "type": "array",
-            "items": {"type": "integer"},
-            "description": "Ids of the breakpoints that triggered the event. In most cases there is only a single breakpoint but here are some examples for multiple breakpoints:\n- Different types of breakpoints map to the same location.\n- Multiple source breakpoints get collapsed to the same instruction by the compiler/runtime.\n- Multiple function breakpoints with different function names map to the same location.",
+            "_enum": ["watch", "hover", "clipboard"],
+            "description": "The context in which the evaluate request is used (same as in the 'evaluate' request, but statements are never executed). If not specified 'watch' is used.",
         },
+        "format": {"description": "Specifies details on how to format the results.", "type": "ValueFormat"},
     }
-    __refs__ = set()
+    __refs__ = set(["format"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(
-        self,
-        reason,
-        description=None,
-        threadId=None,
-        preserveFocusHint=None,
-        text=None,
-        allThreadsStopped=None,
-        hitBreakpointIds=None,
-        update_ids_from_dap=False,
-        **kwargs,
-    ):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, expressions, frameId, context=None, format=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        For backward compatibility this string is shown in the UI if the `description` attribute is missing (but it must not be translated).
-        :param string description: The full reason for the event, e.g. 'Paused on exception'. This string is shown in the UI as is and can be translated.
-        :param integer threadId: The thread which was stopped.
-        :param boolean preserveFocusHint: A value of true hints to the client that this event should not change the focus.
-        :param string text: Additional information. E.g. if reason is `exception`, text contains the exception name. This string is shown in the UI.
-        :param boolean allThreadsStopped: If `allThreadsStopped` is true, a debug adapter can announce that all threads have stopped.
-        - The client should use this information to enable that all threads can be expanded to access their stacktraces.
-        - If the attribute is missing or false, only the thread with the given `threadId` can be expanded.
-        :param array hitBreakpointIds: Ids of the breakpoints that triggered the event. In most cases there is only a single breakpoint but here are some examples for multiple breakpoints:
-        - Different types of breakpoints map to the same location.
-        - Multiple source breakpoints get collapsed to the same instruction by the compiler/runtime.
-        - Multiple function breakpoints with different function names map to the same location.
+        :param array expressions: The expressions to evaluate.
+        :param integer frameId: Evaluate the expressions in the scope of this stack frame.
+        :param string context: The context in which the evaluate request is used (same as in the 'evaluate' request, but statements are never executed). If not specified 'watch' is used.
+        :param ValueFormat format: Specifies details on how to format the results.
         """
-        self.reason = reason
-        self.description = description
-        self.threadId = threadId
-        self.preserveFocusHint = preserveFocusHint
-        self.text = text
-        self.allThreadsStopped = allThreadsStopped
-        self.hitBreakpointIds = hitBreakpointIds
+        self.expressions = expressions
+        self.frameId = frameId
+        self.context = context
+        if format is None:
+            self.format = ValueFormat()
+        else:
+            self.format = ValueFormat(update_ids_from_dap=update_ids_from_dap, **format) if format.__class__ != ValueFormat else format
         if update_ids_from_dap:
-            self.threadId = self._translate_id_from_dap(self.threadId)
+            self.frameId = self._translate_id_from_dap(self.frameId)
         self.kwargs = kwargs
 
     @classmethod
     def update_dict_ids_from_dap(cls, dct):
-        if "threadId" in dct:
-            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
+        if "frameId" in dct:
+            dct["frameId"] = cls._translate_id_from_dap(dct["frameId"])
         return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        description = self.description
-        threadId = self.threadId
-        preserveFocusHint = self.preserveFocusHint
-        text = self.text
-        allThreadsStopped = self.allThreadsStopped
-        hitBreakpointIds = self.hitBreakpointIds
-        if hitBreakpointIds and hasattr(hitBreakpointIds[0], "to_dict"):
-            hitBreakpointIds = [x.to_dict() for x in hitBreakpointIds]
+        expressions = self.expressions
+        if expressions and hasattr(expressions[0], "to_dict"):
+            expressions = [x.to_dict() for x in expressions]
+        frameId = self.frameId
+        context = self.context
+        format = self.format  # noqa (assign to builtin)
         if update_ids_to_dap:
-            if threadId is not None:
-                threadId = self._translate_id_to_dap(threadId)
+            if frameId is not None:
+                frameId = self._translate_id_to_dap(frameId)
         dct = {
-            "reason": reason,
+            "expressions": expressions,
+            "frameId": frameId,
         }
-        if description is not None:
-            dct["description"] = description
-        if threadId is not None:
-            dct["threadId"] = threadId
-        if preserveFocusHint is not None:
-            dct["preserveFocusHint"] = preserveFocusHint
-        if text is not None:
-            dct["text"] = text
-        if allThreadsStopped is not None:
-            dct["allThreadsStopped"] = allThreadsStopped
-        if hitBreakpointIds is not None:
-            dct["hitBreakpointIds"] = hitBreakpointIds
+        if context is not None:
+            dct["context"] = context
+        if format is not None:
+            dct["format"] = format.to_dict(update_ids_to_dap=update_ids_to_dap)
         dct.update(self.kwargs)
         return dct
 
     @classmethod
     def update_dict_ids_to_dap(cls, dct):
-        if "threadId" in dct:
-            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
+        if "frameId" in dct:
+            dct["frameId"] = cls._translate_id_to_dap(dct["frameId"])
         return dct
 
 
+@register_response("pydevdEvaluateMany")
 @register
-class ContinuedEventBody(BaseSchema):
+class PydevdEvaluateManyResponse(BaseSchema):
     """
-    "body" of ContinuedEvent
+    Response to 'pydevdEvaluateMany' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "threadId": {"type": "integer", "description": "The thread which was continued."},
-        "allThreadsContinued": {
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["response"]},
+        "request_seq": {"type": "integer", "description": "Sequence number of the corresponding request."},
+        "success": {
             "type": "boolean",
-            "description": "If `allThreadsContinued` is True, a debug adapter can announce that all threads have continued.",
+            "description": "Outcome of the request.\nIf True, the request was successful and the `body` attribute may contain the result of the request.\nIf the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).",
+        },
+        "command": {"type": "string", "description": "The command requested."},
+        "message": {
+            "type": "string",
+            "description": "Contains the raw error in short form if `success` is false.\nThis raw error might be interpreted by the client and is not shown in the UI.\nSome predefined values exist.",
+            "_enum": ["cancelled", "notStopped"],
+            "enumDescriptions": ["the request was cancelled.", "the request may be retried once the adapter is in a 'stopped' state."],
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "results": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/PydevdEvaluateManyResult"},
+                    "description": "The results of the evaluations (in the same order of the requested expressions).",
+                }
+            },
+            "required": ["results"],
         },
     }
-    __refs__ = set()
+    __refs__ = set(["body"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, threadId, allThreadsContinued=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param integer threadId: The thread which was continued.
-        :param boolean allThreadsContinued: If `allThreadsContinued` is true, a debug adapter can announce that all threads have continued.
+        :param string type:
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        If true, the request was successful and the `body` attribute may contain the result of the request.
+        If the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).
+        :param string command: The command requested.
+        :param PydevdEvaluateManyResponseBody body:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
+        :param string message: Contains the raw error in short form if `success` is false.
+        This raw error might be interpreted by the client and is not shown in the UI.
+        Some predefined values exist.
         """
-        self.threadId = threadId
-        self.allThreadsContinued = allThreadsContinued
-        if update_ids_from_dap:
-            self.threadId = self._translate_id_from_dap(self.threadId)
+        self.type = "response"
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdEvaluateManyResponseBody()
+        else:
+            self.body = (
+                PydevdEvaluateManyResponseBody(update_ids_from_dap=update_ids_from_dap, **body)
+                if body.__class__ != PydevdEvaluateManyResponseBody
+                else body
+            )
+        self.seq = seq
+        self.message = message
         self.kwargs = kwargs
 
-    @classmethod
-    def update_dict_ids_from_dap(cls, dct):
-        if "threadId" in dct:
-            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
-        return dct
-
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        threadId = self.threadId
-        allThreadsContinued = self.allThreadsContinued
-        if update_ids_to_dap:
-            if threadId is not None:
-                threadId = self._translate_id_to_dap(threadId)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
         dct = {
-            "threadId": threadId,
+            "type": type,
+            "request_seq": request_seq,
+            "success": success,
+            "command": command,
+            "body": body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
-        if allThreadsContinued is not None:
-            dct["allThreadsContinued"] = allThreadsContinued
+        if message is not None:
+            dct["message"] = message
         dct.update(self.kwargs)
         return dct
 
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if "threadId" in dct:
-            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
-        return dct
-
 
 @register
-class ExitedEventBody(BaseSchema):
+class PydevdEvaluateManyResult(BaseSchema):
     """
-    "body" of ExitedEvent
+    The result of evaluating one of the expressions of a 'pydevdEvaluateMany' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {"exitCode": {"type": "integer", "description": "The exit code returned from the debuggee."}}
-    __refs__ = set()
+    __props__ = {
+        "result": {"type": "string", "description": "The result of the evaluation (or the error message if the evaluation failed)."},
+        "success": {"type": "boolean", "description": "False if the evaluation failed."},
+        "type": {"type": "string", "description": "The type of the evaluate result."},
+        "presentationHint": {
+            "description": "Properties of an evaluate result that can be used to determine how to render the result in the UI.",
+            "type": "VariablePresentationHint",
+        },
+        "variablesReference": {
+            "type": "integer",
+            "description": "If variablesReference is > 0, the evaluate result is structured and its children can be retrieved by passing variablesReference to the VariablesRequest.",
+        },
+        "namedVariables": {"type": "integer", "description": "The number of named child variables."},
+        "indexedVariables": {"type": "integer", "description": "The number of indexed child variables."},
+    }
+    __refs__ = set(["presentationHint"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, exitCode, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(
+        self,
+        result,
+        success,
+        variablesReference,
+        type=None,
+        presentationHint=None,
+        namedVariables=None,
+        indexedVariables=None,
+        update_ids_from_dap=False,
+        **kwargs,
+    ):  # noqa (update_ids_from_dap may be unused)
         """
-        :param integer exitCode: The exit code returned from the debuggee.
+        :param string result: The result of the evaluation (or the error message if the evaluation failed).
+        :param boolean success: False if the evaluation failed.
+        :param integer variablesReference: If variablesReference is > 0, the evaluate result is structured and its children can be retrieved by passing variablesReference to the VariablesRequest.
+        :param string type: The type of the evaluate result.
+        :param VariablePresentationHint presentationHint: Properties of an evaluate result that can be used to determine how to render the result in the UI.
+        :param integer namedVariables: The number of named child variables.
+        :param integer indexedVariables: The number of indexed child variables.
         """
-        self.exitCode = exitCode
+        self.result = result
+        self.success = success
+        self.variablesReference = variablesReference
+        self.type = type
+        if presentationHint is None:
+            self.presentationHint = VariablePresentationHint()
+        else:
+            self.presentationHint = (
+                VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint)
+                if presentationHint.__class__ != VariablePresentationHint
+                else presentationHint
+            )
+        self.namedVariables = namedVariables
+        self.indexedVariables = indexedVariables
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
         self.kwargs = kwargs
 
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "variablesReference" in dct:
+            dct["variablesReference"] = cls._translate_id_from_dap(dct["variablesReference"])
+        return dct
+
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        exitCode = self.exitCode
+        result = self.result
+        success = self.success
+        variablesReference = self.variablesReference
+        type = self.type  # noqa (assign to builtin)
+        presentationHint = self.presentationHint
+        namedVariables = self.namedVariables
+        indexedVariables = self.indexedVariables
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
         dct = {
-            "exitCode": exitCode,
+            "result": result,
+            "success": success,
+            "variablesReference": variablesReference,
         }
+        if type is not None:
+            dct["type"] = type
+        if presentationHint is not None:
+            dct["presentationHint"] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
+        if namedVariables is not None:
+            dct["namedVariables"] = namedVariables
+        if indexedVariables is not None:
+            dct["indexedVariables"] = indexedVariables
         dct.update(self.kwargs)
         return dct
 
-
-@register
-class TerminatedEventBody(BaseSchema):
-    """
-    "body" of TerminatedEvent
-
-    Note: automatically generated code. Do not edit manually.
-    """
-
-    __props__ = {
-        "restart": {
-            "type": ["array", "boolean", "integer", "null", "number", "object", "string"],
-            "description": "A debug adapter may set `restart` to True (or to an arbitrary object) to request that the client restarts the session.\nThe value is not interpreted by the client and passed unmodified as an attribute `__restart` to the `launch` and `attach` requests.",
-        }
-    }
-    __refs__ = set()
-
-    __slots__ = list(__props__.keys()) + ["kwargs"]
-
-    def __init__(self, restart=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """
-        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] restart: A debug adapter may set `restart` to true (or to an arbitrary object) to request that the client restarts the session.
-        The value is not interpreted by the client and passed unmodified as an attribute `__restart` to the `launch` and `attach` requests.
-        """
-        self.restart = restart
-        self.kwargs = kwargs
-
-    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        restart = self.restart
-        dct = {}
-        if restart is not None:
-            dct["restart"] = restart
-        dct.update(self.kwargs)
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "variablesReference" in dct:
+            dct["variablesReference"] = cls._translate_id_to_dap(dct["variablesReference"])
         return dct
 
 
+@register_request("pydevdHeapSnapshot")
 @register
-class ThreadEventBody(BaseSchema):
+class PydevdHeapSnapshotRequest(BaseSchema):
     """
-    "body" of ThreadEvent
+    Queries the object graph of the suspended program.
+
+    The first query done while a thread is suspended takes a snapshot of all the objects tracked by the
+    garbage collector (with an index of their referrers), which is used to answer all the queries until
+    the thread is resumed (or until the snapshot is released).
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {"type": "string", "description": "The reason for the event.", "_enum": ["started", "exited"]},
-        "threadId": {"type": "integer", "description": "The identifier of the thread."},
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["request"]},
+        "command": {"type": "string", "enum": ["pydevdHeapSnapshot"]},
+        "arguments": {"type": "PydevdHeapSnapshotArguments"},
     }
-    __refs__ = set()
+    __refs__ = set(["arguments"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, reason, threadId, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        :param integer threadId: The identifier of the thread.
+        :param string type:
+        :param string command:
+        :param PydevdHeapSnapshotArguments arguments:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
         """
-        self.reason = reason
-        self.threadId = threadId
-        if update_ids_from_dap:
-            self.threadId = self._translate_id_from_dap(self.threadId)
+        self.type = "request"
+        self.command = "pydevdHeapSnapshot"
+        if arguments is None:
+            self.arguments = PydevdHeapSnapshotArguments()
+        else:
+            self.arguments = (
+                PydevdHeapSnapshotArguments(update_ids_from_dap=update_ids_from_dap, **arguments)
+                if arguments.__class__ != PydevdHeapSnapshotArguments
+                else arguments
+            )
+        self.seq = seq
         self.kwargs = kwargs
 
-    @classmethod
-    def update_dict_ids_from_dap(cls, dct):
-        if "threadId" in dct:
-            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
-        return dct
-
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        threadId = self.threadId
-        if update_ids_to_dap:
-            if threadId is not None:
-                threadId = self._translate_id_to_dap(threadId)
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
         dct = {
-            "reason": reason,
-            "threadId": threadId,
+            "type": type,
+            "command": command,
+            "arguments": arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
         dct.update(self.kwargs)
         return dct
 
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if "threadId" in dct:
-            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
-        return dct
-
 
 @register
-class OutputEventBody(BaseSchema):
+class PydevdHeapSnapshotArguments(BaseSchema):
     """
-    "body" of OutputEvent
+    Arguments for 'pydevdHeapSnapshot' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "category": {
+        "query": {
             "type": "string",
-            "description": "The output category. If not specified or if the category is not understood by the client, `console` is assumed.",
-            "_enum": ["console", "important", "stdout", "stderr", "telemetry"],
-            "enumDescriptions": [
-                "Show the output in the client's default message UI, e.g. a 'debug console'. This category should only be used for informational output from the debugger (as opposed to the debuggee).",
-                "A hint for the client to show the output in the client's UI for important and highly visible information, e.g. as a popup notification. This category should only be used for important messages from the debugger (as opposed to the debuggee). Since this category value is a hint, clients might ignore the hint and assume the `console` category.",
-                "Show the output as normal program output from the debuggee.",
-                "Show the output as error program output from the debuggee.",
-                "Send the output to telemetry instead of showing it to the user.",
-            ],
+            "enum": ["referrers", "referents", "pathToRoot", "typeStats", "recordTypeStats", "diffTypeStats", "release"],
+            "description": "The query to be done: the referrers or referents of an object, the shortest path from a root (a module or a frame) to an object, the number of instances and memory used per type, the recording of the number of instances and memory used per type (kept across suspensions), the types which grew the most since it was recorded, or the release of the current snapshot.",
         },
-        "output": {"type": "string", "description": "The output to report."},
-        "group": {
+        "frameId": {
+            "type": "integer",
+            "description": "The frame of the suspended thread (the expression is evaluated in the scope of this stack frame).",
+        },
+        "expression": {
             "type": "string",
-            "description": "Support for keeping an output log organized by grouping related messages.",
-            "enum": ["start", "startCollapsed", "end"],
-            "enumDescriptions": [
-                "Start a new group in expanded mode. Subsequent output events are members of the group and should be shown indented.\nThe `output` attribute becomes the name of the group and is not indented.",
-                "Start a new group in collapsed mode. Subsequent output events are members of the group and should be shown indented (as soon as the group is expanded).\nThe `output` attribute becomes the name of the group and is not indented.",
-                "End the current group and decrease the indentation of subsequent output events.\nA non-empty `output` attribute is shown as the unindented end of the group.",
-            ],
+            "description": "An expression which evaluates to the object to be queried (not used if 'variablesReference' is given).",
         },
         "variablesReference": {
             "type": "integer",
-            "description": "If an attribute `variablesReference` exists and its value is > 0, the output contains objects which can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.",
+            "description": "The reference of a variable (i.e.: one of the results of a previous query) with the object to be queried.",
         },
-        "source": {"description": "The source location where the output was produced.", "type": "Source"},
-        "line": {"type": "integer", "description": "The source location's line where the output was produced."},
-        "column": {
+        "maxResults": {
             "type": "integer",
-            "description": "The position in `line` where the output was produced. It is measured in UTF-16 code units and the client capability `columnsStartAt1` determines whether it is 0- or 1-based.",
+            "description": "The maximum number of results (or types for 'typeStats') to be returned. Defaults to 100.",
         },
-        "data": {
-            "type": ["array", "boolean", "integer", "null", "number", "object", "string"],
-            "description": "Additional data to report. For the `telemetry` category the data is sent to telemetry, for the other categories the data is shown in JSON format.",
+        "maxSamples": {
+            "type": "integer",
+            "description": "The maximum number of sample instances of each type to be returned (for 'diffTypeStats'). Defaults to 3.",
         },
+        "format": {"description": "Specifies details on how to format the results.", "type": "ValueFormat"},
     }
-    __refs__ = set(["source"])
+    __refs__ = set(["format"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
     def __init__(
         self,
-        output,
-        category=None,
-        group=None,
+        query,
+        frameId,
+        expression=None,
         variablesReference=None,
-        source=None,
-        line=None,
-        column=None,
-        data=None,
+        maxResults=None,
+        maxSamples=None,
+        format=None,
         update_ids_from_dap=False,
         **kwargs,
     ):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string output: The output to report.
-        :param string category: The output category. If not specified or if the category is not understood by the client, `console` is assumed.
-        :param string group: Support for keeping an output log organized by grouping related messages.
-        :param integer variablesReference: If an attribute `variablesReference` exists and its value is > 0, the output contains objects which can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.
-        :param Source source: The source location where the output was produced.
-        :param integer line: The source location's line where the output was produced.
-        :param integer column: The position in `line` where the output was produced. It is measured in UTF-16 code units and the client capability `columnsStartAt1` determines whether it is 0- or 1-based.
-        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] data: Additional data to report. For the `telemetry` category the data is sent to telemetry, for the other categories the data is shown in JSON format.
+        :param string query: The query to be done: the referrers or referents of an object, the shortest path from a root (a module or a frame) to an object, the number of instances and memory used per type, the recording of the number of instances and memory used per type (kept across suspensions), the types which grew the most since it was recorded, or the release of the current snapshot.
+        :param integer frameId: The frame of the suspended thread (the expression is evaluated in the scope of this stack frame).
+        :param string expression: An expression which evaluates to the object to be queried (not used if 'variablesReference' is given).
+        :param integer variablesReference: The reference of a variable (i.e.: one of the results of a previous query) with the object to be queried.
+        :param integer maxResults: The maximum number of results (or types for 'typeStats') to be returned. Defaults to 100.
+        :param integer maxSamples: The maximum number of sample instances of each type to be returned (for 'diffTypeStats'). Defaults to 3.
+        :param ValueFormat format: Specifies details on how to format the results.
         """
-        self.output = output
-        self.category = category
-        self.group = group
+        self.query = query
+        self.frameId = frameId
+        self.expression = expression
         self.variablesReference = variablesReference
-        if source is None:
-            self.source = Source()
+        self.maxResults = maxResults
+        self.maxSamples = maxSamples
+        if format is None:
+            self.format = ValueFormat()
         else:
-            self.source = Source(update_ids_from_dap=update_ids_from_dap, **source) if source.__class__ != Source else source
-        self.line = line
-        self.column = column
-        self.data = data
+            self.format = ValueFormat(update_ids_from_dap=update_ids_from_dap, **format) if format.__class__ != ValueFormat else format
         if update_ids_from_dap:
+            self.frameId = self._translate_id_from_dap(self.frameId)
             self.variablesReference = self._translate_id_from_dap(self.variablesReference)
         self.kwargs = kwargs
 
     @classmethod
     def update_dict_ids_from_dap(cls, dct):
+        if "frameId" in dct:
+            dct["frameId"] = cls._translate_id_from_dap(dct["frameId"])
         if "variablesReference" in dct:
             dct["variablesReference"] = cls._translate_id_from_dap(dct["variablesReference"])
         return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        output = self.output
-        category = self.category
-        group = self.group
+        query = self.query
+        frameId = self.frameId
+        expression = self.expression
         variablesReference = self.variablesReference
-        source = self.source
-        line = self.line
-        column = self.column
-        data = self.data
+        maxResults = self.maxResults
+        maxSamples = self.maxSamples
+        format = self.format  # noqa (assign to builtin)
         if update_ids_to_dap:
+            if frameId is not None:
+                frameId = self._translate_id_to_dap(frameId)
             if variablesReference is not None:
                 variablesReference = self._translate_id_to_dap(variablesReference)
         dct = {
-            "output": output,
+            "query": query,
+            "frameId": frameId,
         }
-        if category is not None:
-            dct["category"] = category
-        if group is not None:
-            dct["group"] = group
+        if expression is not None:
+            dct["expression"] = expression
         if variablesReference is not None:
             dct["variablesReference"] = variablesReference
-        if source is not None:
-            dct["source"] = source.to_dict(update_ids_to_dap=update_ids_to_dap)
-        if line is not None:
-            dct["line"] = line
-        if column is not None:
-            dct["column"] = column
-        if data is not None:
-            dct["data"] = data
+        if maxResults is not None:
+            dct["maxResults"] = maxResults
+        if maxSamples is not None:
+            dct["maxSamples"] = maxSamples
+        if format is not None:
+            dct["format"] = format.to_dict(update_ids_to_dap=update_ids_to_dap)
         dct.update(self.kwargs)
         return dct
 
     @classmethod
     def update_dict_ids_to_dap(cls, dct):
+        if "frameId" in dct:
+            dct["frameId"] = cls._translate_id_to_dap(dct["frameId"])
         if "variablesReference" in dct:
             dct["variablesReference"] = cls._translate_id_to_dap(dct["variablesReference"])
         return dct
 
 
+@register_response("pydevdHeapSnapshot")
 @register
-class BreakpointEventBody(BaseSchema):
+class PydevdHeapSnapshotResponse(BaseSchema):
     """
-    "body" of BreakpointEvent
+    Response to 'pydevdHeapSnapshot' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {"type": "string", "description": "The reason for the event.", "_enum": ["changed", "new", "removed"]},
-        "breakpoint": {
-            "description": "The `id` attribute is used to find the target breakpoint, the other attributes are used as the new values.",
-            "type": "Breakpoint",
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["response"]},
+        "request_seq": {"type": "integer", "description": "Sequence number of the corresponding request."},
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request.\nIf True, the request was successful and the `body` attribute may contain the result of the request.\nIf the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).",
+        },
+        "command": {"type": "string", "description": "The command requested."},
+        "message": {
+            "type": "string",
+            "description": "Contains the raw error in short form if `success` is false.\nThis raw error might be interpreted by the client and is not shown in the UI.\nSome predefined values exist.",
+            "_enum": ["cancelled", "notStopped"],
+            "enumDescriptions": ["the request was cancelled.", "the request may be retried once the adapter is in a 'stopped' state."],
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "variables": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/Variable"},
+                    "description": "The objects found (they may be expanded with the 'variables' request while the thread is suspended). For 'pathToRoot' they're in order from the root to the queried object.",
+                },
+                "typeStats": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/PydevdHeapTypeStats"},
+                    "description": "The types with the most memory used by their instances (for 'typeStats') or the types which grew the most (for 'diffTypeStats').",
+                },
+                "totalObjects": {"type": "integer", "description": "The number of objects in the snapshot."},
+            },
         },
     }
-    __refs__ = set(["breakpoint"])
+    __refs__ = set(["body"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, reason, breakpoint, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        :param Breakpoint breakpoint: The `id` attribute is used to find the target breakpoint, the other attributes are used as the new values.
+        :param string type:
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        If true, the request was successful and the `body` attribute may contain the result of the request.
+        If the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).
+        :param string command: The command requested.
+        :param PydevdHeapSnapshotResponseBody body:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
+        :param string message: Contains the raw error in short form if `success` is false.
+        This raw error might be interpreted by the client and is not shown in the UI.
+        Some predefined values exist.
         """
-        self.reason = reason
-        if breakpoint is None:
-            self.breakpoint = Breakpoint()
+        self.type = "response"
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdHeapSnapshotResponseBody()
         else:
-            self.breakpoint = (
-                Breakpoint(update_ids_from_dap=update_ids_from_dap, **breakpoint) if breakpoint.__class__ != Breakpoint else breakpoint
+            self.body = (
+                PydevdHeapSnapshotResponseBody(update_ids_from_dap=update_ids_from_dap, **body)
+                if body.__class__ != PydevdHeapSnapshotResponseBody
+                else body
             )
+        self.seq = seq
+        self.message = message
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        breakpoint = self.breakpoint  # noqa (assign to builtin)
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
         dct = {
-            "reason": reason,
-            "breakpoint": breakpoint.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "type": type,
+            "request_seq": request_seq,
+            "success": success,
+            "command": command,
+            "body": body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
+        if message is not None:
+            dct["message"] = message
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ModuleEventBody(BaseSchema):
+class PydevdHeapTypeStats(BaseSchema):
     """
-    "body" of ModuleEvent
+    The number of instances and the (shallow) memory used by the instances of a type in a heap snapshot
+    (and, for 'diffTypeStats', how much it grew).
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {"type": "string", "description": "The reason for the event.", "enum": ["new", "changed", "removed"]},
-        "module": {
-            "description": "The new, changed, or removed module. In case of `removed` only the module id is used.",
-            "type": "Module",
+        "type": {"type": "string", "description": "The qualified name of the type."},
+        "count": {"type": "integer", "description": "The number of instances."},
+        "size": {"type": "integer", "description": "The sum of the sizes (in bytes) of the instances."},
+        "countDelta": {
+            "type": "integer",
+            "description": "How many instances were added since the type stats were recorded (for 'diffTypeStats').",
+        },
+        "sizeDelta": {
+            "type": "integer",
+            "description": "How many bytes were added since the type stats were recorded (for 'diffTypeStats').",
+        },
+        "samples": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Variable"},
+            "description": "Some instances of the type (usually the most recently created ones) to be inspected (for 'diffTypeStats').",
         },
     }
-    __refs__ = set(["module"])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, reason, module, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, type, count, size, countDelta=None, sizeDelta=None, samples=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        :param Module module: The new, changed, or removed module. In case of `removed` only the module id is used.
+        :param string type: The qualified name of the type.
+        :param integer count: The number of instances.
+        :param integer size: The sum of the sizes (in bytes) of the instances.
+        :param integer countDelta: How many instances were added since the type stats were recorded (for 'diffTypeStats').
+        :param integer sizeDelta: How many bytes were added since the type stats were recorded (for 'diffTypeStats').
+        :param array samples: Some instances of the type (usually the most recently created ones) to be inspected (for 'diffTypeStats').
         """
-        self.reason = reason
-        if module is None:
-            self.module = Module()
-        else:
-            self.module = Module(update_ids_from_dap=update_ids_from_dap, **module) if module.__class__ != Module else module
+        self.type = type
+        self.count = count
+        self.size = size
+        self.countDelta = countDelta
+        self.sizeDelta = sizeDelta
+        self.samples = samples
+        if update_ids_from_dap and self.samples:
+            for o in self.samples:
+                Variable.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        module = self.module
+        type = self.type  # noqa (assign to builtin)
+        count = self.count
+        size = self.size
+        countDelta = self.countDelta
+        sizeDelta = self.sizeDelta
+        samples = self.samples
+        if samples and hasattr(samples[0], "to_dict"):
+            samples = [x.to_dict() for x in samples]
         dct = {
-            "reason": reason,
-            "module": module.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "type": type,
+            "count": count,
+            "size": size,
         }
+        if countDelta is not None:
+            dct["countDelta"] = countDelta
+        if sizeDelta is not None:
+            dct["sizeDelta"] = sizeDelta
+        if samples is not None:
+            dct["samples"] = [Variable.update_dict_ids_to_dap(o) for o in samples] if (update_ids_to_dap and samples) else samples
         dct.update(self.kwargs)
         return dct
 
 
+@register_event("pydevdPrefetch")
 @register
-class LoadedSourceEventBody(BaseSchema):
+class PydevdPrefetchEvent(BaseSchema):
     """
-    "body" of LoadedSourceEvent
+    The event is sent (if 'prefetchOnStop' is set in the launch/attach arguments) right before the
+    'stopped' event of a thread.
+
+    It has the data that clients usually request right after a thread is stopped (its first frames, the
+    scopes of the top frame and the variables in the 'Locals' scope), so that the debug adapter can
+    answer those requests without a round trip to the debugger.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "reason": {"type": "string", "description": "The reason for the event.", "enum": ["new", "changed", "removed"]},
-        "source": {"description": "The new, changed, or removed source.", "type": "Source"},
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["event"]},
+        "event": {"type": "string", "enum": ["pydevdPrefetch"]},
+        "body": {
+            "type": "object",
+            "properties": {
+                "threadId": {"type": "integer", "description": "The thread which was stopped."},
+                "stackFrames": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/StackFrame"},
+                    "description": "The first frames of the stack (as in a 'stackTrace' request with 'startFrame' == 0).",
+                },
+                "totalFrames": {
+                    "type": "integer",
+                    "description": "The total number of frames available in the stack (as in the 'stackTrace' response).",
+                },
+                "scopes": {"type": "array", "items": {"$ref": "#/definitions/Scope"}, "description": "The scopes of the top frame."},
+                "variables": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/Variable"},
+                    "description": "The variables of the 'Locals' scope of the top frame (not available if there were too many variables or if it took too long to compute them).",
+                },
+            },
+            "required": ["threadId", "stackFrames"],
+        },
     }
-    __refs__ = set(["source"])
+    __refs__ = set(["body"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, reason, source, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string reason: The reason for the event.
-        :param Source source: The new, changed, or removed source.
+        :param string type:
+        :param string event:
+        :param PydevdPrefetchEventBody body:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
         """
-        self.reason = reason
-        if source is None:
-            self.source = Source()
+        self.type = "event"
+        self.event = "pydevdPrefetch"
+        if body is None:
+            self.body = PydevdPrefetchEventBody()
         else:
-            self.source = Source(update_ids_from_dap=update_ids_from_dap, **source) if source.__class__ != Source else source
+            self.body = (
+                PydevdPrefetchEventBody(update_ids_from_dap=update_ids_from_dap, **body)
+                if body.__class__ != PydevdPrefetchEventBody
+                else body
+            )
+        self.seq = seq
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        reason = self.reason
-        source = self.source
+        type = self.type  # noqa (assign to builtin)
+        event = self.event
+        body = self.body
+        seq = self.seq
         dct = {
-            "reason": reason,
-            "source": source.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "type": type,
+            "event": event,
+            "body": body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
         dct.update(self.kwargs)
         return dct
 
 
+@register_request("pydevdStackTraces")
 @register
-class ProcessEventBody(BaseSchema):
+class PydevdStackTracesRequest(BaseSchema):
     """
-    "body" of ProcessEvent
+    Provides the stacks of many suspended threads at once (i.e.: to populate the call stack of all the
+    threads after a pause in a single round trip instead of one 'stackTrace' request per thread).
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "name": {
-            "type": "string",
-            "description": "The logical name of the process. This is usually the full path to process's executable file. Example: /home/example/myproj/program.js.",
-        },
-        "systemProcessId": {
-            "type": "integer",
-            "description": "The system process id of the debugged process. This property is missing for non-system processes.",
-        },
-        "isLocalProcess": {"type": "boolean", "description": "If True, the process is running on the same computer as the debug adapter."},
-        "startMethod": {
-            "type": "string",
-            "enum": ["launch", "attach", "attachForSuspendedLaunch"],
-            "description": "Describes how the debug engine started debugging this process.",
-            "enumDescriptions": [
-                "Process was launched under the debugger.",
-                "Debugger attached to an existing process.",
-                "A project launcher component has launched a new process in a suspended state and then asked the debugger to attach.",
-            ],
-        },
-        "pointerSize": {
+        "seq": {
             "type": "integer",
-            "description": "The size of a pointer or address for this process, in bits. This value may be used by clients when formatting addresses for display.",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
         },
+        "type": {"type": "string", "enum": ["request"]},
+        "command": {"type": "string", "enum": ["pydevdStackTraces"]},
+        "arguments": {"type": "PydevdStackTracesArguments"},
     }
-    __refs__ = set()
+    __refs__ = set(["arguments"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(
-        self, name, systemProcessId=None, isLocalProcess=None, startMethod=None, pointerSize=None, update_ids_from_dap=False, **kwargs
-    ):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string name: The logical name of the process. This is usually the full path to process's executable file. Example: /home/example/myproj/program.js.
-        :param integer systemProcessId: The system process id of the debugged process. This property is missing for non-system processes.
-        :param boolean isLocalProcess: If true, the process is running on the same computer as the debug adapter.
-        :param string startMethod: Describes how the debug engine started debugging this process.
-        :param integer pointerSize: The size of a pointer or address for this process, in bits. This value may be used by clients when formatting addresses for display.
+        :param string type:
+        :param string command:
+        :param PydevdStackTracesArguments arguments:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
         """
-        self.name = name
-        self.systemProcessId = systemProcessId
-        self.isLocalProcess = isLocalProcess
-        self.startMethod = startMethod
-        self.pointerSize = pointerSize
+        self.type = "request"
+        self.command = "pydevdStackTraces"
+        if arguments is None:
+            self.arguments = PydevdStackTracesArguments()
+        else:
+            self.arguments = (
+                PydevdStackTracesArguments(update_ids_from_dap=update_ids_from_dap, **arguments)
+                if arguments.__class__ != PydevdStackTracesArguments
+                else arguments
+            )
+        self.seq = seq
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        name = self.name
-        systemProcessId = self.systemProcessId
-        isLocalProcess = self.isLocalProcess
-        startMethod = self.startMethod
-        pointerSize = self.pointerSize
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
         dct = {
-            "name": name,
+            "type": type,
+            "command": command,
+            "arguments": arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
-        if systemProcessId is not None:
-            dct["systemProcessId"] = systemProcessId
-        if isLocalProcess is not None:
-            dct["isLocalProcess"] = isLocalProcess
-        if startMethod is not None:
-            dct["startMethod"] = startMethod
-        if pointerSize is not None:
-            dct["pointerSize"] = pointerSize
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class CapabilitiesEventBody(BaseSchema):
+class PydevdStackTracesArguments(BaseSchema):
     """
-    "body" of CapabilitiesEvent
+    Arguments for 'pydevdStackTraces' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {"capabilities": {"description": "The set of updated capabilities.", "type": "Capabilities"}}
-    __refs__ = set(["capabilities"])
+    __props__ = {
+        "threadIds": {
+            "type": "array",
+            "items": {"type": "integer"},
+            "description": "The threads whose stacks should be provided. If not specified, the stacks of all the suspended threads are provided.",
+        },
+        "startFrame": {
+            "type": "integer",
+            "description": "The index of the first frame to return (as in the 'stackTrace' request); if omitted frames start at 0.",
+        },
+        "levels": {
+            "type": "integer",
+            "description": "The maximum number of frames to return for each thread (as in the 'stackTrace' request). If levels is not specified or 0, all frames are returned.",
+        },
+        "format": {"description": "Specifies details on how to format the stack frames.", "type": "StackFrameFormat"},
+    }
+    __refs__ = set(["format"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, capabilities, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, threadIds=None, startFrame=None, levels=None, format=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param Capabilities capabilities: The set of updated capabilities.
+        :param array threadIds: The threads whose stacks should be provided. If not specified, the stacks of all the suspended threads are provided.
+        :param integer startFrame: The index of the first frame to return (as in the 'stackTrace' request); if omitted frames start at 0.
+        :param integer levels: The maximum number of frames to return for each thread (as in the 'stackTrace' request). If levels is not specified or 0, all frames are returned.
+        :param StackFrameFormat format: Specifies details on how to format the stack frames.
         """
-        if capabilities is None:
-            self.capabilities = Capabilities()
+        self.threadIds = threadIds
+        self.startFrame = startFrame
+        self.levels = levels
+        if format is None:
+            self.format = StackFrameFormat()
         else:
-            self.capabilities = (
-                Capabilities(update_ids_from_dap=update_ids_from_dap, **capabilities)
-                if capabilities.__class__ != Capabilities
-                else capabilities
+            self.format = (
+                StackFrameFormat(update_ids_from_dap=update_ids_from_dap, **format) if format.__class__ != StackFrameFormat else format
             )
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        capabilities = self.capabilities
-        dct = {
-            "capabilities": capabilities.to_dict(update_ids_to_dap=update_ids_to_dap),
-        }
+        threadIds = self.threadIds
+        if threadIds and hasattr(threadIds[0], "to_dict"):
+            threadIds = [x.to_dict() for x in threadIds]
+        startFrame = self.startFrame
+        levels = self.levels
+        format = self.format  # noqa (assign to builtin)
+        dct = {}
+        if threadIds is not None:
+            dct["threadIds"] = threadIds
+        if startFrame is not None:
+            dct["startFrame"] = startFrame
+        if levels is not None:
+            dct["levels"] = levels
+        if format is not None:
+            dct["format"] = format.to_dict(update_ids_to_dap=update_ids_to_dap)
         dct.update(self.kwargs)
         return dct
 
 
+@register_response("pydevdStackTraces")
 @register
-class ProgressStartEventBody(BaseSchema):
+class PydevdStackTracesResponse(BaseSchema):
     """
-    "body" of ProgressStartEvent
+    Response to 'pydevdStackTraces' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "progressId": {
-            "type": "string",
-            "description": "An ID that can be used in subsequent `progressUpdate` and `progressEnd` events to make them refer to the same progress reporting.\nIDs must be unique within a debug session.",
-        },
-        "title": {
-            "type": "string",
-            "description": "Short title of the progress reporting. Shown in the UI to describe the long running operation.",
-        },
-        "requestId": {
+        "seq": {
             "type": "integer",
-            "description": "The request ID that this progress report is related to. If specified a debug adapter is expected to emit progress events for the long running request until the request has been either completed or cancelled.\nIf the request ID is omitted, the progress report is assumed to be related to some general activity of the debug adapter.",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
         },
-        "cancellable": {
+        "type": {"type": "string", "enum": ["response"]},
+        "request_seq": {"type": "integer", "description": "Sequence number of the corresponding request."},
+        "success": {
             "type": "boolean",
-            "description": "If True, the request that reports progress may be cancelled with a `cancel` request.\nSo this property basically controls whether the client should use UX that supports cancellation.\nClients that don't support cancellation are allowed to ignore the setting.",
+            "description": "Outcome of the request.\nIf True, the request was successful and the `body` attribute may contain the result of the request.\nIf the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).",
         },
-        "message": {"type": "string", "description": "More detailed progress message."},
-        "percentage": {
-            "type": "number",
-            "description": "Progress percentage to display (value range: 0 to 100). If omitted no percentage is shown.",
+        "command": {"type": "string", "description": "The command requested."},
+        "message": {
+            "type": "string",
+            "description": "Contains the raw error in short form if `success` is false.\nThis raw error might be interpreted by the client and is not shown in the UI.\nSome predefined values exist.",
+            "_enum": ["cancelled", "notStopped"],
+            "enumDescriptions": ["the request was cancelled.", "the request may be retried once the adapter is in a 'stopped' state."],
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "stackTraces": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/PydevdStackTrace"},
+                    "description": "The stacks of the requested threads (threads which aren't suspended are not included).",
+                }
+            },
+            "required": ["stackTraces"],
         },
     }
-    __refs__ = set()
+    __refs__ = set(["body"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(
-        self, progressId, title, requestId=None, cancellable=None, message=None, percentage=None, update_ids_from_dap=False, **kwargs
-    ):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string progressId: An ID that can be used in subsequent `progressUpdate` and `progressEnd` events to make them refer to the same progress reporting.
-        IDs must be unique within a debug session.
-        :param string title: Short title of the progress reporting. Shown in the UI to describe the long running operation.
-        :param integer requestId: The request ID that this progress report is related to. If specified a debug adapter is expected to emit progress events for the long running request until the request has been either completed or cancelled.
-        If the request ID is omitted, the progress report is assumed to be related to some general activity of the debug adapter.
-        :param boolean cancellable: If true, the request that reports progress may be cancelled with a `cancel` request.
-        So this property basically controls whether the client should use UX that supports cancellation.
-        Clients that don't support cancellation are allowed to ignore the setting.
-        :param string message: More detailed progress message.
-        :param number percentage: Progress percentage to display (value range: 0 to 100). If omitted no percentage is shown.
+        :param string type:
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        If true, the request was successful and the `body` attribute may contain the result of the request.
+        If the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).
+        :param string command: The command requested.
+        :param PydevdStackTracesResponseBody body:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
+        :param string message: Contains the raw error in short form if `success` is false.
+        This raw error might be interpreted by the client and is not shown in the UI.
+        Some predefined values exist.
         """
-        self.progressId = progressId
-        self.title = title
-        self.requestId = requestId
-        self.cancellable = cancellable
+        self.type = "response"
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdStackTracesResponseBody()
+        else:
+            self.body = (
+                PydevdStackTracesResponseBody(update_ids_from_dap=update_ids_from_dap, **body)
+                if body.__class__ != PydevdStackTracesResponseBody
+                else body
+            )
+        self.seq = seq
         self.message = message
-        self.percentage = percentage
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        progressId = self.progressId
-        title = self.title
-        requestId = self.requestId
-        cancellable = self.cancellable
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
         message = self.message
-        percentage = self.percentage
         dct = {
-            "progressId": progressId,
-            "title": title,
+            "type": type,
+            "request_seq": request_seq,
+            "success": success,
+            "command": command,
+            "body": body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
-        if requestId is not None:
-            dct["requestId"] = requestId
-        if cancellable is not None:
-            dct["cancellable"] = cancellable
         if message is not None:
             dct["message"] = message
-        if percentage is not None:
-            dct["percentage"] = percentage
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ProgressUpdateEventBody(BaseSchema):
+class PydevdStackTrace(BaseSchema):
     """
-    "body" of ProgressUpdateEvent
+    The stack of one of the threads in a 'pydevdStackTraces' response.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "progressId": {"type": "string", "description": "The ID that was introduced in the initial `progressStart` event."},
-        "message": {"type": "string", "description": "More detailed progress message. If omitted, the previous message (if any) is used."},
-        "percentage": {
-            "type": "number",
-            "description": "Progress percentage to display (value range: 0 to 100). If omitted no percentage is shown.",
+        "threadId": {"type": "integer", "description": "The thread of the stack."},
+        "stackFrames": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/StackFrame"},
+            "description": "The frames of the stack (as in the 'stackTrace' response).",
+        },
+        "totalFrames": {
+            "type": "integer",
+            "description": "The total number of frames available in the stack (as in the 'stackTrace' response).",
         },
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, progressId, message=None, percentage=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, threadId, stackFrames, totalFrames=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string progressId: The ID that was introduced in the initial `progressStart` event.
-        :param string message: More detailed progress message. If omitted, the previous message (if any) is used.
-        :param number percentage: Progress percentage to display (value range: 0 to 100). If omitted no percentage is shown.
+        :param integer threadId: The thread of the stack.
+        :param array stackFrames: The frames of the stack (as in the 'stackTrace' response).
+        :param integer totalFrames: The total number of frames available in the stack (as in the 'stackTrace' response).
         """
-        self.progressId = progressId
-        self.message = message
-        self.percentage = percentage
+        self.threadId = threadId
+        self.stackFrames = stackFrames
+        if update_ids_from_dap and self.stackFrames:
+            for o in self.stackFrames:
+                StackFrame.update_dict_ids_from_dap(o)
+        self.totalFrames = totalFrames
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
         self.kwargs = kwargs
 
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
+        return dct
+
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        progressId = self.progressId
-        message = self.message
-        percentage = self.percentage
+        threadId = self.threadId
+        stackFrames = self.stackFrames
+        if stackFrames and hasattr(stackFrames[0], "to_dict"):
+            stackFrames = [x.to_dict() for x in stackFrames]
+        totalFrames = self.totalFrames
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
         dct = {
-            "progressId": progressId,
+            "threadId": threadId,
+            "stackFrames": [StackFrame.update_dict_ids_to_dap(o) for o in stackFrames]
+            if (update_ids_to_dap and stackFrames)
+            else stackFrames,
         }
-        if message is not None:
-            dct["message"] = message
-        if percentage is not None:
-            dct["percentage"] = percentage
+        if totalFrames is not None:
+            dct["totalFrames"] = totalFrames
         dct.update(self.kwargs)
         return dct
 
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
+        return dct
+
 
+@register_request("pydevdProfile")
 @register
-class ProgressEndEventBody(BaseSchema):
+class PydevdProfileRequest(BaseSchema):
     """
-    "body" of ProgressEndEvent
+    Starts or stops the sampling profiler.
+
+    While it's running the stacks of all the threads are sampled at the given rate and the aggregated
+    samples are sent in 'pydevdProfile' events (as flame graph data).
+
+    Note: when the debugger is using sys.monitoring (Python 3.12 onwards), tracing is turned off while
+    profiling (so, breakpoints are not hit and stepping is not available until the profiler is stopped).
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "progressId": {"type": "string", "description": "The ID that was introduced in the initial `ProgressStartEvent`."},
-        "message": {"type": "string", "description": "More detailed progress message. If omitted, the previous message (if any) is used."},
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["request"]},
+        "command": {"type": "string", "enum": ["pydevdProfile"]},
+        "arguments": {"type": "PydevdProfileArguments"},
     }
-    __refs__ = set()
+    __refs__ = set(["arguments"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, progressId, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, arguments, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string progressId: The ID that was introduced in the initial `ProgressStartEvent`.
-        :param string message: More detailed progress message. If omitted, the previous message (if any) is used.
+        :param string type:
+        :param string command:
+        :param PydevdProfileArguments arguments:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
         """
-        self.progressId = progressId
-        self.message = message
+        self.type = "request"
+        self.command = "pydevdProfile"
+        if arguments is None:
+            self.arguments = PydevdProfileArguments()
+        else:
+            self.arguments = (
+                PydevdProfileArguments(update_ids_from_dap=update_ids_from_dap, **arguments)
+                if arguments.__class__ != PydevdProfileArguments
+                else arguments
+            )
+        self.seq = seq
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        progressId = self.progressId
-        message = self.message
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        arguments = self.arguments
+        seq = self.seq
         dct = {
-            "progressId": progressId,
+            "type": type,
+            "command": command,
+            "arguments": arguments.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
-        if message is not None:
-            dct["message"] = message
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class InvalidatedEventBody(BaseSchema):
+class PydevdProfileArguments(BaseSchema):
     """
-    "body" of InvalidatedEvent
+    Arguments for 'pydevdProfile' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "areas": {
-            "type": "array",
-            "description": "Set of logical areas that got invalidated. This property has a hint characteristic: a client can only be expected to make a 'best effort' in honoring the areas but there are no guarantees. If this property is missing, empty, or if values are not understood, the client should assume a single value `all`.",
-            "items": {"$ref": "#/definitions/InvalidatedAreas"},
+        "action": {"type": "string", "enum": ["start", "stop"], "description": "Whether the profiler should be started or stopped."},
+        "samplesPerSecond": {
+            "type": "number",
+            "description": "How many times per second the stacks are sampled (only used when starting; defaults to 100).",
         },
-        "threadId": {"type": "integer", "description": "If specified, the client only needs to refetch data related to this thread."},
-        "stackFrameId": {
-            "type": "integer",
-            "description": "If specified, the client only needs to refetch data related to this stack frame (and the `threadId` is ignored).",
+        "flushInterval": {
+            "type": "number",
+            "description": "The interval (in seconds) at which 'pydevdProfile' events are sent (only used when starting; defaults to 1).",
         },
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, areas=None, threadId=None, stackFrameId=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, action, samplesPerSecond=None, flushInterval=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array areas: Set of logical areas that got invalidated. This property has a hint characteristic: a client can only be expected to make a 'best effort' in honoring the areas but there are no guarantees. If this property is missing, empty, or if values are not understood, the client should assume a single value `all`.
-        :param integer threadId: If specified, the client only needs to refetch data related to this thread.
-        :param integer stackFrameId: If specified, the client only needs to refetch data related to this stack frame (and the `threadId` is ignored).
+        :param string action: Whether the profiler should be started or stopped.
+        :param number samplesPerSecond: How many times per second the stacks are sampled (only used when starting; defaults to 100).
+        :param number flushInterval: The interval (in seconds) at which 'pydevdProfile' events are sent (only used when starting; defaults to 1).
         """
-        self.areas = areas
-        if update_ids_from_dap and self.areas:
-            for o in self.areas:
-                InvalidatedAreas.update_dict_ids_from_dap(o)
-        self.threadId = threadId
-        self.stackFrameId = stackFrameId
-        if update_ids_from_dap:
-            self.threadId = self._translate_id_from_dap(self.threadId)
+        self.action = action
+        self.samplesPerSecond = samplesPerSecond
+        self.flushInterval = flushInterval
         self.kwargs = kwargs
 
-    @classmethod
-    def update_dict_ids_from_dap(cls, dct):
-        if "threadId" in dct:
-            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
-        return dct
-
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        areas = self.areas
-        if areas and hasattr(areas[0], "to_dict"):
-            areas = [x.to_dict() for x in areas]
-        threadId = self.threadId
-        stackFrameId = self.stackFrameId
-        if update_ids_to_dap:
-            if threadId is not None:
-                threadId = self._translate_id_to_dap(threadId)
-        dct = {}
-        if areas is not None:
-            dct["areas"] = [InvalidatedAreas.update_dict_ids_to_dap(o) for o in areas] if (update_ids_to_dap and areas) else areas
-        if threadId is not None:
-            dct["threadId"] = threadId
-        if stackFrameId is not None:
-            dct["stackFrameId"] = stackFrameId
+        action = self.action
+        samplesPerSecond = self.samplesPerSecond
+        flushInterval = self.flushInterval
+        dct = {
+            "action": action,
+        }
+        if samplesPerSecond is not None:
+            dct["samplesPerSecond"] = samplesPerSecond
+        if flushInterval is not None:
+            dct["flushInterval"] = flushInterval
         dct.update(self.kwargs)
         return dct
 
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if "threadId" in dct:
-            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
-        return dct
-
 
+@register_response("pydevdProfile")
 @register
-class MemoryEventBody(BaseSchema):
+class PydevdProfileResponse(BaseSchema):
     """
-    "body" of MemoryEvent
+    Response to 'pydevdProfile' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "memoryReference": {"type": "string", "description": "Memory reference of a memory range that has been updated."},
-        "offset": {"type": "integer", "description": "Starting offset in bytes where memory has been updated. Can be negative."},
-        "count": {"type": "integer", "description": "Number of bytes updated."},
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["response"]},
+        "request_seq": {"type": "integer", "description": "Sequence number of the corresponding request."},
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request.\nIf True, the request was successful and the `body` attribute may contain the result of the request.\nIf the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).",
+        },
+        "command": {"type": "string", "description": "The command requested."},
+        "message": {
+            "type": "string",
+            "description": "Contains the raw error in short form if `success` is false.\nThis raw error might be interpreted by the client and is not shown in the UI.\nSome predefined values exist.",
+            "_enum": ["cancelled", "notStopped"],
+            "enumDescriptions": ["the request was cancelled.", "the request may be retried once the adapter is in a 'stopped' state."],
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "samples": {
+                    "type": "integer",
+                    "description": "The total number of stacks sampled since the profiler was started (0 when starting).",
+                }
+            },
+            "required": ["samples"],
+        },
     }
-    __refs__ = set()
+    __refs__ = set(["body"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, memoryReference, offset, count, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string memoryReference: Memory reference of a memory range that has been updated.
-        :param integer offset: Starting offset in bytes where memory has been updated. Can be negative.
-        :param integer count: Number of bytes updated.
+        :param string type:
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        If true, the request was successful and the `body` attribute may contain the result of the request.
+        If the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).
+        :param string command: The command requested.
+        :param PydevdProfileResponseBody body:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
+        :param string message: Contains the raw error in short form if `success` is false.
+        This raw error might be interpreted by the client and is not shown in the UI.
+        Some predefined values exist.
         """
-        self.memoryReference = memoryReference
-        self.offset = offset
-        self.count = count
+        self.type = "response"
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdProfileResponseBody()
+        else:
+            self.body = (
+                PydevdProfileResponseBody(update_ids_from_dap=update_ids_from_dap, **body)
+                if body.__class__ != PydevdProfileResponseBody
+                else body
+            )
+        self.seq = seq
+        self.message = message
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        memoryReference = self.memoryReference
-        offset = self.offset
-        count = self.count
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
         dct = {
-            "memoryReference": memoryReference,
-            "offset": offset,
-            "count": count,
+            "type": type,
+            "request_seq": request_seq,
+            "success": success,
+            "command": command,
+            "body": body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
+        if message is not None:
+            dct["message"] = message
         dct.update(self.kwargs)
         return dct
 
 
+@register_event("pydevdProfile")
 @register
-class RunInTerminalRequestArgumentsEnv(BaseSchema):
-    """
-    "env" of RunInTerminalRequestArguments
-
-    Note: automatically generated code. Do not edit manually.
+class PydevdProfileEvent(BaseSchema):
     """
+    The event is sent periodically while the sampling profiler is running with the stacks sampled since
+    the previous event.
 
-    __props__ = {}
-    __refs__ = set()
-
-    __slots__ = list(__props__.keys()) + ["kwargs"]
-
-    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """ """
-
-        self.kwargs = kwargs
-
-    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        dct = {}
-        dct.update(self.kwargs)
-        return dct
-
-
-@register
-class RunInTerminalResponseBody(BaseSchema):
-    """
-    "body" of RunInTerminalResponse
+    The sampled stacks are aggregated in a tree (where each node is a function called from the function
+    of its parent node), so, it may be merged into a flame graph by the client.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "processId": {"type": "integer", "description": "The process ID. The value should be less than or equal to 2147483647 (2^31-1)."},
-        "shellProcessId": {
+        "seq": {
             "type": "integer",
-            "description": "The process ID of the terminal shell. The value should be less than or equal to 2147483647 (2^31-1).",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["event"]},
+        "event": {"type": "string", "enum": ["pydevdProfile"]},
+        "body": {
+            "type": "object",
+            "properties": {
+                "frames": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/PydevdProfileFrame"},
+                    "description": "The functions first seen since the previous event (the index of a function is its position in the concatenation of the 'frames' of all the events of the profiling session).",
+                },
+                "nodes": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "The nodes of the tree (in pre-order) flattened as triples of (index of the parent node in this event or -1 for a root, index of the function, number of samples whose innermost function is the one of the node).",
+                },
+                "samples": {"type": "integer", "description": "The number of stacks sampled since the previous event."},
+                "done": {
+                    "type": "boolean",
+                    "description": "True if this is the last event of the profiling session (i.e.: the profiler was stopped).",
+                },
+            },
+            "required": ["frames", "nodes", "samples", "done"],
         },
     }
-    __refs__ = set()
+    __refs__ = set(["body"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, processId=None, shellProcessId=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param integer processId: The process ID. The value should be less than or equal to 2147483647 (2^31-1).
-        :param integer shellProcessId: The process ID of the terminal shell. The value should be less than or equal to 2147483647 (2^31-1).
+        :param string type:
+        :param string event:
+        :param PydevdProfileEventBody body:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
         """
-        self.processId = processId
-        self.shellProcessId = shellProcessId
+        self.type = "event"
+        self.event = "pydevdProfile"
+        if body is None:
+            self.body = PydevdProfileEventBody()
+        else:
+            self.body = (
+                PydevdProfileEventBody(update_ids_from_dap=update_ids_from_dap, **body)
+                if body.__class__ != PydevdProfileEventBody
+                else body
+            )
+        self.seq = seq
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        processId = self.processId
-        shellProcessId = self.shellProcessId
-        dct = {}
-        if processId is not None:
-            dct["processId"] = processId
-        if shellProcessId is not None:
-            dct["shellProcessId"] = shellProcessId
+        type = self.type  # noqa (assign to builtin)
+        event = self.event
+        body = self.body
+        seq = self.seq
+        dct = {
+            "type": type,
+            "event": event,
+            "body": body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
+        }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class StartDebuggingRequestArgumentsConfiguration(BaseSchema):
+class PydevdProfileFrame(BaseSchema):
     """
-    "configuration" of StartDebuggingRequestArguments
+    A function seen in the stacks sampled by the profiler.
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {}
+    __props__ = {
+        "name": {"type": "string", "description": "The name of the function."},
+        "path": {"type": "string", "description": "The path of the file where the function is defined."},
+        "line": {"type": "integer", "description": "The line where the function is defined."},
+    }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """ """
-
+    def __init__(self, name, path, line, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string name: The name of the function.
+        :param string path: The path of the file where the function is defined.
+        :param integer line: The line where the function is defined.
+        """
+        self.name = name
+        self.path = path
+        self.line = line
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        dct = {}
+        name = self.name
+        path = self.path
+        line = self.line
+        dct = {
+            "name": name,
+            "path": path,
+            "line": line,
+        }
         dct.update(self.kwargs)
         return dct
 
 
+@register_request("pydevdTracepoints")
 @register
-class BreakpointLocationsResponseBody(BaseSchema):
+class PydevdTracepointsRequest(BaseSchema):
     """
-    "body" of BreakpointLocationsResponse
+    Sends right away (in a 'pydevdTracepoints' event) the tracepoint hits captured since the last event.
+
+    Note: tracepoints are only available if 'tracepoints' is set in the launch/attach arguments (in
+    which case logpoints capture their messages in a ring buffer instead of sending an 'output' event
+    for each hit).
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "breakpoints": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/BreakpointLocation"},
-            "description": "Sorted set of possible breakpoint locations.",
-        }
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["request"]},
+        "command": {"type": "string", "enum": ["pydevdTracepoints"]},
+        "arguments": {"type": "PydevdTracepointsArguments"},
     }
-    __refs__ = set()
+    __refs__ = set(["arguments"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, seq=-1, arguments=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array breakpoints: Sorted set of possible breakpoint locations.
+        :param string type:
+        :param string command:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
+        :param PydevdTracepointsArguments arguments:
         """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                BreakpointLocation.update_dict_ids_from_dap(o)
+        self.type = "request"
+        self.command = "pydevdTracepoints"
+        self.seq = seq
+        if arguments is None:
+            self.arguments = PydevdTracepointsArguments()
+        else:
+            self.arguments = (
+                PydevdTracepointsArguments(update_ids_from_dap=update_ids_from_dap, **arguments)
+                if arguments.__class__ != PydevdTracepointsArguments
+                else arguments
+            )
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
+        type = self.type  # noqa (assign to builtin)
+        command = self.command
+        seq = self.seq
+        arguments = self.arguments
         dct = {
-            "breakpoints": [BreakpointLocation.update_dict_ids_to_dap(o) for o in breakpoints]
-            if (update_ids_to_dap and breakpoints)
-            else breakpoints,
+            "type": type,
+            "command": command,
+            "seq": seq,
         }
+        if arguments is not None:
+            dct["arguments"] = arguments.to_dict(update_ids_to_dap=update_ids_to_dap)
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class SetBreakpointsResponseBody(BaseSchema):
+class PydevdTracepointsArguments(BaseSchema):
     """
-    "body" of SetBreakpointsResponse
+    Arguments for 'pydevdTracepoints' request.
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {
-        "breakpoints": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/Breakpoint"},
-            "description": "Information about the breakpoints.\nThe array elements are in the same order as the elements of the `breakpoints` (or the deprecated `lines`) array in the arguments.",
-        }
-    }
+    __props__ = {}
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """
-        :param array breakpoints: Information about the breakpoints.
-        The array elements are in the same order as the elements of the `breakpoints` (or the deprecated `lines`) array in the arguments.
-        """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                Breakpoint.update_dict_ids_from_dap(o)
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """ """
+
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
-        dct = {
-            "breakpoints": [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints]
-            if (update_ids_to_dap and breakpoints)
-            else breakpoints,
-        }
+        dct = {}
         dct.update(self.kwargs)
         return dct
 
 
+@register_response("pydevdTracepoints")
 @register
-class SetFunctionBreakpointsResponseBody(BaseSchema):
+class PydevdTracepointsResponse(BaseSchema):
     """
-    "body" of SetFunctionBreakpointsResponse
+    Response to 'pydevdTracepoints' request (sent after the 'pydevdTracepoints' event).
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "breakpoints": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/Breakpoint"},
-            "description": "Information about the breakpoints. The array elements correspond to the elements of the `breakpoints` array.",
-        }
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["response"]},
+        "request_seq": {"type": "integer", "description": "Sequence number of the corresponding request."},
+        "success": {
+            "type": "boolean",
+            "description": "Outcome of the request.\nIf True, the request was successful and the `body` attribute may contain the result of the request.\nIf the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).",
+        },
+        "command": {"type": "string", "description": "The command requested."},
+        "message": {
+            "type": "string",
+            "description": "Contains the raw error in short form if `success` is false.\nThis raw error might be interpreted by the client and is not shown in the UI.\nSome predefined values exist.",
+            "_enum": ["cancelled", "notStopped"],
+            "enumDescriptions": ["the request was cancelled.", "the request may be retried once the adapter is in a 'stopped' state."],
+        },
+        "body": {
+            "type": "object",
+            "properties": {
+                "hits": {
+                    "type": "integer",
+                    "description": "The number of hits sent in the 'pydevdTracepoints' event (-1 if tracepoints are not enabled).",
+                }
+            },
+            "required": ["hits"],
+        },
     }
-    __refs__ = set()
+    __refs__ = set(["body"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, request_seq, success, command, body, seq=-1, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array breakpoints: Information about the breakpoints. The array elements correspond to the elements of the `breakpoints` array.
+        :param string type:
+        :param integer request_seq: Sequence number of the corresponding request.
+        :param boolean success: Outcome of the request.
+        If true, the request was successful and the `body` attribute may contain the result of the request.
+        If the value is false, the attribute `message` contains the error in short form and the `body` may contain additional information (see `ErrorResponse.body.error`).
+        :param string command: The command requested.
+        :param PydevdTracepointsResponseBody body:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
+        :param string message: Contains the raw error in short form if `success` is false.
+        This raw error might be interpreted by the client and is not shown in the UI.
+        Some predefined values exist.
         """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                Breakpoint.update_dict_ids_from_dap(o)
+        self.type = "response"
+        self.request_seq = request_seq
+        self.success = success
+        self.command = command
+        if body is None:
+            self.body = PydevdTracepointsResponseBody()
+        else:
+            self.body = (
+                PydevdTracepointsResponseBody(update_ids_from_dap=update_ids_from_dap, **body)
+                if body.__class__ != PydevdTracepointsResponseBody
+                else body
+            )
+        self.seq = seq
+        self.message = message
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
+        type = self.type  # noqa (assign to builtin)
+        request_seq = self.request_seq
+        success = self.success
+        command = self.command
+        body = self.body
+        seq = self.seq
+        message = self.message
         dct = {
-            "breakpoints": [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints]
-            if (update_ids_to_dap and breakpoints)
-            else breakpoints,
+            "type": type,
+            "request_seq": request_seq,
+            "success": success,
+            "command": command,
+            "body": body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
         }
+        if message is not None:
+            dct["message"] = message
         dct.update(self.kwargs)
         return dct
 
 
+@register_event("pydevdTracepoints")
 @register
-class SetExceptionBreakpointsResponseBody(BaseSchema):
+class PydevdTracepointsEvent(BaseSchema):
     """
-    "body" of SetExceptionBreakpointsResponse
+    The event is sent periodically (or when requested through a 'pydevdTracepoints' request) with the
+    tracepoint hits captured since the previous event.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "breakpoints": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/Breakpoint"},
-            "description": "Information about the exception breakpoints or filters.\nThe breakpoints returned are in the same order as the elements of the `filters`, `filterOptions`, `exceptionOptions` arrays in the arguments. If both `filters` and `filterOptions` are given, the returned array must start with `filters` information first, followed by `filterOptions` information.",
-        }
+        "seq": {
+            "type": "integer",
+            "description": "Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.",
+        },
+        "type": {"type": "string", "enum": ["event"]},
+        "event": {"type": "string", "enum": ["pydevdTracepoints"]},
+        "body": {
+            "type": "object",
+            "properties": {
+                "hits": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/PydevdTracepointHit"},
+                    "description": "The hits captured since the previous event (oldest first).",
+                },
+                "tracepoints": {
+                    "type": "array",
+                    "items": {"$ref": "#/definitions/PydevdTracepointStats"},
+                    "description": "The counters of the tracepoints hit since tracepoints were enabled.",
+                },
+            },
+            "required": ["hits", "tracepoints"],
+        },
     }
-    __refs__ = set()
+    __refs__ = set(["body"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, breakpoints=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, body, seq=-1, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array breakpoints: Information about the exception breakpoints or filters.
-        The breakpoints returned are in the same order as the elements of the `filters`, `filterOptions`, `exceptionOptions` arrays in the arguments. If both `filters` and `filterOptions` are given, the returned array must start with `filters` information first, followed by `filterOptions` information.
+        :param string type:
+        :param string event:
+        :param PydevdTracepointsEventBody body:
+        :param integer seq: Sequence number of the message (also known as message ID). The `seq` for the first message sent by a client or debug adapter is 1, and for each subsequent message is 1 greater than the previous message sent by that actor. `seq` can be used to order requests, responses, and events, and to associate requests with their corresponding responses. For protocol messages of type `request` the sequence number can be used to cancel the request.
         """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                Breakpoint.update_dict_ids_from_dap(o)
+        self.type = "event"
+        self.event = "pydevdTracepoints"
+        if body is None:
+            self.body = PydevdTracepointsEventBody()
+        else:
+            self.body = (
+                PydevdTracepointsEventBody(update_ids_from_dap=update_ids_from_dap, **body)
+                if body.__class__ != PydevdTracepointsEventBody
+                else body
+            )
+        self.seq = seq
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
-        dct = {}
-        if breakpoints is not None:
-            dct["breakpoints"] = (
-                [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints] if (update_ids_to_dap and breakpoints) else breakpoints
-            )
+        type = self.type  # noqa (assign to builtin)
+        event = self.event
+        body = self.body
+        seq = self.seq
+        dct = {
+            "type": type,
+            "event": event,
+            "body": body.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "seq": seq,
+        }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class DataBreakpointInfoResponseBody(BaseSchema):
+class PydevdTracepointHit(BaseSchema):
     """
-    "body" of DataBreakpointInfoResponse
+    A hit captured by a tracepoint.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "dataId": {
-            "type": ["string", "null"],
-            "description": "An identifier for the data on which a data breakpoint can be registered with the `setDataBreakpoints` request or null if no data breakpoint is available. If a `variablesReference` or `frameId` is passed, the `dataId` is valid in the current suspended state, otherwise it's valid indefinitely. See 'Lifetime of Object References' in the Overview section for details. Breakpoints set using the `dataId` in the `setDataBreakpoints` request may outlive the lifetime of the associated `dataId`.",
-        },
-        "description": {
-            "type": "string",
-            "description": "UI string that describes on what data the breakpoint is set on or why a data breakpoint is not available.",
-        },
-        "accessTypes": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/DataBreakpointAccessType"},
-            "description": "Attribute lists the available access types for a potential data breakpoint. A UI client could surface this information.",
-        },
-        "canPersist": {
-            "type": "boolean",
-            "description": "Attribute indicates that a potential data breakpoint could be persisted across sessions.",
+        "breakpointId": {
+            "type": "integer",
+            "description": "The id of the breakpoint (as in the 'setBreakpoints' response) of the tracepoint.",
         },
+        "threadId": {"type": "integer", "description": "The thread which hit the tracepoint."},
+        "timestamp": {"type": "number", "description": "The time of the hit (in seconds since the epoch)."},
+        "message": {"type": "string", "description": "The evaluated log message."},
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, dataId, description, accessTypes=None, canPersist=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, breakpointId, threadId, timestamp, message, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param ['string', 'null'] dataId: An identifier for the data on which a data breakpoint can be registered with the `setDataBreakpoints` request or null if no data breakpoint is available. If a `variablesReference` or `frameId` is passed, the `dataId` is valid in the current suspended state, otherwise it's valid indefinitely. See 'Lifetime of Object References' in the Overview section for details. Breakpoints set using the `dataId` in the `setDataBreakpoints` request may outlive the lifetime of the associated `dataId`.
-        :param string description: UI string that describes on what data the breakpoint is set on or why a data breakpoint is not available.
-        :param array accessTypes: Attribute lists the available access types for a potential data breakpoint. A UI client could surface this information.
-        :param boolean canPersist: Attribute indicates that a potential data breakpoint could be persisted across sessions.
+        :param integer breakpointId: The id of the breakpoint (as in the 'setBreakpoints' response) of the tracepoint.
+        :param integer threadId: The thread which hit the tracepoint.
+        :param number timestamp: The time of the hit (in seconds since the epoch).
+        :param string message: The evaluated log message.
         """
-        self.dataId = dataId
-        self.description = description
-        self.accessTypes = accessTypes
-        if update_ids_from_dap and self.accessTypes:
-            for o in self.accessTypes:
-                DataBreakpointAccessType.update_dict_ids_from_dap(o)
-        self.canPersist = canPersist
+        self.breakpointId = breakpointId
+        self.threadId = threadId
+        self.timestamp = timestamp
+        self.message = message
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
         self.kwargs = kwargs
 
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
+        return dct
+
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        dataId = self.dataId
-        description = self.description
-        accessTypes = self.accessTypes
-        if accessTypes and hasattr(accessTypes[0], "to_dict"):
-            accessTypes = [x.to_dict() for x in accessTypes]
-        canPersist = self.canPersist
+        breakpointId = self.breakpointId
+        threadId = self.threadId
+        timestamp = self.timestamp
+        message = self.message
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
         dct = {
-            "dataId": dataId,
-            "description": description,
+            "breakpointId": breakpointId,
+            "threadId": threadId,
+            "timestamp": timestamp,
+            "message": message,
         }
-        if accessTypes is not None:
-            dct["accessTypes"] = (
-                [DataBreakpointAccessType.update_dict_ids_to_dap(o) for o in accessTypes]
-                if (update_ids_to_dap and accessTypes)
-                else accessTypes
-            )
-        if canPersist is not None:
-            dct["canPersist"] = canPersist
         dct.update(self.kwargs)
         return dct
 
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
+        return dct
+
 
 @register
-class SetDataBreakpointsResponseBody(BaseSchema):
+class PydevdTracepointStats(BaseSchema):
     """
-    "body" of SetDataBreakpointsResponse
+    The counters of a tracepoint.
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "breakpoints": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/Breakpoint"},
-            "description": "Information about the data breakpoints. The array elements correspond to the elements of the input argument `breakpoints` array.",
-        }
+        "breakpointId": {
+            "type": "integer",
+            "description": "The id of the breakpoint (as in the 'setBreakpoints' response) of the tracepoint.",
+        },
+        "hits": {"type": "integer", "description": "The number of times the tracepoint was hit (including the hits skipped by sampling)."},
+        "captured": {"type": "integer", "description": "The number of hits captured in the buffer."},
+        "dropped": {
+            "type": "integer",
+            "description": "The number of hits dropped (because of the rate limit or because they were overwritten in the buffer before being sent).",
+        },
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, breakpointId, hits, captured, dropped, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array breakpoints: Information about the data breakpoints. The array elements correspond to the elements of the input argument `breakpoints` array.
+        :param integer breakpointId: The id of the breakpoint (as in the 'setBreakpoints' response) of the tracepoint.
+        :param integer hits: The number of times the tracepoint was hit (including the hits skipped by sampling).
+        :param integer captured: The number of hits captured in the buffer.
+        :param integer dropped: The number of hits dropped (because of the rate limit or because they were overwritten in the buffer before being sent).
         """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                Breakpoint.update_dict_ids_from_dap(o)
+        self.breakpointId = breakpointId
+        self.hits = hits
+        self.captured = captured
+        self.dropped = dropped
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
+        breakpointId = self.breakpointId
+        hits = self.hits
+        captured = self.captured
+        dropped = self.dropped
         dct = {
-            "breakpoints": [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints]
-            if (update_ids_to_dap and breakpoints)
-            else breakpoints,
+            "breakpointId": breakpointId,
+            "hits": hits,
+            "captured": captured,
+            "dropped": dropped,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class SetInstructionBreakpointsResponseBody(BaseSchema):
+class ErrorResponseBody(BaseSchema):
     """
-    "body" of SetInstructionBreakpointsResponse
+    "body" of ErrorResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {
-        "breakpoints": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/Breakpoint"},
-            "description": "Information about the breakpoints. The array elements correspond to the elements of the `breakpoints` array.",
-        }
-    }
-    __refs__ = set()
+    __props__ = {"error": {"description": "A structured error message.", "type": "Message"}}
+    __refs__ = set(["error"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, error=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array breakpoints: Information about the breakpoints. The array elements correspond to the elements of the `breakpoints` array.
+        :param Message error: A structured error message.
         """
-        self.breakpoints = breakpoints
-        if update_ids_from_dap and self.breakpoints:
-            for o in self.breakpoints:
-                Breakpoint.update_dict_ids_from_dap(o)
+        if error is None:
+            self.error = Message()
+        else:
+            self.error = Message(update_ids_from_dap=update_ids_from_dap, **error) if error.__class__ != Message else error
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        breakpoints = self.breakpoints
-        if breakpoints and hasattr(breakpoints[0], "to_dict"):
-            breakpoints = [x.to_dict() for x in breakpoints]
-        dct = {
-            "breakpoints": [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints]
-            if (update_ids_to_dap and breakpoints)
-            else breakpoints,
-        }
+        error = self.error
+        dct = {}
+        if error is not None:
+            dct["error"] = error.to_dict(update_ids_to_dap=update_ids_to_dap)
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ContinueResponseBody(BaseSchema):
+class StoppedEventBody(BaseSchema):
     """
-    "body" of ContinueResponse
+    "body" of StoppedEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "allThreadsContinued": {
+        "reason": {
+            "type": "string",
+            "description": "The reason for the event.\nFor backward compatibility this string is shown in the UI if the `description` attribute is missing (but it must not be translated).",
+            "_enum": [
+                "step",
+                "breakpoint",
+                "exception",
+                "pause",
+                "entry",
+                "goto",
+                "function breakpoint",
+                "data breakpoint",
+                "instruction breakpoint",
+            ],
+        },
+        "description": {
+            "type": "string",
+            "description": "The full reason for the event, e.g. 'Paused on exception'. This string is shown in the UI as is and can be translated.",
+        },
+        "threadId": {"type": "integer", "description": "The thread which was stopped."},
+        "preserveFocusHint": {
             "type": "boolean",
-            "description": "The value True (or a missing property) signals to the client that all threads have been resumed. The value false indicates that not all threads were resumed.",
-        }
+            "description": "A value of True hints to the client that this event should not change the focus.",
+        },
+        "text": {
+            "type": "string",
+            "description": "Additional information. E.g. if reason is `exception`, text contains the exception name. This string is shown in the UI.",
+        },
+        "allThreadsStopped": {
+            "type": "boolean",
+            "description": "If `allThreadsStopped` is True, a debug adapter can announce that all threads have stopped.\n- The client should use this information to enable that all threads can be expanded to access their stacktraces.\n- If the attribute is missing or false, only the thread with the given `threadId` can be expanded.",
+        },
+        "hitBreakpointIds": {
+            "type": "array",
+            "items": {"type": "integer"},
+            "description": "Ids of the breakpoints that triggered the event. In most cases there is only a single breakpoint but here are some examples for multiple breakpoints:\n- Different types of breakpoints map to the same location.\n- Multiple source breakpoints get collapsed to the same instruction by the compiler/runtime.\n- Multiple function breakpoints with different function names map to the same location.",
+        },
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, allThreadsContinued=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(
+        self,
+        reason,
+        description=None,
+        threadId=None,
+        preserveFocusHint=None,
+        text=None,
+        allThreadsStopped=None,
+        hitBreakpointIds=None,
+        update_ids_from_dap=False,
+        **kwargs,
+    ):  # noqa (update_ids_from_dap may be unused)
         """
-        :param boolean allThreadsContinued: The value true (or a missing property) signals to the client that all threads have been resumed. The value false indicates that not all threads were resumed.
+        :param string reason: The reason for the event.
+        For backward compatibility this string is shown in the UI if the `description` attribute is missing (but it must not be translated).
+        :param string description: The full reason for the event, e.g. 'Paused on exception'. This string is shown in the UI as is and can be translated.
+        :param integer threadId: The thread which was stopped.
+        :param boolean preserveFocusHint: A value of true hints to the client that this event should not change the focus.
+        :param string text: Additional information. E.g. if reason is `exception`, text contains the exception name. This string is shown in the UI.
+        :param boolean allThreadsStopped: If `allThreadsStopped` is true, a debug adapter can announce that all threads have stopped.
+        - The client should use this information to enable that all threads can be expanded to access their stacktraces.
+        - If the attribute is missing or false, only the thread with the given `threadId` can be expanded.
+        :param array hitBreakpointIds: Ids of the breakpoints that triggered the event. In most cases there is only a single breakpoint but here are some examples for multiple breakpoints:
+        - Different types of breakpoints map to the same location.
+        - Multiple source breakpoints get collapsed to the same instruction by the compiler/runtime.
+        - Multiple function breakpoints with different function names map to the same location.
         """
-        self.allThreadsContinued = allThreadsContinued
+        self.reason = reason
+        self.description = description
+        self.threadId = threadId
+        self.preserveFocusHint = preserveFocusHint
+        self.text = text
+        self.allThreadsStopped = allThreadsStopped
+        self.hitBreakpointIds = hitBreakpointIds
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
         self.kwargs = kwargs
 
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
+        return dct
+
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        allThreadsContinued = self.allThreadsContinued
-        dct = {}
-        if allThreadsContinued is not None:
-            dct["allThreadsContinued"] = allThreadsContinued
+        reason = self.reason
+        description = self.description
+        threadId = self.threadId
+        preserveFocusHint = self.preserveFocusHint
+        text = self.text
+        allThreadsStopped = self.allThreadsStopped
+        hitBreakpointIds = self.hitBreakpointIds
+        if hitBreakpointIds and hasattr(hitBreakpointIds[0], "to_dict"):
+            hitBreakpointIds = [x.to_dict() for x in hitBreakpointIds]
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
+        dct = {
+            "reason": reason,
+        }
+        if description is not None:
+            dct["description"] = description
+        if threadId is not None:
+            dct["threadId"] = threadId
+        if preserveFocusHint is not None:
+            dct["preserveFocusHint"] = preserveFocusHint
+        if text is not None:
+            dct["text"] = text
+        if allThreadsStopped is not None:
+            dct["allThreadsStopped"] = allThreadsStopped
+        if hitBreakpointIds is not None:
+            dct["hitBreakpointIds"] = hitBreakpointIds
         dct.update(self.kwargs)
         return dct
 
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
+        return dct
+
 
 @register
-class StackTraceResponseBody(BaseSchema):
+class ContinuedEventBody(BaseSchema):
     """
-    "body" of StackTraceResponse
+    "body" of ContinuedEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "stackFrames": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/StackFrame"},
-            "description": "The frames of the stack frame. If the array has length zero, there are no stack frames available.\nThis means that there is no location information available.",
-        },
-        "totalFrames": {
-            "type": "integer",
-            "description": "The total number of frames available in the stack. If omitted or if `totalFrames` is larger than the available frames, a client is expected to request frames until a request returns less frames than requested (which indicates the end of the stack). Returning monotonically increasing `totalFrames` values for subsequent requests can be used to enforce paging in the client.",
+        "threadId": {"type": "integer", "description": "The thread which was continued."},
+        "allThreadsContinued": {
+            "type": "boolean",
+            "description": "If `allThreadsContinued` is True, a debug adapter can announce that all threads have continued.",
         },
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, stackFrames, totalFrames=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, threadId, allThreadsContinued=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array stackFrames: The frames of the stack frame. If the array has length zero, there are no stack frames available.
-        This means that there is no location information available.
-        :param integer totalFrames: The total number of frames available in the stack. If omitted or if `totalFrames` is larger than the available frames, a client is expected to request frames until a request returns less frames than requested (which indicates the end of the stack). Returning monotonically increasing `totalFrames` values for subsequent requests can be used to enforce paging in the client.
+        :param integer threadId: The thread which was continued.
+        :param boolean allThreadsContinued: If `allThreadsContinued` is true, a debug adapter can announce that all threads have continued.
         """
-        self.stackFrames = stackFrames
-        if update_ids_from_dap and self.stackFrames:
-            for o in self.stackFrames:
-                StackFrame.update_dict_ids_from_dap(o)
-        self.totalFrames = totalFrames
+        self.threadId = threadId
+        self.allThreadsContinued = allThreadsContinued
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
         self.kwargs = kwargs
 
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
+        return dct
+
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        stackFrames = self.stackFrames
-        if stackFrames and hasattr(stackFrames[0], "to_dict"):
-            stackFrames = [x.to_dict() for x in stackFrames]
-        totalFrames = self.totalFrames
+        threadId = self.threadId
+        allThreadsContinued = self.allThreadsContinued
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
         dct = {
-            "stackFrames": [StackFrame.update_dict_ids_to_dap(o) for o in stackFrames]
-            if (update_ids_to_dap and stackFrames)
-            else stackFrames,
+            "threadId": threadId,
         }
-        if totalFrames is not None:
-            dct["totalFrames"] = totalFrames
+        if allThreadsContinued is not None:
+            dct["allThreadsContinued"] = allThreadsContinued
         dct.update(self.kwargs)
         return dct
 
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
+        return dct
+
 
 @register
-class ScopesResponseBody(BaseSchema):
+class ExitedEventBody(BaseSchema):
     """
-    "body" of ScopesResponse
+    "body" of ExitedEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {
-        "scopes": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/Scope"},
-            "description": "The scopes of the stack frame. If the array has length zero, there are no scopes available.",
-        }
-    }
+    __props__ = {"exitCode": {"type": "integer", "description": "The exit code returned from the debuggee."}}
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, scopes, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, exitCode, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array scopes: The scopes of the stack frame. If the array has length zero, there are no scopes available.
+        :param integer exitCode: The exit code returned from the debuggee.
         """
-        self.scopes = scopes
-        if update_ids_from_dap and self.scopes:
-            for o in self.scopes:
-                Scope.update_dict_ids_from_dap(o)
+        self.exitCode = exitCode
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        scopes = self.scopes
-        if scopes and hasattr(scopes[0], "to_dict"):
-            scopes = [x.to_dict() for x in scopes]
+        exitCode = self.exitCode
         dct = {
-            "scopes": [Scope.update_dict_ids_to_dap(o) for o in scopes] if (update_ids_to_dap and scopes) else scopes,
+            "exitCode": exitCode,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class VariablesResponseBody(BaseSchema):
+class TerminatedEventBody(BaseSchema):
     """
-    "body" of VariablesResponse
+    "body" of TerminatedEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "variables": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/Variable"},
-            "description": "All (or a range) of variables for the given variable reference.",
+        "restart": {
+            "type": ["array", "boolean", "integer", "null", "number", "object", "string"],
+            "description": "A debug adapter may set `restart` to True (or to an arbitrary object) to request that the client restarts the session.\nThe value is not interpreted by the client and passed unmodified as an attribute `__restart` to the `launch` and `attach` requests.",
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, variables, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, restart=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array variables: All (or a range) of variables for the given variable reference.
+        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] restart: A debug adapter may set `restart` to true (or to an arbitrary object) to request that the client restarts the session.
+        The value is not interpreted by the client and passed unmodified as an attribute `__restart` to the `launch` and `attach` requests.
         """
-        self.variables = variables
-        if update_ids_from_dap and self.variables:
-            for o in self.variables:
-                Variable.update_dict_ids_from_dap(o)
+        self.restart = restart
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        variables = self.variables
-        if variables and hasattr(variables[0], "to_dict"):
-            variables = [x.to_dict() for x in variables]
+        restart = self.restart
+        dct = {}
+        if restart is not None:
+            dct["restart"] = restart
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ThreadEventBody(BaseSchema):
+    """
+    "body" of ThreadEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "reason": {"type": "string", "description": "The reason for the event.", "_enum": ["started", "exited"]},
+        "threadId": {"type": "integer", "description": "The identifier of the thread."},
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, reason, threadId, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string reason: The reason for the event.
+        :param integer threadId: The identifier of the thread.
+        """
+        self.reason = reason
+        self.threadId = threadId
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
+        self.kwargs = kwargs
+
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        reason = self.reason
+        threadId = self.threadId
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
         dct = {
-            "variables": [Variable.update_dict_ids_to_dap(o) for o in variables] if (update_ids_to_dap and variables) else variables,
+            "reason": reason,
+            "threadId": threadId,
         }
         dct.update(self.kwargs)
         return dct
 
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
+        return dct
+
 
 @register
-class SetVariableResponseBody(BaseSchema):
+class OutputEventBody(BaseSchema):
     """
-    "body" of SetVariableResponse
+    "body" of OutputEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "value": {"type": "string", "description": "The new value of the variable."},
-        "type": {"type": "string", "description": "The type of the new value. Typically shown in the UI when hovering over the value."},
-        "variablesReference": {
-            "type": "integer",
-            "description": "If `variablesReference` is > 0, the new value is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.",
+        "category": {
+            "type": "string",
+            "description": "The output category. If not specified or if the category is not understood by the client, `console` is assumed.",
+            "_enum": ["console", "important", "stdout", "stderr", "telemetry"],
+            "enumDescriptions": [
+                "Show the output in the client's default message UI, e.g. a 'debug console'. This category should only be used for informational output from the debugger (as opposed to the debuggee).",
+                "A hint for the client to show the output in the client's UI for important and highly visible information, e.g. as a popup notification. This category should only be used for important messages from the debugger (as opposed to the debuggee). Since this category value is a hint, clients might ignore the hint and assume the `console` category.",
+                "Show the output as normal program output from the debuggee.",
+                "Show the output as error program output from the debuggee.",
+                "Send the output to telemetry instead of showing it to the user.",
+            ],
         },
-        "namedVariables": {
+        "output": {"type": "string", "description": "The output to report."},
+        "group": {
+            "type": "string",
+            "description": "Support for keeping an output log organized by grouping related messages.",
+            "enum": ["start", "startCollapsed", "end"],
+            "enumDescriptions": [
+                "Start a new group in expanded mode. Subsequent output events are members of the group and should be shown indented.\nThe `output` attribute becomes the name of the group and is not indented.",
+                "Start a new group in collapsed mode. Subsequent output events are members of the group and should be shown indented (as soon as the group is expanded).\nThe `output` attribute becomes the name of the group and is not indented.",
+                "End the current group and decrease the indentation of subsequent output events.\nA non-empty `output` attribute is shown as the unindented end of the group.",
+            ],
+        },
+        "variablesReference": {
             "type": "integer",
-            "description": "The number of named child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+            "description": "If an attribute `variablesReference` exists and its value is > 0, the output contains objects which can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.",
         },
-        "indexedVariables": {
+        "source": {"description": "The source location where the output was produced.", "type": "Source"},
+        "line": {"type": "integer", "description": "The source location's line where the output was produced."},
+        "column": {
             "type": "integer",
-            "description": "The number of indexed child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+            "description": "The position in `line` where the output was produced. It is measured in UTF-16 code units and the client capability `columnsStartAt1` determines whether it is 0- or 1-based.",
         },
-        "memoryReference": {
-            "type": "string",
-            "description": "A memory reference to a location appropriate for this result.\nFor pointer type eval results, this is generally a reference to the memory address contained in the pointer.\nThis attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is True.",
+        "data": {
+            "type": ["array", "boolean", "integer", "null", "number", "object", "string"],
+            "description": "Additional data to report. For the `telemetry` category the data is sent to telemetry, for the other categories the data is shown in JSON format.",
         },
     }
-    __refs__ = set()
+    __refs__ = set(["source"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
     def __init__(
         self,
-        value,
-        type=None,
+        output,
+        category=None,
+        group=None,
         variablesReference=None,
-        namedVariables=None,
-        indexedVariables=None,
-        memoryReference=None,
+        source=None,
+        line=None,
+        column=None,
+        data=None,
         update_ids_from_dap=False,
         **kwargs,
     ):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string value: The new value of the variable.
-        :param string type: The type of the new value. Typically shown in the UI when hovering over the value.
-        :param integer variablesReference: If `variablesReference` is > 0, the new value is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.
-        :param integer namedVariables: The number of named child variables.
-        The client can use this information to present the variables in a paged UI and fetch them in chunks.
-        The value should be less than or equal to 2147483647 (2^31-1).
-        :param integer indexedVariables: The number of indexed child variables.
-        The client can use this information to present the variables in a paged UI and fetch them in chunks.
-        The value should be less than or equal to 2147483647 (2^31-1).
-        :param string memoryReference: A memory reference to a location appropriate for this result.
-        For pointer type eval results, this is generally a reference to the memory address contained in the pointer.
-        This attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is true.
+        :param string output: The output to report.
+        :param string category: The output category. If not specified or if the category is not understood by the client, `console` is assumed.
+        :param string group: Support for keeping an output log organized by grouping related messages.
+        :param integer variablesReference: If an attribute `variablesReference` exists and its value is > 0, the output contains objects which can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.
+        :param Source source: The source location where the output was produced.
+        :param integer line: The source location's line where the output was produced.
+        :param integer column: The position in `line` where the output was produced. It is measured in UTF-16 code units and the client capability `columnsStartAt1` determines whether it is 0- or 1-based.
+        :param ['array', 'boolean', 'integer', 'null', 'number', 'object', 'string'] data: Additional data to report. For the `telemetry` category the data is sent to telemetry, for the other categories the data is shown in JSON format.
         """
-        self.value = value
-        self.type = type
+        self.output = output
+        self.category = category
+        self.group = group
         self.variablesReference = variablesReference
-        self.namedVariables = namedVariables
-        self.indexedVariables = indexedVariables
-        self.memoryReference = memoryReference
+        if source is None:
+            self.source = Source()
+        else:
+            self.source = Source(update_ids_from_dap=update_ids_from_dap, **source) if source.__class__ != Source else source
+        self.line = line
+        self.column = column
+        self.data = data
         if update_ids_from_dap:
             self.variablesReference = self._translate_id_from_dap(self.variablesReference)
         self.kwargs = kwargs
@@ -16594,28 +17166,34 @@ class SetVariableResponseBody(BaseSchema):
         return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        value = self.value
-        type = self.type  # noqa (assign to builtin)
+        output = self.output
+        category = self.category
+        group = self.group
         variablesReference = self.variablesReference
-        namedVariables = self.namedVariables
-        indexedVariables = self.indexedVariables
-        memoryReference = self.memoryReference
+        source = self.source
+        line = self.line
+        column = self.column
+        data = self.data
         if update_ids_to_dap:
             if variablesReference is not None:
                 variablesReference = self._translate_id_to_dap(variablesReference)
         dct = {
-            "value": value,
+            "output": output,
         }
-        if type is not None:
-            dct["type"] = type
+        if category is not None:
+            dct["category"] = category
+        if group is not None:
+            dct["group"] = group
         if variablesReference is not None:
             dct["variablesReference"] = variablesReference
-        if namedVariables is not None:
-            dct["namedVariables"] = namedVariables
-        if indexedVariables is not None:
-            dct["indexedVariables"] = indexedVariables
-        if memoryReference is not None:
-            dct["memoryReference"] = memoryReference
+        if source is not None:
+            dct["source"] = source.to_dict(update_ids_to_dap=update_ids_to_dap)
+        if line is not None:
+            dct["line"] = line
+        if column is not None:
+            dct["column"] = column
+        if data is not None:
+            dct["data"] = data
         dct.update(self.kwargs)
         return dct
 
@@ -16627,832 +17205,2463 @@ class SetVariableResponseBody(BaseSchema):
 
 
 @register
-class SourceResponseBody(BaseSchema):
+class BreakpointEventBody(BaseSchema):
     """
-    "body" of SourceResponse
+    "body" of BreakpointEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "content": {"type": "string", "description": "Content of the source reference."},
-        "mimeType": {"type": "string", "description": "Content type (MIME type) of the source."},
+        "reason": {"type": "string", "description": "The reason for the event.", "_enum": ["changed", "new", "removed"]},
+        "breakpoint": {
+            "description": "The `id` attribute is used to find the target breakpoint, the other attributes are used as the new values.",
+            "type": "Breakpoint",
+        },
     }
-    __refs__ = set()
+    __refs__ = set(["breakpoint"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, content, mimeType=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, reason, breakpoint, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string content: Content of the source reference.
-        :param string mimeType: Content type (MIME type) of the source.
+        :param string reason: The reason for the event.
+        :param Breakpoint breakpoint: The `id` attribute is used to find the target breakpoint, the other attributes are used as the new values.
         """
-        self.content = content
-        self.mimeType = mimeType
+        self.reason = reason
+        if breakpoint is None:
+            self.breakpoint = Breakpoint()
+        else:
+            self.breakpoint = (
+                Breakpoint(update_ids_from_dap=update_ids_from_dap, **breakpoint) if breakpoint.__class__ != Breakpoint else breakpoint
+            )
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        content = self.content
-        mimeType = self.mimeType
+        reason = self.reason
+        breakpoint = self.breakpoint  # noqa (assign to builtin)
         dct = {
-            "content": content,
+            "reason": reason,
+            "breakpoint": breakpoint.to_dict(update_ids_to_dap=update_ids_to_dap),
         }
-        if mimeType is not None:
-            dct["mimeType"] = mimeType
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ThreadsResponseBody(BaseSchema):
+class ModuleEventBody(BaseSchema):
     """
-    "body" of ThreadsResponse
+    "body" of ModuleEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {"threads": {"type": "array", "items": {"$ref": "#/definitions/Thread"}, "description": "All threads."}}
-    __refs__ = set()
+    __props__ = {
+        "reason": {"type": "string", "description": "The reason for the event.", "enum": ["new", "changed", "removed"]},
+        "module": {
+            "description": "The new, changed, or removed module. In case of `removed` only the module id is used.",
+            "type": "Module",
+        },
+    }
+    __refs__ = set(["module"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, threads, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, reason, module, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array threads: All threads.
+        :param string reason: The reason for the event.
+        :param Module module: The new, changed, or removed module. In case of `removed` only the module id is used.
         """
-        self.threads = threads
-        if update_ids_from_dap and self.threads:
-            for o in self.threads:
-                Thread.update_dict_ids_from_dap(o)
+        self.reason = reason
+        if module is None:
+            self.module = Module()
+        else:
+            self.module = Module(update_ids_from_dap=update_ids_from_dap, **module) if module.__class__ != Module else module
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        threads = self.threads
-        if threads and hasattr(threads[0], "to_dict"):
-            threads = [x.to_dict() for x in threads]
+        reason = self.reason
+        module = self.module
         dct = {
-            "threads": [Thread.update_dict_ids_to_dap(o) for o in threads] if (update_ids_to_dap and threads) else threads,
+            "reason": reason,
+            "module": module.to_dict(update_ids_to_dap=update_ids_to_dap),
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ModulesResponseBody(BaseSchema):
+class LoadedSourceEventBody(BaseSchema):
     """
-    "body" of ModulesResponse
+    "body" of LoadedSourceEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "modules": {"type": "array", "items": {"$ref": "#/definitions/Module"}, "description": "All modules or range of modules."},
-        "totalModules": {"type": "integer", "description": "The total number of modules available."},
+        "reason": {"type": "string", "description": "The reason for the event.", "enum": ["new", "changed", "removed"]},
+        "source": {"description": "The new, changed, or removed source.", "type": "Source"},
     }
-    __refs__ = set()
+    __refs__ = set(["source"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, modules, totalModules=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, reason, source, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array modules: All modules or range of modules.
-        :param integer totalModules: The total number of modules available.
+        :param string reason: The reason for the event.
+        :param Source source: The new, changed, or removed source.
         """
-        self.modules = modules
-        if update_ids_from_dap and self.modules:
-            for o in self.modules:
-                Module.update_dict_ids_from_dap(o)
-        self.totalModules = totalModules
+        self.reason = reason
+        if source is None:
+            self.source = Source()
+        else:
+            self.source = Source(update_ids_from_dap=update_ids_from_dap, **source) if source.__class__ != Source else source
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        modules = self.modules
-        if modules and hasattr(modules[0], "to_dict"):
-            modules = [x.to_dict() for x in modules]
-        totalModules = self.totalModules
+        reason = self.reason
+        source = self.source
         dct = {
-            "modules": [Module.update_dict_ids_to_dap(o) for o in modules] if (update_ids_to_dap and modules) else modules,
+            "reason": reason,
+            "source": source.to_dict(update_ids_to_dap=update_ids_to_dap),
         }
-        if totalModules is not None:
-            dct["totalModules"] = totalModules
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class LoadedSourcesResponseBody(BaseSchema):
+class ProcessEventBody(BaseSchema):
     """
-    "body" of LoadedSourcesResponse
+    "body" of ProcessEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {"sources": {"type": "array", "items": {"$ref": "#/definitions/Source"}, "description": "Set of loaded sources."}}
+    __props__ = {
+        "name": {
+            "type": "string",
+            "description": "The logical name of the process. This is usually the full path to process's executable file. Example: /home/example/myproj/program.js.",
+        },
+        "systemProcessId": {
+            "type": "integer",
+            "description": "The system process id of the debugged process. This property is missing for non-system processes.",
+        },
+        "isLocalProcess": {"type": "boolean", "description": "If True, the process is running on the same computer as the debug adapter."},
+        "startMethod": {
+            "type": "string",
+            "enum": ["launch", "attach", "attachForSuspendedLaunch"],
+            "description": "Describes how the debug engine started debugging this process.",
+            "enumDescriptions": [
+                "Process was launched under the debugger.",
+                "Debugger attached to an existing process.",
+                "A project launcher component has launched a new process in a suspended state and then asked the debugger to attach.",
+            ],
+        },
+        "pointerSize": {
+            "type": "integer",
+            "description": "The size of a pointer or address for this process, in bits. This value may be used by clients when formatting addresses for display.",
+        },
+    }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, sources, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(
+        self, name, systemProcessId=None, isLocalProcess=None, startMethod=None, pointerSize=None, update_ids_from_dap=False, **kwargs
+    ):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array sources: Set of loaded sources.
+        :param string name: The logical name of the process. This is usually the full path to process's executable file. Example: /home/example/myproj/program.js.
+        :param integer systemProcessId: The system process id of the debugged process. This property is missing for non-system processes.
+        :param boolean isLocalProcess: If true, the process is running on the same computer as the debug adapter.
+        :param string startMethod: Describes how the debug engine started debugging this process.
+        :param integer pointerSize: The size of a pointer or address for this process, in bits. This value may be used by clients when formatting addresses for display.
         """
-        self.sources = sources
-        if update_ids_from_dap and self.sources:
-            for o in self.sources:
-                Source.update_dict_ids_from_dap(o)
+        self.name = name
+        self.systemProcessId = systemProcessId
+        self.isLocalProcess = isLocalProcess
+        self.startMethod = startMethod
+        self.pointerSize = pointerSize
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        sources = self.sources
-        if sources and hasattr(sources[0], "to_dict"):
-            sources = [x.to_dict() for x in sources]
+        name = self.name
+        systemProcessId = self.systemProcessId
+        isLocalProcess = self.isLocalProcess
+        startMethod = self.startMethod
+        pointerSize = self.pointerSize
         dct = {
-            "sources": [Source.update_dict_ids_to_dap(o) for o in sources] if (update_ids_to_dap and sources) else sources,
+            "name": name,
         }
+        if systemProcessId is not None:
+            dct["systemProcessId"] = systemProcessId
+        if isLocalProcess is not None:
+            dct["isLocalProcess"] = isLocalProcess
+        if startMethod is not None:
+            dct["startMethod"] = startMethod
+        if pointerSize is not None:
+            dct["pointerSize"] = pointerSize
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class EvaluateResponseBody(BaseSchema):
+class CapabilitiesEventBody(BaseSchema):
     """
-    "body" of EvaluateResponse
+    "body" of CapabilitiesEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {"capabilities": {"description": "The set of updated capabilities.", "type": "Capabilities"}}
+    __refs__ = set(["capabilities"])
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, capabilities, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param Capabilities capabilities: The set of updated capabilities.
+        """
+        if capabilities is None:
+            self.capabilities = Capabilities()
+        else:
+            self.capabilities = (
+                Capabilities(update_ids_from_dap=update_ids_from_dap, **capabilities)
+                if capabilities.__class__ != Capabilities
+                else capabilities
+            )
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        capabilities = self.capabilities
+        dct = {
+            "capabilities": capabilities.to_dict(update_ids_to_dap=update_ids_to_dap),
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ProgressStartEventBody(BaseSchema):
+    """
+    "body" of ProgressStartEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "result": {"type": "string", "description": "The result of the evaluate request."},
-        "type": {
+        "progressId": {
             "type": "string",
-            "description": "The type of the evaluate result.\nThis attribute should only be returned by a debug adapter if the corresponding capability `supportsVariableType` is True.",
-        },
-        "presentationHint": {
-            "description": "Properties of an evaluate result that can be used to determine how to render the result in the UI.",
-            "type": "VariablePresentationHint",
+            "description": "An ID that can be used in subsequent `progressUpdate` and `progressEnd` events to make them refer to the same progress reporting.\nIDs must be unique within a debug session.",
         },
-        "variablesReference": {
-            "type": "integer",
-            "description": "If `variablesReference` is > 0, the evaluate result is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.",
+        "title": {
+            "type": "string",
+            "description": "Short title of the progress reporting. Shown in the UI to describe the long running operation.",
         },
-        "namedVariables": {
+        "requestId": {
             "type": "integer",
-            "description": "The number of named child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+            "description": "The request ID that this progress report is related to. If specified a debug adapter is expected to emit progress events for the long running request until the request has been either completed or cancelled.\nIf the request ID is omitted, the progress report is assumed to be related to some general activity of the debug adapter.",
         },
-        "indexedVariables": {
-            "type": "integer",
-            "description": "The number of indexed child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+        "cancellable": {
+            "type": "boolean",
+            "description": "If True, the request that reports progress may be cancelled with a `cancel` request.\nSo this property basically controls whether the client should use UX that supports cancellation.\nClients that don't support cancellation are allowed to ignore the setting.",
         },
-        "memoryReference": {
-            "type": "string",
-            "description": "A memory reference to a location appropriate for this result.\nFor pointer type eval results, this is generally a reference to the memory address contained in the pointer.\nThis attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is True.",
+        "message": {"type": "string", "description": "More detailed progress message."},
+        "percentage": {
+            "type": "number",
+            "description": "Progress percentage to display (value range: 0 to 100). If omitted no percentage is shown.",
         },
     }
-    __refs__ = set(["presentationHint"])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
     def __init__(
-        self,
-        result,
-        variablesReference,
-        type=None,
-        presentationHint=None,
-        namedVariables=None,
-        indexedVariables=None,
-        memoryReference=None,
-        update_ids_from_dap=False,
-        **kwargs,
+        self, progressId, title, requestId=None, cancellable=None, message=None, percentage=None, update_ids_from_dap=False, **kwargs
     ):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string result: The result of the evaluate request.
-        :param integer variablesReference: If `variablesReference` is > 0, the evaluate result is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.
-        :param string type: The type of the evaluate result.
-        This attribute should only be returned by a debug adapter if the corresponding capability `supportsVariableType` is true.
-        :param VariablePresentationHint presentationHint: Properties of an evaluate result that can be used to determine how to render the result in the UI.
-        :param integer namedVariables: The number of named child variables.
-        The client can use this information to present the variables in a paged UI and fetch them in chunks.
-        The value should be less than or equal to 2147483647 (2^31-1).
-        :param integer indexedVariables: The number of indexed child variables.
-        The client can use this information to present the variables in a paged UI and fetch them in chunks.
-        The value should be less than or equal to 2147483647 (2^31-1).
-        :param string memoryReference: A memory reference to a location appropriate for this result.
-        For pointer type eval results, this is generally a reference to the memory address contained in the pointer.
-        This attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is true.
+        :param string progressId: An ID that can be used in subsequent `progressUpdate` and `progressEnd` events to make them refer to the same progress reporting.
+        IDs must be unique within a debug session.
+        :param string title: Short title of the progress reporting. Shown in the UI to describe the long running operation.
+        :param integer requestId: The request ID that this progress report is related to. If specified a debug adapter is expected to emit progress events for the long running request until the request has been either completed or cancelled.
+        If the request ID is omitted, the progress report is assumed to be related to some general activity of the debug adapter.
+        :param boolean cancellable: If true, the request that reports progress may be cancelled with a `cancel` request.
+        So this property basically controls whether the client should use UX that supports cancellation.
+        Clients that don't support cancellation are allowed to ignore the setting.
+        :param string message: More detailed progress message.
+        :param number percentage: Progress percentage to display (value range: 0 to 100). If omitted no percentage is shown.
         """
-        self.result = result
-        self.variablesReference = variablesReference
-        self.type = type
-        if presentationHint is None:
-            self.presentationHint = VariablePresentationHint()
-        else:
-            self.presentationHint = (
-                VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint)
-                if presentationHint.__class__ != VariablePresentationHint
-                else presentationHint
-            )
-        self.namedVariables = namedVariables
-        self.indexedVariables = indexedVariables
-        self.memoryReference = memoryReference
+        self.progressId = progressId
+        self.title = title
+        self.requestId = requestId
+        self.cancellable = cancellable
+        self.message = message
+        self.percentage = percentage
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        progressId = self.progressId
+        title = self.title
+        requestId = self.requestId
+        cancellable = self.cancellable
+        message = self.message
+        percentage = self.percentage
+        dct = {
+            "progressId": progressId,
+            "title": title,
+        }
+        if requestId is not None:
+            dct["requestId"] = requestId
+        if cancellable is not None:
+            dct["cancellable"] = cancellable
+        if message is not None:
+            dct["message"] = message
+        if percentage is not None:
+            dct["percentage"] = percentage
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ProgressUpdateEventBody(BaseSchema):
+    """
+    "body" of ProgressUpdateEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "progressId": {"type": "string", "description": "The ID that was introduced in the initial `progressStart` event."},
+        "message": {"type": "string", "description": "More detailed progress message. If omitted, the previous message (if any) is used."},
+        "percentage": {
+            "type": "number",
+            "description": "Progress percentage to display (value range: 0 to 100). If omitted no percentage is shown.",
+        },
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, progressId, message=None, percentage=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string progressId: The ID that was introduced in the initial `progressStart` event.
+        :param string message: More detailed progress message. If omitted, the previous message (if any) is used.
+        :param number percentage: Progress percentage to display (value range: 0 to 100). If omitted no percentage is shown.
+        """
+        self.progressId = progressId
+        self.message = message
+        self.percentage = percentage
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        progressId = self.progressId
+        message = self.message
+        percentage = self.percentage
+        dct = {
+            "progressId": progressId,
+        }
+        if message is not None:
+            dct["message"] = message
+        if percentage is not None:
+            dct["percentage"] = percentage
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ProgressEndEventBody(BaseSchema):
+    """
+    "body" of ProgressEndEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "progressId": {"type": "string", "description": "The ID that was introduced in the initial `ProgressStartEvent`."},
+        "message": {"type": "string", "description": "More detailed progress message. If omitted, the previous message (if any) is used."},
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, progressId, message=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string progressId: The ID that was introduced in the initial `ProgressStartEvent`.
+        :param string message: More detailed progress message. If omitted, the previous message (if any) is used.
+        """
+        self.progressId = progressId
+        self.message = message
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        progressId = self.progressId
+        message = self.message
+        dct = {
+            "progressId": progressId,
+        }
+        if message is not None:
+            dct["message"] = message
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class InvalidatedEventBody(BaseSchema):
+    """
+    "body" of InvalidatedEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "areas": {
+            "type": "array",
+            "description": "Set of logical areas that got invalidated. This property has a hint characteristic: a client can only be expected to make a 'best effort' in honoring the areas but there are no guarantees. If this property is missing, empty, or if values are not understood, the client should assume a single value `all`.",
+            "items": {"$ref": "#/definitions/InvalidatedAreas"},
+        },
+        "threadId": {"type": "integer", "description": "If specified, the client only needs to refetch data related to this thread."},
+        "stackFrameId": {
+            "type": "integer",
+            "description": "If specified, the client only needs to refetch data related to this stack frame (and the `threadId` is ignored).",
+        },
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, areas=None, threadId=None, stackFrameId=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array areas: Set of logical areas that got invalidated. This property has a hint characteristic: a client can only be expected to make a 'best effort' in honoring the areas but there are no guarantees. If this property is missing, empty, or if values are not understood, the client should assume a single value `all`.
+        :param integer threadId: If specified, the client only needs to refetch data related to this thread.
+        :param integer stackFrameId: If specified, the client only needs to refetch data related to this stack frame (and the `threadId` is ignored).
+        """
+        self.areas = areas
+        if update_ids_from_dap and self.areas:
+            for o in self.areas:
+                InvalidatedAreas.update_dict_ids_from_dap(o)
+        self.threadId = threadId
+        self.stackFrameId = stackFrameId
         if update_ids_from_dap:
-            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+            self.threadId = self._translate_id_from_dap(self.threadId)
         self.kwargs = kwargs
 
     @classmethod
     def update_dict_ids_from_dap(cls, dct):
-        if "variablesReference" in dct:
-            dct["variablesReference"] = cls._translate_id_from_dap(dct["variablesReference"])
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
         return dct
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        result = self.result
-        variablesReference = self.variablesReference
-        type = self.type  # noqa (assign to builtin)
-        presentationHint = self.presentationHint
-        namedVariables = self.namedVariables
-        indexedVariables = self.indexedVariables
-        memoryReference = self.memoryReference
+        areas = self.areas
+        if areas and hasattr(areas[0], "to_dict"):
+            areas = [x.to_dict() for x in areas]
+        threadId = self.threadId
+        stackFrameId = self.stackFrameId
         if update_ids_to_dap:
-            if variablesReference is not None:
-                variablesReference = self._translate_id_to_dap(variablesReference)
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
+        dct = {}
+        if areas is not None:
+            dct["areas"] = [InvalidatedAreas.update_dict_ids_to_dap(o) for o in areas] if (update_ids_to_dap and areas) else areas
+        if threadId is not None:
+            dct["threadId"] = threadId
+        if stackFrameId is not None:
+            dct["stackFrameId"] = stackFrameId
+        dct.update(self.kwargs)
+        return dct
+
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
+        return dct
+
+
+@register
+class MemoryEventBody(BaseSchema):
+    """
+    "body" of MemoryEvent
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "memoryReference": {"type": "string", "description": "Memory reference of a memory range that has been updated."},
+        "offset": {"type": "integer", "description": "Starting offset in bytes where memory has been updated. Can be negative."},
+        "count": {"type": "integer", "description": "Number of bytes updated."},
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, memoryReference, offset, count, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string memoryReference: Memory reference of a memory range that has been updated.
+        :param integer offset: Starting offset in bytes where memory has been updated. Can be negative.
+        :param integer count: Number of bytes updated.
+        """
+        self.memoryReference = memoryReference
+        self.offset = offset
+        self.count = count
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        memoryReference = self.memoryReference
+        offset = self.offset
+        count = self.count
         dct = {
-            "result": result,
-            "variablesReference": variablesReference,
+            "memoryReference": memoryReference,
+            "offset": offset,
+            "count": count,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class RunInTerminalRequestArgumentsEnv(BaseSchema):
+    """
+    "env" of RunInTerminalRequestArguments
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {}
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """ """
+
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        dct = {}
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class RunInTerminalResponseBody(BaseSchema):
+    """
+    "body" of RunInTerminalResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "processId": {"type": "integer", "description": "The process ID. The value should be less than or equal to 2147483647 (2^31-1)."},
+        "shellProcessId": {
+            "type": "integer",
+            "description": "The process ID of the terminal shell. The value should be less than or equal to 2147483647 (2^31-1).",
+        },
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, processId=None, shellProcessId=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer processId: The process ID. The value should be less than or equal to 2147483647 (2^31-1).
+        :param integer shellProcessId: The process ID of the terminal shell. The value should be less than or equal to 2147483647 (2^31-1).
+        """
+        self.processId = processId
+        self.shellProcessId = shellProcessId
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        processId = self.processId
+        shellProcessId = self.shellProcessId
+        dct = {}
+        if processId is not None:
+            dct["processId"] = processId
+        if shellProcessId is not None:
+            dct["shellProcessId"] = shellProcessId
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class StartDebuggingRequestArgumentsConfiguration(BaseSchema):
+    """
+    "configuration" of StartDebuggingRequestArguments
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {}
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """ """
+
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        dct = {}
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class BreakpointLocationsResponseBody(BaseSchema):
+    """
+    "body" of BreakpointLocationsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "breakpoints": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/BreakpointLocation"},
+            "description": "Sorted set of possible breakpoint locations.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array breakpoints: Sorted set of possible breakpoint locations.
+        """
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                BreakpointLocation.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
+        dct = {
+            "breakpoints": [BreakpointLocation.update_dict_ids_to_dap(o) for o in breakpoints]
+            if (update_ids_to_dap and breakpoints)
+            else breakpoints,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class SetBreakpointsResponseBody(BaseSchema):
+    """
+    "body" of SetBreakpointsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "breakpoints": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Breakpoint"},
+            "description": "Information about the breakpoints.\nThe array elements are in the same order as the elements of the `breakpoints` (or the deprecated `lines`) array in the arguments.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array breakpoints: Information about the breakpoints.
+        The array elements are in the same order as the elements of the `breakpoints` (or the deprecated `lines`) array in the arguments.
+        """
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                Breakpoint.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
+        dct = {
+            "breakpoints": [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints]
+            if (update_ids_to_dap and breakpoints)
+            else breakpoints,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class SetFunctionBreakpointsResponseBody(BaseSchema):
+    """
+    "body" of SetFunctionBreakpointsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "breakpoints": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Breakpoint"},
+            "description": "Information about the breakpoints. The array elements correspond to the elements of the `breakpoints` array.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array breakpoints: Information about the breakpoints. The array elements correspond to the elements of the `breakpoints` array.
+        """
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                Breakpoint.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
+        dct = {
+            "breakpoints": [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints]
+            if (update_ids_to_dap and breakpoints)
+            else breakpoints,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class SetExceptionBreakpointsResponseBody(BaseSchema):
+    """
+    "body" of SetExceptionBreakpointsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "breakpoints": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Breakpoint"},
+            "description": "Information about the exception breakpoints or filters.\nThe breakpoints returned are in the same order as the elements of the `filters`, `filterOptions`, `exceptionOptions` arrays in the arguments. If both `filters` and `filterOptions` are given, the returned array must start with `filters` information first, followed by `filterOptions` information.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, breakpoints=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array breakpoints: Information about the exception breakpoints or filters.
+        The breakpoints returned are in the same order as the elements of the `filters`, `filterOptions`, `exceptionOptions` arrays in the arguments. If both `filters` and `filterOptions` are given, the returned array must start with `filters` information first, followed by `filterOptions` information.
+        """
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                Breakpoint.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
+        dct = {}
+        if breakpoints is not None:
+            dct["breakpoints"] = (
+                [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints] if (update_ids_to_dap and breakpoints) else breakpoints
+            )
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class DataBreakpointInfoResponseBody(BaseSchema):
+    """
+    "body" of DataBreakpointInfoResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "dataId": {
+            "type": ["string", "null"],
+            "description": "An identifier for the data on which a data breakpoint can be registered with the `setDataBreakpoints` request or null if no data breakpoint is available. If a `variablesReference` or `frameId` is passed, the `dataId` is valid in the current suspended state, otherwise it's valid indefinitely. See 'Lifetime of Object References' in the Overview section for details. Breakpoints set using the `dataId` in the `setDataBreakpoints` request may outlive the lifetime of the associated `dataId`.",
+        },
+        "description": {
+            "type": "string",
+            "description": "UI string that describes on what data the breakpoint is set on or why a data breakpoint is not available.",
+        },
+        "accessTypes": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/DataBreakpointAccessType"},
+            "description": "Attribute lists the available access types for a potential data breakpoint. A UI client could surface this information.",
+        },
+        "canPersist": {
+            "type": "boolean",
+            "description": "Attribute indicates that a potential data breakpoint could be persisted across sessions.",
+        },
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, dataId, description, accessTypes=None, canPersist=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param ['string', 'null'] dataId: An identifier for the data on which a data breakpoint can be registered with the `setDataBreakpoints` request or null if no data breakpoint is available. If a `variablesReference` or `frameId` is passed, the `dataId` is valid in the current suspended state, otherwise it's valid indefinitely. See 'Lifetime of Object References' in the Overview section for details. Breakpoints set using the `dataId` in the `setDataBreakpoints` request may outlive the lifetime of the associated `dataId`.
+        :param string description: UI string that describes on what data the breakpoint is set on or why a data breakpoint is not available.
+        :param array accessTypes: Attribute lists the available access types for a potential data breakpoint. A UI client could surface this information.
+        :param boolean canPersist: Attribute indicates that a potential data breakpoint could be persisted across sessions.
+        """
+        self.dataId = dataId
+        self.description = description
+        self.accessTypes = accessTypes
+        if update_ids_from_dap and self.accessTypes:
+            for o in self.accessTypes:
+                DataBreakpointAccessType.update_dict_ids_from_dap(o)
+        self.canPersist = canPersist
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        dataId = self.dataId
+        description = self.description
+        accessTypes = self.accessTypes
+        if accessTypes and hasattr(accessTypes[0], "to_dict"):
+            accessTypes = [x.to_dict() for x in accessTypes]
+        canPersist = self.canPersist
+        dct = {
+            "dataId": dataId,
+            "description": description,
+        }
+        if accessTypes is not None:
+            dct["accessTypes"] = (
+                [DataBreakpointAccessType.update_dict_ids_to_dap(o) for o in accessTypes]
+                if (update_ids_to_dap and accessTypes)
+                else accessTypes
+            )
+        if canPersist is not None:
+            dct["canPersist"] = canPersist
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class SetDataBreakpointsResponseBody(BaseSchema):
+    """
+    "body" of SetDataBreakpointsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "breakpoints": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Breakpoint"},
+            "description": "Information about the data breakpoints. The array elements correspond to the elements of the input argument `breakpoints` array.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array breakpoints: Information about the data breakpoints. The array elements correspond to the elements of the input argument `breakpoints` array.
+        """
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                Breakpoint.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
+        dct = {
+            "breakpoints": [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints]
+            if (update_ids_to_dap and breakpoints)
+            else breakpoints,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class SetInstructionBreakpointsResponseBody(BaseSchema):
+    """
+    "body" of SetInstructionBreakpointsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "breakpoints": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Breakpoint"},
+            "description": "Information about the breakpoints. The array elements correspond to the elements of the `breakpoints` array.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, breakpoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array breakpoints: Information about the breakpoints. The array elements correspond to the elements of the `breakpoints` array.
+        """
+        self.breakpoints = breakpoints
+        if update_ids_from_dap and self.breakpoints:
+            for o in self.breakpoints:
+                Breakpoint.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        breakpoints = self.breakpoints
+        if breakpoints and hasattr(breakpoints[0], "to_dict"):
+            breakpoints = [x.to_dict() for x in breakpoints]
+        dct = {
+            "breakpoints": [Breakpoint.update_dict_ids_to_dap(o) for o in breakpoints]
+            if (update_ids_to_dap and breakpoints)
+            else breakpoints,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ContinueResponseBody(BaseSchema):
+    """
+    "body" of ContinueResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "allThreadsContinued": {
+            "type": "boolean",
+            "description": "The value True (or a missing property) signals to the client that all threads have been resumed. The value false indicates that not all threads were resumed.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, allThreadsContinued=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param boolean allThreadsContinued: The value true (or a missing property) signals to the client that all threads have been resumed. The value false indicates that not all threads were resumed.
+        """
+        self.allThreadsContinued = allThreadsContinued
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        allThreadsContinued = self.allThreadsContinued
+        dct = {}
+        if allThreadsContinued is not None:
+            dct["allThreadsContinued"] = allThreadsContinued
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class StackTraceResponseBody(BaseSchema):
+    """
+    "body" of StackTraceResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "stackFrames": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/StackFrame"},
+            "description": "The frames of the stack frame. If the array has length zero, there are no stack frames available.\nThis means that there is no location information available.",
+        },
+        "totalFrames": {
+            "type": "integer",
+            "description": "The total number of frames available in the stack. If omitted or if `totalFrames` is larger than the available frames, a client is expected to request frames until a request returns less frames than requested (which indicates the end of the stack). Returning monotonically increasing `totalFrames` values for subsequent requests can be used to enforce paging in the client.",
+        },
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, stackFrames, totalFrames=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array stackFrames: The frames of the stack frame. If the array has length zero, there are no stack frames available.
+        This means that there is no location information available.
+        :param integer totalFrames: The total number of frames available in the stack. If omitted or if `totalFrames` is larger than the available frames, a client is expected to request frames until a request returns less frames than requested (which indicates the end of the stack). Returning monotonically increasing `totalFrames` values for subsequent requests can be used to enforce paging in the client.
+        """
+        self.stackFrames = stackFrames
+        if update_ids_from_dap and self.stackFrames:
+            for o in self.stackFrames:
+                StackFrame.update_dict_ids_from_dap(o)
+        self.totalFrames = totalFrames
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        stackFrames = self.stackFrames
+        if stackFrames and hasattr(stackFrames[0], "to_dict"):
+            stackFrames = [x.to_dict() for x in stackFrames]
+        totalFrames = self.totalFrames
+        dct = {
+            "stackFrames": [StackFrame.update_dict_ids_to_dap(o) for o in stackFrames]
+            if (update_ids_to_dap and stackFrames)
+            else stackFrames,
+        }
+        if totalFrames is not None:
+            dct["totalFrames"] = totalFrames
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ScopesResponseBody(BaseSchema):
+    """
+    "body" of ScopesResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "scopes": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Scope"},
+            "description": "The scopes of the stack frame. If the array has length zero, there are no scopes available.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, scopes, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array scopes: The scopes of the stack frame. If the array has length zero, there are no scopes available.
+        """
+        self.scopes = scopes
+        if update_ids_from_dap and self.scopes:
+            for o in self.scopes:
+                Scope.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        scopes = self.scopes
+        if scopes and hasattr(scopes[0], "to_dict"):
+            scopes = [x.to_dict() for x in scopes]
+        dct = {
+            "scopes": [Scope.update_dict_ids_to_dap(o) for o in scopes] if (update_ids_to_dap and scopes) else scopes,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class VariablesResponseBody(BaseSchema):
+    """
+    "body" of VariablesResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "variables": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Variable"},
+            "description": "All (or a range) of variables for the given variable reference.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, variables, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array variables: All (or a range) of variables for the given variable reference.
+        """
+        self.variables = variables
+        if update_ids_from_dap and self.variables:
+            for o in self.variables:
+                Variable.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        variables = self.variables
+        if variables and hasattr(variables[0], "to_dict"):
+            variables = [x.to_dict() for x in variables]
+        dct = {
+            "variables": [Variable.update_dict_ids_to_dap(o) for o in variables] if (update_ids_to_dap and variables) else variables,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class SetVariableResponseBody(BaseSchema):
+    """
+    "body" of SetVariableResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "value": {"type": "string", "description": "The new value of the variable."},
+        "type": {"type": "string", "description": "The type of the new value. Typically shown in the UI when hovering over the value."},
+        "variablesReference": {
+            "type": "integer",
+            "description": "If `variablesReference` is > 0, the new value is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.",
+        },
+        "namedVariables": {
+            "type": "integer",
+            "description": "The number of named child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+        },
+        "indexedVariables": {
+            "type": "integer",
+            "description": "The number of indexed child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+        },
+        "memoryReference": {
+            "type": "string",
+            "description": "A memory reference to a location appropriate for this result.\nFor pointer type eval results, this is generally a reference to the memory address contained in the pointer.\nThis attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is True.",
+        },
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(
+        self,
+        value,
+        type=None,
+        variablesReference=None,
+        namedVariables=None,
+        indexedVariables=None,
+        memoryReference=None,
+        update_ids_from_dap=False,
+        **kwargs,
+    ):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string value: The new value of the variable.
+        :param string type: The type of the new value. Typically shown in the UI when hovering over the value.
+        :param integer variablesReference: If `variablesReference` is > 0, the new value is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.
+        :param integer namedVariables: The number of named child variables.
+        The client can use this information to present the variables in a paged UI and fetch them in chunks.
+        The value should be less than or equal to 2147483647 (2^31-1).
+        :param integer indexedVariables: The number of indexed child variables.
+        The client can use this information to present the variables in a paged UI and fetch them in chunks.
+        The value should be less than or equal to 2147483647 (2^31-1).
+        :param string memoryReference: A memory reference to a location appropriate for this result.
+        For pointer type eval results, this is generally a reference to the memory address contained in the pointer.
+        This attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is true.
+        """
+        self.value = value
+        self.type = type
+        self.variablesReference = variablesReference
+        self.namedVariables = namedVariables
+        self.indexedVariables = indexedVariables
+        self.memoryReference = memoryReference
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+        self.kwargs = kwargs
+
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "variablesReference" in dct:
+            dct["variablesReference"] = cls._translate_id_from_dap(dct["variablesReference"])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        value = self.value
+        type = self.type  # noqa (assign to builtin)
+        variablesReference = self.variablesReference
+        namedVariables = self.namedVariables
+        indexedVariables = self.indexedVariables
+        memoryReference = self.memoryReference
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
+        dct = {
+            "value": value,
+        }
+        if type is not None:
+            dct["type"] = type
+        if variablesReference is not None:
+            dct["variablesReference"] = variablesReference
+        if namedVariables is not None:
+            dct["namedVariables"] = namedVariables
+        if indexedVariables is not None:
+            dct["indexedVariables"] = indexedVariables
+        if memoryReference is not None:
+            dct["memoryReference"] = memoryReference
+        dct.update(self.kwargs)
+        return dct
+
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "variablesReference" in dct:
+            dct["variablesReference"] = cls._translate_id_to_dap(dct["variablesReference"])
+        return dct
+
+
+@register
+class SourceResponseBody(BaseSchema):
+    """
+    "body" of SourceResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "content": {"type": "string", "description": "Content of the source reference."},
+        "mimeType": {"type": "string", "description": "Content type (MIME type) of the source."},
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, content, mimeType=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string content: Content of the source reference.
+        :param string mimeType: Content type (MIME type) of the source.
+        """
+        self.content = content
+        self.mimeType = mimeType
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        content = self.content
+        mimeType = self.mimeType
+        dct = {
+            "content": content,
+        }
+        if mimeType is not None:
+            dct["mimeType"] = mimeType
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ThreadsResponseBody(BaseSchema):
+    """
+    "body" of ThreadsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {"threads": {"type": "array", "items": {"$ref": "#/definitions/Thread"}, "description": "All threads."}}
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, threads, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array threads: All threads.
+        """
+        self.threads = threads
+        if update_ids_from_dap and self.threads:
+            for o in self.threads:
+                Thread.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        threads = self.threads
+        if threads and hasattr(threads[0], "to_dict"):
+            threads = [x.to_dict() for x in threads]
+        dct = {
+            "threads": [Thread.update_dict_ids_to_dap(o) for o in threads] if (update_ids_to_dap and threads) else threads,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ModulesResponseBody(BaseSchema):
+    """
+    "body" of ModulesResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "modules": {"type": "array", "items": {"$ref": "#/definitions/Module"}, "description": "All modules or range of modules."},
+        "totalModules": {"type": "integer", "description": "The total number of modules available."},
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, modules, totalModules=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array modules: All modules or range of modules.
+        :param integer totalModules: The total number of modules available.
+        """
+        self.modules = modules
+        if update_ids_from_dap and self.modules:
+            for o in self.modules:
+                Module.update_dict_ids_from_dap(o)
+        self.totalModules = totalModules
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        modules = self.modules
+        if modules and hasattr(modules[0], "to_dict"):
+            modules = [x.to_dict() for x in modules]
+        totalModules = self.totalModules
+        dct = {
+            "modules": [Module.update_dict_ids_to_dap(o) for o in modules] if (update_ids_to_dap and modules) else modules,
+        }
+        if totalModules is not None:
+            dct["totalModules"] = totalModules
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class LoadedSourcesResponseBody(BaseSchema):
+    """
+    "body" of LoadedSourcesResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {"sources": {"type": "array", "items": {"$ref": "#/definitions/Source"}, "description": "Set of loaded sources."}}
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, sources, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array sources: Set of loaded sources.
+        """
+        self.sources = sources
+        if update_ids_from_dap and self.sources:
+            for o in self.sources:
+                Source.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        sources = self.sources
+        if sources and hasattr(sources[0], "to_dict"):
+            sources = [x.to_dict() for x in sources]
+        dct = {
+            "sources": [Source.update_dict_ids_to_dap(o) for o in sources] if (update_ids_to_dap and sources) else sources,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class EvaluateResponseBody(BaseSchema):
+    """
+    "body" of EvaluateResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "result": {"type": "string", "description": "The result of the evaluate request."},
+        "type": {
+            "type": "string",
+            "description": "The type of the evaluate result.\nThis attribute should only be returned by a debug adapter if the corresponding capability `supportsVariableType` is True.",
+        },
+        "presentationHint": {
+            "description": "Properties of an evaluate result that can be used to determine how to render the result in the UI.",
+            "type": "VariablePresentationHint",
+        },
+        "variablesReference": {
+            "type": "integer",
+            "description": "If `variablesReference` is > 0, the evaluate result is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.",
+        },
+        "namedVariables": {
+            "type": "integer",
+            "description": "The number of named child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+        },
+        "indexedVariables": {
+            "type": "integer",
+            "description": "The number of indexed child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+        },
+        "memoryReference": {
+            "type": "string",
+            "description": "A memory reference to a location appropriate for this result.\nFor pointer type eval results, this is generally a reference to the memory address contained in the pointer.\nThis attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is True.",
+        },
+    }
+    __refs__ = set(["presentationHint"])
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(
+        self,
+        result,
+        variablesReference,
+        type=None,
+        presentationHint=None,
+        namedVariables=None,
+        indexedVariables=None,
+        memoryReference=None,
+        update_ids_from_dap=False,
+        **kwargs,
+    ):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string result: The result of the evaluate request.
+        :param integer variablesReference: If `variablesReference` is > 0, the evaluate result is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.
+        :param string type: The type of the evaluate result.
+        This attribute should only be returned by a debug adapter if the corresponding capability `supportsVariableType` is true.
+        :param VariablePresentationHint presentationHint: Properties of an evaluate result that can be used to determine how to render the result in the UI.
+        :param integer namedVariables: The number of named child variables.
+        The client can use this information to present the variables in a paged UI and fetch them in chunks.
+        The value should be less than or equal to 2147483647 (2^31-1).
+        :param integer indexedVariables: The number of indexed child variables.
+        The client can use this information to present the variables in a paged UI and fetch them in chunks.
+        The value should be less than or equal to 2147483647 (2^31-1).
+        :param string memoryReference: A memory reference to a location appropriate for this result.
+        For pointer type eval results, this is generally a reference to the memory address contained in the pointer.
+        This attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is true.
+        """
+        self.result = result
+        self.variablesReference = variablesReference
+        self.type = type
+        if presentationHint is None:
+            self.presentationHint = VariablePresentationHint()
+        else:
+            self.presentationHint = (
+                VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint)
+                if presentationHint.__class__ != VariablePresentationHint
+                else presentationHint
+            )
+        self.namedVariables = namedVariables
+        self.indexedVariables = indexedVariables
+        self.memoryReference = memoryReference
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+        self.kwargs = kwargs
+
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "variablesReference" in dct:
+            dct["variablesReference"] = cls._translate_id_from_dap(dct["variablesReference"])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        result = self.result
+        variablesReference = self.variablesReference
+        type = self.type  # noqa (assign to builtin)
+        presentationHint = self.presentationHint
+        namedVariables = self.namedVariables
+        indexedVariables = self.indexedVariables
+        memoryReference = self.memoryReference
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
+        dct = {
+            "result": result,
+            "variablesReference": variablesReference,
+        }
+        if type is not None:
+            dct["type"] = type
+        if presentationHint is not None:
+            dct["presentationHint"] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
+        if namedVariables is not None:
+            dct["namedVariables"] = namedVariables
+        if indexedVariables is not None:
+            dct["indexedVariables"] = indexedVariables
+        if memoryReference is not None:
+            dct["memoryReference"] = memoryReference
+        dct.update(self.kwargs)
+        return dct
+
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "variablesReference" in dct:
+            dct["variablesReference"] = cls._translate_id_to_dap(dct["variablesReference"])
+        return dct
+
+
+@register
+class SetExpressionResponseBody(BaseSchema):
+    """
+    "body" of SetExpressionResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "value": {"type": "string", "description": "The new value of the expression."},
+        "type": {
+            "type": "string",
+            "description": "The type of the value.\nThis attribute should only be returned by a debug adapter if the corresponding capability `supportsVariableType` is True.",
+        },
+        "presentationHint": {
+            "description": "Properties of a value that can be used to determine how to render the result in the UI.",
+            "type": "VariablePresentationHint",
+        },
+        "variablesReference": {
+            "type": "integer",
+            "description": "If `variablesReference` is > 0, the evaluate result is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.",
+        },
+        "namedVariables": {
+            "type": "integer",
+            "description": "The number of named child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+        },
+        "indexedVariables": {
+            "type": "integer",
+            "description": "The number of indexed child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
+        },
+        "memoryReference": {
+            "type": "string",
+            "description": "A memory reference to a location appropriate for this result.\nFor pointer type eval results, this is generally a reference to the memory address contained in the pointer.\nThis attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is True.",
+        },
+    }
+    __refs__ = set(["presentationHint"])
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(
+        self,
+        value,
+        type=None,
+        presentationHint=None,
+        variablesReference=None,
+        namedVariables=None,
+        indexedVariables=None,
+        memoryReference=None,
+        update_ids_from_dap=False,
+        **kwargs,
+    ):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string value: The new value of the expression.
+        :param string type: The type of the value.
+        This attribute should only be returned by a debug adapter if the corresponding capability `supportsVariableType` is true.
+        :param VariablePresentationHint presentationHint: Properties of a value that can be used to determine how to render the result in the UI.
+        :param integer variablesReference: If `variablesReference` is > 0, the evaluate result is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.
+        :param integer namedVariables: The number of named child variables.
+        The client can use this information to present the variables in a paged UI and fetch them in chunks.
+        The value should be less than or equal to 2147483647 (2^31-1).
+        :param integer indexedVariables: The number of indexed child variables.
+        The client can use this information to present the variables in a paged UI and fetch them in chunks.
+        The value should be less than or equal to 2147483647 (2^31-1).
+        :param string memoryReference: A memory reference to a location appropriate for this result.
+        For pointer type eval results, this is generally a reference to the memory address contained in the pointer.
+        This attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is true.
+        """
+        self.value = value
+        self.type = type
+        if presentationHint is None:
+            self.presentationHint = VariablePresentationHint()
+        else:
+            self.presentationHint = (
+                VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint)
+                if presentationHint.__class__ != VariablePresentationHint
+                else presentationHint
+            )
+        self.variablesReference = variablesReference
+        self.namedVariables = namedVariables
+        self.indexedVariables = indexedVariables
+        self.memoryReference = memoryReference
+        if update_ids_from_dap:
+            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
+        self.kwargs = kwargs
+
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "variablesReference" in dct:
+            dct["variablesReference"] = cls._translate_id_from_dap(dct["variablesReference"])
+        return dct
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        value = self.value
+        type = self.type  # noqa (assign to builtin)
+        presentationHint = self.presentationHint
+        variablesReference = self.variablesReference
+        namedVariables = self.namedVariables
+        indexedVariables = self.indexedVariables
+        memoryReference = self.memoryReference
+        if update_ids_to_dap:
+            if variablesReference is not None:
+                variablesReference = self._translate_id_to_dap(variablesReference)
+        dct = {
+            "value": value,
+        }
+        if type is not None:
+            dct["type"] = type
+        if presentationHint is not None:
+            dct["presentationHint"] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
+        if variablesReference is not None:
+            dct["variablesReference"] = variablesReference
+        if namedVariables is not None:
+            dct["namedVariables"] = namedVariables
+        if indexedVariables is not None:
+            dct["indexedVariables"] = indexedVariables
+        if memoryReference is not None:
+            dct["memoryReference"] = memoryReference
+        dct.update(self.kwargs)
+        return dct
+
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "variablesReference" in dct:
+            dct["variablesReference"] = cls._translate_id_to_dap(dct["variablesReference"])
+        return dct
+
+
+@register
+class StepInTargetsResponseBody(BaseSchema):
+    """
+    "body" of StepInTargetsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "targets": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/StepInTarget"},
+            "description": "The possible step-in targets of the specified source location.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array targets: The possible step-in targets of the specified source location.
+        """
+        self.targets = targets
+        if update_ids_from_dap and self.targets:
+            for o in self.targets:
+                StepInTarget.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        targets = self.targets
+        if targets and hasattr(targets[0], "to_dict"):
+            targets = [x.to_dict() for x in targets]
+        dct = {
+            "targets": [StepInTarget.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class GotoTargetsResponseBody(BaseSchema):
+    """
+    "body" of GotoTargetsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "targets": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/GotoTarget"},
+            "description": "The possible goto targets of the specified location.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array targets: The possible goto targets of the specified location.
+        """
+        self.targets = targets
+        if update_ids_from_dap and self.targets:
+            for o in self.targets:
+                GotoTarget.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        targets = self.targets
+        if targets and hasattr(targets[0], "to_dict"):
+            targets = [x.to_dict() for x in targets]
+        dct = {
+            "targets": [GotoTarget.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class CompletionsResponseBody(BaseSchema):
+    """
+    "body" of CompletionsResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "targets": {"type": "array", "items": {"$ref": "#/definitions/CompletionItem"}, "description": "The possible completions for ."}
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array targets: The possible completions for .
+        """
+        self.targets = targets
+        if update_ids_from_dap and self.targets:
+            for o in self.targets:
+                CompletionItem.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        targets = self.targets
+        if targets and hasattr(targets[0], "to_dict"):
+            targets = [x.to_dict() for x in targets]
+        dct = {
+            "targets": [CompletionItem.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+        }
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ExceptionInfoResponseBody(BaseSchema):
+    """
+    "body" of ExceptionInfoResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "exceptionId": {"type": "string", "description": "ID of the exception that was thrown."},
+        "description": {"type": "string", "description": "Descriptive text for the exception."},
+        "breakMode": {"description": "Mode that caused the exception notification to be raised.", "type": "ExceptionBreakMode"},
+        "details": {"description": "Detailed information about the exception.", "type": "ExceptionDetails"},
+    }
+    __refs__ = set(["breakMode", "details"])
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, exceptionId, breakMode, description=None, details=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string exceptionId: ID of the exception that was thrown.
+        :param ExceptionBreakMode breakMode: Mode that caused the exception notification to be raised.
+        :param string description: Descriptive text for the exception.
+        :param ExceptionDetails details: Detailed information about the exception.
+        """
+        self.exceptionId = exceptionId
+        if breakMode is not None:
+            assert breakMode in ExceptionBreakMode.VALID_VALUES
+        self.breakMode = breakMode
+        self.description = description
+        if details is None:
+            self.details = ExceptionDetails()
+        else:
+            self.details = (
+                ExceptionDetails(update_ids_from_dap=update_ids_from_dap, **details) if details.__class__ != ExceptionDetails else details
+            )
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        exceptionId = self.exceptionId
+        breakMode = self.breakMode
+        description = self.description
+        details = self.details
+        dct = {
+            "exceptionId": exceptionId,
+            "breakMode": breakMode,
+        }
+        if description is not None:
+            dct["description"] = description
+        if details is not None:
+            dct["details"] = details.to_dict(update_ids_to_dap=update_ids_to_dap)
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class ReadMemoryResponseBody(BaseSchema):
+    """
+    "body" of ReadMemoryResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "address": {
+            "type": "string",
+            "description": "The address of the first byte of data returned.\nTreated as a hex value if prefixed with `0x`, or as a decimal value otherwise.",
+        },
+        "unreadableBytes": {
+            "type": "integer",
+            "description": "The number of unreadable bytes encountered after the last successfully read byte.\nThis can be used to determine the number of bytes that should be skipped before a subsequent `readMemory` request succeeds.",
+        },
+        "data": {
+            "type": "string",
+            "description": "The bytes read from memory, encoded using base64. If the decoded length of `data` is less than the requested `count` in the original `readMemory` request, and `unreadableBytes` is zero or omitted, then the client should assume it's reached the end of readable memory.",
+        },
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, address, unreadableBytes=None, data=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param string address: The address of the first byte of data returned.
+        Treated as a hex value if prefixed with `0x`, or as a decimal value otherwise.
+        :param integer unreadableBytes: The number of unreadable bytes encountered after the last successfully read byte.
+        This can be used to determine the number of bytes that should be skipped before a subsequent `readMemory` request succeeds.
+        :param string data: The bytes read from memory, encoded using base64. If the decoded length of `data` is less than the requested `count` in the original `readMemory` request, and `unreadableBytes` is zero or omitted, then the client should assume it's reached the end of readable memory.
+        """
+        self.address = address
+        self.unreadableBytes = unreadableBytes
+        self.data = data
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        address = self.address
+        unreadableBytes = self.unreadableBytes
+        data = self.data
+        dct = {
+            "address": address,
+        }
+        if unreadableBytes is not None:
+            dct["unreadableBytes"] = unreadableBytes
+        if data is not None:
+            dct["data"] = data
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class WriteMemoryResponseBody(BaseSchema):
+    """
+    "body" of WriteMemoryResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "offset": {
+            "type": "integer",
+            "description": "Property that should be returned when `allowPartial` is True to indicate the offset of the first byte of data successfully written. Can be negative.",
+        },
+        "bytesWritten": {
+            "type": "integer",
+            "description": "Property that should be returned when `allowPartial` is True to indicate the number of bytes starting from address that were successfully written.",
+        },
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, offset=None, bytesWritten=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param integer offset: Property that should be returned when `allowPartial` is true to indicate the offset of the first byte of data successfully written. Can be negative.
+        :param integer bytesWritten: Property that should be returned when `allowPartial` is true to indicate the number of bytes starting from address that were successfully written.
+        """
+        self.offset = offset
+        self.bytesWritten = bytesWritten
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        offset = self.offset
+        bytesWritten = self.bytesWritten
+        dct = {}
+        if offset is not None:
+            dct["offset"] = offset
+        if bytesWritten is not None:
+            dct["bytesWritten"] = bytesWritten
+        dct.update(self.kwargs)
+        return dct
+
+
+@register
+class DisassembleResponseBody(BaseSchema):
+    """
+    "body" of DisassembleResponse
+
+    Note: automatically generated code. Do not edit manually.
+    """
+
+    __props__ = {
+        "instructions": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/DisassembledInstruction"},
+            "description": "The list of disassembled instructions.",
+        }
+    }
+    __refs__ = set()
+
+    __slots__ = list(__props__.keys()) + ["kwargs"]
+
+    def __init__(self, instructions, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array instructions: The list of disassembled instructions.
+        """
+        self.instructions = instructions
+        if update_ids_from_dap and self.instructions:
+            for o in self.instructions:
+                DisassembledInstruction.update_dict_ids_from_dap(o)
+        self.kwargs = kwargs
+
+    def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
+        instructions = self.instructions
+        if instructions and hasattr(instructions[0], "to_dict"):
+            instructions = [x.to_dict() for x in instructions]
+        dct = {
+            "instructions": [DisassembledInstruction.update_dict_ids_to_dap(o) for o in instructions]
+            if (update_ids_to_dap and instructions)
+            else instructions,
         }
-        if type is not None:
-            dct["type"] = type
-        if presentationHint is not None:
-            dct["presentationHint"] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
-        if namedVariables is not None:
-            dct["namedVariables"] = namedVariables
-        if indexedVariables is not None:
-            dct["indexedVariables"] = indexedVariables
-        if memoryReference is not None:
-            dct["memoryReference"] = memoryReference
         dct.update(self.kwargs)
         return dct
 
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if "variablesReference" in dct:
-            dct["variablesReference"] = cls._translate_id_to_dap(dct["variablesReference"])
-        return dct
-
 
 @register
-class SetExpressionResponseBody(BaseSchema):
+class MessageVariables(BaseSchema):
     """
-    "body" of SetExpressionResponse
+    "variables" of Message
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {
-        "value": {"type": "string", "description": "The new value of the expression."},
-        "type": {
-            "type": "string",
-            "description": "The type of the value.\nThis attribute should only be returned by a debug adapter if the corresponding capability `supportsVariableType` is True.",
-        },
-        "presentationHint": {
-            "description": "Properties of a value that can be used to determine how to render the result in the UI.",
-            "type": "VariablePresentationHint",
-        },
-        "variablesReference": {
-            "type": "integer",
-            "description": "If `variablesReference` is > 0, the evaluate result is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.",
-        },
-        "namedVariables": {
-            "type": "integer",
-            "description": "The number of named child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
-        },
-        "indexedVariables": {
-            "type": "integer",
-            "description": "The number of indexed child variables.\nThe client can use this information to present the variables in a paged UI and fetch them in chunks.\nThe value should be less than or equal to 2147483647 (2^31-1).",
-        },
-        "memoryReference": {
-            "type": "string",
-            "description": "A memory reference to a location appropriate for this result.\nFor pointer type eval results, this is generally a reference to the memory address contained in the pointer.\nThis attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is True.",
-        },
-    }
-    __refs__ = set(["presentationHint"])
+    __props__ = {}
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(
-        self,
-        value,
-        type=None,
-        presentationHint=None,
-        variablesReference=None,
-        namedVariables=None,
-        indexedVariables=None,
-        memoryReference=None,
-        update_ids_from_dap=False,
-        **kwargs,
-    ):  # noqa (update_ids_from_dap may be unused)
-        """
-        :param string value: The new value of the expression.
-        :param string type: The type of the value.
-        This attribute should only be returned by a debug adapter if the corresponding capability `supportsVariableType` is true.
-        :param VariablePresentationHint presentationHint: Properties of a value that can be used to determine how to render the result in the UI.
-        :param integer variablesReference: If `variablesReference` is > 0, the evaluate result is structured and its children can be retrieved by passing `variablesReference` to the `variables` request as long as execution remains suspended. See 'Lifetime of Object References' in the Overview section for details.
-        :param integer namedVariables: The number of named child variables.
-        The client can use this information to present the variables in a paged UI and fetch them in chunks.
-        The value should be less than or equal to 2147483647 (2^31-1).
-        :param integer indexedVariables: The number of indexed child variables.
-        The client can use this information to present the variables in a paged UI and fetch them in chunks.
-        The value should be less than or equal to 2147483647 (2^31-1).
-        :param string memoryReference: A memory reference to a location appropriate for this result.
-        For pointer type eval results, this is generally a reference to the memory address contained in the pointer.
-        This attribute may be returned by a debug adapter if corresponding capability `supportsMemoryReferences` is true.
-        """
-        self.value = value
-        self.type = type
-        if presentationHint is None:
-            self.presentationHint = VariablePresentationHint()
-        else:
-            self.presentationHint = (
-                VariablePresentationHint(update_ids_from_dap=update_ids_from_dap, **presentationHint)
-                if presentationHint.__class__ != VariablePresentationHint
-                else presentationHint
-            )
-        self.variablesReference = variablesReference
-        self.namedVariables = namedVariables
-        self.indexedVariables = indexedVariables
-        self.memoryReference = memoryReference
-        if update_ids_from_dap:
-            self.variablesReference = self._translate_id_from_dap(self.variablesReference)
-        self.kwargs = kwargs
+    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """ """
 
-    @classmethod
-    def update_dict_ids_from_dap(cls, dct):
-        if "variablesReference" in dct:
-            dct["variablesReference"] = cls._translate_id_from_dap(dct["variablesReference"])
-        return dct
+        self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        value = self.value
-        type = self.type  # noqa (assign to builtin)
-        presentationHint = self.presentationHint
-        variablesReference = self.variablesReference
-        namedVariables = self.namedVariables
-        indexedVariables = self.indexedVariables
-        memoryReference = self.memoryReference
-        if update_ids_to_dap:
-            if variablesReference is not None:
-                variablesReference = self._translate_id_to_dap(variablesReference)
-        dct = {
-            "value": value,
-        }
-        if type is not None:
-            dct["type"] = type
-        if presentationHint is not None:
-            dct["presentationHint"] = presentationHint.to_dict(update_ids_to_dap=update_ids_to_dap)
-        if variablesReference is not None:
-            dct["variablesReference"] = variablesReference
-        if namedVariables is not None:
-            dct["namedVariables"] = namedVariables
-        if indexedVariables is not None:
-            dct["indexedVariables"] = indexedVariables
-        if memoryReference is not None:
-            dct["memoryReference"] = memoryReference
+        dct = {}
         dct.update(self.kwargs)
         return dct
 
-    @classmethod
-    def update_dict_ids_to_dap(cls, dct):
-        if "variablesReference" in dct:
-            dct["variablesReference"] = cls._translate_id_to_dap(dct["variablesReference"])
-        return dct
-
 
 @register
-class StepInTargetsResponseBody(BaseSchema):
+class PydevdSystemInfoResponseBody(BaseSchema):
     """
-    "body" of StepInTargetsResponse
+    "body" of PydevdSystemInfoResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "targets": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/StepInTarget"},
-            "description": "The possible step-in targets of the specified source location.",
-        }
+        "python": {"description": "Information about the python version running in the current process.", "type": "PydevdPythonInfo"},
+        "platform": {
+            "description": "Information about the plarforn on which the current process is running.",
+            "type": "PydevdPlatformInfo",
+        },
+        "process": {"description": "Information about the current process.", "type": "PydevdProcessInfo"},
+        "pydevd": {"description": "Information about pydevd.", "type": "PydevdInfo"},
     }
-    __refs__ = set()
+    __refs__ = set(["python", "platform", "process", "pydevd"])
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, python, platform, process, pydevd, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array targets: The possible step-in targets of the specified source location.
+        :param PydevdPythonInfo python: Information about the python version running in the current process.
+        :param PydevdPlatformInfo platform: Information about the plarforn on which the current process is running.
+        :param PydevdProcessInfo process: Information about the current process.
+        :param PydevdInfo pydevd: Information about pydevd.
         """
-        self.targets = targets
-        if update_ids_from_dap and self.targets:
-            for o in self.targets:
-                StepInTarget.update_dict_ids_from_dap(o)
+        if python is None:
+            self.python = PydevdPythonInfo()
+        else:
+            self.python = (
+                PydevdPythonInfo(update_ids_from_dap=update_ids_from_dap, **python) if python.__class__ != PydevdPythonInfo else python
+            )
+        if platform is None:
+            self.platform = PydevdPlatformInfo()
+        else:
+            self.platform = (
+                PydevdPlatformInfo(update_ids_from_dap=update_ids_from_dap, **platform)
+                if platform.__class__ != PydevdPlatformInfo
+                else platform
+            )
+        if process is None:
+            self.process = PydevdProcessInfo()
+        else:
+            self.process = (
+                PydevdProcessInfo(update_ids_from_dap=update_ids_from_dap, **process) if process.__class__ != PydevdProcessInfo else process
+            )
+        if pydevd is None:
+            self.pydevd = PydevdInfo()
+        else:
+            self.pydevd = PydevdInfo(update_ids_from_dap=update_ids_from_dap, **pydevd) if pydevd.__class__ != PydevdInfo else pydevd
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        targets = self.targets
-        if targets and hasattr(targets[0], "to_dict"):
-            targets = [x.to_dict() for x in targets]
+        python = self.python
+        platform = self.platform
+        process = self.process
+        pydevd = self.pydevd
         dct = {
-            "targets": [StepInTarget.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+            "python": python.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "platform": platform.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "process": process.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "pydevd": pydevd.to_dict(update_ids_to_dap=update_ids_to_dap),
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class GotoTargetsResponseBody(BaseSchema):
+class PydevdAuthorizeResponseBody(BaseSchema):
     """
-    "body" of GotoTargetsResponse
+    "body" of PydevdAuthorizeResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {
-        "targets": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/GotoTarget"},
-            "description": "The possible goto targets of the specified location.",
-        }
-    }
+    __props__ = {"clientAccessToken": {"type": "string", "description": "The access token to access the client (i.e.: usually the IDE)."}}
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, clientAccessToken, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array targets: The possible goto targets of the specified location.
+        :param string clientAccessToken: The access token to access the client (i.e.: usually the IDE).
         """
-        self.targets = targets
-        if update_ids_from_dap and self.targets:
-            for o in self.targets:
-                GotoTarget.update_dict_ids_from_dap(o)
+        self.clientAccessToken = clientAccessToken
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        targets = self.targets
-        if targets and hasattr(targets[0], "to_dict"):
-            targets = [x.to_dict() for x in targets]
+        clientAccessToken = self.clientAccessToken
         dct = {
-            "targets": [GotoTarget.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+            "clientAccessToken": clientAccessToken,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class CompletionsResponseBody(BaseSchema):
+class PydevdEvaluateManyResponseBody(BaseSchema):
     """
-    "body" of CompletionsResponse
+    "body" of PydevdEvaluateManyResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "targets": {"type": "array", "items": {"$ref": "#/definitions/CompletionItem"}, "description": "The possible completions for ."}
+        "results": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/PydevdEvaluateManyResult"},
+            "description": "The results of the evaluations (in the same order of the requested expressions).",
+        }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, targets, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, results, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array targets: The possible completions for .
+        :param array results: The results of the evaluations (in the same order of the requested expressions).
         """
-        self.targets = targets
-        if update_ids_from_dap and self.targets:
-            for o in self.targets:
-                CompletionItem.update_dict_ids_from_dap(o)
+        self.results = results
+        if update_ids_from_dap and self.results:
+            for o in self.results:
+                PydevdEvaluateManyResult.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        targets = self.targets
-        if targets and hasattr(targets[0], "to_dict"):
-            targets = [x.to_dict() for x in targets]
+        results = self.results
+        if results and hasattr(results[0], "to_dict"):
+            results = [x.to_dict() for x in results]
         dct = {
-            "targets": [CompletionItem.update_dict_ids_to_dap(o) for o in targets] if (update_ids_to_dap and targets) else targets,
+            "results": [PydevdEvaluateManyResult.update_dict_ids_to_dap(o) for o in results]
+            if (update_ids_to_dap and results)
+            else results,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ExceptionInfoResponseBody(BaseSchema):
+class PydevdHeapSnapshotResponseBody(BaseSchema):
     """
-    "body" of ExceptionInfoResponse
+    "body" of PydevdHeapSnapshotResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "exceptionId": {"type": "string", "description": "ID of the exception that was thrown."},
-        "description": {"type": "string", "description": "Descriptive text for the exception."},
-        "breakMode": {"description": "Mode that caused the exception notification to be raised.", "type": "ExceptionBreakMode"},
-        "details": {"description": "Detailed information about the exception.", "type": "ExceptionDetails"},
+        "variables": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Variable"},
+            "description": "The objects found (they may be expanded with the 'variables' request while the thread is suspended). For 'pathToRoot' they're in order from the root to the queried object.",
+        },
+        "typeStats": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/PydevdHeapTypeStats"},
+            "description": "The types with the most memory used by their instances (for 'typeStats') or the types which grew the most (for 'diffTypeStats').",
+        },
+        "totalObjects": {"type": "integer", "description": "The number of objects in the snapshot."},
     }
-    __refs__ = set(["breakMode", "details"])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, exceptionId, breakMode, description=None, details=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, variables=None, typeStats=None, totalObjects=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string exceptionId: ID of the exception that was thrown.
-        :param ExceptionBreakMode breakMode: Mode that caused the exception notification to be raised.
-        :param string description: Descriptive text for the exception.
-        :param ExceptionDetails details: Detailed information about the exception.
+        :param array variables: The objects found (they may be expanded with the 'variables' request while the thread is suspended). For 'pathToRoot' they're in order from the root to the queried object.
+        :param array typeStats: The types with the most memory used by their instances (for 'typeStats') or the types which grew the most (for 'diffTypeStats').
+        :param integer totalObjects: The number of objects in the snapshot.
         """
-        self.exceptionId = exceptionId
-        if breakMode is not None:
-            assert breakMode in ExceptionBreakMode.VALID_VALUES
-        self.breakMode = breakMode
-        self.description = description
-        if details is None:
-            self.details = ExceptionDetails()
-        else:
-            self.details = (
-                ExceptionDetails(update_ids_from_dap=update_ids_from_dap, **details) if details.__class__ != ExceptionDetails else details
-            )
+        self.variables = variables
+        if update_ids_from_dap and self.variables:
+            for o in self.variables:
+                Variable.update_dict_ids_from_dap(o)
+        self.typeStats = typeStats
+        if update_ids_from_dap and self.typeStats:
+            for o in self.typeStats:
+                PydevdHeapTypeStats.update_dict_ids_from_dap(o)
+        self.totalObjects = totalObjects
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        exceptionId = self.exceptionId
-        breakMode = self.breakMode
-        description = self.description
-        details = self.details
-        dct = {
-            "exceptionId": exceptionId,
-            "breakMode": breakMode,
-        }
-        if description is not None:
-            dct["description"] = description
-        if details is not None:
-            dct["details"] = details.to_dict(update_ids_to_dap=update_ids_to_dap)
+        variables = self.variables
+        if variables and hasattr(variables[0], "to_dict"):
+            variables = [x.to_dict() for x in variables]
+        typeStats = self.typeStats
+        if typeStats and hasattr(typeStats[0], "to_dict"):
+            typeStats = [x.to_dict() for x in typeStats]
+        totalObjects = self.totalObjects
+        dct = {}
+        if variables is not None:
+            dct["variables"] = [Variable.update_dict_ids_to_dap(o) for o in variables] if (update_ids_to_dap and variables) else variables
+        if typeStats is not None:
+            dct["typeStats"] = (
+                [PydevdHeapTypeStats.update_dict_ids_to_dap(o) for o in typeStats] if (update_ids_to_dap and typeStats) else typeStats
+            )
+        if totalObjects is not None:
+            dct["totalObjects"] = totalObjects
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class ReadMemoryResponseBody(BaseSchema):
+class PydevdPrefetchEventBody(BaseSchema):
     """
-    "body" of ReadMemoryResponse
+    "body" of PydevdPrefetchEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "address": {
-            "type": "string",
-            "description": "The address of the first byte of data returned.\nTreated as a hex value if prefixed with `0x`, or as a decimal value otherwise.",
+        "threadId": {"type": "integer", "description": "The thread which was stopped."},
+        "stackFrames": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/StackFrame"},
+            "description": "The first frames of the stack (as in a 'stackTrace' request with 'startFrame' == 0).",
         },
-        "unreadableBytes": {
+        "totalFrames": {
             "type": "integer",
-            "description": "The number of unreadable bytes encountered after the last successfully read byte.\nThis can be used to determine the number of bytes that should be skipped before a subsequent `readMemory` request succeeds.",
+            "description": "The total number of frames available in the stack (as in the 'stackTrace' response).",
         },
-        "data": {
-            "type": "string",
-            "description": "The bytes read from memory, encoded using base64. If the decoded length of `data` is less than the requested `count` in the original `readMemory` request, and `unreadableBytes` is zero or omitted, then the client should assume it's reached the end of readable memory.",
+        "scopes": {"type": "array", "items": {"$ref": "#/definitions/Scope"}, "description": "The scopes of the top frame."},
+        "variables": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/Variable"},
+            "description": "The variables of the 'Locals' scope of the top frame (not available if there were too many variables or if it took too long to compute them).",
         },
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, address, unreadableBytes=None, data=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, threadId, stackFrames, totalFrames=None, scopes=None, variables=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string address: The address of the first byte of data returned.
-        Treated as a hex value if prefixed with `0x`, or as a decimal value otherwise.
-        :param integer unreadableBytes: The number of unreadable bytes encountered after the last successfully read byte.
-        This can be used to determine the number of bytes that should be skipped before a subsequent `readMemory` request succeeds.
-        :param string data: The bytes read from memory, encoded using base64. If the decoded length of `data` is less than the requested `count` in the original `readMemory` request, and `unreadableBytes` is zero or omitted, then the client should assume it's reached the end of readable memory.
+        :param integer threadId: The thread which was stopped.
+        :param array stackFrames: The first frames of the stack (as in a 'stackTrace' request with 'startFrame' == 0).
+        :param integer totalFrames: The total number of frames available in the stack (as in the 'stackTrace' response).
+        :param array scopes: The scopes of the top frame.
+        :param array variables: The variables of the 'Locals' scope of the top frame (not available if there were too many variables or if it took too long to compute them).
         """
-        self.address = address
-        self.unreadableBytes = unreadableBytes
-        self.data = data
+        self.threadId = threadId
+        self.stackFrames = stackFrames
+        if update_ids_from_dap and self.stackFrames:
+            for o in self.stackFrames:
+                StackFrame.update_dict_ids_from_dap(o)
+        self.totalFrames = totalFrames
+        self.scopes = scopes
+        if update_ids_from_dap and self.scopes:
+            for o in self.scopes:
+                Scope.update_dict_ids_from_dap(o)
+        self.variables = variables
+        if update_ids_from_dap and self.variables:
+            for o in self.variables:
+                Variable.update_dict_ids_from_dap(o)
+        if update_ids_from_dap:
+            self.threadId = self._translate_id_from_dap(self.threadId)
         self.kwargs = kwargs
 
+    @classmethod
+    def update_dict_ids_from_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_from_dap(dct["threadId"])
+        return dct
+
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        address = self.address
-        unreadableBytes = self.unreadableBytes
-        data = self.data
+        threadId = self.threadId
+        stackFrames = self.stackFrames
+        if stackFrames and hasattr(stackFrames[0], "to_dict"):
+            stackFrames = [x.to_dict() for x in stackFrames]
+        totalFrames = self.totalFrames
+        scopes = self.scopes
+        if scopes and hasattr(scopes[0], "to_dict"):
+            scopes = [x.to_dict() for x in scopes]
+        variables = self.variables
+        if variables and hasattr(variables[0], "to_dict"):
+            variables = [x.to_dict() for x in variables]
+        if update_ids_to_dap:
+            if threadId is not None:
+                threadId = self._translate_id_to_dap(threadId)
         dct = {
-            "address": address,
+            "threadId": threadId,
+            "stackFrames": [StackFrame.update_dict_ids_to_dap(o) for o in stackFrames]
+            if (update_ids_to_dap and stackFrames)
+            else stackFrames,
         }
-        if unreadableBytes is not None:
-            dct["unreadableBytes"] = unreadableBytes
-        if data is not None:
-            dct["data"] = data
+        if totalFrames is not None:
+            dct["totalFrames"] = totalFrames
+        if scopes is not None:
+            dct["scopes"] = [Scope.update_dict_ids_to_dap(o) for o in scopes] if (update_ids_to_dap and scopes) else scopes
+        if variables is not None:
+            dct["variables"] = [Variable.update_dict_ids_to_dap(o) for o in variables] if (update_ids_to_dap and variables) else variables
         dct.update(self.kwargs)
         return dct
 
+    @classmethod
+    def update_dict_ids_to_dap(cls, dct):
+        if "threadId" in dct:
+            dct["threadId"] = cls._translate_id_to_dap(dct["threadId"])
+        return dct
+
 
 @register
-class WriteMemoryResponseBody(BaseSchema):
+class PydevdStackTracesResponseBody(BaseSchema):
     """
-    "body" of WriteMemoryResponse
+    "body" of PydevdStackTracesResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "offset": {
-            "type": "integer",
-            "description": "Property that should be returned when `allowPartial` is True to indicate the offset of the first byte of data successfully written. Can be negative.",
-        },
-        "bytesWritten": {
-            "type": "integer",
-            "description": "Property that should be returned when `allowPartial` is True to indicate the number of bytes starting from address that were successfully written.",
-        },
+        "stackTraces": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/PydevdStackTrace"},
+            "description": "The stacks of the requested threads (threads which aren't suspended are not included).",
+        }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, offset=None, bytesWritten=None, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, stackTraces, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param integer offset: Property that should be returned when `allowPartial` is true to indicate the offset of the first byte of data successfully written. Can be negative.
-        :param integer bytesWritten: Property that should be returned when `allowPartial` is true to indicate the number of bytes starting from address that were successfully written.
+        :param array stackTraces: The stacks of the requested threads (threads which aren't suspended are not included).
         """
-        self.offset = offset
-        self.bytesWritten = bytesWritten
+        self.stackTraces = stackTraces
+        if update_ids_from_dap and self.stackTraces:
+            for o in self.stackTraces:
+                PydevdStackTrace.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        offset = self.offset
-        bytesWritten = self.bytesWritten
-        dct = {}
-        if offset is not None:
-            dct["offset"] = offset
-        if bytesWritten is not None:
-            dct["bytesWritten"] = bytesWritten
+        stackTraces = self.stackTraces
+        if stackTraces and hasattr(stackTraces[0], "to_dict"):
+            stackTraces = [x.to_dict() for x in stackTraces]
+        dct = {
+            "stackTraces": [PydevdStackTrace.update_dict_ids_to_dap(o) for o in stackTraces]
+            if (update_ids_to_dap and stackTraces)
+            else stackTraces,
+        }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class DisassembleResponseBody(BaseSchema):
+class PydevdProfileResponseBody(BaseSchema):
     """
-    "body" of DisassembleResponse
+    "body" of PydevdProfileResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "instructions": {
-            "type": "array",
-            "items": {"$ref": "#/definitions/DisassembledInstruction"},
-            "description": "The list of disassembled instructions.",
+        "samples": {
+            "type": "integer",
+            "description": "The total number of stacks sampled since the profiler was started (0 when starting).",
         }
     }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, instructions, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, samples, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param array instructions: The list of disassembled instructions.
+        :param integer samples: The total number of stacks sampled since the profiler was started (0 when starting).
         """
-        self.instructions = instructions
-        if update_ids_from_dap and self.instructions:
-            for o in self.instructions:
-                DisassembledInstruction.update_dict_ids_from_dap(o)
+        self.samples = samples
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        instructions = self.instructions
-        if instructions and hasattr(instructions[0], "to_dict"):
-            instructions = [x.to_dict() for x in instructions]
+        samples = self.samples
         dct = {
-            "instructions": [DisassembledInstruction.update_dict_ids_to_dap(o) for o in instructions]
-            if (update_ids_to_dap and instructions)
-            else instructions,
+            "samples": samples,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class MessageVariables(BaseSchema):
+class PydevdProfileEventBody(BaseSchema):
     """
-    "variables" of Message
+    "body" of PydevdProfileEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {}
+    __props__ = {
+        "frames": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/PydevdProfileFrame"},
+            "description": "The functions first seen since the previous event (the index of a function is its position in the concatenation of the 'frames' of all the events of the profiling session).",
+        },
+        "nodes": {
+            "type": "array",
+            "items": {"type": "integer"},
+            "description": "The nodes of the tree (in pre-order) flattened as triples of (index of the parent node in this event or -1 for a root, index of the function, number of samples whose innermost function is the one of the node).",
+        },
+        "samples": {"type": "integer", "description": "The number of stacks sampled since the previous event."},
+        "done": {
+            "type": "boolean",
+            "description": "True if this is the last event of the profiling session (i.e.: the profiler was stopped).",
+        },
+    }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
-        """ """
-
+    def __init__(self, frames, nodes, samples, done, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+        """
+        :param array frames: The functions first seen since the previous event (the index of a function is its position in the concatenation of the 'frames' of all the events of the profiling session).
+        :param array nodes: The nodes of the tree (in pre-order) flattened as triples of (index of the parent node in this event or -1 for a root, index of the function, number of samples whose innermost function is the one of the node).
+        :param integer samples: The number of stacks sampled since the previous event.
+        :param boolean done: True if this is the last event of the profiling session (i.e.: the profiler was stopped).
+        """
+        self.frames = frames
+        if update_ids_from_dap and self.frames:
+            for o in self.frames:
+                PydevdProfileFrame.update_dict_ids_from_dap(o)
+        self.nodes = nodes
+        self.samples = samples
+        self.done = done
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        dct = {}
+        frames = self.frames
+        if frames and hasattr(frames[0], "to_dict"):
+            frames = [x.to_dict() for x in frames]
+        nodes = self.nodes
+        if nodes and hasattr(nodes[0], "to_dict"):
+            nodes = [x.to_dict() for x in nodes]
+        samples = self.samples
+        done = self.done
+        dct = {
+            "frames": [PydevdProfileFrame.update_dict_ids_to_dap(o) for o in frames] if (update_ids_to_dap and frames) else frames,
+            "nodes": nodes,
+            "samples": samples,
+            "done": done,
+        }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class PydevdSystemInfoResponseBody(BaseSchema):
+class PydevdTracepointsResponseBody(BaseSchema):
     """
-    "body" of PydevdSystemInfoResponse
+    "body" of PydevdTracepointsResponse
 
     Note: automatically generated code. Do not edit manually.
     """
 
     __props__ = {
-        "python": {"description": "Information about the python version running in the current process.", "type": "PydevdPythonInfo"},
-        "platform": {
-            "description": "Information about the plarforn on which the current process is running.",
-            "type": "PydevdPlatformInfo",
-        },
-        "process": {"description": "Information about the current process.", "type": "PydevdProcessInfo"},
-        "pydevd": {"description": "Information about pydevd.", "type": "PydevdInfo"},
+        "hits": {
+            "type": "integer",
+            "description": "The number of hits sent in the 'pydevdTracepoints' event (-1 if tracepoints are not enabled).",
+        }
     }
-    __refs__ = set(["python", "platform", "process", "pydevd"])
+    __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, python, platform, process, pydevd, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, hits, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param PydevdPythonInfo python: Information about the python version running in the current process.
-        :param PydevdPlatformInfo platform: Information about the plarforn on which the current process is running.
-        :param PydevdProcessInfo process: Information about the current process.
-        :param PydevdInfo pydevd: Information about pydevd.
+        :param integer hits: The number of hits sent in the 'pydevdTracepoints' event (-1 if tracepoints are not enabled).
         """
-        if python is None:
-            self.python = PydevdPythonInfo()
-        else:
-            self.python = (
-                PydevdPythonInfo(update_ids_from_dap=update_ids_from_dap, **python) if python.__class__ != PydevdPythonInfo else python
-            )
-        if platform is None:
-            self.platform = PydevdPlatformInfo()
-        else:
-            self.platform = (
-                PydevdPlatformInfo(update_ids_from_dap=update_ids_from_dap, **platform)
-                if platform.__class__ != PydevdPlatformInfo
-                else platform
-            )
-        if process is None:
-            self.process = PydevdProcessInfo()
-        else:
-            self.process = (
-                PydevdProcessInfo(update_ids_from_dap=update_ids_from_dap, **process) if process.__class__ != PydevdProcessInfo else process
-            )
-        if pydevd is None:
-            self.pydevd = PydevdInfo()
-        else:
-            self.pydevd = PydevdInfo(update_ids_from_dap=update_ids_from_dap, **pydevd) if pydevd.__class__ != PydevdInfo else pydevd
+        self.hits = hits
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        python = self.python
-        platform = self.platform
-        process = self.process
-        pydevd = self.pydevd
+        hits = self.hits
         dct = {
-            "python": python.to_dict(update_ids_to_dap=update_ids_to_dap),
-            "platform": platform.to_dict(update_ids_to_dap=update_ids_to_dap),
-            "process": process.to_dict(update_ids_to_dap=update_ids_to_dap),
-            "pydevd": pydevd.to_dict(update_ids_to_dap=update_ids_to_dap),
+            "hits": hits,
         }
         dct.update(self.kwargs)
         return dct
 
 
 @register
-class PydevdAuthorizeResponseBody(BaseSchema):
+class PydevdTracepointsEventBody(BaseSchema):
     """
-    "body" of PydevdAuthorizeResponse
+    "body" of PydevdTracepointsEvent
 
     Note: automatically generated code. Do not edit manually.
     """
 
-    __props__ = {"clientAccessToken": {"type": "string", "description": "The access token to access the client (i.e.: usually the IDE)."}}
+    __props__ = {
+        "hits": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/PydevdTracepointHit"},
+            "description": "The hits captured since the previous event (oldest first).",
+        },
+        "tracepoints": {
+            "type": "array",
+            "items": {"$ref": "#/definitions/PydevdTracepointStats"},
+            "description": "The counters of the tracepoints hit since tracepoints were enabled.",
+        },
+    }
     __refs__ = set()
 
     __slots__ = list(__props__.keys()) + ["kwargs"]
 
-    def __init__(self, clientAccessToken, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
+    def __init__(self, hits, tracepoints, update_ids_from_dap=False, **kwargs):  # noqa (update_ids_from_dap may be unused)
         """
-        :param string clientAccessToken: The access token to access the client (i.e.: usually the IDE).
+        :param array hits: The hits captured since the previous event (oldest first).
+        :param array tracepoints: The counters of the tracepoints hit since tracepoints were enabled.
         """
-        self.clientAccessToken = clientAccessToken
+        self.hits = hits
+        if update_ids_from_dap and self.hits:
+            for o in self.hits:
+                PydevdTracepointHit.update_dict_ids_from_dap(o)
+        self.tracepoints = tracepoints
+        if update_ids_from_dap and self.tracepoints:
+            for o in self.tracepoints:
+                PydevdTracepointStats.update_dict_ids_from_dap(o)
         self.kwargs = kwargs
 
     def to_dict(self, update_ids_to_dap=False):  # noqa (update_ids_to_dap may be unused)
-        clientAccessToken = self.clientAccessToken
+        hits = self.hits
+        if hits and hasattr(hits[0], "to_dict"):
+            hits = [x.to_dict() for x in hits]
+        tracepoints = self.tracepoints
+        if tracepoints and hasattr(tracepoints[0], "to_dict"):
+            tracepoints = [x.to_dict() for x in tracepoints]
         dct = {
-            "clientAccessToken": clientAccessToken,
+            "hits": [PydevdTracepointHit.update_dict_ids_to_dap(o) for o in hits] if (update_ids_to_dap and hits) else hits,
+            "tracepoints": [PydevdTracepointStats.update_dict_ids_to_dap(o) for o in tracepoints]
+            if (update_ids_to_dap and tracepoints)
+            else tracepoints,
         }
         dct.update(self.kwargs)
         return dct
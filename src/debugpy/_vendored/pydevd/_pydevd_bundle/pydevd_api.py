@@ -3,7 +3,7 @@ import bisect
 import types
 
 from _pydev_bundle._pydev_saved_modules import threading
-from _pydevd_bundle import pydevd_utils, pydevd_source_mapping
+from _pydevd_bundle import pydevd_utils, pydevd_source_mapping, pydevd_warm_cache, pydevd_sampling_profiler, pydevd_tracepoints
 from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
 from _pydevd_bundle.pydevd_comm import (
     InternalGetThreadStack,
@@ -21,6 +21,8 @@ from _pydevd_bundle.pydevd_comm import (
     internal_change_variable,
     internal_change_variable_json,
     internal_evaluate_expression_json,
+    internal_evaluate_many_json,
+    internal_heap_snapshot_json,
     internal_set_expression_json,
     internal_get_exception_details_json,
     internal_step_in_thread,
@@ -73,10 +75,23 @@ else:
     def _get_code_lines(code):
         if not isinstance(code, types.CodeType):
             path = code
+            if pydevd_warm_cache.is_enabled():
+                stat = os.stat(path)
+                lines = pydevd_warm_cache.load(path, "lines", stat)
+                if lines is not None:
+                    return iter(lines)
+            else:
+                stat = None
+
             with tokenize.open(path) as f:
                 src = f.read()
             code = compile(src, path, "exec", 0, dont_inherit=True)
-            return _get_code_lines(code)
+            if stat is None:
+                return _get_code_lines(code)
+
+            lines = sorted(set(_get_code_lines(code)))
+            pydevd_warm_cache.store(path, "lines", lines, stat)
+            return iter(lines)
 
         def iterate():
             # First, get all line starts for this code object. This does not include
@@ -111,6 +126,8 @@ class PyDevdAPI(object):
 
     def run(self, py_db):
         py_db.ready_to_run = True
+        # The command thread only starts enumerating the threads at this point.
+        py_db._py_db_command_thread_event.set()
 
     def notify_initialize(self, py_db):
         py_db.on_initialize()
@@ -215,6 +232,7 @@ class PyDevdAPI(object):
         self.set_enable_thread_notifications(py_db, False)
         self.remove_all_breakpoints(py_db, "*")
         self.remove_all_exception_breakpoints(py_db)
+        self.stop_sampling_profiler(py_db)
         self.notify_disconnect(py_db)
 
         if resume_threads:
@@ -238,6 +256,59 @@ class PyDevdAPI(object):
         else:
             py_db.post_internal_command(internal_get_thread_stack, "*")
 
+    def request_stack_traces(self, py_db, seq, thread_ids=None, fmt=None, start_frame=0, levels=0):
+        """
+        Provides the stacks of the given threads (or of all the suspended threads if not given)
+        at once. As opposed to request_stack, it doesn't wait for threads to be suspended (only
+        the threads which are already suspended are provided).
+        """
+        if thread_ids is None:
+            thread_ids = py_db.suspended_frames_manager.get_suspended_thread_ids()
+        py_db.writer.add_command(
+            py_db.cmd_factory.make_get_stack_traces_message(py_db, seq, thread_ids, fmt or {}, start_frame=start_frame, levels=levels)
+        )
+
+    def start_sampling_profiler(self, py_db, samples_per_second, flush_interval):
+        """
+        Starts sampling the stacks of all the threads (the samples are sent in 'pydevdProfile' events).
+
+        Note: when using sys.monitoring, tracing is disabled until the profiler is stopped.
+
+        :return bool:
+            Whether the profiler was started (False if it was already running).
+        """
+        return pydevd_sampling_profiler.start_sampling_profiler(py_db, samples_per_second, flush_interval)
+
+    def stop_sampling_profiler(self, py_db):
+        """
+        :return int:
+            The number of stacks sampled since the profiler was started.
+        """
+        return pydevd_sampling_profiler.stop_sampling_profiler(py_db)
+
+    def set_tracepoints(self, py_db, tracepoints):
+        """
+        :param bool|dict tracepoints:
+            If set, logpoints capture their messages in a ring buffer which is sent in batches
+            (in 'pydevdTracepoints' events) instead of sending an 'output' event for each hit.
+
+            If it's a dict, it may have the `bufferSize`, `flushInterval`, `maxHitsPerSecond`
+            and `sampleEvery` settings.
+        """
+        pydevd_tracepoints.set_tracepoints(py_db, tracepoints)
+
+    def request_tracepoints(self, py_db):
+        """
+        Sends the tracepoint hits captured since the last 'pydevdTracepoints' event right away.
+
+        :return int:
+            The number of hits sent (-1 if tracepoints are not enabled).
+        """
+        tracepoints = py_db.tracepoints
+        if tracepoints is None:
+            return -1
+        return tracepoints.send_batch(py_db, force=True)
+
     def request_exception_info_json(self, py_db, request, thread_id, thread, max_frames):
         py_db.post_method_as_internal_command(
             thread_id,
@@ -772,6 +843,12 @@ class PyDevdAPI(object):
     def request_exec_or_evaluate_json(self, py_db, request, thread_id):
         py_db.post_method_as_internal_command(thread_id, internal_evaluate_expression_json, request, thread_id)
 
+    def request_evaluate_many_json(self, py_db, request, thread_id):
+        py_db.post_method_as_internal_command(thread_id, internal_evaluate_many_json, request, thread_id)
+
+    def request_heap_snapshot_json(self, py_db, request, thread_id):
+        py_db.post_method_as_internal_command(thread_id, internal_heap_snapshot_json, request, thread_id)
+
     def request_set_expression_json(self, py_db, request, thread_id):
         py_db.post_method_as_internal_command(thread_id, internal_set_expression_json, request, thread_id)
 
@@ -1131,6 +1208,17 @@ class PyDevdAPI(object):
     def set_terminate_keyboard_interrupt(self, py_db, terminate_keyboard_interrupt):
         py_db.terminate_keyboard_interrupt = terminate_keyboard_interrupt
 
+    def set_prefetch_on_stop(self, py_db, prefetch_on_stop):
+        py_db.prefetch_on_stop = prefetch_on_stop
+
+    def set_inherit_state_on_fork(self, py_db, inherit_state_on_fork):
+        py_db.inherit_state_on_fork = inherit_state_on_fork
+
+    def set_snapshot_on_suspend(self, py_db, snapshot_on_suspend):
+        py_db.snapshot_on_suspend = snapshot_on_suspend
+        if not snapshot_on_suspend:
+            py_db.suspended_frames_manager.release_snapshot()
+
     def terminate_process(self, py_db):
         """
         Terminates the current process (and child processes if the option to also terminate
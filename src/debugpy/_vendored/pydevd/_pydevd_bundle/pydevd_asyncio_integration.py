@@ -0,0 +1,121 @@
+"""
+Shows the asyncio tasks paused in the event loop of a suspended thread as custom frames.
+
+The tasks are only collected when a thread is about to be suspended (through
+asyncio.all_tasks() for the loop running in that thread), so, there's no cost
+while the program is running.
+"""
+import sys
+
+from _pydev_bundle import pydev_log
+from _pydevd_bundle.pydevd_constants import ASYNCIO_SHOW_PAUSED_TASKS, PYDEVD_ASYNCIO_MAX_PAUSED_TASKS, thread_get_ident
+from _pydevd_bundle.pydevd_custom_frames import add_custom_frame
+from _pydevd_bundle.pydevd_frame_utils import FramesList
+from pydevd_file_utils import basename
+
+
+def _iter_awaitable_frames(awaitable):
+    # Follows the chain of awaitables (coroutines, generators and async generators)
+    # from the outermost to the innermost one.
+    while awaitable is not None:
+        frame = getattr(awaitable, "cr_frame", None)
+        if frame is not None:
+            yield frame
+            awaitable = getattr(awaitable, "cr_await", None)
+            continue
+
+        frame = getattr(awaitable, "gi_frame", None)
+        if frame is not None:
+            yield frame
+            awaitable = getattr(awaitable, "gi_yieldfrom", None)
+            continue
+
+        frame = getattr(awaitable, "ag_frame", None)
+        if frame is not None:
+            yield frame
+            awaitable = getattr(awaitable, "ag_await", None)
+            continue
+
+        break
+
+
+def create_frames_list_from_task(task):
+    """
+    :return FramesList:
+        The frames of the coroutine chain of the task (innermost first), or None if
+        the task has no frames (i.e.: it's done).
+    """
+    frames = list(_iter_awaitable_frames(task.get_coro()))
+    if not frames:
+        return None
+
+    frames_list = FramesList()
+    for frame in reversed(frames):
+        frames_list.append(frame)
+    return frames_list
+
+
+def _get_paused_name(py_db, task, frames_list):
+    # i.e.: Show in the description of the task the innermost user-code found.
+    use_frame = next(iter(frames_list))
+    for frame in frames_list:
+        if not py_db.apply_files_filter(frame, frame.f_code.co_filename, True):
+            use_frame = frame
+            break
+
+    return "%s: %s - %s" % (task.get_name(), use_frame.f_code.co_name, basename(use_frame.f_code.co_filename))
+
+
+def add_paused_tasks_custom_frames(py_db):
+    """
+    Shows the tasks paused in the event loop running in the current thread as custom
+    frames (used when the current thread is about to be suspended).
+
+    :return list(str):
+        The custom thread ids added (which should be removed with remove_custom_frame
+        when the thread is resumed).
+    """
+    if not ASYNCIO_SHOW_PAUSED_TASKS:
+        return []
+
+    # Don't import asyncio if the program isn't using it.
+    asyncio = sys.modules.get("asyncio")
+    if asyncio is None:
+        return []
+
+    loop = asyncio._get_running_loop()
+    if loop is None:
+        return []
+
+    try:
+        tasks = asyncio.all_tasks(loop)
+        current_task = asyncio.current_task(loop)
+    except:
+        pydev_log.exception("Error getting asyncio tasks.")
+        return []
+
+    thread_id = thread_get_ident()
+    custom_frame_thread_ids = []
+    for task in tasks:
+        if task is current_task or task.done():
+            continue
+
+        if len(custom_frame_thread_ids) >= PYDEVD_ASYNCIO_MAX_PAUSED_TASKS:
+            pydev_log.info(
+                "Only showing %s of %s paused asyncio tasks (see PYDEVD_ASYNCIO_MAX_PAUSED_TASKS).",
+                PYDEVD_ASYNCIO_MAX_PAUSED_TASKS,
+                len(tasks),
+            )
+            break
+
+        try:
+            frames_list = create_frames_list_from_task(task)
+            if frames_list is None:
+                continue
+            custom_frame_thread_ids.append(
+                add_custom_frame(next(iter(frames_list)), _get_paused_name(py_db, task, frames_list), thread_id, frames_list)
+            )
+        except:
+            pydev_log.exception("Error showing paused asyncio task: %s", task)
+
+    return custom_frame_thread_ids
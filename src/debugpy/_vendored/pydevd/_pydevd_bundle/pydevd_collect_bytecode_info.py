@@ -1,9 +1,12 @@
 import dis
 import inspect
+import os
 import sys
+from bisect import bisect_left, bisect_right
 from collections import namedtuple
 
 from _pydev_bundle import pydev_log
+from _pydevd_bundle import pydevd_warm_cache
 from opcode import EXTENDED_ARG, HAVE_ARGUMENT, cmp_op, hascompare, hasconst, hasfree, hasjrel, haslocal, hasname, opname
 
 from io import StringIO
@@ -480,6 +483,91 @@ def collect_try_except_info_from_contents(contents, filename="<unknown>"):
     return visitor.try_except_infos
 
 
+class TryExceptInfosIndex(object):
+    """
+    The try..except infos of a whole file, sorted by the try line, so that the ones
+    in the line range of a given function can be found with a binary search.
+    """
+
+    def __init__(self, try_except_infos):
+        self.try_except_infos = sorted(try_except_infos, key=lambda info: info.try_line)
+        self._try_lines = [info.try_line for info in self.try_except_infos]
+
+    def get_in_line_range(self, min_line, max_line):
+        """
+        :return list(TryExceptInfo):
+            The infos whose try line is in the range [min_line, max_line].
+        """
+        start = bisect_left(self._try_lines, min_line)
+        end = bisect_right(self._try_lines, max_line)
+        return self.try_except_infos[start:end]
+
+    def to_ints(self):
+        """
+        :return list(int):
+            The infos flattened as ints (to be kept in the warm cache): for each info, the try line,
+            except line, except end line, number of raise lines and the raise lines.
+        """
+        ints = []
+        for info in self.try_except_infos:
+            ints.append(info.try_line)
+            ints.append(info.except_line)
+            ints.append(info.except_end_line)
+            ints.append(len(info.raise_lines_in_except))
+            ints.extend(info.raise_lines_in_except)
+        return ints
+
+    @classmethod
+    def from_ints(cls, ints):
+        try_except_infos = []
+        i = 0
+        while i < len(ints):
+            info = TryExceptInfo(ints[i])
+            info.except_line = ints[i + 1]
+            info.except_end_line = ints[i + 2]
+            raise_lines_count = ints[i + 3]
+            i += 4
+            info.raise_lines_in_except = list(ints[i : i + raise_lines_count])
+            i += raise_lines_count
+            try_except_infos.append(info)
+        return cls(try_except_infos)
+
+
+def get_try_except_infos_index(filename, cache):
+    """
+    Provides the TryExceptInfosIndex for the given file, parsing it only if it's not
+    in the cache (nor in the warm cache) or if it changed (based on its mtime and size)
+    since it was cached.
+
+    :param dict cache:
+        filename -> ((mtime, size), TryExceptInfosIndex or None)
+
+    :return TryExceptInfosIndex or None:
+        None if the file could not be parsed (the cache also remembers that).
+
+    :raise OSError: if the file does not exist.
+    """
+    stat = os.stat(filename)
+    version = (stat.st_mtime, stat.st_size)
+    entry = cache.get(filename)
+    if entry is not None and entry[0] == version:
+        return entry[1]
+
+    ints = pydevd_warm_cache.load(filename, "tryexcept", stat)
+    if ints is not None:
+        index = TryExceptInfosIndex.from_ints(ints)
+    else:
+        try:
+            index = TryExceptInfosIndex(collect_try_except_info_from_source(filename))
+        except:
+            pydev_log.exception("Error collecting try..except info from source (%s)", filename)
+            index = None
+        else:
+            pydevd_warm_cache.store(filename, "tryexcept", index.to_ints(), stat)
+    cache[filename] = (version, index)
+    return index
+
+
 RESTART_FROM_LOOKAHEAD = object()
 SEPARATOR = object()
 
@@ -85,6 +85,7 @@ from _pydevd_bundle.pydevd_constants import (
     filter_all_warnings,
     IS_PY311_OR_GREATER,
     PYDEVD_UNBLOCK_THREADS_ON_VARIABLES_TIMEOUT,
+    PYDEVD_REPR_REQUEST_TIMEOUT,
 )
 from _pydev_bundle.pydev_override import overrides
 import weakref
@@ -98,6 +99,8 @@ from _pydevd_bundle._debug_adapter.pydevd_schema import (
 from _pydevd_bundle._debug_adapter import pydevd_base_schema, pydevd_schema
 from _pydevd_bundle.pydevd_net_command import NetCommand
 from _pydevd_bundle.pydevd_xml import ExceptionOnEvaluate
+from _pydevd_bundle.pydevd_safe_repr import SafeRepr
+from _pydevd_bundle.pydevd_heap_snapshot import HeapSnapshot, TypeStatsSummary, get_found_as
 from _pydevd_bundle.pydevd_constants import ForkSafeLock, NULL
 from _pydevd_bundle.pydevd_daemon_thread import PyDBDaemonThread
 from _pydevd_bundle.pydevd_thread_lifecycle import pydevd_find_thread_by_id, resume_threads
@@ -812,8 +815,11 @@ def internal_get_variable_json(py_db, request):
                 PYDEVD_UNBLOCK_THREADS_ON_VARIABLES_TIMEOUT,
                 on_timeout_message=timeout_message,
             ):
+                safe_repr = SafeRepr()
+                if PYDEVD_REPR_REQUEST_TIMEOUT > 0:
+                    safe_repr.deadline = time.time() + PYDEVD_REPR_REQUEST_TIMEOUT
                 for child_var in variable.get_children_variables(fmt=fmt, scope=scope):
-                    variables.append(child_var.get_var_data(fmt=fmt))
+                    variables.append(child_var.get_var_data(fmt=fmt, safe_repr=safe_repr))
     except:
         try:
             exc, exc_type, tb = sys.exc_info()
@@ -1306,6 +1312,227 @@ def internal_evaluate_expression_json(py_db, request, thread_id):
         py_db.writer.add_command(NetCommand(CMD_RETURN, 0, variables_response, is_json=True))
 
 
+def internal_evaluate_many_json(py_db, request, thread_id):
+    """
+    Evaluates many expressions in the same frame (as in a "watch" or "hover" evaluate request:
+    statements are never executed and errors are shown as a string).
+
+    :param PydevdEvaluateManyRequest request:
+    """
+    # : :type arguments: PydevdEvaluateManyArguments
+    arguments = request.arguments
+    context = arguments.context or "watch"
+    fmt = arguments.format
+    if hasattr(fmt, "to_dict"):
+        fmt = fmt.to_dict()
+
+    frame = py_db.find_frame(thread_id, arguments.frameId)
+    frame_tracker = py_db.suspended_frames_manager.get_frame_tracker(thread_id)
+    if frame is None or frame_tracker is None:
+        response = pydevd_base_schema.build_response(
+            request,
+            kwargs={
+                "body": pydevd_schema.PydevdEvaluateManyResponseBody(results=[]),
+                "success": False,
+                "message": "Unable to find frame: %s in thread: %s." % (arguments.frameId, thread_id),
+            },
+        )
+        py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+        return
+
+    safe_repr_custom_attrs = {}
+    if context == "clipboard":
+        safe_repr_custom_attrs = dict(
+            maxstring_outer=2**64,
+            maxstring_inner=2**64,
+            maxother_outer=2**64,
+            maxother_inner=2**64,
+        )
+
+    results = []
+    try:
+        with filter_all_warnings():
+            for expression in arguments.expressions:
+                eval_result = pydevd_vars.evaluate_expression(py_db, frame, expression, is_exec=False)
+                if isinstance_checked(eval_result, ExceptionOnEvaluate):
+                    msg = "%s: %s" % (
+                        eval_result.result.__class__.__name__,
+                        eval_result.result,
+                    )
+                    result = pydevd_schema.PydevdEvaluateManyResult(result=msg, success=False, variablesReference=0)
+                else:
+                    variable = frame_tracker.obtain_as_variable(expression, eval_result, frame=frame)
+                    var_data = variable.get_var_data(fmt=fmt, context=context, **safe_repr_custom_attrs)
+                    result = pydevd_schema.PydevdEvaluateManyResult(
+                        result=var_data["value"],
+                        success=True,
+                        variablesReference=var_data.get("variablesReference", 0),
+                        type=var_data.get("type"),
+                        presentationHint=var_data.get("presentationHint"),
+                        namedVariables=var_data.get("namedVariables"),
+                        indexedVariables=var_data.get("indexedVariables"),
+                    )
+                results.append(result.to_dict())
+    finally:
+        frame = None
+
+    body = pydevd_schema.PydevdEvaluateManyResponseBody(results=results)
+    response = pydevd_base_schema.build_response(request, kwargs={"body": body})
+    py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+
+
+def internal_heap_snapshot_json(py_db, request, thread_id):
+    """
+    Answers queries on the object graph with a HeapSnapshot (which is created on the first
+    query and kept until the thread is resumed or the snapshot is released).
+
+    :param PydevdHeapSnapshotRequest request:
+    """
+    # : :type arguments: PydevdHeapSnapshotArguments
+    arguments = request.arguments
+    query = arguments.query
+    max_results = arguments.maxResults or 100
+    fmt = arguments.format
+    if hasattr(fmt, "to_dict"):
+        fmt = fmt.to_dict()
+
+    def send_response(success=True, message=None, **body_kwargs):
+        kwargs = {"body": pydevd_schema.PydevdHeapSnapshotResponseBody(**body_kwargs)}
+        if not success:
+            kwargs["success"] = False
+            kwargs["message"] = message
+        response = pydevd_base_schema.build_response(request, kwargs=kwargs)
+        py_db.writer.add_command(NetCommand(CMD_RETURN, 0, response, is_json=True))
+
+    frame = py_db.find_frame(thread_id, arguments.frameId)
+    frame_tracker = py_db.suspended_frames_manager.get_frame_tracker(thread_id)
+    if frame is None or frame_tracker is None:
+        send_response(False, "Unable to find frame: %s in thread: %s." % (arguments.frameId, thread_id))
+        return
+
+    try:
+        if query == "release":
+            frame_tracker.heap_snapshot = None
+            send_response()
+            return
+
+        if query == "typeStats":
+            heap_snapshot = _get_heap_snapshot(frame_tracker)
+            type_stats = [
+                pydevd_schema.PydevdHeapTypeStats(type=type_name, count=count, size=size).to_dict()
+                for type_name, count, size in heap_snapshot.get_type_stats(max_results)
+            ]
+            send_response(typeStats=type_stats, totalObjects=len(heap_snapshot))
+            return
+
+        if query == "recordTypeStats":
+            # Note: doesn't need (nor create) a snapshot and is kept across suspensions.
+            py_db.heap_type_stats_baseline = baseline = TypeStatsSummary.create()
+            send_response(totalObjects=len(baseline))
+            return
+
+        if query == "diffTypeStats":
+            baseline = py_db.heap_type_stats_baseline
+            if baseline is None:
+                send_response(False, "No type stats recorded to diff with (a 'recordTypeStats' query is needed first).")
+                return
+
+            summary = TypeStatsSummary.create(max_samples=arguments.maxSamples if arguments.maxSamples is not None else 3)
+            safe_repr = SafeRepr()
+            type_stats = []
+            for type_name, count, size, count_delta, size_delta, samples in summary.diff(baseline, max_results):
+                sample_variables = []
+                for sample in samples:
+                    sample_variables.append(
+                        _create_heap_variable(frame_tracker, thread_id, frame, "<%s>" % (type_name,), sample, fmt, safe_repr)
+                    )
+                type_stats.append(
+                    pydevd_schema.PydevdHeapTypeStats(
+                        type=type_name, count=count, size=size, countDelta=count_delta, sizeDelta=size_delta, samples=sample_variables
+                    ).to_dict()
+                )
+            total_objects = len(summary)
+            summary = samples = sample = None
+            send_response(typeStats=type_stats, totalObjects=total_objects)
+            return
+
+        if arguments.variablesReference:
+            try:
+                obj = frame_tracker.get_variable(arguments.variablesReference).value
+            except KeyError:
+                send_response(False, "Unable to find variable reference: %s." % (arguments.variablesReference,))
+                return
+
+        elif arguments.expression is not None:
+            with filter_all_warnings():
+                obj = pydevd_vars.evaluate_expression(py_db, frame, arguments.expression, is_exec=False)
+            if isinstance_checked(obj, ExceptionOnEvaluate):
+                send_response(False, "%s: %s" % (obj.result.__class__.__name__, obj.result))
+                return
+
+        else:
+            send_response(False, "Either 'expression' or 'variablesReference' must be given.")
+            return
+
+        heap_snapshot = _get_heap_snapshot(frame_tracker)
+        # Note: explicit loops (and not comprehensions) so that obj isn't kept in a cell
+        # (which would then be reported as a referrer).
+        found = []
+        if query == "referrers":
+            for referrer in heap_snapshot.get_referrers(obj):
+                found.append((get_found_as(referrer, obj), referrer))
+
+        elif query == "referents":
+            for referent in heap_snapshot.get_referents(obj):
+                found.append((get_found_as(obj, referent), referent))
+
+        elif query == "pathToRoot":
+            parent = None
+            for path_obj in heap_snapshot.get_path_to_root(obj):
+                found.append((get_found_as(parent, path_obj) if parent is not None else "", path_obj))
+                parent = path_obj
+
+        else:
+            send_response(False, "Unexpected query: %s." % (query,))
+            return
+
+        variables = []
+        safe_repr = SafeRepr()
+        for found_as, found_obj in found[:max_results]:
+            name = found_as or "<%s>" % (type(found_obj).__name__,)
+            variables.append(_create_heap_variable(frame_tracker, thread_id, frame, name, found_obj, fmt, safe_repr))
+        send_response(variables=variables, totalObjects=len(heap_snapshot))
+    except:
+        pydev_log.exception("Error answering heap snapshot query: %s", query)
+        exc = get_exception_traceback_str()
+        send_response(False, exc)
+    finally:
+        frame = None
+        obj = None
+        found = None
+        parent = None
+
+
+def _create_heap_variable(frame_tracker, thread_id, frame, name, obj, fmt, safe_repr):
+    if frame_tracker.find_frame(thread_id, id(obj)) is obj:
+        # A frame being shown in the stack: its reference provides its locals.
+        return {"name": name, "value": safe_repr(obj), "type": "frame", "variablesReference": id(obj)}
+
+    variable = frame_tracker.obtain_as_variable(name, obj, frame=frame)
+    var_data = variable.get_var_data(fmt=fmt, safe_repr=safe_repr)
+    # The same object may have been gotten as a variable before (with another name).
+    var_data["name"] = name
+    var_data.pop("evaluateName", None)
+    return var_data
+
+
+def _get_heap_snapshot(frame_tracker):
+    heap_snapshot = frame_tracker.heap_snapshot
+    if heap_snapshot is None:
+        heap_snapshot = frame_tracker.heap_snapshot = HeapSnapshot()
+    return heap_snapshot
+
+
 def _evaluate_response_return_exception(py_db, request, exc_type, exc, initial_tb):
     try:
         tb = initial_tb
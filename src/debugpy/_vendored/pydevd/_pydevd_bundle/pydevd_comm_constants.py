@@ -98,6 +98,10 @@ CMD_LOAD_SOURCE_FROM_FRAME_ID = 207
 
 CMD_SET_FUNCTION_BREAK = 208
 
+CMD_PREFETCH_EVENT = 209
+CMD_PROFILE_EVENT = 210
+CMD_TRACEPOINTS_EVENT = 211
+
 CMD_VERSION = 501
 CMD_RETURN = 502
 CMD_SET_PROTOCOL = 503
@@ -186,6 +190,9 @@ ID_TO_MEANING = {
     "205": "CMD_AUTHENTICATE",
     "206": "CMD_STEP_INTO_COROUTINE",
     "207": "CMD_LOAD_SOURCE_FROM_FRAME_ID",
+    "209": "CMD_PREFETCH_EVENT",
+    "210": "CMD_PROFILE_EVENT",
+    "211": "CMD_TRACEPOINTS_EVENT",
     "501": "CMD_VERSION",
     "502": "CMD_RETURN",
     "503": "CMD_SET_PROTOCOL",
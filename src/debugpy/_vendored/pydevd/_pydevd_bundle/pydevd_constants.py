@@ -259,8 +259,20 @@ SUPPORT_GEVENT = is_true_in_env("GEVENT_SUPPORT")
 # as a different thread, but if the UI isn't optimized for that the experience is lacking...).
 GEVENT_SHOW_PAUSED_GREENLETS = is_true_in_env("GEVENT_SHOW_PAUSED_GREENLETS")
 
+# Opt-in support to show the asyncio tasks paused in the event loop of a suspended thread (each one
+# shown as a different thread). The tasks are only collected when the thread is suspended (so, there's
+# no cost while running), and at most PYDEVD_ASYNCIO_MAX_PAUSED_TASKS are shown.
+ASYNCIO_SHOW_PAUSED_TASKS = is_true_in_env("PYDEVD_ASYNCIO_SHOW_PAUSED_TASKS")
+PYDEVD_ASYNCIO_MAX_PAUSED_TASKS = as_int_in_env("PYDEVD_ASYNCIO_MAX_PAUSED_TASKS", 500)
+
 DISABLE_FILE_VALIDATION = is_true_in_env("PYDEVD_DISABLE_FILE_VALIDATION")
 
+# Opt-in directory for a persistent cache of facts about source files which are expensive to
+# compute (i.e.: the lines with code, the try..except info), shared by all the debugged processes
+# (so that the workers of a process pool don't recompute them at each start).
+# See: pydevd_warm_cache.py
+PYDEVD_WARM_CACHE_DIR = os.getenv("PYDEVD_WARM_CACHE_DIR", "")
+
 GEVENT_SUPPORT_NOT_SET_MSG = os.getenv(
     "GEVENT_SUPPORT_NOT_SET_MSG",
     "It seems that the gevent monkey-patching is being used.\n"
@@ -345,6 +357,16 @@ PANDAS_MAX_COLWIDTH = as_int_in_env("PYDEVD_PANDAS_MAX_COLWIDTH", 50)
 # If getting an attribute or computing some value is too slow, let the user know if the given timeout elapses.
 PYDEVD_WARN_SLOW_RESOLVE_TIMEOUT = as_float_in_env("PYDEVD_WARN_SLOW_RESOLVE_TIMEOUT", 0.50)
 
+# Computing the value shown for a variable calls its `__repr__`, which may be slow (i.e.: an ORM object
+# which hits the database). PYDEVD_REPR_TIMEOUT is the time (in seconds) to compute the repr of a single
+# variable: containers stop being rendered after it and types whose `__repr__` takes longer than that
+# are afterwards shown as `<Type object at 0x...>` in the variables view (the full value is still
+# computed when it's requested for the clipboard or the repl). PYDEVD_REPR_REQUEST_TIMEOUT is the time
+# to compute the values of all the variables of a variables request (after it, the remaining
+# user-defined reprs are also shown in the cheap form). A value <= 0 disables the related limit.
+PYDEVD_REPR_TIMEOUT = as_float_in_env("PYDEVD_REPR_TIMEOUT", 0.5)
+PYDEVD_REPR_REQUEST_TIMEOUT = as_float_in_env("PYDEVD_REPR_REQUEST_TIMEOUT", 2.0)
+
 # This timeout is used to track the time to send a message saying that the evaluation
 # is taking too long and possible mitigations.
 PYDEVD_WARN_EVALUATION_TIMEOUT = as_float_in_env("PYDEVD_WARN_EVALUATION_TIMEOUT", 3.0)
@@ -386,6 +408,20 @@ PYDEVD_UNBLOCK_THREADS_ON_VARIABLES_TIMEOUT = as_float_in_env("PYDEVD_UNBLOCK_TH
 # on how the thread interruption works (there are some caveats related to it).
 PYDEVD_INTERRUPT_THREAD_TIMEOUT = as_float_in_env("PYDEVD_INTERRUPT_THREAD_TIMEOUT", -1)
 
+# Threads started/finished through the patched thread startup are notified as it happens, so, enumerating
+# all the threads is only needed to find the remaining ones (i.e.: threads which were alive before the
+# debugger was attached or threads created outside of Python). This is the interval (in seconds) in which
+# that is done by the pydevd background threads.
+PYDEVD_THREADS_SCAN_INTERVAL = as_float_in_env("PYDEVD_THREADS_SCAN_INTERVAL", 2.0)
+
+# When 'prefetchOnStop' is set in the launch/attach arguments, the first frames of a suspended thread, the
+# scopes of the top frame and its locals are sent to the client right away (see: PydevdPrefetchEvent). The
+# locals are only sent if there aren't more than PYDEVD_PREFETCH_MAX_VARIABLES of them and if computing them
+# doesn't take more than PYDEVD_PREFETCH_TIMEOUT seconds.
+PYDEVD_PREFETCH_LEVELS = as_int_in_env("PYDEVD_PREFETCH_LEVELS", 20)
+PYDEVD_PREFETCH_MAX_VARIABLES = as_int_in_env("PYDEVD_PREFETCH_MAX_VARIABLES", 100)
+PYDEVD_PREFETCH_TIMEOUT = as_float_in_env("PYDEVD_PREFETCH_TIMEOUT", 0.1)
+
 # If PYDEVD_APPLY_PATCHING_TO_HIDE_PYDEVD_THREADS is set to False, the patching to hide pydevd threads won't be applied.
 PYDEVD_APPLY_PATCHING_TO_HIDE_PYDEVD_THREADS = (
     os.getenv("PYDEVD_APPLY_PATCHING_TO_HIDE_PYDEVD_THREADS", "true").lower() in ENV_TRUE_LOWER_VALUES
@@ -633,7 +669,9 @@ def clear_cached_thread_id(thread):
             if thread.__pydevd_id__ != "console_main":
                 # The console_main is a special thread id used in the console and its id should never be reset
                 # (otherwise we may no longer be able to get its variables -- see: https://www.brainwy.com/tracker/PyDev/776).
+                tid = thread.__pydevd_id__
                 del thread.__pydevd_id__
+                _unregister_thread_id(tid, thread)
         except AttributeError:
             pass
 
@@ -641,6 +679,56 @@ def clear_cached_thread_id(thread):
 # Don't let threads be collected (so that id(thread) is guaranteed to be unique).
 _thread_id_to_thread_found = {}
 
+# Registry of the threads which have a pydevd thread id (thread id -> weakref(thread)), so that
+# a thread can be found by its id without having to enumerate all the threads.
+_thread_id_to_thread_ref = {}
+
+
+def _register_thread_id(tid, thread):
+    """
+    Note: must be called with the _thread_id_lock held.
+    """
+
+    def on_thread_collected(ref):
+        # Note: no lock here as it may be called from the gc at any point.
+        if _thread_id_to_thread_ref.get(tid) is ref:
+            _thread_id_to_thread_ref.pop(tid, None)
+
+    try:
+        _thread_id_to_thread_ref[tid] = weakref.ref(thread, on_thread_collected)
+    except TypeError:
+        pass  # Not weak-referenceable: get_thread_by_id() won't find it.
+
+
+def _unregister_thread_id(tid, thread):
+    ref = _thread_id_to_thread_ref.get(tid)
+    if ref is not None and ref() is thread:
+        _thread_id_to_thread_ref.pop(tid, None)
+
+
+def get_thread_by_id(thread_id):
+    """
+    :return threading.Thread|NoneType:
+        The thread which has the given pydevd thread id or None if no thread with that
+        id is registered (note that the returned thread may no longer be alive).
+    """
+    ref = _thread_id_to_thread_ref.get(thread_id)
+    if ref is None:
+        return None
+    thread = ref()
+    if thread is None or getattr(thread, "__pydevd_id__", None) != thread_id:
+        return None
+    return thread
+
+
+def unregister_thread_id(thread_id):
+    """
+    Removes the given thread id from the registry used by `get_thread_by_id` (to be called
+    when a thread exits).
+    """
+    with _thread_id_lock:
+        _thread_id_to_thread_ref.pop(thread_id, None)
+
 
 def _get_or_compute_thread_id_with_lock(thread, is_current_thread):
     with _thread_id_lock:
@@ -657,6 +745,7 @@ def _get_or_compute_thread_id_with_lock(thread, is_current_thread):
         tid = "pid_%s_id_%s" % (pid, id(thread))
 
         thread.__pydevd_id__ = tid
+        _register_thread_id(tid, thread)
 
     return tid
 
@@ -698,7 +787,11 @@ def get_thread_id(thread):
 
 def set_thread_id(thread, thread_id):
     with _thread_id_lock:
+        old_thread_id = getattr(thread, "__pydevd_id__", None)
+        if old_thread_id is not None:
+            _unregister_thread_id(old_thread_id, thread)
         thread.__pydevd_id__ = thread_id
+        _register_thread_id(thread_id, thread)
 
 
 # =======================================================================================================================
@@ -40,7 +40,7 @@ custom_frames_container_init()
 
 
 class CustomFrame:
-    def __init__(self, name, frame, thread_id):
+    def __init__(self, name, frame, thread_id, frames_list=None):
         # 0 = string with the representation of that frame
         self.name = name
 
@@ -53,8 +53,11 @@ class CustomFrame:
         # 3 = the thread id of the given frame
         self.thread_id = thread_id
 
+        # 4 = the FramesList to show (if None, it's created from the frame and its f_back chain)
+        self.frames_list = frames_list
 
-def add_custom_frame(frame, name, thread_id):
+
+def add_custom_frame(frame, name, thread_id, frames_list=None, frame_custom_thread_id=None):
     """
     It's possible to show paused frames by adding a custom frame through this API (it's
     intended to be used for coroutines, but could potentially be used for generators too).
@@ -68,23 +71,32 @@ def add_custom_frame(frame, name, thread_id):
     :param thread_id:
         The thread id to which this frame is related (must match thread.ident).
 
+    :param FramesList frames_list:
+        If given, the frames to be shown (for coroutines, whose frames aren't linked
+        through f_back while they're not running).
+
+    :param str frame_custom_thread_id:
+        If given, the custom thread id (previously returned by this function) to be reused
+        (so that the same object is shown with the same id whenever it's paused).
+
     :return: str
         Returns the custom thread id which will be used to show the given frame paused.
     """
     with CustomFramesContainer.custom_frames_lock:
-        curr_thread_id = get_current_thread_id(threading.current_thread())
-        next_id = CustomFramesContainer._next_frame_id = CustomFramesContainer._next_frame_id + 1
+        if frame_custom_thread_id is None:
+            curr_thread_id = get_current_thread_id(threading.current_thread())
+            next_id = CustomFramesContainer._next_frame_id = CustomFramesContainer._next_frame_id + 1
 
-        # Note: the frame id kept contains an id and thread information on the thread where the frame was added
-        # so that later on we can check if the frame is from the current thread by doing frame_id.endswith('|'+thread_id).
-        frame_custom_thread_id = "__frame__:%s|%s" % (next_id, curr_thread_id)
+            # Note: the frame id kept contains an id and thread information on the thread where the frame was added
+            # so that later on we can check if the frame is from the current thread by doing frame_id.endswith('|'+thread_id).
+            frame_custom_thread_id = "__frame__:%s|%s" % (next_id, curr_thread_id)
         if DEBUG:
             sys.stderr.write(
                 "add_custom_frame: %s (%s) %s %s\n"
                 % (frame_custom_thread_id, get_abs_path_real_path_and_base_from_frame(frame)[-1], frame.f_lineno, frame.f_code.co_name)
             )
 
-        CustomFramesContainer.custom_frames[frame_custom_thread_id] = CustomFrame(name, frame, thread_id)
+        CustomFramesContainer.custom_frames[frame_custom_thread_id] = CustomFrame(name, frame, thread_id, frames_list)
         CustomFramesContainer._py_db_command_thread_event.set()
         return frame_custom_thread_id
 
@@ -97,6 +97,7 @@ DONT_TRACE = {
     'pydevd_additional_thread_info.py': PYDEV_FILE,
     'pydevd_additional_thread_info_regular.py': PYDEV_FILE,
     'pydevd_api.py': PYDEV_FILE,
+    'pydevd_asyncio_integration.py': PYDEV_FILE,
     'pydevd_base_schema.py': PYDEV_FILE,
     'pydevd_breakpoints.py': PYDEV_FILE,
     'pydevd_bytecode_utils.py': PYDEV_FILE,
@@ -126,6 +127,7 @@ DONT_TRACE = {
     'pydevd_frame_tracing.py': PYDEV_FILE,
     'pydevd_frame_utils.py': PYDEV_FILE,
     'pydevd_gevent_integration.py': PYDEV_FILE,
+    'pydevd_heap_snapshot.py': PYDEV_FILE,
     'pydevd_helpers.py': PYDEV_FILE,
     'pydevd_import_class.py': PYDEV_FILE,
     'pydevd_io.py': PYDEV_FILE,
@@ -146,6 +148,7 @@ DONT_TRACE = {
     'pydevd_resolver.py': PYDEV_FILE,
     'pydevd_runpy.py': PYDEV_FILE,
     'pydevd_safe_repr.py': PYDEV_FILE,
+    'pydevd_sampling_profiler.py': PYDEV_FILE,
     'pydevd_save_locals.py': PYDEV_FILE,
     'pydevd_schema.py': PYDEV_FILE,
     'pydevd_schema_log.py': PYDEV_FILE,
@@ -159,11 +162,13 @@ DONT_TRACE = {
     'pydevd_timeout.py': PYDEV_FILE,
     'pydevd_trace_dispatch.py': PYDEV_FILE,
     'pydevd_trace_dispatch_regular.py': PYDEV_FILE,
+    'pydevd_tracepoints.py': PYDEV_FILE,
     'pydevd_traceproperty.py': PYDEV_FILE,
     'pydevd_tracing.py': PYDEV_FILE,
     'pydevd_utils.py': PYDEV_FILE,
     'pydevd_vars.py': PYDEV_FILE,
     'pydevd_vm_type.py': PYDEV_FILE,
+    'pydevd_warm_cache.py': PYDEV_FILE,
     'pydevd_xml.py': PYDEV_FILE,
 }
 
@@ -727,7 +727,10 @@ class PyDBFrame:
                         stop = False
                         stop_on_plugin_breakpoint = False
 
-                        if info.pydev_message is not None and len(info.pydev_message) > 0:
+                        if py_db.tracepoints is not None:
+                            py_db.tracepoints.add_hit(breakpoint, new_frame)
+
+                        elif info.pydev_message is not None and len(info.pydev_message) > 0:
                             cmd = py_db.cmd_factory.make_io_message(info.pydev_message + os.linesep, "1")
                             py_db.writer.add_command(cmd)
 
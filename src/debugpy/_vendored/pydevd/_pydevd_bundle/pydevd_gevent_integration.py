@@ -1,64 +1,120 @@
+import gc
+import weakref
+
 import pydevd_tracing
 import greenlet
 import gevent
-from _pydev_bundle._pydev_saved_modules import threading
-from _pydevd_bundle.pydevd_custom_frames import add_custom_frame, update_custom_frame, remove_custom_frame
-from _pydevd_bundle.pydevd_constants import GEVENT_SHOW_PAUSED_GREENLETS, get_global_debugger, thread_get_ident
+from _pydevd_bundle.pydevd_comm_constants import (
+    CMD_SMART_STEP_INTO,
+    CMD_STEP_INTO,
+    CMD_STEP_INTO_COROUTINE,
+    CMD_STEP_INTO_MY_CODE,
+    CMD_STEP_OVER,
+    CMD_STEP_OVER_MY_CODE,
+    CMD_STEP_RETURN,
+    CMD_STEP_RETURN_MY_CODE,
+)
+from _pydevd_bundle.pydevd_custom_frames import add_custom_frame
+from _pydevd_bundle.pydevd_constants import GEVENT_SHOW_PAUSED_GREENLETS, thread_get_ident
 from _pydev_bundle import pydev_log
 from pydevd_file_utils import basename
 
-_saved_greenlets_to_custom_frame_thread_id = {}
 
-if GEVENT_SHOW_PAUSED_GREENLETS:
+def _get_paused_name(py_db, g):
+    frame = g.gr_frame
+    use_frame = frame
+
+    # i.e.: Show in the description of the greenlet the last user-code found.
+    while use_frame is not None:
+        if py_db.apply_files_filter(use_frame, use_frame.f_code.co_filename, True):
+            frame = use_frame
+            use_frame = use_frame.f_back
+        else:
+            break
 
-    def _get_paused_name(py_db, g):
-        frame = g.gr_frame
+    if use_frame is None:
         use_frame = frame
 
-        # i.e.: Show in the description of the greenlet the last user-code found.
-        while use_frame is not None:
-            if py_db.apply_files_filter(use_frame, use_frame.f_code.co_filename, True):
-                frame = use_frame
-                use_frame = use_frame.f_back
-            else:
-                break
-
-        if use_frame is None:
-            use_frame = frame
-
-        return "%s: %s - %s" % (type(g).__name__, use_frame.f_code.co_name, basename(use_frame.f_code.co_filename))
-
-    def greenlet_events(event, args):
-        if event in ("switch", "throw"):
-            py_db = get_global_debugger()
-            origin, target = args
-
-            if not origin.dead and origin.gr_frame is not None:
-                frame_custom_thread_id = _saved_greenlets_to_custom_frame_thread_id.get(origin)
-                if frame_custom_thread_id is None:
-                    _saved_greenlets_to_custom_frame_thread_id[origin] = add_custom_frame(
-                        origin.gr_frame, _get_paused_name(py_db, origin), thread_get_ident()
-                    )
-                else:
-                    update_custom_frame(frame_custom_thread_id, origin.gr_frame, _get_paused_name(py_db, origin), thread_get_ident())
-            else:
-                frame_custom_thread_id = _saved_greenlets_to_custom_frame_thread_id.pop(origin, None)
-                if frame_custom_thread_id is not None:
-                    remove_custom_frame(frame_custom_thread_id)
-
-            # This one will be resumed, so, remove custom frame from it.
-            frame_custom_thread_id = _saved_greenlets_to_custom_frame_thread_id.pop(target, None)
-            if frame_custom_thread_id is not None:
-                remove_custom_frame(frame_custom_thread_id)
-
-        # The tracing needs to be reapplied for each greenlet as gevent
-        # clears the tracing set through sys.settrace for each greenlet.
-        pydevd_tracing.reapply_settrace()
-
-else:
-    # i.e.: no logic related to showing paused greenlets is needed.
-    def greenlet_events(event, args):
-        pydevd_tracing.reapply_settrace()
+    return "%s: %s - %s" % (type(g).__name__, use_frame.f_code.co_name, basename(use_frame.f_code.co_filename))
+
+
+def _get_root(g):
+    while g.parent is not None:
+        g = g.parent
+    return g
+
+
+_STEP_REASONS = frozenset(
+    (
+        CMD_STEP_INTO,
+        CMD_STEP_INTO_MY_CODE,
+        CMD_STEP_OVER,
+        CMD_STEP_OVER_MY_CODE,
+        CMD_STEP_RETURN,
+        CMD_STEP_RETURN_MY_CODE,
+        CMD_STEP_INTO_COROUTINE,
+        CMD_SMART_STEP_INTO,
+    )
+)
+
+# greenlet -> the custom thread id used to show it paused (or None if it wasn't shown yet). Besides
+# keeping the ids stable across stops, its keys are the greenlets considered when stepping.
+_greenlet_to_custom_thread_id = weakref.WeakKeyDictionary()
+
+
+def add_paused_greenlets_custom_frames(py_db, stop_reason=None):
+    """
+    Shows the greenlets paused in the current thread as custom frames (used when the
+    current thread is about to be suspended, so, the paused greenlets are only discovered
+    at that point and not tracked on each switch).
+
+    :param int stop_reason:
+        The reason for the stop. When stepping, the heap isn't searched for new greenlets
+        (greenlets created while stepping are shown in the next stop which isn't a step).
+
+    :return list(str):
+        The custom thread ids added (which should be removed with remove_custom_frame
+        when the thread is resumed).
+    """
+    if not GEVENT_SHOW_PAUSED_GREENLETS:
+        return []
+
+    current = greenlet.getcurrent()
+    root = _get_root(current)
+    thread_id = thread_get_ident()
+
+    if stop_reason in _STEP_REASONS:
+        greenlets = list(_greenlet_to_custom_thread_id.keys())
+    else:
+        greenlets = [obj for obj in gc.get_objects() if isinstance(obj, greenlet.greenlet)]
+
+    if current not in _greenlet_to_custom_thread_id:
+        _greenlet_to_custom_thread_id[current] = None
+
+    custom_frame_thread_ids = []
+    for g in greenlets:
+        if g is current:
+            continue
+        try:
+            if g.dead or g.gr_frame is None or _get_root(g) is not root:
+                continue
+            custom_frame_thread_id = add_custom_frame(
+                g.gr_frame,
+                _get_paused_name(py_db, g),
+                thread_id,
+                frame_custom_thread_id=_greenlet_to_custom_thread_id.get(g),
+            )
+            _greenlet_to_custom_thread_id[g] = custom_frame_thread_id
+            custom_frame_thread_ids.append(custom_frame_thread_id)
+        except:
+            pydev_log.exception("Error showing paused greenlet: %s", g)
+    return custom_frame_thread_ids
+
+
+def greenlet_events(event, args):
+    # The tracing needs to be reapplied for each greenlet as gevent
+    # clears the tracing set through sys.settrace for each greenlet.
+    pydevd_tracing.reapply_settrace()
 
 
 def enable_gevent_integration():
@@ -69,14 +125,9 @@ def enable_gevent_integration():
     # Note: gevent.version_info is WRONG (gevent.__version__ must be used).
     try:
         if tuple(int(x) for x in gevent.__version__.split(".")[:2]) <= (20, 0):
-            if not GEVENT_SHOW_PAUSED_GREENLETS:
-                return
-
-            if not hasattr(greenlet, "settrace"):
-                # In older versions it was optional.
-                # We still try to use if available though.
-                pydev_log.debug("greenlet.settrace not available. GEVENT_SHOW_PAUSED_GREENLETS will have no effect.")
-                return
+            # Older versions don't clear the tracing for each greenlet (and paused
+            # greenlets are discovered when suspending, so, switches needn't be traced).
+            return
         try:
             greenlet.settrace(greenlet_events)
         except:
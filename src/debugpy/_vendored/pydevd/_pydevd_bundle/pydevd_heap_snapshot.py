@@ -0,0 +1,285 @@
+"""
+A snapshot of the objects tracked by the garbage collector, with a reverse-reference
+index, so that many object-graph queries (referrers, referents, paths to roots and
+per-type statistics) can be answered with a single pass over the heap (as opposed
+to gc.get_referrers(), which scans the whole heap for each queried object).
+
+Note that the snapshot keeps all the objects alive, so, it should only be kept while
+the program is suspended (it's kept by the _FramesTracker of the suspended thread).
+"""
+import gc
+import sys
+import types
+from array import array
+from collections import deque
+
+from os.path import basename
+
+
+def _is_internal_frame(frame):
+    return basename(frame.f_code.co_filename).startswith(("pydev", "_pydev"))
+
+
+def get_found_as(referrer, obj):
+    """
+    :return str:
+        How the referrer references the given object (i.e.: a dict key, an attribute name,
+        a list index), or an empty string if it couldn't be discovered.
+    """
+    try:
+        if isinstance(referrer, dict):
+            for key, value in referrer.items():
+                if value is obj:
+                    return "[%r]" % (key,)
+
+        elif isinstance(referrer, (list, tuple)):
+            for i, value in enumerate(referrer):
+                if value is obj:
+                    return "[%s]" % (i,)
+
+        elif isinstance(referrer, types.FrameType):
+            for key, value in referrer.f_locals.items():
+                if value is obj:
+                    return key
+
+        else:
+            instance_dict = getattr(referrer, "__dict__", None)
+            if isinstance(instance_dict, dict):
+                for key, value in instance_dict.items():
+                    if value is obj:
+                        return "." + str(key)
+    except Exception:
+        pass
+    return ""
+
+
+class HeapSnapshot(object):
+    def __init__(self):
+        objects = gc.get_objects()
+        self._id_to_obj = id_to_obj = {}
+        self._id_to_referrer_ids = id_to_referrer_ids = {}
+
+        # The structures of the snapshot itself and the debugger frames must not be
+        # reported as referrers.
+        internal_ids = {id(self), id(objects), id(id_to_obj), id(id_to_referrer_ids)}
+
+        # Running frames (and their locals) may not be visible to the garbage collector
+        # (they're referenced by the thread stack), so, they're added explicitly (with
+        # their locals as referents).
+        frame_id_to_locals = {}
+        for frame in sys._current_frames().values():
+            while frame is not None:
+                if not _is_internal_frame(frame):
+                    f_locals = frame.f_locals
+                    if isinstance(f_locals, dict) and f_locals is not frame.f_globals:
+                        # Just a snapshot of the locals (the frame is reported instead).
+                        internal_ids.add(id(f_locals))
+                    frame_id_to_locals[id(frame)] = list(f_locals.values())
+                    objects.append(frame)
+                frame = frame.f_back
+        frame = f_locals = None
+        internal_ids.add(id(frame_id_to_locals))
+
+        for obj in objects:
+            obj_id = id(obj)
+            if obj_id in internal_ids or obj_id in id_to_obj:
+                continue
+            if isinstance(obj, types.FrameType) and _is_internal_frame(obj):
+                continue
+            id_to_obj[obj_id] = obj
+
+            referents = gc.get_referents(obj)
+            frame_locals = frame_id_to_locals.get(obj_id)
+            if frame_locals is not None:
+                referents.extend(frame_locals)
+
+            for referent in referents:
+                referent_id = id(referent)
+                referrer_ids = id_to_referrer_ids.get(referent_id)
+                if referrer_ids is None:
+                    id_to_referrer_ids[referent_id] = [obj_id]
+                else:
+                    referrer_ids.append(obj_id)
+
+        del objects
+        del frame_id_to_locals
+
+    def __len__(self):
+        return len(self._id_to_obj)
+
+    def get_referrers(self, obj):
+        """
+        :return list(object):
+            The objects (from the snapshot) which reference the given object.
+        """
+        id_to_obj = self._id_to_obj
+        referrers = []
+        for referrer_id in self._id_to_referrer_ids.get(id(obj), ()):
+            referrer = id_to_obj.get(referrer_id)
+            if referrer is not None:
+                referrers.append(referrer)
+        return referrers
+
+    def get_referents(self, obj):
+        """
+        :return list(object):
+            The objects referenced by the given object.
+        """
+        return gc.get_referents(obj)
+
+    def get_path_to_root(self, obj, max_depth=20):
+        """
+        Searches (breadth-first) for the shortest chain of referrers from a root (a module or
+        a frame of the program) to the given object.
+
+        :return list(object):
+            The path from the root to the given object (inclusive), or an empty list if
+            no root was found in up to max_depth steps.
+        """
+        obj_id = id(obj)
+        id_to_obj = self._id_to_obj
+        id_to_referrer_ids = self._id_to_referrer_ids
+
+        # id -> id of the object it references in the path (i.e.: one step closer to obj).
+        parents = {obj_id: None}
+        queue = deque([(obj_id, 0)])
+        while queue:
+            curr_id, depth = queue.popleft()
+            curr = obj if curr_id == obj_id else id_to_obj.get(curr_id)
+            if curr_id != obj_id and isinstance(curr, (types.ModuleType, types.FrameType)):
+                path = []
+                while curr_id is not None:
+                    path.append(obj if curr_id == obj_id else id_to_obj[curr_id])
+                    curr_id = parents[curr_id]
+                return path
+
+            if depth >= max_depth:
+                continue
+
+            for referrer_id in id_to_referrer_ids.get(curr_id, ()):
+                if referrer_id not in parents and referrer_id in id_to_obj:
+                    parents[referrer_id] = curr_id
+                    queue.append((referrer_id, depth + 1))
+        return []
+
+    def get_type_stats(self, max_types=100):
+        """
+        :return list(tuple(str, int, int)):
+            The (type name, number of instances, total size in bytes) of the types with
+            the most memory used by their instances (only objects tracked by the garbage
+            collector are considered and the size is shallow, as given by sys.getsizeof).
+        """
+        return TypeStatsSummary.create(self._id_to_obj.values()).get_top_types(max_types)
+
+
+def _get_type_name(obj_type):
+    return "%s.%s" % (obj_type.__module__, obj_type.__qualname__)
+
+
+class TypeStatsSummary(object):
+    """
+    The number of instances and the total (shallow) size of the instances of each type at
+    some point (i.e.: to be diffed with a later summary to know which types are growing).
+
+    It's compact (only the type names are kept along with arrays with the counts and sizes)
+    and may be kept across suspensions. Note that if it's created with samples, those are
+    strong references to the sampled instances, so, such a summary should be discarded as
+    soon as the samples aren't needed anymore (a summary without samples doesn't keep any
+    object alive).
+    """
+
+    def __init__(self, type_names, counts, sizes, samples=None):
+        self.type_names = type_names
+        self.counts = array("q", counts)
+        self.sizes = array("q", sizes)
+
+        # type index -> list(object) (only available if requested when created).
+        self.samples = samples if samples is not None else {}
+
+    @classmethod
+    def create(cls, objects=None, max_samples=0):
+        """
+        :param objects:
+            The objects to be summarized (if not given, all the objects tracked by the
+            garbage collector are used).
+
+        :param int max_samples:
+            The number of instances of each type to be kept as samples (as gc.get_objects()
+            provides the objects in the youngest generations first, those are usually the
+            most recently created instances).
+        """
+        if objects is None:
+            objects = gc.get_objects()
+
+        type_to_index = {}
+        type_names = []
+        counts = []
+        sizes = []
+        samples = {}
+        getsizeof = sys.getsizeof
+        for obj in objects:
+            obj_type = type(obj)
+            i = type_to_index.get(obj_type)
+            if i is None:
+                i = type_to_index[obj_type] = len(type_names)
+                type_names.append(_get_type_name(obj_type))
+                counts.append(0)
+                sizes.append(0)
+            count = counts[i] = counts[i] + 1
+            try:
+                sizes[i] += getsizeof(obj)
+            except Exception:
+                pass
+
+            if count <= max_samples:
+                type_samples = samples.get(i)
+                if type_samples is None:
+                    samples[i] = [obj]
+                else:
+                    type_samples.append(obj)
+
+        return cls(type_names, counts, sizes, samples)
+
+    def __len__(self):
+        return sum(self.counts)
+
+    def get_top_types(self, max_types=100):
+        """
+        :return list(tuple(str, int, int)):
+            The (type name, number of instances, total size in bytes) of the types with the
+            most memory used by their instances.
+        """
+        ret = list(zip(self.type_names, self.counts, self.sizes))
+        ret.sort(key=lambda entry: (-entry[2], entry[0]))
+        return ret[:max_types]
+
+    def diff(self, baseline, max_types=100):
+        """
+        :param TypeStatsSummary baseline:
+            A summary created before this one.
+
+        :return list(tuple(str, int, int, int, int, list(object))):
+            The (type name, number of instances, total size in bytes, instances delta, size delta,
+            samples) of the types which grew the most (in memory used) since the baseline.
+        """
+        baseline_name_to_index = dict((name, i) for i, name in enumerate(baseline.type_names))
+        baseline_counts = baseline.counts
+        baseline_sizes = baseline.sizes
+
+        ret = []
+        for i, name in enumerate(self.type_names):
+            count = self.counts[i]
+            size = self.sizes[i]
+            j = baseline_name_to_index.get(name)
+            if j is None:
+                count_delta = count
+                size_delta = size
+            else:
+                count_delta = count - baseline_counts[j]
+                size_delta = size - baseline_sizes[j]
+
+            if count_delta > 0 or size_delta > 0:
+                ret.append((name, count, size, count_delta, size_delta, self.samples.get(i, [])))
+
+        ret.sort(key=lambda entry: (-entry[4], -entry[3], entry[0]))
+        return ret[:max_types]
@@ -3,6 +3,7 @@ import itertools
 import os
 import sys
 import socket as socket_module
+import time
 
 from _pydev_bundle._pydev_imports_tipper import TYPE_IMPORT, TYPE_CLASS, TYPE_FUNCTION, TYPE_ATTR, TYPE_BUILTIN, TYPE_PARAM
 from _pydev_bundle.pydev_is_thread_alive import is_thread_alive
@@ -43,11 +44,15 @@ from _pydevd_bundle.pydevd_comm_constants import (
     CMD_SMART_STEP_INTO,
     CMD_SET_FUNCTION_BREAK,
     CMD_THREAD_RUN,
+    CMD_PREFETCH_EVENT,
+    CMD_PROFILE_EVENT,
+    CMD_TRACEPOINTS_EVENT,
 )
 from _pydevd_bundle.pydevd_constants import get_thread_id, ForkSafeLock, DebugInfoHolder
-from _pydevd_bundle.pydevd_net_command import NetCommand, NULL_NET_COMMAND
+from _pydevd_bundle.pydevd_net_command import NetCommand, NULL_NET_COMMAND, _BaseNetCommand
 from _pydevd_bundle.pydevd_net_command_factory_xml import NetCommandFactory
-from _pydevd_bundle.pydevd_utils import get_non_pydevd_threads
+from _pydevd_bundle.pydevd_utils import get_non_pydevd_threads, ScopeRequest
+from _pydevd_bundle.pydevd_safe_repr import SafeRepr
 import pydevd_file_utils
 from _pydevd_bundle.pydevd_comm import build_exception_info_response
 from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
@@ -57,21 +62,46 @@ from io import StringIO
 from _pydev_bundle import pydev_log
 
 
+class _ModuleEventsNetCommand(_BaseNetCommand):
+    """
+    Sends the module events pending in the ModulesManager.
+
+    The events are only created when the writer gets to this command (so, building a stack trace
+    which discovers new modules doesn't need to create them) and all the events pending at that
+    point are sent at once.
+    """
+
+    id = CMD_MODULE_EVENT
+
+    def __init__(self, modules_manager, py_db):
+        self._modules_manager = modules_manager
+        self._py_db = py_db
+
+    def send(self, sock):
+        for cmd in self._modules_manager.create_pending_module_events():
+            for listener in self._py_db.dap_messages_listeners:
+                listener.before_send(cmd.as_dict)
+            cmd.send(sock)
+
+
 class ModulesManager(object):
     def __init__(self):
         self._lock = ForkSafeLock()
         self._modules = {}
         self._next_id = partial(next, itertools.count(0))
 
+        # Modules tracked whose events still weren't sent.
+        self._pending_modules = []
+        self._module_events_scheduled = False
+
     def track_module(self, filename_in_utf8, module_name, frame):
         """
-        :return list(NetCommand):
-            Returns a list with the module events to be sent.
+        Tracks the module for the given file (if still not tracked). Note that the related module
+        event is only sent after schedule_module_events is called.
         """
         if filename_in_utf8 in self._modules:
-            return []
+            return
 
-        module_events = []
         with self._lock:
             # Must check again after getting the lock.
             if filename_in_utf8 in self._modules:
@@ -97,19 +127,50 @@ class ModulesManager(object):
                 # Note: package doesn't appear in the docs but seems to be expected?
                 module.kwargs["package"] = package_name
 
-            module_event = ModuleEvent(ModuleEventBody("new", module))
+            self._pending_modules.append(module)
+            self._modules[filename_in_utf8] = module.to_dict()
 
-            module_events.append(NetCommand(CMD_MODULE_EVENT, 0, module_event, is_json=True))
+    def schedule_module_events(self, py_db):
+        """
+        Adds a command to the writer to send the events of the modules tracked so far (if there's
+        no such command already waiting to be sent).
+        """
+        with self._lock:
+            if not self._pending_modules or self._module_events_scheduled:
+                return
+            self._module_events_scheduled = True
 
-            self._modules[filename_in_utf8] = module.to_dict()
-        return module_events
+        py_db.writer.add_command(_ModuleEventsNetCommand(self, py_db))
 
-    def get_modules_info(self):
+    def create_pending_module_events(self):
         """
-        :return list(Module)
+        :return list(NetCommand):
+            Returns a list with the module events to be sent.
         """
         with self._lock:
-            return list(self._modules.values())
+            pending_modules = self._pending_modules
+            self._pending_modules = []
+            self._module_events_scheduled = False
+
+        return [NetCommand(CMD_MODULE_EVENT, 0, ModuleEvent(ModuleEventBody("new", module)), is_json=True) for module in pending_modules]
+
+    def get_modules_info(self, start_module=0, module_count=0):
+        """
+        :param int start_module:
+            The index of the first module to return.
+
+        :param int module_count:
+            The maximum number of modules to return (if 0, all the modules from start_module
+            are returned).
+
+        :return tuple(list(Module), int):
+            The requested modules and the total number of modules.
+        """
+        with self._lock:
+            modules = list(self._modules.values())
+
+        end_module = start_module + module_count if module_count else None
+        return modules[start_module:end_module], len(modules)
 
 
 class NetCommandFactoryJson(NetCommandFactory):
@@ -237,8 +298,62 @@ class NetCommandFactoryJson(NetCommandFactory):
 
     @overrides(NetCommandFactory.make_get_thread_stack_message)
     def make_get_thread_stack_message(self, py_db, seq, thread_id, topmost_frame, fmt, must_be_suspended=False, start_frame=0, levels=0):
+        stack = self._make_stack_frames(py_db, thread_id, topmost_frame, fmt, must_be_suspended, start_frame, levels)
+        if stack is None:
+            return None
+        frames, total_frames = stack
+
+        response = pydevd_schema.StackTraceResponse(
+            request_seq=seq,
+            success=True,
+            command="stackTrace",
+            body=pydevd_schema.StackTraceResponseBody(stackFrames=frames, totalFrames=total_frames),
+        )
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def make_get_stack_traces_message(self, py_db, seq, thread_ids, fmt, start_frame=0, levels=0):
+        """
+        Provides the stacks of many suspended threads in a single response (threads which aren't
+        suspended are skipped).
+        """
+        stack_traces = []
+        for thread_id in thread_ids:
+            stack = self._make_stack_frames(py_db, thread_id, None, fmt, True, start_frame, levels)
+            if stack is None:
+                continue
+            frames, total_frames = stack
+
+            # Note: the threadId is translated when the response is converted to a dict, but the
+            # ids of the nested frames must be translated here.
+            stack_traces.append(
+                pydevd_schema.PydevdStackTrace(
+                    threadId=thread_id,
+                    stackFrames=[pydevd_schema.StackFrame.update_dict_ids_to_dap(frame) for frame in frames],
+                    totalFrames=total_frames,
+                ).to_dict()
+            )
+
+        response = pydevd_schema.PydevdStackTracesResponse(
+            request_seq=seq,
+            success=True,
+            command="pydevdStackTraces",
+            body=pydevd_schema.PydevdStackTracesResponseBody(stackTraces=stack_traces),
+        )
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def _make_stack_frames(self, py_db, thread_id, topmost_frame, fmt, must_be_suspended, start_frame, levels):
+        """
+        :return tuple(list(dict), int)|None:
+            The (StackFrame dicts, totalFrames) or None if must_be_suspended is True and the
+            thread isn't suspended.
+        """
         frames = []
-        module_events = []
+
+        # Only the frames in the requested window are formatted (the ones before it just need
+        # to be counted to know whether they're visible) and we stop as soon as the window is
+        # filled.
+        end_frame = start_frame + levels if levels else None
+        total_frames = None
 
         try:
             # : :type suspended_frames_manager: SuspendedFramesManager
@@ -251,6 +366,8 @@ class NetCommandFactoryJson(NetCommandFactory):
                 else:
                     frames_list = pydevd_frame_utils.create_frames_list_from_frame(topmost_frame)
 
+            visible_frames = 0
+            filename_to_exists = {}
             for (
                 frame_id,
                 frame,
@@ -262,36 +379,54 @@ class NetCommandFactoryJson(NetCommandFactory):
                 show_as_current_frame,
                 line_col_info,
             ) in self._iter_visible_frames_info(py_db, frames_list, flatten_chained=True):
+                if end_frame is not None and visible_frames >= end_frame:
+                    # There are more frames, but computing how many are actually visible would
+                    # require going through all of them. The DAP allows an estimate as long as it's
+                    # bigger than the actual number (the client requests more frames until it
+                    # receives less frames than requested), so, provide an upper bound.
+                    total_frames = max(self._count_frames(frames_list), visible_frames + 1)
+                    break
+
+                is_plugin_frame = getattr(frame, "IS_PLUGIN_FRAME", False)
+                if not is_plugin_frame:  # Never filter out plugin frames!
+                    if py_db.is_files_filter_enabled and py_db.apply_files_filter(frame, original_filename, False):
+                        continue
+
+                visible_frames += 1
+                if visible_frames <= start_frame:
+                    continue
+
                 try:
                     module_name = str(frame.f_globals.get("__name__", ""))
                 except:
                     module_name = "<unknown>"
 
-                module_events.extend(self.modules_manager.track_module(filename_in_utf8, module_name, frame))
+                self.modules_manager.track_module(filename_in_utf8, module_name, frame)
 
                 presentation_hint = None
-                if not getattr(frame, "IS_PLUGIN_FRAME", False):  # Never filter out plugin frames!
-                    if py_db.is_files_filter_enabled and py_db.apply_files_filter(frame, original_filename, False):
-                        continue
-
-                    if not py_db.in_project_scope(frame):
-                        presentation_hint = "subtle"
+                if not is_plugin_frame and not py_db.in_project_scope(frame):
+                    presentation_hint = "subtle"
 
                 formatted_name = self._format_frame_name(fmt, method_name, module_name, lineno, filename_in_utf8)
                 if show_as_current_frame:
                     formatted_name += " (Current frame)"
                 source_reference = pydevd_file_utils.get_client_filename_source_reference(filename_in_utf8)
 
-                if not source_reference and not applied_mapping and not os.path.exists(original_filename):
-                    if getattr(frame.f_code, "co_lines", None) or getattr(frame.f_code, "co_lnotab", None):
-                        # Create a source-reference to be used where we provide the source by decompiling the code.
-                        # Note: When the time comes to retrieve the source reference in this case, we'll
-                        # check the linecache first (see: get_decompiled_source_from_frame_id).
-                        source_reference = pydevd_file_utils.create_source_reference_for_frame_id(frame_id, original_filename)
-                    else:
-                        # Check if someone added a source reference to the linecache (Python attrs does this).
-                        if linecache.getline(original_filename, 1):
-                            source_reference = pydevd_file_utils.create_source_reference_for_linecache(original_filename)
+                if not source_reference and not applied_mapping:
+                    exists = filename_to_exists.get(original_filename)
+                    if exists is None:
+                        exists = filename_to_exists[original_filename] = os.path.exists(original_filename)
+
+                    if not exists:
+                        if getattr(frame.f_code, "co_lines", None) or getattr(frame.f_code, "co_lnotab", None):
+                            # Create a source-reference to be used where we provide the source by decompiling the code.
+                            # Note: When the time comes to retrieve the source reference in this case, we'll
+                            # check the linecache first (see: get_decompiled_source_from_frame_id).
+                            source_reference = pydevd_file_utils.create_source_reference_for_frame_id(frame_id, original_filename)
+                        else:
+                            # Check if someone added a source reference to the linecache (Python attrs does this).
+                            if linecache.getline(original_filename, 1):
+                                source_reference = pydevd_file_utils.create_source_reference_for_linecache(original_filename)
 
                 column = 1
                 endcol = None
@@ -325,23 +460,114 @@ class NetCommandFactoryJson(NetCommandFactory):
         finally:
             topmost_frame = None
 
-        for module_event in module_events:
-            py_db.writer.add_command(module_event)
+        self.modules_manager.schedule_module_events(py_db)
 
-        total_frames = len(frames)
-        stack_frames = frames
-        if bool(levels):
-            start = start_frame
-            end = min(start + levels, total_frames)
-            stack_frames = frames[start:end]
+        if total_frames is None:
+            total_frames = visible_frames
 
-        response = pydevd_schema.StackTraceResponse(
-            request_seq=seq,
-            success=True,
-            command="stackTrace",
-            body=pydevd_schema.StackTraceResponseBody(stackFrames=stack_frames, totalFrames=total_frames),
+        return frames, total_frames
+
+    def _count_frames(self, frames_list):
+        count = 0
+        while frames_list is not None:
+            count += len(frames_list)
+            frames_list = frames_list.chained_frames_list
+        return count
+
+    @overrides(NetCommandFactory.make_prefetch_message)
+    def make_prefetch_message(self, py_db, thread_id):
+        """
+        Provides the data which clients usually request right after a thread is suspended (its first
+        frames, the scopes of the top frame and the variables in its 'Locals' scope).
+
+        Must be called from the suspended thread (after its frames are tracked).
+        """
+        initial_time = time.time()
+        stack = self._make_stack_frames(py_db, thread_id, None, {}, True, 0, pydevd_constants.PYDEVD_PREFETCH_LEVELS)
+        if stack is None:
+            return NULL_NET_COMMAND
+        frames, total_frames = stack
+
+        scopes = None
+        variables = None
+        if frames:
+            frame_id = frames[0]["id"]
+            scopes = [
+                pydevd_schema.Scope("Locals", ScopeRequest(frame_id, "locals"), False, presentationHint="locals").to_dict(),
+                pydevd_schema.Scope("Globals", ScopeRequest(frame_id, "globals"), False).to_dict(),
+            ]
+            variables = self._make_prefetch_variables(py_db, thread_id, frame_id, initial_time)
+
+        body = pydevd_schema.PydevdPrefetchEventBody(
+            threadId=thread_id,
+            stackFrames=frames,
+            totalFrames=total_frames,
+            scopes=scopes,
+            variables=variables,
         )
-        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+        return NetCommand(CMD_PREFETCH_EVENT, 0, pydevd_schema.PydevdPrefetchEvent(body), is_json=True)
+
+    def _make_prefetch_variables(self, py_db, thread_id, frame_id, initial_time):
+        frame = py_db.find_frame(thread_id, frame_id)
+        if frame is None:
+            return None
+
+        try:
+            if len(frame.f_locals) > pydevd_constants.PYDEVD_PREFETCH_MAX_VARIABLES:
+                return None
+
+            try:
+                variable = py_db.suspended_frames_manager.get_variable(frame_id)
+            except KeyError:
+                return None
+
+            variables = []
+            safe_repr = SafeRepr()
+            for child_var in variable.get_children_variables(scope=ScopeRequest(frame_id, "locals")):
+                if time.time() - initial_time > pydevd_constants.PYDEVD_PREFETCH_TIMEOUT:
+                    # The client will have to request it.
+                    return None
+                variables.append(child_var.get_var_data(safe_repr=safe_repr))
+            return variables
+        finally:
+            frame = None
+
+    @overrides(NetCommandFactory.make_profile_message)
+    def make_profile_message(self, frames, nodes, samples, done):
+        """
+        :param list(tuple(str, str, int)) frames:
+            The (name, filename, line) of the functions first seen since the last message.
+
+        :param list(int) nodes:
+            The flattened nodes of the tree with the sampled stacks (see StackTrie.pop_nodes()).
+        """
+        profile_frames = []
+        for name, filename, line in frames:
+            path = pydevd_file_utils.map_file_to_client(filename)[0]
+            profile_frames.append(pydevd_schema.PydevdProfileFrame(name, path, line).to_dict())
+
+        body = pydevd_schema.PydevdProfileEventBody(frames=profile_frames, nodes=nodes, samples=samples, done=done)
+        return NetCommand(CMD_PROFILE_EVENT, 0, pydevd_schema.PydevdProfileEvent(body), is_json=True)
+
+    @overrides(NetCommandFactory.make_tracepoints_message)
+    def make_tracepoints_message(self, hits, stats):
+        """
+        :param list(tuple(int, str, float, str)) hits:
+            The (breakpoint id, thread id, timestamp, message) of the captured hits.
+
+        :param list(tuple(int, int, int, int)) stats:
+            The (breakpoint id, hits, captured, dropped) of the tracepoints.
+        """
+        tracepoint_hits = [
+            pydevd_schema.PydevdTracepointHit(breakpoint_id, thread_id, timestamp, message).to_dict()
+            for breakpoint_id, thread_id, timestamp, message in hits
+        ]
+        tracepoints = [
+            pydevd_schema.PydevdTracepointStats(breakpoint_id, hit_count, captured, dropped).to_dict()
+            for breakpoint_id, hit_count, captured, dropped in stats
+        ]
+        body = pydevd_schema.PydevdTracepointsEventBody(hits=tracepoint_hits, tracepoints=tracepoints)
+        return NetCommand(CMD_TRACEPOINTS_EVENT, 0, pydevd_schema.PydevdTracepointsEvent(body), is_json=True)
 
     @overrides(NetCommandFactory.make_warning_message)
     def make_warning_message(self, msg):
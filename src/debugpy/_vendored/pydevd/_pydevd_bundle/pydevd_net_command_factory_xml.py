@@ -124,6 +124,15 @@ class NetCommandFactory(object):
         except:
             return self.make_error_message(seq, get_exception_traceback_str())
 
+    def make_prefetch_message(self, py_db, thread_id):
+        return NULL_NET_COMMAND  # Not a part of the xml protocol
+
+    def make_profile_message(self, frames, nodes, samples, done):
+        return NULL_NET_COMMAND  # Not a part of the xml protocol
+
+    def make_tracepoints_message(self, hits, stats):
+        return NULL_NET_COMMAND  # Not a part of the xml protocol
+
     def make_get_thread_stack_message(self, py_db, seq, thread_id, topmost_frame, fmt, must_be_suspended=False, start_frame=0, levels=0):
         """
         Returns thread stack as XML.
@@ -28,6 +28,8 @@ from _pydevd_bundle._debug_adapter.pydevd_schema import (
     Response,
     Capabilities,
     PydevdAuthorizeRequest,
+    PydevdEvaluateManyResponseBody,
+    PydevdHeapSnapshotResponseBody,
     Request,
     StepInTargetsResponseBody,
     SetFunctionBreakpointsResponseBody,
@@ -50,6 +52,7 @@ from _pydevd_bundle.pydevd_comm_constants import (
     CMD_STEP_RETURN,
 )
 from _pydevd_bundle.pydevd_filtering import ExcludeFilter
+from _pydevd_bundle.pydevd_sampling_profiler import DEFAULT_FLUSH_INTERVAL, DEFAULT_SAMPLES_PER_SECOND
 from _pydevd_bundle.pydevd_json_debug_options import _extract_debug_options, DebugOptions
 from _pydevd_bundle.pydevd_net_command import NetCommand
 from _pydevd_bundle.pydevd_utils import convert_dap_log_message_to_expression, ScopeRequest
@@ -354,6 +357,28 @@ class PyDevJsonCommandProcessor(object):
     def _request_terminate_process(self, py_db):
         self.api.request_terminate_process(py_db)
 
+    def _make_snapshot_thread_response(self, py_db, request, variables_reference, body):
+        """
+        The frames of a thread which was asked to suspend but which still hasn't actually
+        suspended (i.e.: it's blocked in a lock) are only available from a snapshot (see:
+        SuspendedFramesManager.track_snapshot). Requests which need to run code in that
+        thread would never be answered, so, they're rejected right away.
+
+        :return NetCommand or None:
+            The failure response (or None if the variable reference isn't from a snapshot).
+        """
+        if not py_db.suspended_frames_manager.is_snapshot_variable_reference(variables_reference):
+            return None
+        response = pydevd_base_schema.build_response(
+            request,
+            kwargs={
+                "body": body,
+                "success": False,
+                "message": "The thread is not suspended (it's blocked and only its stack is available).",
+            },
+        )
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
     def on_completions_request(self, py_db, request):
         """
         :param CompletionsRequest request:
@@ -371,6 +396,10 @@ class PyDevJsonCommandProcessor(object):
             )
             return NetCommand(CMD_RETURN, 0, variables_response, is_json=True)
 
+        response = self._make_snapshot_thread_response(py_db, request, frame_id, CompletionsResponseBody([]))
+        if response is not None:
+            return response
+
         # Note: line and column are 1-based (convert to 0-based for pydevd).
         column = arguments.column - 1
 
@@ -404,6 +433,11 @@ class PyDevJsonCommandProcessor(object):
         terminate_keyboard_interrupt = args.get("onTerminate", "kill") == "KeyboardInterrupt"
         self.api.set_terminate_keyboard_interrupt(py_db, terminate_keyboard_interrupt)
 
+        self.api.set_prefetch_on_stop(py_db, bool(args.get("prefetchOnStop", False)))
+        self.api.set_snapshot_on_suspend(py_db, bool(args.get("snapshotOnSuspend", False)))
+        self.api.set_inherit_state_on_fork(py_db, bool(args.get("inheritStateOnFork", False)))
+        self.api.set_tracepoints(py_db, args.get("tracepoints", False))
+
         variable_presentation = args.get("variablePresentation", None)
         if isinstance(variable_presentation, dict):
 
@@ -733,6 +767,10 @@ class PyDevJsonCommandProcessor(object):
             )
             return NetCommand(CMD_RETURN, 0, variables_response, is_json=True)
 
+        response = self._make_snapshot_thread_response(py_db, request, frame_id, StepInTargetsResponseBody([]))
+        if response is not None:
+            return response
+
         py_db.post_method_as_internal_command(
             thread_id, internal_get_step_in_targets_json, request.seq, thread_id, frame_id, request, set_additional_thread_info
         )
@@ -1081,6 +1119,67 @@ class PyDevJsonCommandProcessor(object):
             fmt = fmt.to_dict()
         self.api.request_stack(py_db, request.seq, thread_id, fmt=fmt, start_frame=start_frame, levels=levels)
 
+    def on_pydevdstacktraces_request(self, py_db, request):
+        """
+        :param PydevdStackTracesRequest request:
+        """
+        # : :type arguments: PydevdStackTracesArguments
+        arguments = request.arguments
+
+        thread_ids = None
+        if arguments.threadIds is not None:
+            # Note: ids in a list aren't automatically translated from the DAP.
+            thread_ids = []
+            for thread_id in arguments.threadIds:
+                try:
+                    thread_ids.append(pydevd_base_schema.BaseSchema._translate_id_from_dap(thread_id))
+                except KeyError:
+                    pydev_log.info("Unable to find thread for id: %s", thread_id)
+
+        fmt = arguments.format
+        if hasattr(fmt, "to_dict"):
+            fmt = fmt.to_dict()
+        self.api.request_stack_traces(
+            py_db, request.seq, thread_ids, fmt=fmt, start_frame=int(arguments.startFrame or 0), levels=int(arguments.levels or 0)
+        )
+
+    def on_pydevdprofile_request(self, py_db, request):
+        """
+        :param PydevdProfileRequest request:
+        """
+        # : :type arguments: PydevdProfileArguments
+        arguments = request.arguments
+
+        if arguments.action == "start":
+            samples_per_second = arguments.samplesPerSecond or DEFAULT_SAMPLES_PER_SECOND
+            flush_interval = arguments.flushInterval or DEFAULT_FLUSH_INTERVAL
+            if not self.api.start_sampling_profiler(py_db, float(samples_per_second), float(flush_interval)):
+                response = pydevd_base_schema.build_response(
+                    request, kwargs={"body": {"samples": 0}, "success": False, "message": "The profiler is already running."}
+                )
+                return NetCommand(CMD_RETURN, 0, response, is_json=True)
+            samples = 0
+
+        elif arguments.action == "stop":
+            samples = self.api.stop_sampling_profiler(py_db)
+
+        else:
+            response = pydevd_base_schema.build_response(
+                request, kwargs={"body": {"samples": 0}, "success": False, "message": "Unexpected action: %s" % (arguments.action,)}
+            )
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+        response = pydevd_base_schema.build_response(request, kwargs={"body": {"samples": samples}})
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdtracepoints_request(self, py_db, request):
+        """
+        :param PydevdTracepointsRequest request:
+        """
+        hits = self.api.request_tracepoints(py_db)
+        response = pydevd_base_schema.build_response(request, kwargs={"body": {"hits": hits}})
+        return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
     def on_exceptioninfo_request(self, py_db, request):
         """
         :param ExceptionInfoRequest request:
@@ -1140,6 +1239,9 @@ class PyDevJsonCommandProcessor(object):
             thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(arguments.frameId)
 
             if thread_id is not None:
+                response = self._make_snapshot_thread_response(py_db, request, arguments.frameId, EvaluateResponseBody("", 0))
+                if response is not None:
+                    return response
                 self.api.request_exec_or_evaluate_json(py_db, request, thread_id)
             else:
                 body = EvaluateResponseBody("", 0)
@@ -1148,6 +1250,48 @@ class PyDevJsonCommandProcessor(object):
                 )
                 return NetCommand(CMD_RETURN, 0, response, is_json=True)
 
+    def on_pydevdevaluatemany_request(self, py_db, request):
+        """
+        :param PydevdEvaluateManyRequest request:
+        """
+        # : :type arguments: PydevdEvaluateManyArguments
+        arguments = request.arguments
+
+        thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(arguments.frameId)
+
+        if thread_id is not None:
+            response = self._make_snapshot_thread_response(py_db, request, arguments.frameId, PydevdEvaluateManyResponseBody([]))
+            if response is not None:
+                return response
+            self.api.request_evaluate_many_json(py_db, request, thread_id)
+        else:
+            body = PydevdEvaluateManyResponseBody([])
+            response = pydevd_base_schema.build_response(
+                request, kwargs={"body": body, "success": False, "message": "Unable to find thread for evaluation."}
+            )
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
+    def on_pydevdheapsnapshot_request(self, py_db, request):
+        """
+        :param PydevdHeapSnapshotRequest request:
+        """
+        # : :type arguments: PydevdHeapSnapshotArguments
+        arguments = request.arguments
+
+        thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(arguments.frameId)
+
+        if thread_id is not None:
+            response = self._make_snapshot_thread_response(py_db, request, arguments.frameId, PydevdHeapSnapshotResponseBody())
+            if response is not None:
+                return response
+            self.api.request_heap_snapshot_json(py_db, request, thread_id)
+        else:
+            body = PydevdHeapSnapshotResponseBody()
+            response = pydevd_base_schema.build_response(
+                request, kwargs={"body": body, "success": False, "message": "Unable to find thread for heap snapshot."}
+            )
+            return NetCommand(CMD_RETURN, 0, response, is_json=True)
+
     def on_setexpression_request(self, py_db, request):
         # : :type arguments: SetExpressionArguments
         arguments = request.arguments
@@ -1155,6 +1299,9 @@ class PyDevJsonCommandProcessor(object):
         thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(arguments.frameId)
 
         if thread_id is not None:
+            response = self._make_snapshot_thread_response(py_db, request, arguments.frameId, SetExpressionResponseBody(""))
+            if response is not None:
+                return response
             self.api.request_set_expression_json(py_db, request, thread_id)
         else:
             body = SetExpressionResponseBody("")
@@ -1186,6 +1333,10 @@ class PyDevJsonCommandProcessor(object):
 
         thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(variables_reference)
         if thread_id is not None:
+            if py_db.suspended_frames_manager.is_snapshot_variable_reference(variables_reference):
+                # The thread didn't actually suspend (so, it'd never answer): the variables are
+                # gotten from the frames of the snapshot in the command thread.
+                thread_id = "*"
             self.api.request_get_variable_json(py_db, request, thread_id)
         else:
             variables = []
@@ -1211,6 +1362,9 @@ class PyDevJsonCommandProcessor(object):
         thread_id = py_db.suspended_frames_manager.get_thread_id_for_variable_reference(variables_reference)
 
         if thread_id is not None:
+            response = self._make_snapshot_thread_response(py_db, request, variables_reference, SetVariableResponseBody(""))
+            if response is not None:
+                return response
             self.api.request_change_variable_json(py_db, request, thread_id)
         else:
             response = pydevd_base_schema.build_response(
@@ -1225,8 +1379,12 @@ class PyDevJsonCommandProcessor(object):
 
     def on_modules_request(self, py_db, request):
         modules_manager = py_db.cmd_factory.modules_manager  # : :type modules_manager: ModulesManager
-        modules_info = modules_manager.get_modules_info()
-        body = ModulesResponseBody(modules_info)
+        arguments = request.arguments  # : :type arguments: ModulesArguments
+        modules_info, total_modules = modules_manager.get_modules_info(
+            start_module=arguments.startModule or 0,
+            module_count=arguments.moduleCount or 0,
+        )
+        body = ModulesResponseBody(modules_info, totalModules=total_modules)
         variables_response = pydevd_base_schema.build_response(request, kwargs={"body": body})
         return NetCommand(CMD_RETURN, 0, variables_response, is_json=True)
 
@@ -1384,6 +1542,7 @@ class PyDevJsonCommandProcessor(object):
         pydevd_info = pydevd_schema.PydevdInfo(
             usingCython=USING_CYTHON,
             usingFrameEval=USING_FRAME_EVAL,
+            inheritedStateOnFork=py_db.inherited_state_on_fork,
         )
         body = {
             "python": py_info,
@@ -4,8 +4,11 @@
 
 # Gotten from ptvsd for supporting the format expected there.
 import sys
-from _pydevd_bundle.pydevd_constants import IS_PY36_OR_GREATER
+from _pydevd_bundle.pydevd_constants import IS_PY36_OR_GREATER, PYDEVD_REPR_TIMEOUT
 import locale
+import time
+import types
+import weakref
 from _pydev_bundle import pydev_log
 
 
@@ -66,6 +69,32 @@ class SafeRepr(object):
     convert_to_hex = False
     raw_value = False
 
+    # Time (in seconds) to compute a single repr. When it elapses while rendering a collection,
+    # the remaining items are shown as '...' (only if `use_cheap_repr_for_slow_types` is True).
+    # The user's `__repr__` can't be interrupted, so, the types whose `__repr__` take longer than
+    # that are remembered in `slow_repr_types` (a value <= 0 means no limit).
+    time_budget = PYDEVD_REPR_TIMEOUT
+
+    # When set (as a `time.time()` value), collections are also truncated and user-defined
+    # `__repr__` implementations are no longer called after it (i.e.: a single instance may be
+    # reused for all the variables of a request to limit the time spent in the whole request).
+    # Only used if `use_cheap_repr_for_slow_types` is True.
+    deadline = None
+
+    # If True, objects whose type is in `slow_repr_types` (or whose repr is requested after the
+    # deadline) are shown as `<Type object at 0x...>` instead of calling their `__repr__` and
+    # the time budget/deadline apply. If False, the full value is always computed.
+    use_cheap_repr_for_slow_types = False
+
+    # Shared by all instances: type -> [time it took to compute its repr, cheap reprs shown since].
+    # An entry is only used while its time is above the current `time_budget` and it's dropped
+    # after `slow_repr_retry_after` cheap reprs (so that the repr is measured again).
+    slow_repr_types = weakref.WeakKeyDictionary()
+
+    slow_repr_retry_after = 50
+
+    _call_deadline = None
+
     def __call__(self, obj):
         """
         :param object obj:
@@ -74,6 +103,15 @@ class SafeRepr(object):
         :return str:
             Returns bytes encoded as utf-8 on py2 and str on py3.
         """
+        call_deadline = None
+        if self.use_cheap_repr_for_slow_types:
+            call_deadline = self.deadline
+            if self.time_budget > 0:
+                budget_deadline = time.time() + self.time_budget
+                if call_deadline is None or budget_deadline < call_deadline:
+                    call_deadline = budget_deadline
+        self._call_deadline = call_deadline
+
         try:
             return "".join(self._repr(obj, 0))
         except Exception:
@@ -188,7 +226,7 @@ class SafeRepr(object):
                 yield_comma = True
 
                 count -= 1
-                if count <= 0:
+                if count <= 0 or self._is_past_deadline():
                     yield "..."
                     break
 
@@ -240,7 +278,7 @@ class SafeRepr(object):
             yield_comma = True
 
             count -= 1
-            if count <= 0:
+            if count <= 0 or self._is_past_deadline():
                 yield "..."
                 break
 
@@ -340,7 +378,7 @@ class SafeRepr(object):
             elif self.convert_to_hex and isinstance(obj, self.int_types):
                 obj_repr = hex(obj)
             else:
-                obj_repr = repr(obj)
+                obj_repr = self._repr_with_user_repr_check(obj)
         except Exception:
             try:
                 obj_repr = object.__repr__(obj)
@@ -365,6 +403,57 @@ class SafeRepr(object):
         yield "..."
         yield obj_repr[-right_count:]
 
+    def _is_past_deadline(self):
+        call_deadline = self._call_deadline
+        return call_deadline is not None and time.time() > call_deadline
+
+    def _repr_with_user_repr_check(self, obj):
+        """
+        Calls `repr(obj)`, keeping track of the types whose (user-defined) `__repr__` is slow
+        (and not calling it for those if `use_cheap_repr_for_slow_types` is True).
+        """
+        obj_type = type(obj)
+        try:
+            is_user_repr = isinstance(obj_type.__repr__, types.FunctionType)
+        except Exception:
+            is_user_repr = False
+
+        if not is_user_repr:
+            return repr(obj)
+
+        if self.use_cheap_repr_for_slow_types:
+            if self._is_slow_repr_type(obj_type) or self._is_past_deadline():
+                return object.__repr__(obj)
+
+        initial_time = time.time()
+        obj_repr = repr(obj)
+        elapsed = time.time() - initial_time
+        if self.time_budget > 0 and elapsed > self.time_budget:
+            try:
+                self.slow_repr_types[obj_type] = [elapsed, 0]
+            except Exception:
+                pass  # i.e.: not weak-referenceable.
+        return obj_repr
+
+    def _is_slow_repr_type(self, obj_type):
+        try:
+            entry = self.slow_repr_types.get(obj_type)
+        except Exception:
+            return False  # i.e.: not hashable.
+
+        if entry is None:
+            return False
+
+        elapsed, cheap_reprs = entry
+        time_budget = self.time_budget
+        if time_budget <= 0 or elapsed <= time_budget or cheap_reprs >= self.slow_repr_retry_after:
+            # The budget changed (or it's time to measure it again): forget it.
+            self.slow_repr_types.pop(obj_type, None)
+            return False
+
+        entry[1] = cheap_reprs + 1
+        return True
+
     def _convert_to_unicode_or_bytes_repr(self, obj_repr):
         return obj_repr
 
@@ -0,0 +1,248 @@
+"""
+A sampling profiler: a daemon thread samples the stacks of all the threads (through
+sys._current_frames()) at a given rate and aggregates them in a trie (so, a stack which is
+sampled many times is kept only once, along with the number of times it was seen), which is
+periodically sent to the client in 'pydevdProfile' events (as flame graph data).
+
+The frames are filtered as in the call stack (so, with justMyCode only the user code is
+considered and the debugger frames are never considered).
+
+Tracing is turned off while profiling (so that the program runs at full speed and the samples
+aren't skewed by the debugger) and is restored when the profiler is stopped (the profiler is
+also stopped when the client disconnects). Note that breakpoints aren't hit and stepping is not
+available in the meanwhile. With the frame evaluation mode tracing is left as is.
+"""
+import sys
+import time
+
+from _pydev_bundle import pydev_log
+from _pydev_bundle._pydev_saved_modules import threading
+from _pydevd_bundle.pydevd_constants import IS_CPYTHON, NO_FTRACE, PYDEVD_USE_SYS_MONITORING
+from _pydevd_bundle.pydevd_daemon_thread import PyDBDaemonThread
+from _pydevd_sys_monitoring import pydevd_sys_monitoring
+import pydevd_tracing
+
+DEFAULT_SAMPLES_PER_SECOND = 100
+DEFAULT_FLUSH_INTERVAL = 1.0
+
+
+class StackTrie(object):
+    """
+    The sampled stacks aggregated by their functions (from the outermost to the innermost).
+
+    The functions are kept as indexes in a table of (name, filename, line of the definition),
+    so, no code object is kept alive and each function is only sent once to the client (the
+    table is kept for the whole profiling session whereas the nodes are cleared at each flush).
+    """
+
+    def __init__(self):
+        # list(tuple(str, str, int))
+        self.frames = []
+        self._frame_to_index = {}
+        self._sent_frames = 0
+
+        # A node is [frame index, samples whose innermost function is the one of the node,
+        # children (frame index -> node)].
+        self._roots = {}
+        self.samples = 0
+
+    def add_stack(self, frames):
+        """
+        :param list(tuple(str, str, int)) frames:
+            The functions of the sampled stack (from the outermost to the innermost).
+        """
+        if not frames:
+            return
+
+        children = self._roots
+        node = None
+        frame_to_index = self._frame_to_index
+        for frame in frames:
+            frame_index = frame_to_index.get(frame)
+            if frame_index is None:
+                frame_index = frame_to_index[frame] = len(self.frames)
+                self.frames.append(frame)
+
+            node = children.get(frame_index)
+            if node is None:
+                node = children[frame_index] = [frame_index, 0, {}]
+            children = node[2]
+
+        node[1] += 1
+        self.samples += 1
+
+    def pop_new_frames(self):
+        """
+        :return list(tuple(str, str, int)):
+            The functions added since the last call.
+        """
+        new_frames = self.frames[self._sent_frames :]
+        self._sent_frames = len(self.frames)
+        return new_frames
+
+    def pop_nodes(self):
+        """
+        :return list(int):
+            The nodes added since the last call (in pre-order) flattened as triples of (index of
+            the parent node or -1 for a root, frame index, samples).
+        """
+        ret = []
+        stack = [(-1, node) for node in reversed(list(self._roots.values()))]
+        while stack:
+            parent_index, node = stack.pop()
+            node_index = len(ret) // 3
+            ret.extend((parent_index, node[0], node[1]))
+            for child in reversed(list(node[2].values())):
+                stack.append((node_index, child))
+
+        self._roots = {}
+        self.samples = 0
+        return ret
+
+
+class SamplingProfilerThread(PyDBDaemonThread):
+    def __init__(self, py_db, samples_per_second=DEFAULT_SAMPLES_PER_SECOND, flush_interval=DEFAULT_FLUSH_INTERVAL):
+        PyDBDaemonThread.__init__(self, py_db)
+        self.name = "pydevd.SamplingProfiler"
+        self.trie = StackTrie()
+        self.total_samples = 0
+
+        self._interval = 1.0 / max(samples_per_second, 1)
+        self._flush_interval = max(flush_interval, self._interval)
+        self._stop_event = threading.Event()
+
+    def _on_run(self):
+        ignore_thread_ids = self._get_ignore_thread_ids()
+        next_flush = time.time() + self._flush_interval
+        while not self._kill_received and not self._stop_event.wait(self._interval):
+            self._sample(ignore_thread_ids)
+
+            if time.time() >= next_flush:
+                self._flush(False)
+                next_flush = time.time() + self._flush_interval
+                # Threads may have been created in the meanwhile.
+                ignore_thread_ids = self._get_ignore_thread_ids()
+
+        if not self._kill_received:
+            self._flush(True)
+
+    def stop(self, timeout=None):
+        """
+        Stops sampling (the last samples are sent in a 'pydevdProfile' event with done == True).
+        """
+        self._stop_event.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout)
+
+    def _get_ignore_thread_ids(self):
+        # Note: threading.enumerate() may be patched to hide the debugger threads.
+        ignore_thread_ids = set(t.ident for t in list(self.py_db.created_pydb_daemon_threads))
+        ignore_thread_ids.update(t.ident for t in threading.enumerate() if getattr(t, "pydev_do_not_trace", False))
+        return ignore_thread_ids
+
+    def _is_included(self, frame):
+        # Note: both get_file_type() and apply_files_filter() are cached by the PyDB (and that
+        # cache is cleared when the filters change).
+        py_db = self.py_db
+        if py_db.get_file_type(frame) == py_db.PYDEV_FILE:
+            return False
+        if py_db.is_files_filter_enabled:
+            return not py_db.apply_files_filter(frame, frame.f_code.co_filename, False)
+        return True
+
+    def _sample(self, ignore_thread_ids):
+        add_stack = self.trie.add_stack
+        is_included = self._is_included
+        for thread_id, frame in sys._current_frames().items():
+            if thread_id in ignore_thread_ids:
+                continue
+
+            frames = []
+            while frame is not None:
+                if is_included(frame):
+                    code = frame.f_code
+                    frames.append((code.co_name, code.co_filename, code.co_firstlineno))
+                frame = frame.f_back
+            frames.reverse()
+            add_stack(frames)
+        frame = None
+
+    def _flush(self, done):
+        trie = self.trie
+        samples = trie.samples
+        if not samples and not done:
+            return
+
+        self.total_samples += samples
+        py_db = self.py_db
+        if py_db is None:
+            return
+        try:
+            cmd = py_db.cmd_factory.make_profile_message(trie.pop_new_frames(), trie.pop_nodes(), samples, done)
+            py_db.writer.add_command(cmd)
+        except:
+            pydev_log.exception("Error sending profile samples.")
+
+
+def start_sampling_profiler(py_db, samples_per_second=DEFAULT_SAMPLES_PER_SECOND, flush_interval=DEFAULT_FLUSH_INTERVAL):
+    """
+    :return bool:
+        Whether the profiler was started (False if it was already running).
+    """
+    if py_db.sampling_profiler is not None:
+        return False
+
+    py_db.sampling_profiler = SamplingProfilerThread(py_db, samples_per_second, flush_interval)
+    if PYDEVD_USE_SYS_MONITORING:
+        pydevd_sys_monitoring.stop_monitoring(all_threads=True)
+    elif _can_change_settrace(py_db):
+        _disable_settrace(py_db)
+    py_db.sampling_profiler.start()
+    return True
+
+
+def stop_sampling_profiler(py_db):
+    """
+    :return int:
+        The number of stacks sampled since the profiler was started (0 if it wasn't running).
+    """
+    profiler = py_db.sampling_profiler
+    if profiler is None:
+        return 0
+
+    py_db.sampling_profiler = None
+    profiler.stop(timeout=5)
+    if PYDEVD_USE_SYS_MONITORING:
+        pydevd_sys_monitoring.start_monitoring(all_threads=True)
+        # Frames which are running have to be traced again.
+        py_db.set_tracing_for_untraced_contexts(breakpoints_changed=True)
+    elif _can_change_settrace(py_db):
+        _enable_settrace(py_db)
+    return profiler.total_samples
+
+
+def _can_change_settrace(py_db):
+    # With the frame evaluation mode the code is only traced where there are breakpoints, so,
+    # it's left as is.
+    return IS_CPYTHON and py_db.frame_eval_func is None
+
+
+def _disable_settrace(py_db):
+    # New threads and new calls in the existing threads aren't traced...
+    threading.settrace(None)
+    pydevd_tracing.set_trace_to_threads(NO_FTRACE, create_dummy_thread=False)
+
+    # ... and neither are the frames which are already running.
+    ignore_thread_ids = set(
+        t.ident for t in threading.enumerate() if getattr(t, "is_pydev_daemon_thread", False) or getattr(t, "pydev_do_not_trace", False)
+    )
+    for thread_ident, frame in sys._current_frames().items():
+        if thread_ident not in ignore_thread_ids:
+            py_db.set_trace_for_frame_and_parents(thread_ident, frame, disable=True)
+    frame = None
+
+
+def _enable_settrace(py_db):
+    threading.settrace(py_db.trace_dispatch)
+    pydevd_tracing.set_trace_to_threads(py_db.trace_dispatch)
+    py_db.set_tracing_for_untraced_contexts(breakpoints_changed=True)
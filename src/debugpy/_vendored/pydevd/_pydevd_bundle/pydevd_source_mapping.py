@@ -36,7 +36,12 @@ class SourceMapping(object):
     def __init__(self, on_source_mapping_changed=NULL):
         self._mappings_to_server = {}  # dict(normalized(file.py) to [SourceMappingEntry])
         self._mappings_to_client = {}  # dict(<cell> to File.py)
-        self._cache = {}
+
+        # dict(<cell> to tuple(runtime lines, [SourceMappingEntry])) where the entries are sorted by
+        # runtime_line and the runtime lines are the runtime_line of each entry (to be used with bisect).
+        self._runtime_source_to_entries = {}
+
+        self._cache = {}  # dict(<cell> or runtime filename to dict(lineno to map_to_client result))
         self._on_source_mapping_changed = on_source_mapping_changed
 
     def set_source_mapping(self, absolute_filename, mapping):
@@ -67,35 +72,67 @@ class SourceMapping(object):
                     map_entry.runtime_source,
                 )
 
+        changed_runtime_sources = set(map_entry.runtime_source for map_entry in mapping)
         try:
             absolute_normalized_filename = pydevd_file_utils.normcase(absolute_filename)
             current_mapping = self._mappings_to_server.get(absolute_normalized_filename, [])
             for map_entry in current_mapping:
-                del self._mappings_to_client[map_entry.runtime_source]
+                changed_runtime_sources.add(map_entry.runtime_source)
+                self._mappings_to_client.pop(map_entry.runtime_source, None)
 
-            self._mappings_to_server[absolute_normalized_filename] = sorted(mapping, key=lambda entry: entry.line)
+            mapping = sorted(mapping, key=lambda entry: entry.line)
+            self._mappings_to_server[absolute_normalized_filename] = mapping
 
             for map_entry in mapping:
                 self._mappings_to_client[map_entry.runtime_source] = absolute_filename
+
+            # As mappings are 1:N, the entries for a runtime source all come from this file.
+            runtime_source_to_entries = {}
+            for map_entry in mapping:
+                runtime_source_to_entries.setdefault(map_entry.runtime_source, []).append(map_entry)
+
+            for runtime_source in changed_runtime_sources:
+                entries = runtime_source_to_entries.get(runtime_source)
+                if entries:
+                    entries = sorted(entries, key=lambda entry: entry.runtime_line)
+                    self._runtime_source_to_entries[runtime_source] = ([entry.runtime_line for entry in entries], entries)
+                else:
+                    self._runtime_source_to_entries.pop(runtime_source, None)
         finally:
-            self._cache.clear()
+            for runtime_source in changed_runtime_sources:
+                self._cache.pop(runtime_source, None)
             self._on_source_mapping_changed()
         return ""
 
     def map_to_client(self, runtime_source_filename, lineno):
-        key = (lineno, "client", runtime_source_filename)
+        cache = self._cache.get(runtime_source_filename)
+        if cache is None:
+            cache = self._cache.setdefault(runtime_source_filename, {})
         try:
-            return self._cache[key]
+            return cache[lineno]
         except KeyError:
-            for _, mapping in list(self._mappings_to_server.items()):
-                for map_entry in mapping:
-                    if map_entry.runtime_source == runtime_source_filename:  # <cell1>
-                        if map_entry.contains_runtime_line(lineno):  # matches line range
-                            self._cache[key] = (map_entry.source_filename, map_entry.line + (lineno - map_entry.runtime_line), True)
-                            return self._cache[key]
-
-            self._cache[key] = (runtime_source_filename, lineno, False)  # Mark that no translation happened in the cache.
-            return self._cache[key]
+            pass
+
+        found = None
+        runtime_lines_and_entries = self._runtime_source_to_entries.get(runtime_source_filename)
+        if runtime_lines_and_entries is not None:
+            runtime_lines, entries = runtime_lines_and_entries
+            # Only entries starting at or before the line may contain it. If more than one contains
+            # it, the one first in the file (as it was registered) has precedence.
+            i = bisect.bisect_right(runtime_lines, lineno)
+            while i > 0:
+                i -= 1
+                map_entry = entries[i]
+                if map_entry.contains_runtime_line(lineno):
+                    if found is None or map_entry.line < found.line:
+                        found = map_entry
+
+        if found is not None:
+            ret = (found.source_filename, found.line + (lineno - found.runtime_line), True)
+        else:
+            ret = (runtime_source_filename, lineno, False)  # Mark that no translation happened in the cache.
+        cache[lineno] = ret
+        return ret
 
     def has_mapping_entry(self, runtime_source_filename):
         """
@@ -104,18 +141,7 @@ class SourceMapping(object):
         """
         # Note that we're not interested in the line here, just on knowing if a given filename
         # (from the server) has a mapping for it.
-        key = ("has_entry", runtime_source_filename)
-        try:
-            return self._cache[key]
-        except KeyError:
-            for _absolute_normalized_filename, mapping in list(self._mappings_to_server.items()):
-                for map_entry in mapping:
-                    if map_entry.runtime_source == runtime_source_filename:
-                        self._cache[key] = True
-                        return self._cache[key]
-
-            self._cache[key] = False
-            return self._cache[key]
+        return runtime_source_filename in self._runtime_source_to_entries
 
     def map_to_server(self, absolute_filename, lineno):
         """
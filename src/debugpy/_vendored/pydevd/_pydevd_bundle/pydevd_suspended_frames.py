@@ -34,7 +34,9 @@ class _AbstractVariable(object):
     def get_variable_reference(self):
         return id(self.value)
 
-    def get_var_data(self, fmt: Optional[dict] = None, context: Optional[str] = None, **safe_repr_custom_attrs):
+    def get_var_data(
+        self, fmt: Optional[dict] = None, context: Optional[str] = None, safe_repr: Optional[SafeRepr] = None, **safe_repr_custom_attrs
+    ):
         """
         :param dict fmt:
             Format expected by the DAP (keys: 'hex': bool, 'rawString': bool)
@@ -45,12 +47,21 @@ class _AbstractVariable(object):
                 "repl",
                 "hover",
                 "clipboard"
+
+        :param SafeRepr safe_repr:
+            If given, it's reused to compute the value (i.e.: to share its deadline among all the
+            variables of a request).
         """
         timer = Timer()
-        safe_repr = SafeRepr()
+        if safe_repr is None:
+            safe_repr = SafeRepr()
         if fmt is not None:
             safe_repr.convert_to_hex = fmt.get("hex", False)
             safe_repr.raw_value = fmt.get("rawString", False)
+
+        # The full value is always computed when explicitly requested (otherwise, types with a slow
+        # `__repr__` are shown in a cheap form).
+        safe_repr.use_cheap_repr_for_slow_types = context not in ("repl", "clipboard")
         for key, val in safe_repr_custom_attrs.items():
             setattr(safe_repr, key, val)
 
@@ -318,9 +329,14 @@ class _FramesTracker(object):
     This is a helper class to be used to track frames when a thread becomes suspended.
     """
 
-    def __init__(self, suspended_frames_manager, py_db):
+    def __init__(self, suspended_frames_manager, py_db, is_snapshot=False):
         self._suspended_frames_manager = suspended_frames_manager
         self.py_db = py_db
+
+        # A snapshot tracker tracks the frames of a thread which was asked to suspend but
+        # which still hasn't reached the point where it waits for commands (so, it may be
+        # replaced by a regular tracker as soon as the thread actually suspends).
+        self.is_snapshot = is_snapshot
         self._frame_id_to_frame = {}
 
         # Note that a given frame may appear in multiple threads when we have custom
@@ -347,6 +363,10 @@ class _FramesTracker(object):
 
         self._variable_reference_to_variable = {}
 
+        # A HeapSnapshot (created on demand by the pydevdHeapSnapshot request). It keeps all
+        # the objects alive, so, it's only kept while the thread is suspended.
+        self.heap_snapshot = None
+
     def _register_variable(self, variable):
         variable_reference = variable.get_variable_reference()
         self._variable_reference_to_variable[variable_reference] = variable
@@ -386,7 +406,8 @@ class _FramesTracker(object):
         with self._lock:
             coroutine_or_main_thread_id = frame_custom_thread_id or thread_id
 
-            if coroutine_or_main_thread_id in self._suspended_frames_manager._thread_id_to_tracker:
+            existing_tracker = self._suspended_frames_manager._thread_id_to_tracker.get(coroutine_or_main_thread_id)
+            if existing_tracker is not None and not existing_tracker.is_snapshot:
                 sys.stderr.write("pydevd: Something is wrong. Tracker being added twice to the same thread id.\n")
 
             self._suspended_frames_manager._thread_id_to_tracker[coroutine_or_main_thread_id] = self
@@ -423,11 +444,16 @@ class _FramesTracker(object):
                 # Calling multiple times is expected for the set next statement.
                 return
             self._untracked = True
+            thread_id_to_tracker = self._suspended_frames_manager._thread_id_to_tracker
             for thread_id in self._thread_id_to_frame_ids:
-                self._suspended_frames_manager._thread_id_to_tracker.pop(thread_id, None)
+                # Only remove it if it wasn't replaced by some other tracker in the meanwhile.
+                if thread_id_to_tracker.get(thread_id) is self:
+                    del thread_id_to_tracker[thread_id]
 
+            variable_reference_to_frames_tracker = self._suspended_frames_manager._variable_reference_to_frames_tracker
             for frame_id in self._frame_id_to_frame:
-                del self._suspended_frames_manager._variable_reference_to_frames_tracker[frame_id]
+                if variable_reference_to_frames_tracker.get(frame_id) is self:
+                    del variable_reference_to_frames_tracker[frame_id]
 
             self._frame_id_to_frame.clear()
             self._frame_id_to_main_thread_id.clear()
@@ -436,6 +462,7 @@ class _FramesTracker(object):
             self._main_thread_id = None
             self._suspended_frames_manager = None
             self._variable_reference_to_variable.clear()
+            self.heap_snapshot = None
 
     def get_frames_list(self, thread_id):
         with self._lock:
@@ -466,6 +493,11 @@ class SuspendedFramesManager(object):
         # Mappings
         self._variable_reference_to_frames_tracker = {}
 
+        # Trackers for the frames captured at once when all threads are asked to suspend
+        # (see: track_snapshot).
+        self._thread_id_to_snapshot_tracker = {}
+        self._snapshot_lock = ForkSafeLock(rlock=True)
+
     def _get_tracker_for_variable_reference(self, variable_reference):
         tracker = self._variable_reference_to_frames_tracker.get(variable_reference)
         if tracker is not None:
@@ -500,6 +532,15 @@ class SuspendedFramesManager(object):
             return frames_tracker.get_main_thread_id()
         return None
 
+    def is_snapshot_variable_reference(self, variable_reference):
+        """
+        :return bool:
+            True if the variable reference is from the snapshot of a thread which still hasn't
+            actually suspended (so, code can't be run in that thread -- see: track_snapshot).
+        """
+        frames_tracker = self._get_tracker_for_variable_reference(variable_reference)
+        return frames_tracker is not None and frames_tracker.is_snapshot
+
     def get_frame_tracker(self, thread_id):
         return self._thread_id_to_tracker.get(thread_id)
 
@@ -512,6 +553,14 @@ class SuspendedFramesManager(object):
             raise KeyError()
         return frames_tracker.get_variable(variable_reference)
 
+    def get_suspended_thread_ids(self):
+        """
+        :return list(str):
+            The ids of the threads whose frames are tracked (i.e.: suspended threads, including
+            the ones in a snapshot and custom threads).
+        """
+        return list(self._thread_id_to_tracker)
+
     def get_frames_list(self, thread_id):
         tracker = self._thread_id_to_tracker.get(thread_id)
         if tracker is None:
@@ -526,6 +575,46 @@ class SuspendedFramesManager(object):
         finally:
             tracker.untrack_all()
 
+    def track_snapshot(self, py_db, thread_id_to_frames_list):
+        """
+        Tracks the frames of threads which were asked to suspend (i.e.: when suspending all
+        threads) but which still haven't reached the point where they wait for commands, so that
+        stack queries for those threads can be answered right away instead of waiting for each
+        thread to actually suspend.
+
+        Threads which already have their frames tracked are skipped. The snapshot of a thread is
+        released when it actually suspends (at which point its frames are tracked by the
+        thread itself) or when it's resumed (see: release_snapshot).
+
+        :param dict(str, FramesList) thread_id_to_frames_list:
+            The frames of each thread (gotten from a single `sys._current_frames()` call).
+        """
+        with self._snapshot_lock:
+            for thread_id, frames_list in thread_id_to_frames_list.items():
+                if thread_id in self._thread_id_to_tracker:
+                    continue
+                tracker = _FramesTracker(self, py_db, is_snapshot=True)
+                tracker.track(thread_id, frames_list)
+                self._thread_id_to_snapshot_tracker[thread_id] = tracker
+
+    def release_snapshot(self, thread_id="*"):
+        """
+        :param str thread_id:
+            The thread whose snapshot should be released (or "*" to release all the snapshots).
+        """
+        with self._snapshot_lock:
+            if thread_id == "*":
+                trackers = list(self._thread_id_to_snapshot_tracker.values())
+                self._thread_id_to_snapshot_tracker.clear()
+            else:
+                tracker = self._thread_id_to_snapshot_tracker.pop(thread_id, None)
+                if tracker is None:
+                    return
+                trackers = [tracker]
+
+            for tracker in trackers:
+                tracker.untrack_all()
+
     def add_fake_frame(self, thread_id, frame_id, frame):
         self._thread_id_to_fake_frames.setdefault(thread_id, {})[int(frame_id)] = frame
 
@@ -1,24 +1,47 @@
 from _pydevd_bundle import pydevd_utils
 from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info
 from _pydevd_bundle.pydevd_comm_constants import CMD_STEP_INTO, CMD_THREAD_SUSPEND
-from _pydevd_bundle.pydevd_constants import PYTHON_SUSPEND, STATE_SUSPEND, get_thread_id, STATE_RUN, PYDEVD_USE_SYS_MONITORING
+from _pydevd_bundle.pydevd_constants import (
+    PYTHON_SUSPEND,
+    STATE_SUSPEND,
+    get_thread_id,
+    get_thread_by_id,
+    unregister_thread_id,
+    STATE_RUN,
+    PYDEVD_USE_SYS_MONITORING,
+    get_global_debugger,
+    _current_frames,
+)
+from _pydev_bundle.pydev_is_thread_alive import is_thread_alive
 from _pydev_bundle._pydev_saved_modules import threading
 from _pydev_bundle import pydev_log
+from _pydevd_bundle import pydevd_frame_utils
 import sys
 from _pydevd_sys_monitoring import pydevd_sys_monitoring
 
 
 def pydevd_find_thread_by_id(thread_id):
     try:
-        threads = threading.enumerate()
-        for i in threads:
-            tid = get_thread_id(i)
-            if thread_id == tid or thread_id.endswith("|" + tid):
-                return i
+        # Fast path: threads are registered by id as soon as their id is computed.
+        thread = get_thread_by_id(thread_id)
+        if thread is None and "|" in thread_id:
+            thread = get_thread_by_id(thread_id.rpartition("|")[2])
+
+        if thread is not None:
+            if is_thread_alive(thread):
+                return thread
+            unregister_thread_id(get_thread_id(thread))
+
+        else:
+            # Not registered (i.e.: its id was never computed). Fall back to checking all threads.
+            threads = threading.enumerate()
+            for i in threads:
+                tid = get_thread_id(i)
+                if thread_id == tid or thread_id.endswith("|" + tid):
+                    return i
 
         # This can happen when a request comes for a thread which was previously removed.
         pydev_log.info("Could not find thread %s.", thread_id)
-        pydev_log.info("Available: %s.", ([get_thread_id(t) for t in threads],))
     except:
         pydev_log.exception()
 
@@ -71,12 +94,15 @@ def resume_threads(thread_id, except_thread=None):
     else:
         threads = [pydevd_find_thread_by_id(thread_id)]
 
+    py_db = get_global_debugger()
     for t in threads:
         if t is None or t is except_thread:
             pydev_log.info("Skipped resuming thread: %s", t)
             continue
 
         internal_run_thread(t, set_additional_thread_info=set_additional_thread_info)
+        if py_db is not None:
+            py_db.suspended_frames_manager.release_snapshot(get_thread_id(t))
 
 
 from _pydevd_bundle.pydevd_constants import ForkSafeLock
@@ -94,12 +120,17 @@ def suspend_all_threads(py_db, except_thread):
 
     pydev_log.info("Suspending all threads except: %s", except_thread)
     all_threads = pydevd_utils.get_non_pydevd_threads()
+    snapshot_threads = []
     for t in all_threads:
         if getattr(t, "pydev_do_not_trace", None):
             pass  # skip some other threads, i.e. ipython history saving thread from debug console
         else:
             if t is except_thread:
+                if t is not threading.current_thread():
+                    # i.e.: on a pause the thread which was suspended first is also not the current one.
+                    snapshot_threads.append(t)
                 continue
+            snapshot_threads.append(t)
             info = mark_thread_suspended(t, CMD_THREAD_SUSPEND, main_suspend=False)
             frame = info.get_topmost_frame(t)
 
@@ -110,6 +141,29 @@ def suspend_all_threads(py_db, except_thread):
                 finally:
                     frame = None
 
+    if py_db.snapshot_on_suspend:
+        _snapshot_suspended_threads(py_db, snapshot_threads)
+
     if PYDEVD_USE_SYS_MONITORING:
         # After suspending the frames we need the monitoring to be reset.
         pydevd_sys_monitoring.restart_events()
+
+
+def _snapshot_suspended_threads(py_db, threads):
+    """
+    Captures the stacks of all the given threads at once so that stack queries for them don't need
+    to wait for each thread to actually suspend (see: SuspendedFramesManager.track_snapshot).
+    """
+    try:
+        current_frames = _current_frames()
+        thread_id_to_frames_list = {}
+        for t in threads:
+            frame = current_frames.get(t.ident)
+            if frame is not None:
+                thread_id_to_frames_list[get_thread_id(t)] = pydevd_frame_utils.create_frames_list_from_frame(frame)
+        frame = None
+        current_frames = None
+
+        py_db.suspended_frames_manager.track_snapshot(py_db, thread_id_to_frames_list)
+    except:
+        pydev_log.exception("Error taking snapshot of suspended threads.")
@@ -0,0 +1,181 @@
+"""
+Tracepoints: when 'tracepoints' is set in the launch/attach arguments, logpoints don't send an
+'output' event for each hit. Instead, the message of each hit (along with the time and the thread
+of the hit) is captured in a fixed-size ring buffer which is sent to the client in batches (in
+'pydevdTracepoints' events, sent periodically or when requested).
+
+Each tracepoint may be sampled (only 1 in every `sampleEvery` hits is captured) and rate-limited
+(at most `maxHitsPerSecond` hits are captured per second). The log message is only evaluated for
+the hits which are captured. Hits which are rate-limited or which are overwritten in the buffer
+before being sent are counted as dropped.
+"""
+import sys
+import time
+
+from _pydev_bundle import pydev_log
+from _pydev_bundle._pydev_saved_modules import threading
+from _pydevd_bundle.pydevd_constants import get_current_thread_id
+from _pydevd_bundle.pydevd_daemon_thread import PyDBDaemonThread
+
+DEFAULT_BUFFER_SIZE = 1000
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+class _TracepointStats(object):
+    __slots__ = ["hits", "captured", "dropped", "window_start", "window_hits"]
+
+    def __init__(self):
+        self.hits = 0
+        self.captured = 0
+        self.dropped = 0
+
+        # Used for the rate limit (hits captured in the current 1 second window).
+        self.window_start = 0.0
+        self.window_hits = 0
+
+
+class Tracepoints(object):
+    def __init__(self, buffer_size=DEFAULT_BUFFER_SIZE, flush_interval=DEFAULT_FLUSH_INTERVAL, max_hits_per_second=0, sample_every=1):
+        self.flush_interval = max(float(flush_interval), 0.01)
+        self.max_hits_per_second = max(int(max_hits_per_second), 0)
+        self.sample_every = max(int(sample_every), 1)
+
+        self._lock = threading.Lock()
+
+        # The ring buffer with the (breakpoint id, thread id, timestamp, message) of the hits.
+        self._buffer = [None] * max(int(buffer_size), 1)
+        self._next = 0
+        self._count = 0
+
+        # breakpoint id -> _TracepointStats
+        self._breakpoint_id_to_stats = {}
+        self._changed = False
+
+    def add_hit(self, breakpoint, frame):
+        """
+        Called when a tracepoint is hit (the log message is evaluated in the given frame if
+        the hit isn't skipped by the sampling/rate limit).
+        """
+        now = time.time()
+        breakpoint_id = breakpoint.breakpoint_id
+        with self._lock:
+            self._changed = True
+            stats = self._breakpoint_id_to_stats.get(breakpoint_id)
+            if stats is None:
+                stats = self._breakpoint_id_to_stats[breakpoint_id] = _TracepointStats()
+            stats.hits += 1
+            if (stats.hits - 1) % self.sample_every:
+                return
+
+            if self.max_hits_per_second:
+                if now - stats.window_start >= 1.0:
+                    stats.window_start = now
+                    stats.window_hits = 0
+                if stats.window_hits >= self.max_hits_per_second:
+                    stats.dropped += 1
+                    return
+                stats.window_hits += 1
+
+        try:
+            message = str(eval(breakpoint.expression, frame.f_globals, frame.f_locals))
+        except:
+            message = str(sys.exc_info()[1])
+
+        hit = (breakpoint_id, get_current_thread_id(threading.current_thread()), now, message)
+        with self._lock:
+            stats.captured += 1
+            buffer = self._buffer
+            if self._count == len(buffer):
+                # The buffer is full: overwrite the oldest hit.
+                self._breakpoint_id_to_stats[buffer[self._next][0]].dropped += 1
+            else:
+                self._count += 1
+            buffer[self._next] = hit
+            self._next = (self._next + 1) % len(buffer)
+
+    def pop_batch(self, force=False):
+        """
+        :return tuple(list(tuple(int, str, float, str)), list(tuple(int, int, int, int))) or None:
+            The hits captured since the last call (oldest first) and the (breakpoint id, hits,
+            captured, dropped) of the tracepoints (or None if nothing changed since the last call
+            and `force` is False).
+        """
+        with self._lock:
+            if not self._changed and not force:
+                return None
+            self._changed = False
+
+            buffer = self._buffer
+            size = len(buffer)
+            start = (self._next - self._count) % size
+            hits = []
+            for i in range(self._count):
+                j = (start + i) % size
+                hits.append(buffer[j])
+                buffer[j] = None
+            self._count = 0
+
+            stats = [(breakpoint_id, s.hits, s.captured, s.dropped) for breakpoint_id, s in sorted(self._breakpoint_id_to_stats.items())]
+        return hits, stats
+
+    def send_batch(self, py_db, force=False):
+        """
+        Sends the hits captured since the last batch in a 'pydevdTracepoints' event.
+
+        :return int:
+            The number of hits sent.
+        """
+        batch = self.pop_batch(force)
+        if batch is None:
+            return 0
+        hits, stats = batch
+        py_db.writer.add_command(py_db.cmd_factory.make_tracepoints_message(hits, stats))
+        return len(hits)
+
+
+class TracepointsFlusherThread(PyDBDaemonThread):
+    def __init__(self, py_db, tracepoints):
+        PyDBDaemonThread.__init__(self, py_db)
+        self.name = "pydevd.TracepointsFlusher"
+        self.tracepoints = tracepoints
+        self._stop_event = threading.Event()
+
+    def _on_run(self):
+        tracepoints = self.tracepoints
+        while not self._kill_received and not self._stop_event.wait(tracepoints.flush_interval):
+            try:
+                tracepoints.send_batch(self.py_db)
+            except:
+                pydev_log.exception("Error sending tracepoint hits.")
+
+    def stop(self):
+        self._stop_event.set()
+
+
+def set_tracepoints(py_db, options):
+    """
+    :param bool|dict options:
+        If falsy, logpoints send an 'output' event for each hit. Otherwise logpoints are
+        tracepoints (and if it's a dict, it may have the `bufferSize`, `flushInterval`,
+        `maxHitsPerSecond` and `sampleEvery` settings).
+    """
+    if py_db.tracepoints_flusher is not None:
+        py_db.tracepoints_flusher.stop()
+        py_db.tracepoints_flusher = None
+
+    if not options:
+        py_db.tracepoints = None
+        return
+
+    if not isinstance(options, dict):
+        options = {}
+
+    tracepoints = Tracepoints(
+        buffer_size=options.get("bufferSize", DEFAULT_BUFFER_SIZE),
+        flush_interval=options.get("flushInterval", DEFAULT_FLUSH_INTERVAL),
+        max_hits_per_second=options.get("maxHitsPerSecond", 0),
+        sample_every=options.get("sampleEvery", 1),
+    )
+    py_db.tracepoints_flusher = TracepointsFlusherThread(py_db, tracepoints)
+    py_db.tracepoints = tracepoints
+    py_db.tracepoints_flusher.start()
@@ -427,11 +427,7 @@ def compile_as_eval(expression):
 
     :raises Exception if the expression cannot be evaluated.
     """
-    expression_to_evaluate = _expression_to_evaluate(expression)
-    if _ASYNC_COMPILE_FLAGS is not None:
-        return compile(expression_to_evaluate, "<string>", "eval", _ASYNC_COMPILE_FLAGS)
-    else:
-        return compile(expression_to_evaluate, "<string>", "eval")
+    return _compile(expression, "eval")
 
 
 def _compile_as_exec(expression):
@@ -444,11 +440,19 @@ def _compile_as_exec(expression):
 
     :raises Exception if the expression cannot be evaluated.
     """
+    return _compile(expression, "exec")
+
+
+# Watches (and hovers) are usually re-evaluated with the same expressions at each step,
+# so, the compiled code is cached (code objects are immutable, so, it's Ok to share
+# them among frames and threads -- note that errors aren't cached).
+@lru_cache(256)
+def _compile(expression, mode):
     expression_to_evaluate = _expression_to_evaluate(expression)
     if _ASYNC_COMPILE_FLAGS is not None:
-        return compile(expression_to_evaluate, "<string>", "exec", _ASYNC_COMPILE_FLAGS)
+        return compile(expression_to_evaluate, "<string>", mode, _ASYNC_COMPILE_FLAGS)
     else:
-        return compile(expression_to_evaluate, "<string>", "exec")
+        return compile(expression_to_evaluate, "<string>", mode)
 
 
 class _EvalAwaitInNewEventLoop(PyDBDaemonThread):
@@ -0,0 +1,179 @@
+"""
+An opt-in persistent cache (enabled by setting PYDEVD_WARM_CACHE_DIR) for facts about source
+files which are expensive to compute and which only depend on the contents of the file and on
+the interpreter/debugger versions, so, they can be shared by all the debugged processes (i.e.:
+the workers of a process pool would otherwise recompute them at each start).
+
+Facts which depend on the runtime configuration (the file type, whether a file is library code
+given the filters and sys.path or the normalization of paths) are not kept here.
+
+The cache is kept in a subdirectory keyed by the interpreter and the debugger version and each
+entry is a separate file named after the hash of the source file path and the kind of the fact.
+An entry has a header (with the mtime and size of the source file when the entry was computed,
+so, a changed file invalidates it) followed by the raw contents of an array of int32 (so,
+loading it is just reading it into an array).
+
+Entries are written to a temporary file which is then atomically renamed, so, processes starting
+concurrently never see a partially written entry (at worst, they compute the same entry and one
+overwrites the other).
+"""
+import hashlib
+import os
+import struct
+import sys
+import tempfile
+from array import array
+
+from _pydev_bundle import pydev_log
+from _pydevd_bundle.pydevd_constants import PYDEVD_WARM_CACHE_DIR
+
+# Bump when the format of the entries (or of the facts kept in them) changes.
+_FORMAT_VERSION = 1
+
+# magic, mtime (ns) and size of the source file, number of items in the array.
+_HEADER = struct.Struct("<4sqqi")
+_MAGIC = b"PDWC"
+
+_cache_dir = None
+
+
+def _get_debugger_fingerprint():
+    # pydevd.py is always changed in a new release (it has the version), so, its mtime/size
+    # identify the installed debugger (pydevd can't be imported here as it may be __main__).
+    pydevd_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pydevd.py")
+    try:
+        stat = os.stat(pydevd_path)
+        return "%s-%s" % (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return ""
+
+
+def _get_cache_dir():
+    """
+    :return str:
+        The directory with the entries for this interpreter/debugger or an empty string if
+        the cache is disabled (or if the directory could not be created).
+    """
+    global _cache_dir
+    if _cache_dir is not None:
+        return _cache_dir
+
+    _cache_dir = ""
+    if PYDEVD_WARM_CACHE_DIR:
+        key = "|".join(
+            (
+                sys.version,
+                sys.implementation.cache_tag or "",
+                sys.byteorder,
+                str(_FORMAT_VERSION),
+                _get_debugger_fingerprint(),
+            )
+        )
+        cache_dir = os.path.join(
+            PYDEVD_WARM_CACHE_DIR,
+            "%s-%s" % (sys.implementation.cache_tag, hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]),
+        )
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except OSError:
+            pydev_log.exception("Unable to create warm cache directory: %s", cache_dir)
+        else:
+            _cache_dir = cache_dir
+    return _cache_dir
+
+
+def is_enabled():
+    """
+    :return bool:
+        Whether the cache is enabled (callers may skip gathering what's only needed to use it).
+    """
+    return bool(_get_cache_dir())
+
+
+def _get_entry_path(cache_dir, filename, kind):
+    name = hashlib.sha1(filename.encode("utf-8", "surrogatepass")).hexdigest()
+    return os.path.join(cache_dir, "%s.%s" % (name, kind))
+
+
+def load(filename, kind, stat=None):
+    """
+    :param str filename:
+        The absolute path of the source file.
+
+    :param str kind:
+        The kind of the fact (i.e.: "lines").
+
+    :param os.stat_result stat:
+        The stat of the source file (if already available).
+
+    :return array or None:
+        The array of ints stored for the source file or None if the cache is disabled, there's
+        no entry or if the source file changed since the entry was stored.
+    """
+    cache_dir = _get_cache_dir()
+    if not cache_dir:
+        return None
+
+    try:
+        if stat is None:
+            stat = os.stat(filename)
+        with open(_get_entry_path(cache_dir, filename, kind), "rb") as stream:
+            contents = stream.read()
+    except OSError:
+        return None
+
+    try:
+        magic, mtime_ns, size, count = _HEADER.unpack_from(contents)
+        if magic != _MAGIC or mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+            return None
+
+        ints = array("i")
+        ints.frombytes(contents[_HEADER.size :])
+    except (struct.error, ValueError):
+        return None
+
+    if len(ints) != count:
+        return None
+    return ints
+
+
+def store(filename, kind, ints, stat=None):
+    """
+    Stores the given ints for the source file (does nothing if the cache is disabled).
+
+    :param str filename:
+        The absolute path of the source file.
+
+    :param str kind:
+        The kind of the fact (i.e.: "lines").
+
+    :param list(int) ints:
+        The ints to be stored (must fit in an int32).
+
+    :param os.stat_result stat:
+        The stat of the source file when the ints were computed (if not given, the file is
+        stat'ed now).
+    """
+    cache_dir = _get_cache_dir()
+    if not cache_dir:
+        return
+
+    try:
+        if stat is None:
+            stat = os.stat(filename)
+        ints = array("i", ints)
+        contents = _HEADER.pack(_MAGIC, stat.st_mtime_ns, stat.st_size, len(ints)) + ints.tobytes()
+
+        fd, temp_path = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as stream:
+                stream.write(contents)
+            os.replace(temp_path, _get_entry_path(cache_dir, filename, kind))
+        except:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+    except (OSError, OverflowError):
+        pydev_log.debug("Unable to store %s in the warm cache for: %s", kind, filename)
@@ -7839,7 +7839,7 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
  *     cdef str co_filename = <str> code_obj.co_filename
  *     cdef str co_name = <str> code_obj.co_name             # <<<<<<<<<<<<<<
  *     cdef dict cache_file_type
- *     cdef tuple cache_file_type_key
+ *     cdef str cache_file_type_key
 */
   __pyx_t_4 = ((PyObject *)__pyx_v_code_obj->co_name);
   __Pyx_INCREF(__pyx_t_4);
@@ -7847,7 +7847,7 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
   __pyx_t_4 = 0;
 
   /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":248
- *     cdef tuple cache_file_type_key
+ *     cdef str cache_file_type_key
  * 
  *     func_code_info = FuncCodeInfo()             # <<<<<<<<<<<<<<
  *     func_code_info.breakpoints_mtime = main_debugger.mtime
@@ -8075,31 +8075,19 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
     /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":265
  *         # Note: this cache key must be the same from PyDB.get_file_type() -- see it for comments
  *         # on the cache.
- *         cache_file_type_key = (frame_obj.f_code.co_firstlineno, abs_path_real_path_and_base[0], <object>frame_obj.f_code)             # <<<<<<<<<<<<<<
+ *         cache_file_type_key = abs_path_real_path_and_base[0]             # <<<<<<<<<<<<<<
  *         try:
  *             file_type = cache_file_type[cache_file_type_key]  # Make it faster
 */
-    __pyx_t_2 = __Pyx_PyLong_From_int(__pyx_v_frame_obj->f_code->co_firstlineno); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
+    __pyx_t_2 = __Pyx_GetItemInt(__pyx_v_abs_path_real_path_and_base, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 265, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
-    __pyx_t_4 = __Pyx_GetItemInt(__pyx_v_abs_path_real_path_and_base, 0, long, 1, __Pyx_PyLong_From_long, 0, 0, 1, 1, __Pyx_ReferenceSharing_OwnStrongReference); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 265, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_4);
-    __pyx_t_1 = PyTuple_New(3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 265, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_1);
-    __Pyx_GIVEREF(__pyx_t_2);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_2) != (0)) __PYX_ERR(0, 265, __pyx_L1_error);
-    __Pyx_GIVEREF(__pyx_t_4);
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __pyx_t_4) != (0)) __PYX_ERR(0, 265, __pyx_L1_error);
-    __Pyx_INCREF(((PyObject *)__pyx_v_frame_obj->f_code));
-    __Pyx_GIVEREF(((PyObject *)__pyx_v_frame_obj->f_code));
-    if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 2, ((PyObject *)__pyx_v_frame_obj->f_code)) != (0)) __PYX_ERR(0, 265, __pyx_L1_error);
+    if (!(likely(PyUnicode_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_2))) __PYX_ERR(0, 265, __pyx_L1_error)
+    __pyx_v_cache_file_type_key = ((PyObject*)__pyx_t_2);
     __pyx_t_2 = 0;
-    __pyx_t_4 = 0;
-    __pyx_v_cache_file_type_key = ((PyObject*)__pyx_t_1);
-    __pyx_t_1 = 0;
 
     /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":266
  *         # on the cache.
- *         cache_file_type_key = (frame_obj.f_code.co_firstlineno, abs_path_real_path_and_base[0], <object>frame_obj.f_code)
+ *         cache_file_type_key = abs_path_real_path_and_base[0]
  *         try:             # <<<<<<<<<<<<<<
  *             file_type = cache_file_type[cache_file_type_key]  # Make it faster
  *         except:
@@ -8114,7 +8102,7 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
       /*try:*/ {
 
         /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":267
- *         cache_file_type_key = (frame_obj.f_code.co_firstlineno, abs_path_real_path_and_base[0], <object>frame_obj.f_code)
+ *         cache_file_type_key = abs_path_real_path_and_base[0]
  *         try:
  *             file_type = cache_file_type[cache_file_type_key]  # Make it faster             # <<<<<<<<<<<<<<
  *         except:
@@ -8124,14 +8112,14 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
           PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
           __PYX_ERR(0, 267, __pyx_L15_error)
         }
-        __pyx_t_1 = __Pyx_PyDict_GetItem(__pyx_v_cache_file_type, __pyx_v_cache_file_type_key); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 267, __pyx_L15_error)
-        __Pyx_GOTREF(__pyx_t_1);
-        __pyx_v_file_type = __pyx_t_1;
-        __pyx_t_1 = 0;
+        __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_cache_file_type, __pyx_v_cache_file_type_key); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 267, __pyx_L15_error)
+        __Pyx_GOTREF(__pyx_t_2);
+        __pyx_v_file_type = __pyx_t_2;
+        __pyx_t_2 = 0;
 
         /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":266
  *         # on the cache.
- *         cache_file_type_key = (frame_obj.f_code.co_firstlineno, abs_path_real_path_and_base[0], <object>frame_obj.f_code)
+ *         cache_file_type_key = abs_path_real_path_and_base[0]
  *         try:             # <<<<<<<<<<<<<<
  *             file_type = cache_file_type[cache_file_type_key]  # Make it faster
  *         except:
@@ -8158,10 +8146,10 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
 */
       /*except:*/ {
         __Pyx_AddTraceback("_pydevd_frame_eval.pydevd_frame_evaluator.get_func_code_info", __pyx_clineno, __pyx_lineno, __pyx_filename);
-        if (__Pyx_GetException(&__pyx_t_1, &__pyx_t_4, &__pyx_t_2) < 0) __PYX_ERR(0, 268, __pyx_L17_except_error)
-        __Pyx_XGOTREF(__pyx_t_1);
-        __Pyx_XGOTREF(__pyx_t_4);
+        if (__Pyx_GetException(&__pyx_t_2, &__pyx_t_4, &__pyx_t_1) < 0) __PYX_ERR(0, 268, __pyx_L17_except_error)
         __Pyx_XGOTREF(__pyx_t_2);
+        __Pyx_XGOTREF(__pyx_t_4);
+        __Pyx_XGOTREF(__pyx_t_1);
 
         /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":269
  *             file_type = cache_file_type[cache_file_type_key]  # Make it faster
@@ -8182,15 +8170,15 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
         }
         __Pyx_XDECREF_SET(__pyx_v_file_type, __pyx_t_10);
         __pyx_t_10 = 0;
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
-        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+        __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
         goto __pyx_L16_exception_handled;
       }
 
       /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":266
  *         # on the cache.
- *         cache_file_type_key = (frame_obj.f_code.co_firstlineno, abs_path_real_path_and_base[0], <object>frame_obj.f_code)
+ *         cache_file_type_key = abs_path_real_path_and_base[0]
  *         try:             # <<<<<<<<<<<<<<
  *             file_type = cache_file_type[cache_file_type_key]  # Make it faster
  *         except:
@@ -8273,22 +8261,22 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
  *             function_breakpoint: object = main_debugger.function_breakpoint_name_to_breakpoint.get(func_code_info.co_name)
  *             # print('\n---')
 */
-      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(__pyx_v_main_debugger, __pyx_mstate_global->__pyx_n_u_breakpoints); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_4 = __pyx_t_1;
+      __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_v_main_debugger, __pyx_mstate_global->__pyx_n_u_breakpoints); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_4 = __pyx_t_2;
       __Pyx_INCREF(__pyx_t_4);
       __pyx_t_5 = 0;
       {
         PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_func_code_info->canonical_normalized_filename};
-        __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
-        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 277, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
+        __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 277, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
       }
-      if (!(likely(PyDict_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("dict", __pyx_t_2))) __PYX_ERR(0, 277, __pyx_L1_error)
-      __pyx_v_breakpoints = ((PyObject*)__pyx_t_2);
-      __pyx_t_2 = 0;
+      if (!(likely(PyDict_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("dict", __pyx_t_1))) __PYX_ERR(0, 277, __pyx_L1_error)
+      __pyx_v_breakpoints = ((PyObject*)__pyx_t_1);
+      __pyx_t_1 = 0;
 
       /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":278
  * 
@@ -8299,19 +8287,19 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
 */
       __pyx_t_4 = __Pyx_PyObject_GetAttrStr(__pyx_v_main_debugger, __pyx_mstate_global->__pyx_n_u_function_breakpoint_name_to_brea); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 278, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_4);
-      __pyx_t_1 = __pyx_t_4;
-      __Pyx_INCREF(__pyx_t_1);
+      __pyx_t_2 = __pyx_t_4;
+      __Pyx_INCREF(__pyx_t_2);
       __pyx_t_5 = 0;
       {
-        PyObject *__pyx_callargs[2] = {__pyx_t_1, __pyx_v_func_code_info->co_name};
-        __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_v_func_code_info->co_name};
+        __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
         __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 278, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 278, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
       }
-      __pyx_v_function_breakpoint = __pyx_t_2;
-      __pyx_t_2 = 0;
+      __pyx_v_function_breakpoint = __pyx_t_1;
+      __pyx_t_1 = 0;
 
       /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":283
  *             # print(func_code_info.canonical_normalized_filename)
@@ -8320,10 +8308,10 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
  *             cached_code_obj_info: object = _cache.get(code_obj_py)
  *             if cached_code_obj_info:
 */
-      __pyx_t_2 = ((PyObject *)__pyx_v_code_obj);
-      __Pyx_INCREF(__pyx_t_2);
-      __pyx_v_code_obj_py = __pyx_t_2;
-      __pyx_t_2 = 0;
+      __pyx_t_1 = ((PyObject *)__pyx_v_code_obj);
+      __Pyx_INCREF(__pyx_t_1);
+      __pyx_v_code_obj_py = __pyx_t_1;
+      __pyx_t_1 = 0;
 
       /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":284
  *             # print(main_debugger.breakpoints.get(func_code_info.canonical_normalized_filename))
@@ -8333,11 +8321,11 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
  *                 # The cache is for new code objects, so, in this case it's already
 */
       __pyx_t_4 = NULL;
-      __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_cache); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 284, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_1);
-      __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_get); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 284, __pyx_L1_error)
+      __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_cache); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+      __pyx_t_10 = __Pyx_PyObject_GetAttrStr(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_get); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 284, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_10);
-      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
       __pyx_t_5 = 1;
       #if CYTHON_UNPACK_METHODS
       if (unlikely(PyMethod_Check(__pyx_t_10))) {
@@ -8352,14 +8340,14 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
       #endif
       {
         PyObject *__pyx_callargs[2] = {__pyx_t_4, __pyx_v_code_obj_py};
-        __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_10, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_10, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_4); __pyx_t_4 = 0;
         __Pyx_DECREF(__pyx_t_10); __pyx_t_10 = 0;
-        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 284, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
+        if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 284, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
       }
-      __pyx_v_cached_code_obj_info = __pyx_t_2;
-      __pyx_t_2 = 0;
+      __pyx_v_cached_code_obj_info = __pyx_t_1;
+      __pyx_t_1 = 0;
 
       /* "_pydevd_frame_eval/pydevd_frame_evaluator.pyx":285
  *             code_obj_py: object = <object> code_obj
@@ -8396,13 +8384,13 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
         __pyx_t_5 = 0;
         {
           PyObject *__pyx_callargs[2] = {__pyx_t_10, __pyx_v_breakpoints};
-          __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_compute_force_stay_in_untraced_m, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+          __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_compute_force_stay_in_untraced_m, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 293, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_2);
+          if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 293, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_1);
         }
-        if ((likely(PyTuple_CheckExact(__pyx_t_2))) || (PyList_CheckExact(__pyx_t_2))) {
-          PyObject* sequence = __pyx_t_2;
+        if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+          PyObject* sequence = __pyx_t_1;
           Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
           if (unlikely(size != 2)) {
             if (size > 2) __Pyx_RaiseTooManyValuesError(2);
@@ -8429,23 +8417,23 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
           __pyx_t_4 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 292, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_4);
           #endif
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         } else {
           Py_ssize_t index = -1;
-          __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 292, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          __pyx_t_13 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_1);
-          index = 0; __pyx_t_10 = __pyx_t_13(__pyx_t_1); if (unlikely(!__pyx_t_10)) goto __pyx_L27_unpacking_failed;
+          __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 292, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __pyx_t_13 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_2);
+          index = 0; __pyx_t_10 = __pyx_t_13(__pyx_t_2); if (unlikely(!__pyx_t_10)) goto __pyx_L27_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_10);
-          index = 1; __pyx_t_4 = __pyx_t_13(__pyx_t_1); if (unlikely(!__pyx_t_4)) goto __pyx_L27_unpacking_failed;
+          index = 1; __pyx_t_4 = __pyx_t_13(__pyx_t_2); if (unlikely(!__pyx_t_4)) goto __pyx_L27_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_4);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_1), 2) < (0)) __PYX_ERR(0, 292, __pyx_L1_error)
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_2), 2) < (0)) __PYX_ERR(0, 292, __pyx_L1_error)
           __pyx_t_13 = NULL;
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
           goto __pyx_L28_unpacking_done;
           __pyx_L27_unpacking_failed:;
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
           __pyx_t_13 = NULL;
           if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
           __PYX_ERR(0, 292, __pyx_L1_error)
@@ -8544,10 +8532,10 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
  *                 func_code_info.breakpoint_found = breakpoint_found
  * 
 */
-        __pyx_t_2 = __pyx_f_18_pydevd_frame_eval_22pydevd_frame_evaluator_generate_code_with_breakpoints(__pyx_v_code_obj_py, __pyx_v_breakpoints); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_2);
-        if ((likely(PyTuple_CheckExact(__pyx_t_2))) || (PyList_CheckExact(__pyx_t_2))) {
-          PyObject* sequence = __pyx_t_2;
+        __pyx_t_1 = __pyx_f_18_pydevd_frame_eval_22pydevd_frame_evaluator_generate_code_with_breakpoints(__pyx_v_code_obj_py, __pyx_v_breakpoints); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_1);
+        if ((likely(PyTuple_CheckExact(__pyx_t_1))) || (PyList_CheckExact(__pyx_t_1))) {
+          PyObject* sequence = __pyx_t_1;
           Py_ssize_t size = __Pyx_PySequence_SIZE(sequence);
           if (unlikely(size != 2)) {
             if (size > 2) __Pyx_RaiseTooManyValuesError(2);
@@ -8574,23 +8562,23 @@ static struct __pyx_obj_18_pydevd_frame_eval_22pydevd_frame_evaluator_FuncCodeIn
           __pyx_t_10 = __Pyx_PySequence_ITEM(sequence, 1); if (unlikely(!__pyx_t_10)) __PYX_ERR(0, 307, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_10);
           #endif
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
         } else {
           Py_ssize_t index = -1;
-          __pyx_t_1 = PyObject_GetIter(__pyx_t_2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 307, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_1);
-          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-          __pyx_t_13 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_1);
-          index = 0; __pyx_t_4 = __pyx_t_13(__pyx_t_1); if (unlikely(!__pyx_t_4)) goto __pyx_L29_unpacking_failed;
+          __pyx_t_2 = PyObject_GetIter(__pyx_t_1); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 307, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __pyx_t_13 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_2);
+          index = 0; __pyx_t_4 = __pyx_t_13(__pyx_t_2); if (unlikely(!__pyx_t_4)) goto __pyx_L29_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_4);
-          index = 1; __pyx_t_10 = __pyx_t_13(__pyx_t_1); if (unlikely(!__pyx_t_10)) goto __pyx_L29_unpacking_failed;
+          index = 1; __pyx_t_10 = __pyx_t_13(__pyx_t_2); if (unlikely(!__pyx_t_10)) goto __pyx_L29_unpacking_failed;
           __Pyx_GOTREF(__pyx_t_10);
-          if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_1), 2) < (0)) __PYX_ERR(0, 307, __pyx_L1_error)
+          if (__Pyx_IternextUnpackEndCheck(__pyx_t_13(__pyx_t_2), 2) < (0)) __PYX_ERR(0, 307, __pyx_L1_error)
           __pyx_t_13 = NULL;
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
           goto __pyx_L30_unpacking_done;
           __pyx_L29_unpacking_failed:;
-          __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+          __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
           __pyx_t_13 = NULL;
           if (__Pyx_IterFinish() == 0) __Pyx_RaiseNeedMoreValuesError(index);
           __PYX_ERR(0, 307, __pyx_L1_error)
@@ -18738,9 +18726,9 @@ const char* const cstring = "BZh91AY&SY\300\251C\007\000\001\022\177\377\376\377
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1953 bytes) */
-const char* const cstring = "x\332\225\025Ms\023WRRD!\326^(/\006/E\250\035mQq\002F\340Z\023R!,\253\370\013\310\256\203?\202\355\004\266\353i\246Gz\361\350\315h\336\033!\025$\361Q\3079\316Q\3079\352\250\243\216:\276\243\216\372\t\376\t\25173\262%\333d\227\303L\367\353\327\375\372\273\373\376sS#\232n\033\250\331\245\237Q\027\032\345\232N\364\n\032\013\232\250\020\241qR\305\t\206\252\307\205VB\315E\217\243Q\330\260\005\306\234\313MQ\261\231z\300@\213\226\320%\002\255\246\306\205Ku\201\256bb\332\313\325\227\367\226\276Z\322\01034\027\325\203\\\343^I\267\010\347\3105\333\324J\036\265\004e\232h:\310\013\332sSk\332\236\306\020\rM\330\232C\370\204\200\250 \3238\n\205h\363\2041[\020Am\006\242\351PV\236\327\014\352\242.h\035\225\364\032\2618\026^\027\236\022\303\000f\0134('%\013\221\251\177Y\247<\306\014p\232\006\326\r0]RE\300:\261\356\237\241xD\330n\301i6\276Q.\2622\267=W\307\177\302\262\n\337+by8\206\026\000\\4<\035A\217\302\0040y\311QpA\304\371\327\272]u<\201`\332\256\216\300\005i\002e\3401\341\022\035\r\250\332\006\302\262m\340\277)\303\347\314\264'\016\347i\236\274>\243{\005K^\371\031Z\016\272k\036\323\025\273b\035\307\317\276z\352\366\314\243\353\226]\"V\364t\031\335g\266e\240\273\361\375\326\177\340eq\347\3316\0247V\340\333\342\366*,\177\277\261S|\276\261\272\005\360\262\331\200\227\315\025\252\013\330\300\206\330Bs\033\305\216rz\247\342\"1\224\252\023\354\254I\023wg#L\242\272 \206AU\305\020\013(3m\342\226\to2\235\332\005\335vmOP\206\034\240d\333\202\013\2278c\330\030J\031C\367\364\271\344\"9\000\233\201N\274rE\0006tt\224*~|\343qt\301c\347386eb\034\205\n\025@\004X\221MQ\233\002\350\304\262\342\277N\030\360\003\352\350\026\022\027D\344<X\266\236x\246+1U8Q\331\224\210~\240\332\032\022\252iG'\273\364\363\010\202\323\374?\nO\367\\\027\231H\324\031\250\273h\202\323\0040T\332b`Pnx\325j3\326\014\006\345\016\021z\345\204FY\031*QE\000 \023\021\250\253W\261\201:\0006\250\0000A\331l\306\217\230\224\031Q\030\004q\0057\251\313\343\260\230\264\001\302v\300\302:Z\211>\302\014(\243HN\246\307\364\250\211O:9\242""\301\330?\232 '\201\007\2468\205=F*#\213\006\034D\321zKE\005\306\023\3454\313(\224NR\342\340\020Q\001\027\211\025c\312\234\022\341\010\246kW\343y\2428\343t\232\324B5\273NH\006\034'DeI\3056\272\233\310\235\242L\210F\276D<\343B\324@&&\220\244JFL\212+\356\022(G\375\nF\251\\!\034\034\313+SvR\241\261\267|\354*\262%\246R\306\321\025\243\031:\242\tt9\306\241\245\034\216\233\213\362\230\021\014\202U5\270#\213(\347\236\243\004\004\025X\345\026I\362;\372T6l\323\344(\242\002\257\022\312\000F\377F5\202\266\341Y\010P\025\264\212\020\347\020\000\030\276\005\025\315X:6\336\261\235\304\210\222\307\014\013\013\311\211\223z\\\346\236\205<&Umv\200\315\304\265\221\207\261Pr\032\033(\223\321=\207W\267\031\027$\256\230s\256'\373e\264\201T\236=A-~vK\025&(\243\326\372\037l\307\313\354\303\214U\333\240f\023JM\201\252\250\306\314S\357\203\323l\200^A\375\200{\325\370\344\"\367,\021\343IA)T\225g\214y\314\241\372\201\205\023{\343\324\325\311\374>u1\276cO\337\214\357\301\350\256.\324JW\251\257y\304\032\225A\262*\340\354v\034\021\260\241P\341\271\314\365\030G\313T+\344C\331\265l\375 \3321I\235\361\211y\303Q\030h\222(\"\307{\010\316\331I\274b\277M\224\202\312\nrN\313\214\010\317E0\211.l\267\031\tp5\343N\322\304\233\034@QadT\002\342\0257n\350\231\265\220\364\033+O\026\233\347\030D`\374Of\001\217\206\271\307\361\330\356\330\304:\272<\352jf\332\207\351A\366n\270\030\256u\3622\365\270\273x\224K]\230\226S\267\202\315\240\032>\221_\275\350\317\313\315\222,\351\212Q\223\332bgf\220\275\324\232\363/\007D\221n\006\213\203\354u\237\014\262\327\374\315\243?\245.\\j\345\374\\\360I\3604\314\207\213\203\334u\237\370\215\2406\314^<\254\rr\327\374\355 \035\314\014r\263\376\262_\013\322\203\354T\353I\220\2267\276\010?\355l\216\253\210\330\377\334\332\3657\344\337\037w\027\207c\370 \373\327\340J\273\026\246\025\377\2350\037~\331\2319L+\335\323\255/\375Y\177\323'2\365iPT\217?\r\362\312\222\303\342\321l\352\322|\233\014s\267\202\035\231\377G\347I/\335\233\031\344n\006KA\255\235\036\346\246ZK\255\332`\372N\230\037N""\337\to\313\302z\357\235\334\332\226\333\257\344\253]\271\2737\314]\221W\362m\245(\227\272p\271\265\331\"#tG\316,\204+\362A\2617+W\367\345\376\033\371\346\277\203\354tk\335_\364\327\202\2056Q\336\324[\273\376j0\033l\016r\177\361\363\203\334\234_\033\346\346|!o>\354\354vW{W{+\362\331\236\334\003\t\2064\312\262| \017~=J\245~K\257e\216R\251\265\314w\n|\227\331P`#\263\245\300V\006\024\200\214\251\200\231)g\222\270]\221W\026\302\225N\2723\327\235\352=\352\347\207\223\224\305\323\226\177\333\273-\327\014iTd\345\375Q*\365K\272\250\036,f~P\340\207\314\276\002\373\031K\001+\343(\340dj\231\217\360q!\\\357<\354~\322]\222O\267\344\326\276\334\377\361\304\322\273\341RX\353\\\354\274\353\315\367g\206\223\224\374\230\245\267\333+\362\363\307\352\211m\271\275+w\337\312\267\357\216R\251\367\351\027\312\240\027\243\310\354)\260\227y\255\300\353\314\233\217\261\362\353\356|\357ZO\357\317\366\337\310\037\211$\2464\251\244UY\255\313\372/G\251\324\257\351e\365\352r&II\242xG\201\235\314O\n\374\224y=\226\204{\341Ng\2463\337\275\331[\357/\016')\305c\327\374[\201\321^\010\215N\376#l\275\033>R\374#M\005%\336y\324\275\333\333\355\027\207\223\224\250\257.\014\2627\202\033\355\317\342\256\371\"\234\t?\353D\350\347a:\274\036\326\016\323\303\354\337\202\232\324\036t\246\272\217{\007rsk\220\275\352?i\347\302t\030\365\343{\377Q\220\037\344\356\2075\371\340_\275\313}\242\372k\361\003r_\007{\355\315\330\207Dn!,\206o\272\205~\372\217\304\036\007\2256i\327\306\304\356\205\233!\353n\364\363\177$\366M\320P\363`L\254\020\222\360\267.\353\027\023\261AvJN)\257\357uj\207\3518\264\333~z\220\233j=\364/\005s\355\364`\372\252\3770\310\265\323\355\271\360bX\213\344~\007\036\027\014>";
-    PyObject *data = __Pyx_DecompressString(cstring, 1953, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1927 bytes) */
+const char* const cstring = "x\332\225\025Ms\023G\326RD!\326^(\007\023/E\250\035oQq\262\030\201kMH\205\260\254\342/ \273\n\262\035l\022\274]\255\231\036iV\243\031i\272GH\005I|\324q\216s\324q\216:\352\250\243\216}\324Q?\201\237\220\367fF\366\3106\311\242*\315\353~\337\237\375\356>\325\025\252\250\266\306\024\273\364?\246\n\305\340\212J\325\n\323V\024Q\241B\341\264\306\246\030j.\027J\211)\016s9\323r\005[\260\210s\275-*\266\205\n4f\032%\346P\301\314\266\302\205c\250\2029\310d)\3177\237\337Y\373jM\241\226\006\032P!W\270[RM\3129\343\212\255+%\3270\205a)\242]g<\247\200\203m\333U,\3064E\330J\035\370\222\002\242\302,\2053\201\007e\231Z\226-\2500l\213\200\270a\225\227\025\315p\300\210\321d(\275EM\316r\257r\217\251\246\021`e\232\301i\311d\314\302oY5xt\322H\275\255\261\246Ft\007\302'\254I\315\273g0.\025\266\223\253\267[\337`\210V\231\333\256\243\262\177\222uL\337\013\240\263\3041G\210\3034WeD\r\323D\3104\021B\340\340\371\371d\325\256\325]\240\3516\030 \300\327&\206E\\K8T\005_kP\035\262\016\237\177\033\026{j\351\366\324\345<\313\323\3443\2667X\311-?af\2359[\256\245\";\262&\317g\265\236\242\236Q\272m\332%j\206\252\313\314yb\233\032s\n\337\357\374\207<\317\357=\331%\371\302\006\3716\277\273I\326\277/\354\345\237\0266w\010y\336n\301\177\003\332\207\024XK\3540}\227\211=\014z\257\3420\252\241\251\223\323Y\227\246hg3L\303\276\200V0\260c\250\tI\325m\352\224)o[\252aC\332\035\333\205Vd\234\220\222m\203\270C\353\211S\342hX\026sN\337K`\275J\300\224J\335rE\020\326RY\035M\361c\n\214\220\003\205<\237\241n\033\226H\036I\305\020\204\nb\206>\205cJ\000\230f\364U\251Ex\325\250\253&\243\016\021a\360\304\264\32582\025\305\260q\302\266)Q\265\212cMb,\320\361\006C>\2010\003\377G\343\251\256\3430K\304\346\340\3560\035$\t\321\260l\021\200)\323\334Z\255\035Y\006\024\257S\241VNp0=\244\022v\004!\240,\004M\324\312ZL\205s\013\342&:A\237\365H\211nXZ\230\006A\035\301u\303\341QZt\243E\204]'&\310\233\261=xkH\231\211\370\246C\272\303!>\231\344\020G\022\337\360\0059I<\261\220S\330\tT\231Y\341\003G\302l\2756D\205$\013Uo\203A\264IKp\241@\005""\242\031\235\320\235\022\345\340\211c\327\242\367\0049\243r\352\206\311\360\355:Ai\344\270 X%\314mH\233\252\035b\246D\303XB\236\244\220\2411KL\035\342.\2310!W4%\244\034\316+\321J\345\n\205\030L\267\014\245?\356\320(Z\236 \205\276DX\303\202\266\026\2237t\202\203\262r\026\245\326\200\356\235\014\227\301#F\242QV\303\207;\364\310\340\334\255\243\2000\004\253qx\355\243\372N\376X\r[\327\201\0366x\215\202\007d\362m\325Bhk.d\204\324\204\001\325\213j\010?\213\275&\230\315H:r\276\016\035\0239Qr\241\257\340A\216n\2346\2436\007E<B\201\213U\326\216C\233D\030\t\305\267\304\2032\235\335sxU\230uA\243\2169\207<=/\223\r\204u\206\324\231\374\354\226\312Ma&\243\365\007l\307\313\354\375\214\220\002Co\223R[0l\252\204{\250\037\344Z\004ZU\255r\267\026\335\034\306]SD\347\270\241\360\210\355\031\235\\\253n\250U\210$\2717N\221N\336\357S\204\344\216=MI\356\301\220\326\024\270\322\261\364\r\227\232\2236\210W\0059\273\035'\010\326\302\243p\035\313q\241\241M\035W\310\373\252\013]X\rwL\334g|\352\275\201\233\306t\032f\344x\017\221sv\022\257\330\257c\243\004\253\30287\312\026\205;(\202}e;\355P\200\343\033wR&\336\206\025\205X2q*\006\321\212K:zf-\304\363f\225\247\233\315\255k`'\372\306o\001\017\037sXY\307~G.6aN\303\251\006mG\251Q\346v\260\032l\365\226\344\314\303\376\352\273\354\314\20599{\323/\372\265\340\221\374\352\331pY\026K\262\244\"\243\"\225\325\336\374(s\251\263\350]\366)\242n\370\253\243\314'\036\035e\256y\305w\177\232\271p\251\223\365\262\376G\376\343`)X\035e\201\344\265\374\3068s\361\2501\312^\363v\375\224\077\077\312.x\353^\303\007\371\331\316#?%\257\177\021|\332+&M\204\354\177\356\354{\005\3717pk\2348\2172\177\361\257t\033A\n\371\377\016f\276\354\315\037\245\320\366\\\347Ko\301+zT\316|\352\347Q\371c\177\t=9\312\277[\230\271\264\334\245\343\354M\177O.\375\243\367h\220\032\200\0377\3745\277\321M\215\263\263\235\265Nc4\007\352\306\360\271%s\333\2037rgW\356\276\220/\366\345\376\3018{E^Y\352\242!\310\320\345N\261C'\307=9\277\022l\310{\371\301\202\334|)_\036\312\303\377\2162s\235mo\325\333\362W""\272\024\243i\202\373\233\376\202_\034e?\366\226F\331E\2571\206\217\2207\356\367\366\373\233\203\253\203\r\371\344@\036\020I4\251\225e\271*\253\277\274\233\231\3715\265\225\006\260\225\376\016\301w\351\002\202Bz\007\301N\232  i\035\201\236.\247\343\274\201\253\340Q/\325[\354\317\016\036\014\227\306\323\230\325\323\236\177;\270%\267\300lEV\336\202\246\237SyT\230O\377\200\340\207\364K\004/\323&\0023]GPO7\322\037\020\343J\260\335\273\337\377\250\277&\037\357\310\035\310\321\217'\236\336\016\326\202F\357b\357\315`y8?\236\306,%<\275\325\335\220\237?D\025P\025(\311k\371\372\rx\3626\365\014\035z6\311\314\001\202\203\364+\004\257\322\207\037\342\345\327\375\345\301\265\201:\\\030\036\312\037\251\244\272\324\ri\324d\255)\233?\203\272_R\353\250u=\035\227$6\274\207`/\375\023\202\237\300\360Ihw\202\275\336|o\271\177c\260=\\\035Oc\362\307\241y7}\255\273\022h\275\245\017\360\365v\360\000\371'\226r(\336{\320\277=\330\037\346\307\323\230p\256.\2142\327\375\353\335\317\242\251\371\"\230\017>\353\205\307\317\203T\360I\3208J\2153\177\365\033R\271\327\233\355?\034Teqg\224\271\352=\352f\201\036\316\343[\357\201\017.\334\r\032\362\336\277\006\227\207\024\347k\365=r_\373\007\335b\024C,\267\022\344\203\303~n\230\372=\261\207~\245K\273\215\204\330\235\240\030X\375\302p\351\367\304\276\361[\370\036$\304r\001\r~\355[\303|,\006@\316b\324wz\215\243T\224\332]/5\202\271\277\357]\362\027\273\251\321\334U\357\276\237\355\246\272\213\301\305\240\021\312\375\006\036\027\014>";
+    PyObject *data = __Pyx_DecompressString(cstring, 1927, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
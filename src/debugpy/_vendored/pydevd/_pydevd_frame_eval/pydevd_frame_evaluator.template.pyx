@@ -243,7 +243,7 @@ cdef FuncCodeInfo get_func_code_info(ThreadInfo thread_info, PyFrameObject * fra
     cdef str co_filename = <str> code_obj.co_filename
     cdef str co_name = <str> code_obj.co_name
     cdef dict cache_file_type
-    cdef tuple cache_file_type_key
+    cdef str cache_file_type_key
 
     func_code_info = FuncCodeInfo()
     func_code_info.breakpoints_mtime = main_debugger.mtime
@@ -262,7 +262,7 @@ cdef FuncCodeInfo get_func_code_info(ThreadInfo thread_info, PyFrameObject * fra
         cache_file_type = main_debugger.get_cache_file_type()
         # Note: this cache key must be the same from PyDB.get_file_type() -- see it for comments
         # on the cache.
-        cache_file_type_key = (frame_obj.f_code.co_firstlineno, abs_path_real_path_and_base[0], <object>frame_obj.f_code)
+        cache_file_type_key = abs_path_real_path_and_base[0]
         try:
             file_type = cache_file_type[cache_file_type_key]  # Make it faster
         except:
@@ -103,6 +103,10 @@ TRACE_PROPERTY = "pydevd_traceproperty.py"
 _global_notify_skipped_step_in = False
 _global_notify_skipped_step_in_lock = ForkSafeLock()
 
+# Whether some thread may have to be suspended (see update_monitor_events). While it's
+# set, line events can't be disabled based only on the breakpoint lines of a function.
+_suspend_requested = False
+
 
 # fmt: off
 # IFDEF CYTHON
@@ -404,6 +408,8 @@ def _create_thread_info(depth):
 #     cdef bint plugin_return_stepping
 #     cdef int pydb_mtime
 #     cdef dict bp_line_to_breakpoint
+#     cdef bytes bp_lines_bitmap
+#     cdef int bp_lines_first_line
 #     cdef object function_breakpoint
 #     cdef bint always_filtered_out
 #     cdef bint filtered_out_force_checked
@@ -441,6 +447,12 @@ class FuncCodeInfo:
         self.pydb_mtime: int = -1
 
         self.bp_line_to_breakpoint: Dict[int, Any] = {}
+
+        # Bit i is set if there's a breakpoint at line bp_lines_first_line + i (empty
+        # if there are no breakpoints in the function).
+        self.bp_lines_bitmap: bytes = b""
+        self.bp_lines_first_line: int = 0
+
         self.function_breakpoint = None
 
         # This means some file is globally filtered out during debugging. Note
@@ -464,6 +476,20 @@ class FuncCodeInfo:
         return -1
 
 
+# fmt: off
+# IFDEF CYTHON
+# cdef bint _is_breakpoint_line(FuncCodeInfo func_code_info, int line):
+#     cdef int index
+# ELSE
+def _is_breakpoint_line(func_code_info, line):
+# ENDIF
+# fmt: on
+    index = line - func_code_info.bp_lines_first_line
+    if index < 0 or (index >> 3) >= len(func_code_info.bp_lines_bitmap):
+        return False
+    return (func_code_info.bp_lines_bitmap[index >> 3] >> (index & 7)) & 1
+
+
 # fmt: off
 # IFDEF CYTHON
 # cdef _get_thread_info(bint create, int depth):
@@ -580,7 +606,7 @@ def _get_func_code_info(code_obj, frame_or_depth) -> FuncCodeInfo:
     # fmt: off
     # IFDEF CYTHON
     # cdef dict cache_file_type
-    # cdef tuple cache_file_type_key
+    # cdef str cache_file_type_key
     # cdef PyCodeObject * code
     # cdef str co_filename
     # cdef str co_name
@@ -589,7 +615,7 @@ def _get_func_code_info(code_obj, frame_or_depth) -> FuncCodeInfo:
     # co_name = <str> code.co_name
     # ELSE
     cache_file_type: dict
-    cache_file_type_key: tuple
+    cache_file_type_key: str
     code = code_obj
     co_filename: str = code.co_filename
     co_name: str = code.co_name
@@ -620,7 +646,7 @@ def _get_func_code_info(code_obj, frame_or_depth) -> FuncCodeInfo:
     cache_file_type = py_db.get_cache_file_type()
     # Note: this cache key must be the same from PyDB.get_file_type() -- see it for comments
     # on the cache.
-    cache_file_type_key = (code.co_firstlineno, abs_path_real_path_and_base[0], code_obj)
+    cache_file_type_key = abs_path_real_path_and_base[0]
     try:
         file_type = cache_file_type[cache_file_type_key]  # Make it faster
     except:
@@ -699,6 +725,15 @@ def _get_func_code_info(code_obj, frame_or_depth) -> FuncCodeInfo:
         func_code_info.breakpoint_found = bool(bp_line_to_breakpoint)
         func_code_info.bp_line_to_breakpoint = bp_line_to_breakpoint
 
+        if bp_line_to_breakpoint:
+            first_line = code_line_info.first_line
+            bp_lines_bitmap = bytearray(((code_line_info.last_line - first_line) >> 3) + 1)
+            for breakpoint_line in bp_line_to_breakpoint:
+                index = breakpoint_line - first_line
+                bp_lines_bitmap[index >> 3] |= 1 << (index & 7)
+            func_code_info.bp_lines_bitmap = bytes(bp_lines_bitmap)
+            func_code_info.bp_lines_first_line = first_line
+
     if py_db.plugin:
         plugin_manager = py_db.plugin
         is_tracked_frame = plugin_manager.is_tracked_frame(frame)
@@ -1342,7 +1377,10 @@ def _stop_on_breakpoint(
         stop = False
         stop_on_plugin_breakpoint = False
 
-        if additional_info.pydev_message is not None and len(additional_info.pydev_message) > 0:
+        if py_db.tracepoints is not None:
+            py_db.tracepoints.add_hit(bp, new_frame)
+
+        elif additional_info.pydev_message is not None and len(additional_info.pydev_message) > 0:
             cmd = py_db.cmd_factory.make_io_message(additional_info.pydev_message + os.linesep, "1")
             py_db.writer.add_command(cmd)
 
@@ -1475,6 +1513,17 @@ def _line_event(code, line):
 # ENDIF
 # fmt: on
 
+    # Fast path for functions with breakpoints: if no thread is stepping or has to be
+    # suspended, the line events of lines without a breakpoint are disabled before
+    # looking at any thread-related state (they're re-enabled by restart_events()
+    # when stepping starts, a suspend is requested or breakpoints change).
+    func_code_info = _code_to_func_code_info_cache.get(code)
+    if func_code_info is not None and func_code_info.bp_lines_bitmap and not _suspend_requested:
+        if not func_code_info.plugin_line_breakpoint_found and not _is_breakpoint_line(func_code_info, line):
+            py_db: object = GlobalDebuggerHolder.global_dbg
+            if py_db is not None and func_code_info.pydb_mtime == py_db.mtime and not any_thread_stepping():
+                return monitor.DISABLE
+
     # A bunch of things have to be repeated especially because in the sys.monitoring
     # everything is global, yet, when we start tracing something for stepping that
     # needs to be per-thread.
@@ -1485,7 +1534,7 @@ def _line_event(code, line):
         if thread_info is None:
             return
 
-    py_db: object = GlobalDebuggerHolder.global_dbg
+    py_db = GlobalDebuggerHolder.global_dbg
     if py_db is None or py_db.pydb_disposed:
         return monitor.DISABLE
 
@@ -1504,7 +1553,7 @@ def _line_event(code, line):
         # threads may still want it...
         return
     
-    func_code_info: FuncCodeInfo = _get_func_code_info(code, 1)
+    func_code_info = _get_func_code_info(code, 1)
     if func_code_info.always_skip_code or func_code_info.always_filtered_out:
         return monitor.DISABLE
 
@@ -1916,6 +1965,22 @@ def resume_current_thread_tracing():
     thread_info.trace = True
 
 
+def _is_suspend_requested() -> bool:
+    for t in threading.enumerate():
+        if getattr(t, "pydev_do_not_trace", False):
+            continue
+        try:
+            additional_info = t.additional_info
+            if additional_info is None:
+                # i.e.: if we don't have it then it makes no sense to check if it was suspended or is stepping
+                continue
+        except AttributeError:
+            continue
+        if additional_info.pydev_step_cmd != -1 or additional_info.pydev_state == 2:
+            return True
+    return False
+
+
 def update_monitor_events(suspend_requested: Optional[bool]=None) -> None:
     """
     This should be called when breakpoints change.
@@ -1932,22 +1997,11 @@ def update_monitor_events(suspend_requested: Optional[bool]=None) -> None:
     if py_db is None:
         return
 
-    if suspend_requested is None:
-        suspend_requested = False
+    global _suspend_requested
 
-        for t in threading.enumerate():
-            if getattr(t, "pydev_do_not_trace", False):
-                continue
-            try:
-                additional_info = t.additional_info
-                if additional_info is None:
-                    # i.e.: if we don't have it then it makes no sense to check if it was suspended or is stepping
-                    continue
-            except AttributeError:
-                continue
-            if additional_info.pydev_step_cmd != -1 or additional_info.pydev_state == 2:
-                suspend_requested = True
-                break
+    if suspend_requested is None:
+        suspend_requested = _is_suspend_requested()
+    _suspend_requested = suspend_requested
 
     required_events = 0
 
@@ -2044,9 +2098,16 @@ def _is_same_frame(info, target_frame, current_frame):
 def _do_wait_suspend(py_db, thread_info, frame, event, arg):
 # ENDIF
 # fmt: on
+    global _suspend_requested
+
     thread_info.additional_info.trace_suspend_type = "sys_monitor"
     py_db.do_wait_suspend(thread_info.thread, frame, event, arg)
 
+    # Once the last suspended thread resumes, the fast path in _line_event() can be
+    # used again.
+    if _suspend_requested:
+        _suspend_requested = _is_suspend_requested()
+
 # This can be used to diagnose exceptions inside of the debugger itself.
 #
 # import types
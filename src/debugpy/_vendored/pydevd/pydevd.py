@@ -47,6 +47,7 @@ from _pydevd_bundle import pydevd_extension_utils, pydevd_frame_utils
 from _pydevd_bundle.pydevd_filtering import FilesFiltering, glob_matches_path
 from _pydevd_bundle import pydevd_io, pydevd_vm_type, pydevd_defaults
 from _pydevd_bundle import pydevd_utils
+from _pydevd_bundle import pydevd_asyncio_integration
 from _pydevd_bundle import pydevd_runpy
 from _pydev_bundle.pydev_console_utils import DebugConsoleStdIn
 from _pydevd_bundle.pydevd_additional_thread_info import set_additional_thread_info, remove_additional_info
@@ -93,10 +94,11 @@ from _pydevd_bundle.pydevd_constants import (
     PYDEVD_IPYTHON_COMPATIBLE_DEBUGGING,
     PYDEVD_IPYTHON_CONTEXT,
     PYDEVD_USE_SYS_MONITORING,
+    PYDEVD_THREADS_SCAN_INTERVAL,
     IS_PY314_OR_GREATER,
 )
 from _pydevd_bundle.pydevd_defaults import PydevdCustomization  # Note: import alias used on pydev_monkey.
-from _pydevd_bundle.pydevd_custom_frames import CustomFramesContainer, custom_frames_container_init
+from _pydevd_bundle.pydevd_custom_frames import CustomFramesContainer, custom_frames_container_init, remove_custom_frame
 from _pydevd_bundle.pydevd_dont_trace_files import DONT_TRACE, PYDEV_FILE, LIB_FILE, DONT_TRACE_DIRS
 from _pydevd_bundle.pydevd_extension_api import DebuggerEventHandler
 from _pydevd_bundle.pydevd_frame_utils import exception_on_frame, short_stack
@@ -148,7 +150,7 @@ from _pydevd_bundle.pydevd_process_net_command import process_net_command
 from _pydevd_bundle.pydevd_net_command import NetCommand, NULL_NET_COMMAND
 
 from _pydevd_bundle.pydevd_breakpoints import stop_on_unhandled_exception
-from _pydevd_bundle.pydevd_collect_bytecode_info import collect_try_except_info, collect_return_info, collect_try_except_info_from_source
+from _pydevd_bundle.pydevd_collect_bytecode_info import collect_try_except_info, collect_return_info, get_try_except_infos_index
 from _pydevd_bundle.pydevd_suspended_frames import SuspendedFramesManager
 from socket import SHUT_RDWR
 from _pydevd_bundle.pydevd_api import PyDevdAPI
@@ -239,8 +241,14 @@ _global_redirect_stderr_to_server = False
 
 file_system_encoding = getfilesystemencoding()
 
+# The file type only depends on the file, so, it's kept per absolute path (and not per code
+# object, which would keep alive all the code objects ever traced).
 _CACHE_FILE_TYPE = {}
 
+# The exception is code compiled from '<string>', whose file type depends on the frame which
+# runs it. These entries are kept only while the related code object is alive.
+_CACHE_CODE_FILE_TYPE = weakref.WeakKeyDictionary()
+
 pydev_log.debug("Using GEVENT_SUPPORT: %s", pydevd_constants.SUPPORT_GEVENT)
 pydev_log.debug("Using GEVENT_SHOW_PAUSED_GREENLETS: %s", pydevd_constants.GEVENT_SHOW_PAUSED_GREENLETS)
 pydev_log.debug("pydevd __file__: %s", os.path.abspath(__file__))
@@ -271,13 +279,30 @@ class PyDBCommandThread(PyDBDaemonThread):
             return
 
         try:
+            py_db = self.py_db
             while not self._kill_received:
+                # Clear before processing so that a command posted while processing isn't missed.
+                self._py_db_command_thread_event.clear()
+                commands_pending = False
                 try:
-                    self.py_db.process_internal_commands(("*",))
+                    # Commands are processed as soon as they're posted. Enumerating all the threads
+                    # (to notify about threads not started/finished through the patched thread
+                    # startup) is only done from time to time.
+                    commands_pending = py_db.process_internal_commands(("*",), scan_threads=py_db.get_time_until_threads_scan() <= 0)
                 except:
                     pydev_log.info("Finishing debug communication...(2)")
-                self._py_db_command_thread_event.clear()
-                self._py_db_command_thread_event.wait(TIMEOUT_SLOW)
+
+                if commands_pending:
+                    # Commands which couldn't be executed now were put back (i.e.: a command waiting
+                    # for a thread to suspend, which is executed by this thread after a timeout), so,
+                    # check them again shortly (re-adding them doesn't set the event).
+                    self._py_db_command_thread_event.wait(TIMEOUT_FAST)
+                elif not py_db.ready_to_run:
+                    # Threads aren't scanned until the debugger is ready to run (the event is set
+                    # when it is or when a command is posted).
+                    self._py_db_command_thread_event.wait()
+                else:
+                    self._py_db_command_thread_event.wait(max(py_db.get_time_until_threads_scan(), TIMEOUT_FAST))
         except:
             try:
                 pydev_log.debug(sys.exc_info()[0])
@@ -311,8 +336,14 @@ class CheckAliveThread(PyDBDaemonThread):
     @overrides(PyDBDaemonThread._on_run)
     def _on_run(self):
         py_db = self.py_db
+        main_thread = threading.main_thread()
 
         def can_exit():
+            # Checking the main thread is cheap (as opposed to enumerating all the threads) and no
+            # other thread needs to be checked while it's alive.
+            if is_thread_alive(main_thread):
+                return False
+
             with py_db._main_lock:
                 # Note: it's important to get the lock besides checking that it's empty (this
                 # means that we're not in the middle of some command processing).
@@ -322,8 +353,11 @@ class CheckAliveThread(PyDBDaemonThread):
             return not py_db.has_user_threads_alive() and writer_empty
 
         try:
+            # The thread startup notifies when a thread finishes (which wakes us up), so, the
+            # timeout is mostly to notice that the main thread finished.
             while not self._kill_received:
                 self._wait_event.wait(TIMEOUT_SLOW)
+                self._wait_event.clear()
                 if can_exit():
                     break
 
@@ -335,6 +369,15 @@ class CheckAliveThread(PyDBDaemonThread):
         except:
             pydev_log.exception()
 
+    def wake_up(self):
+        self._wait_event.set()
+
+    @overrides(PyDBDaemonThread.do_kill_pydev_thread)
+    def do_kill_pydev_thread(self):
+        PyDBDaemonThread.do_kill_pydev_thread(self)
+        # Set flag so that it can exit before the usual timeout.
+        self.wake_up()
+
     def join(self, timeout=None):
         # If someone tries to join this thread, mark it to be killed.
         # This is the case for CherryPy when auto-reload is turned on.
@@ -608,6 +651,22 @@ class PyDB(object):
         # thread with a KeyboardInterrupt).
         self.terminate_keyboard_interrupt = False
 
+        # Determines whether the data usually requested by the client right after a thread
+        # is suspended should be sent right away (see: make_prefetch_message).
+        self.prefetch_on_stop = False
+
+        # Determines whether the stacks of all threads should be captured at once when all
+        # threads are suspended (so that they're available before each thread actually suspends).
+        self.snapshot_on_suspend = False
+
+        # Determines whether the debugger in a forked process should keep the configuration of the
+        # parent process (see: inherit_state_from).
+        self.inherit_state_on_fork = False
+
+        # Whether this debugger is in a forked process and inherited the configuration of the
+        # parent process (in which case it runs without waiting for the client to configure it).
+        self.inherited_state_on_fork = False
+
         # Set to True after a keyboard interrupt is requested the first time.
         self.keyboard_interrupt_requested = False
 
@@ -673,6 +732,7 @@ class PyDB(object):
         # find that thread alive anymore, we must remove it from this list and make the java side know that the thread
         # was killed.
         self._running_thread_ids = {}
+        self._last_threads_scan_time = 0
         # Note: also access '_enable_thread_notifications' with '_lock_running_thread_ids'
         self._enable_thread_notifications = False
 
@@ -772,6 +832,20 @@ class PyDB(object):
 
         self._in_project_scope_cache = {}
         self._exclude_by_filter_cache = {}
+        # The TypeStatsSummary recorded by the 'recordTypeStats' query of the pydevdHeapSnapshot
+        # request (to be diffed in a later suspension).
+        self.heap_type_stats_baseline = None
+
+        # The SamplingProfilerThread while the sampling profiler is running (see pydevdProfile request).
+        self.sampling_profiler = None
+
+        # The Tracepoints (and the thread which sends its hits) if logpoints are tracepoints
+        # (see 'tracepoints' in the launch arguments).
+        self.tracepoints = None
+        self.tracepoints_flusher = None
+
+        # filename -> ((mtime, size), TryExceptInfosIndex); see collect_try_except_info().
+        self._try_except_infos_index_cache = {}
         self._apply_filter_cache = {}
         self._ignore_system_exit_codes = set()
         self._break_on_system_exit = None  # None = default behavior, tuple = (codes_set, ranges_list)
@@ -791,9 +865,10 @@ class PyDB(object):
         filename = code_obj.co_filename
         try:
             if os.path.exists(filename):
-                pydev_log.debug("Collecting try..except info from source for %s", filename)
-                try_except_infos = collect_try_except_info_from_source(filename)
-                if try_except_infos:
+                # The source of a file is only parsed once (per version of the file),
+                # regardless of how many of its functions need the info.
+                index = get_try_except_infos_index(filename, self._try_except_infos_index_cache)
+                if index is not None:
                     # Filter for the current function
                     max_line = -1
                     min_line = sys.maxsize
@@ -804,8 +879,7 @@ class PyDB(object):
                             if line < min_line:
                                 min_line = line
 
-                    try_except_infos = [x for x in try_except_infos if min_line <= x.try_line <= max_line]
-                return try_except_infos
+                    return index.get_in_line_range(min_line, max_line)
 
         except:
             pydev_log.exception("Error collecting try..except info from source (%s)", filename)
@@ -1023,6 +1097,9 @@ class PyDB(object):
             etype, value, tb = None, None, None
 
     def handle_breakpoint_expression(self, pybreakpoint, info, new_frame):
+        if self.tracepoints is not None and pybreakpoint.is_logpoint:
+            # Tracepoints only evaluate the message for the hits which are captured.
+            return
         try:
             try:
                 val = eval(pybreakpoint.expression, new_frame.f_globals, new_frame.f_locals)
@@ -1075,7 +1152,9 @@ class PyDB(object):
         # be changed for another function in PyDevdAPI.set_dont_trace_start_end_patterns.
         return False
 
-    def get_file_type(self, frame, abs_real_path_and_basename=None, _cache_file_type=_CACHE_FILE_TYPE):
+    def get_file_type(
+        self, frame, abs_real_path_and_basename=None, _cache_file_type=_CACHE_FILE_TYPE, _cache_code_file_type=_CACHE_CODE_FILE_TYPE
+    ):
         """
         :param abs_real_path_and_basename:
             The result from get_abs_path_real_path_and_base_from_file or
@@ -1100,20 +1179,24 @@ class PyDB(object):
                 abs_real_path_and_basename = get_abs_path_real_path_and_base_from_frame(frame)
 
         # Note 1: we have to take into account that we may have files as '<string>', and that in
-        # this case the cache key can't rely only on the filename. With the current cache, there's
-        # still a potential miss if 2 functions which have exactly the same content are compiled
-        # with '<string>', but in practice as we only separate the one from python -c from the rest
-        # this shouldn't be a problem in practice.
-
-        # Note 2: firstlineno added to make misses faster in the first comparison.
-
-        # Note 3: this cache key is repeated in pydevd_frame_evaluator.pyx:get_func_code_info (for
-        # speedups).
-        cache_key = (frame.f_code.co_firstlineno, abs_real_path_and_basename[0], frame.f_code)
+        # this case the cache key can't rely only on the filename (so, in this case the code object
+        # is used as the key in a separate cache). There's still a potential miss if 2 functions
+        # which have exactly the same content are compiled with '<string>', but in practice as we
+        # only separate the one from python -c from the rest this shouldn't be a problem in practice.
+
+        # Note 2: this cache key is repeated in pydevd_frame_evaluator.pyx:get_func_code_info and
+        # in _pydevd_sys_monitoring.py:_get_func_code_info (for speedups).
+        abs_path = abs_real_path_and_basename[0]
         try:
-            return _cache_file_type[cache_key]
+            return _cache_file_type[abs_path]
         except:
-            if abs_real_path_and_basename[0] == "<string>":
+            if abs_path == "<string>":
+                cache_key = frame.f_code
+                try:
+                    return _cache_code_file_type[cache_key]
+                except KeyError:
+                    pass
+
                 f = frame.f_back
                 while f is not None:
                     if self.get_file_type(f) != self.PYDEV_FILE and pydevd_file_utils.basename(f.f_code.co_filename) not in (
@@ -1129,14 +1212,14 @@ class PyDB(object):
 
                         # Note that we return as a LIB_FILE and not PYDEV_FILE because we still want
                         # to show it in the stack.
-                        _cache_file_type[cache_key] = LIB_FILE
+                        _cache_code_file_type[cache_key] = LIB_FILE
                         return LIB_FILE
 
                     f = f.f_back
                 else:
                     # This is a top-level file (used in python -c), so, trace it as usual... we
                     # still won't be able to show the sources, but some tests require this to work.
-                    _cache_file_type[cache_key] = None
+                    _cache_code_file_type[cache_key] = None
                     return None
 
             file_type = self._internal_get_file_type(abs_real_path_and_basename)
@@ -1144,11 +1227,11 @@ class PyDB(object):
                 if self.dont_trace_external_files(abs_real_path_and_basename[0]):
                     file_type = PYDEV_FILE
 
-            _cache_file_type[cache_key] = file_type
+            _cache_file_type[abs_path] = file_type
             return file_type
 
     def is_cache_file_type_empty(self):
-        return not _CACHE_FILE_TYPE
+        return not _CACHE_FILE_TYPE and not _CACHE_CODE_FILE_TYPE
 
     def get_cache_file_type(self, _cache=_CACHE_FILE_TYPE):  # i.e.: Make it local.
         return _cache
@@ -1273,6 +1356,63 @@ class PyDB(object):
         if PYDEVD_USE_SYS_MONITORING:
             pydevd_sys_monitoring.restart_events()
 
+    # Attributes kept from the debugger of the parent process when `inherit_state_on_fork` is set.
+    _STATE_INHERITED_ON_FORK = (
+        "api_received_breakpoints",
+        "breakpoints",
+        "function_breakpoint_name_to_breakpoint",
+        "file_to_id_to_line_breakpoint",
+        "break_on_uncaught_exceptions",
+        "break_on_caught_exceptions",
+        "break_on_user_uncaught_exceptions",
+        "skip_on_exceptions_thrown_in_same_context",
+        "ignore_exceptions_thrown_in_lines_with_ignore_exception",
+        "skip_suspend_on_breakpoint_exception",
+        "skip_print_breakpoint_exception",
+        "filename_to_lines_where_exceptions_are_ignored",
+        "disable_property_trace",
+        "disable_property_getter_trace",
+        "disable_property_setter_trace",
+        "disable_property_deleter_trace",
+        "show_return_values",
+        "stepping_resumes_all_threads",
+        "multi_threads_single_notification",
+        "variable_presentation",
+        "terminate_child_processes",
+        "terminate_keyboard_interrupt",
+        "prefetch_on_stop",
+        "snapshot_on_suspend",
+        "inherit_state_on_fork",
+        "_set_breakpoints_with_id",
+        "_ignore_system_exit_codes",
+        "_break_on_system_exit",
+        # Filters and the related caches.
+        "_files_filtering",
+        "_filename_to_not_in_scope",
+        "_in_project_scope_cache",
+        "_exclude_by_filter_cache",
+        "_apply_filter_cache",
+        "_exclude_filters_enabled",
+        "_is_libraries_filter_enabled",
+        "is_files_filter_enabled",
+        "mtime",
+    )
+
+    def inherit_state_from(self, parent_py_db):
+        """
+        Copies the configuration (breakpoints, exception breakpoints, filters and the related
+        caches) from the debugger of the parent process, so that a debugger which is reinitialized
+        in a forked process doesn't need to wait for the client to configure it again.
+
+        Note that module-level caches (such as the file type and path normalization caches) are
+        already kept in the forked process. Breakpoints handled by plugins aren't kept (the client
+        still sends its configuration when it connects to the forked process, which replaces the
+        inherited one).
+        """
+        for attr in self._STATE_INHERITED_ON_FORK:
+            setattr(self, attr, getattr(parent_py_db, attr))
+        self.inherited_state_on_fork = True
+
     @property
     def multi_threads_single_notification(self):
         return self._threads_suspended_single_notification.multi_threads_single_notification
@@ -1380,6 +1520,7 @@ class PyDB(object):
         # as places which were traced may no longer need to be traced and vice-versa.
         self.on_breakpoints_changed()
         _CACHE_FILE_TYPE.clear()
+        _CACHE_CODE_FILE_TYPE.clear()
         self._clear_caches()
 
     def _exclude_by_filter(self, frame, absolute_filename):
@@ -1801,6 +1942,10 @@ class PyDB(object):
 
         self.writer.add_command(self.cmd_factory.make_thread_killed_message(thread_id))
 
+        check_alive_thread = self.check_alive_thread
+        if check_alive_thread is not None:
+            check_alive_thread.wake_up()
+
     def set_enable_thread_notifications(self, enable):
         with self._lock_running_thread_ids:
             if self._enable_thread_notifications != enable:
@@ -1811,18 +1956,38 @@ class PyDB(object):
                     # (so, clear the cache related to that).
                     self._running_thread_ids = {}
 
-    def process_internal_commands(self, process_thread_ids: Optional[tuple]=None):
+    def get_time_until_threads_scan(self):
+        """
+        :return float:
+            The time (in seconds) until all the threads should be enumerated again in
+            `process_internal_commands` (<= 0 means that it should be done now).
+        """
+        return self._last_threads_scan_time + PYDEVD_THREADS_SCAN_INTERVAL - time.time()
+
+    def process_internal_commands(self, process_thread_ids: Optional[tuple]=None, scan_threads: bool=True):
         """
         This function processes internal commands.
+
+        :param scan_threads:
+            If True all the threads are enumerated to notify about threads which were created or
+            which are no longer alive (threads started through the patched thread startup notify
+            about it themselves, so, this may be False if just the commands should be processed).
+
+        :return bool:
+            True if some command couldn't be executed by the current thread and was put back in
+            its queue (to be executed later on).
         """
         # If this method is being called before the debugger is ready to run we should not notify
         # about threads and should only process commands sent to all threads.
         ready_to_run = self.ready_to_run
 
         dispose = False
+        commands_pending = False
         with self._main_lock:
             program_threads_alive = {}
-            if ready_to_run:
+            scan_threads = scan_threads and ready_to_run
+            if scan_threads:
+                self._last_threads_scan_time = time.time()
                 self.check_output_redirect()
 
                 all_threads = threadingEnumerate()
@@ -1862,7 +2027,7 @@ class PyDB(object):
             cmds_to_execute = []
 
             # Without self._lock_running_thread_ids
-            if len(program_threads_alive) == 0 and ready_to_run:
+            if len(program_threads_alive) == 0 and scan_threads:
                 dispose = True
             else:
                 curr_thread_id = get_current_thread_id(threadingCurrentThread())
@@ -1899,6 +2064,8 @@ class PyDB(object):
                         # this is how we exit
                         for internal_cmd in cmds_to_add_back:
                             queue.put(internal_cmd)
+                        if cmds_to_add_back:
+                            commands_pending = True
 
         if dispose:
             # Note: must be called without the main lock to avoid deadlocks.
@@ -1911,6 +2078,7 @@ class PyDB(object):
                     internal_cmd.do_it(self)
                 except:
                     pydev_log.exception("Error processing internal command.")
+        return commands_pending
 
     def has_breakpoint_id_collision(self, breakpoint_id):
         """
@@ -2224,6 +2392,9 @@ class PyDB(object):
             for f in frames_list:
                 pydev_log.debug("  Stack: %s, %s, %s", f.f_code.co_filename, f.f_code.co_name, f.f_lineno)
 
+        # The thread is actually suspended now, so, its frames are tracked by itself.
+        self.suspended_frames_manager.release_snapshot(thread_id)
+
         with self.suspended_frames_manager.track_frames(self) as frames_tracker:
             frames_tracker.track(thread_id, frames_list)
             cmd = frames_tracker.create_thread_suspend_command(
@@ -2231,14 +2402,31 @@ class PyDB(object):
             )
             self.writer.add_command(cmd)
 
+            if self.prefetch_on_stop and stop_reason != CMD_THREAD_SUSPEND:
+                # Note: this must be sent before the stopped event (sent when notifying that the
+                # thread is suspended) so that it's available when the client reacts to it.
+                try:
+                    self.writer.add_command(self.cmd_factory.make_prefetch_message(self, thread_id))
+                except:
+                    pydev_log.exception("Error computing data to prefetch.")
+
+            # Paused greenlets and asyncio tasks are only discovered now (and not tracked
+            # while running).
+            paused_custom_frames = pydevd_asyncio_integration.add_paused_tasks_custom_frames(self)
+            if pydevd_gevent_integration is not None:
+                paused_custom_frames.extend(pydevd_gevent_integration.add_paused_greenlets_custom_frames(self, stop_reason))
+
             with CustomFramesContainer.custom_frames_lock:  # @UndefinedVariable
                 from_this_thread = []
 
                 for frame_custom_thread_id, custom_frame in CustomFramesContainer.custom_frames.items():
                     if custom_frame.thread_id == thread.ident:
+                        custom_frames_list = custom_frame.frames_list
+                        if custom_frames_list is None:
+                            custom_frames_list = pydevd_frame_utils.create_frames_list_from_frame(custom_frame.frame)
                         frames_tracker.track(
                             thread_id,
-                            pydevd_frame_utils.create_frames_list_from_frame(custom_frame.frame),
+                            custom_frames_list,
                             frame_custom_thread_id=frame_custom_thread_id,
                         )
                         # print('Frame created as thread: %s' % (frame_custom_thread_id,))
@@ -2255,8 +2443,12 @@ class PyDB(object):
 
                     from_this_thread.append(frame_custom_thread_id)
 
-            with self._threads_suspended_single_notification.notify_thread_suspended(thread_id, thread, stop_reason):
-                keep_suspended = self._do_wait_suspend(thread, frame, event, arg, trace_suspend_type, from_this_thread, frames_tracker)
+            try:
+                with self._threads_suspended_single_notification.notify_thread_suspended(thread_id, thread, stop_reason):
+                    keep_suspended = self._do_wait_suspend(thread, frame, event, arg, trace_suspend_type, from_this_thread, frames_tracker)
+            finally:
+                for frame_custom_thread_id in paused_custom_frames:
+                    remove_custom_frame(frame_custom_thread_id)
 
         frames_list = None
 
@@ -3145,6 +3337,9 @@ def settrace(
     # Internal use (may be used to set the setup info directly for subprocesess).
     __setup_holder__ = kwargs.get("__setup_holder__")
 
+    # Internal use (the debugger of the parent process when reinitializing in a forked process).
+    __inherit_state_from__ = kwargs.get("__inherit_state_from__")
+
     with _set_trace_lock:
         _locked_settrace(
             host,
@@ -3162,6 +3357,7 @@ def settrace(
             access_token,
             client_access_token,
             __setup_holder__=__setup_holder__,
+            __inherit_state_from__=__inherit_state_from__,
             notify_stdin=notify_stdin,
             ppid=ppid,
         )
@@ -3188,6 +3384,7 @@ def _locked_settrace(
     __setup_holder__,
     notify_stdin,
     ppid,
+    __inherit_state_from__=None,
 ):
     if patch_multiprocessing:
         try:
@@ -3210,6 +3407,8 @@ def _locked_settrace(
         SetupHolder.setup = __setup_holder__
     if py_db is None:
         py_db = PyDB()
+        if __inherit_state_from__ is not None:
+            py_db.inherit_state_from(__inherit_state_from__)
         pydevd_vm_type.setup_type()
 
         if SetupHolder.setup is None:
@@ -3443,8 +3642,11 @@ def settrace_forked(setup_tracing=True):
     from _pydevd_bundle.pydevd_constants import GlobalDebuggerHolder
 
     py_db = GlobalDebuggerHolder.global_dbg
+    parent_py_db = None
     if py_db is not None:
         py_db.created_pydb_daemon_threads = {}  # Just making sure we won't touch those (paused) threads.
+        if py_db.inherit_state_on_fork:
+            parent_py_db = py_db
         py_db = None
 
     GlobalDebuggerHolder.global_dbg = None
@@ -3489,7 +3691,12 @@ def settrace_forked(setup_tracing=True):
                 patch_multiprocessing=True,
                 access_token=access_token,
                 client_access_token=client_access_token,
+                # With the parent's configuration there's no need to wait for the client to
+                # configure the debugger (it runs right away with the inherited breakpoints).
+                wait_for_ready_to_run=parent_py_db is None,
+                __inherit_state_from__=parent_py_db,
             )
+    parent_py_db = None
 
 
 @contextmanager
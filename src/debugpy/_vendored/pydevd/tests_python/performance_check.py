@@ -1,283 +1,371 @@
-from tests_python import debugger_unittest
-import sys
-import re
-import os
-
-CHECK_BASELINE, CHECK_REGULAR, CHECK_CYTHON, CHECK_FRAME_EVAL = "baseline", "regular", "cython", "frame_eval"
-
-pytest_plugins = [
-    str("tests_python.debugger_fixtures"),
-]
-
-RUNS = 5
+"""
+Benchmarks the tracing overhead of pydevd.
 
+Each scenario in `resources/_performance_scenarios.py` is run without the debugger and then
+with the debugger using each of the available tracing backends. The slowdown ratio
+(time when debugged / time when not debugged) is reported and written as json so that
+regressions can be tracked over time.
 
-class PerformanceWriterThread(debugger_unittest.AbstractWriterThread):
-    CHECK = None
+Usage:
 
-    debugger_unittest.AbstractWriterThread.get_environ  # overrides
+    python tests_python/performance_check.py --output results.json
+    python tests_python/performance_check.py --backends python cython --scenarios no_breakpoints
 
-    def get_environ(self):
-        env = os.environ.copy()
-        if self.CHECK == CHECK_BASELINE:
-            env["PYTHONPATH"] = r"X:\PyDev.Debugger.baseline"
+The debuggee is run as `pydevd.py --json-dap-http ...` and a minimal DAP client is used to
+drive it (so, nothing besides the standard library is needed).
+"""
 
-        elif self.CHECK == CHECK_CYTHON:
-            env["PYDEVD_USE_CYTHON"] = "YES"
-            env["PYDEVD_USE_FRAME_EVAL"] = "NO"
-
-        elif self.CHECK == CHECK_FRAME_EVAL:
-            env["PYDEVD_USE_CYTHON"] = "YES"
-            env["PYDEVD_USE_FRAME_EVAL"] = "YES"
-
-        elif self.CHECK == CHECK_REGULAR:
-            env["PYDEVD_USE_CYTHON"] = "NO"
-            env["PYDEVD_USE_FRAME_EVAL"] = "NO"
-
-        else:
-            raise AssertionError("Don't know what to check.")
-        return env
-
-    debugger_unittest.AbstractWriterThread.get_pydevd_file  # overrides
-
-    def get_pydevd_file(self):
-        if self.CHECK == CHECK_BASELINE:
-            return os.path.abspath(os.path.join(r"X:\PyDev.Debugger.baseline", "pydevd.py"))
-        dirname = os.path.dirname(__file__)
-        dirname = os.path.dirname(dirname)
-        return os.path.abspath(os.path.join(dirname, "pydevd.py"))
-
-
-class CheckDebuggerPerformance(debugger_unittest.DebuggerRunner):
-    def get_command_line(self):
-        return [sys.executable]
-
-    def _get_time_from_result(self, stdout):
-        match = re.search(r"TotalTime>>((\d|\.)+)<<", stdout)
-        time_taken = match.group(1)
-        return float(time_taken)
-
-    def obtain_results(self, benchmark_name, filename):
-        class PerformanceCheck(PerformanceWriterThread):
-            TEST_FILE = debugger_unittest._get_debugger_test_file(filename)
-            BENCHMARK_NAME = benchmark_name
-
-        writer_thread_class = PerformanceCheck
-
-        runs = RUNS
-        all_times = []
-        for _ in range(runs):
-            stdout_ref = []
-
-            def store_stdout(stdout, stderr):
-                stdout_ref.append(stdout)
-
-            with self.check_case(writer_thread_class) as writer:
-                writer.additional_output_checks = store_stdout
-                yield writer
-
-            assert len(stdout_ref) == 1
-            all_times.append(self._get_time_from_result(stdout_ref[0]))
-            print("partial for: %s: %.3fs" % (writer_thread_class.BENCHMARK_NAME, all_times[-1]))
-        if len(all_times) > 3:
-            all_times.remove(min(all_times))
-            all_times.remove(max(all_times))
-        time_when_debugged = sum(all_times) / float(len(all_times))
-
-        args = self.get_command_line()
-        args.append(writer_thread_class.TEST_FILE)
-        # regular_time = self._get_time_from_result(self.run_process(args, writer_thread=None))
-        # simple_trace_time = self._get_time_from_result(self.run_process(args+['--regular-trace'], writer_thread=None))
-
-        if "SPEEDTIN_AUTHORIZATION_KEY" in os.environ:
-            SPEEDTIN_AUTHORIZATION_KEY = os.environ["SPEEDTIN_AUTHORIZATION_KEY"]
-
-            # sys.path.append(r'X:\speedtin\pyspeedtin')
-            import pyspeedtin  # If the authorization key is there, pyspeedtin must be available
-            import pydevd
-
-            pydevd_cython_project_id, pydevd_pure_python_project_id = 6, 7
-            if writer_thread_class.CHECK == CHECK_BASELINE:
-                project_ids = (pydevd_cython_project_id, pydevd_pure_python_project_id)
-            elif writer_thread_class.CHECK == CHECK_REGULAR:
-                project_ids = (pydevd_pure_python_project_id,)
-            elif writer_thread_class.CHECK == CHECK_CYTHON:
-                project_ids = (pydevd_cython_project_id,)
+import argparse
+import ast
+import json
+import os
+import platform
+import queue
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+_TESTS_PYTHON_DIR = os.path.dirname(os.path.abspath(__file__))
+_PYDEVD_DIR = os.path.dirname(_TESTS_PYTHON_DIR)
+_RESOURCES_DIR = os.path.join(_TESTS_PYTHON_DIR, "resources")
+
+PYDEVD_FILE = os.path.join(_PYDEVD_DIR, "pydevd.py")
+TARGET_FILE = os.path.join(_RESOURCES_DIR, "_performance_scenarios.py")
+UNRELATED_FILE = os.path.join(_RESOURCES_DIR, "_performance_1.py")
+
+TIMEOUT = 120
+
+# Number of steps done in the step over scenario (after that the program is resumed).
+STEPS = 60
+
+BACKEND_TO_ENV = {
+    "python": {"PYDEVD_USE_CYTHON": "NO", "PYDEVD_USE_FRAME_EVAL": "NO", "PYDEVD_USE_SYS_MONITORING": "NO"},
+    "cython": {"PYDEVD_USE_CYTHON": "YES", "PYDEVD_USE_FRAME_EVAL": "NO", "PYDEVD_USE_SYS_MONITORING": "NO"},
+    "frame_eval": {"PYDEVD_USE_CYTHON": "YES", "PYDEVD_USE_FRAME_EVAL": "YES", "PYDEVD_USE_SYS_MONITORING": "NO"},
+    "sys_monitoring": {"PYDEVD_USE_CYTHON": "NO", "PYDEVD_USE_FRAME_EVAL": "NO", "PYDEVD_USE_SYS_MONITORING": "YES"},
+    "sys_monitoring_cython": {"PYDEVD_USE_CYTHON": "YES", "PYDEVD_USE_FRAME_EVAL": "NO", "PYDEVD_USE_SYS_MONITORING": "YES"},
+}
+
+SCENARIOS = (
+    "no_breakpoints",
+    "breakpoint_in_unrelated_file",
+    "breakpoint_in_hot_function",
+    "conditional_breakpoint",
+    "step_over_in_loop",
+    "exception_heavy",
+)
+
+
+def get_default_backends():
+    backends = ["python", "cython"]
+    if sys.version_info[:2] < (3, 12):
+        backends.append("frame_eval")
+    else:
+        backends.extend(["sys_monitoring", "sys_monitoring_cython"])
+    return backends
+
+
+def get_line_with_content(filename, content):
+    with open(filename, "r") as stream:
+        for i, line in enumerate(stream.readlines()):
+            if content in line:
+                return i + 1
+    raise AssertionError("Did not find: %s in %s" % (content, filename))
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+class _DapClient(object):
+    """
+    A minimal client for the DAP (json messages over the http-like protocol).
+    """
+
+    def __init__(self, sock):
+        self._sock = sock
+        self._seq = 0
+        self._messages = queue.Queue()
+        self._pending = []
+        self._reader_thread = threading.Thread(target=self._read_messages, name="Benchmark DAP reader")
+        self._reader_thread.daemon = True
+        self._reader_thread.start()
+
+    def _read_messages(self):
+        stream = self._sock.makefile("rb")
+        try:
+            while True:
+                content_length = None
+                while True:
+                    line = stream.readline()
+                    if not line:
+                        return
+                    line = line.strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(b":")
+                    if name.strip().lower() == b"content-length":
+                        content_length = int(value.strip())
+                if content_length is None:
+                    continue
+                self._messages.put(json.loads(stream.read(content_length).decode("utf-8")))
+        except (OSError, ValueError):
+            pass
+        finally:
+            self._messages.put(None)
+
+    def write_message(self, msg):
+        self._seq += 1
+        msg["seq"] = self._seq
+        body = json.dumps(msg).encode("utf-8")
+        self._sock.sendall(b"Content-Length: %d\r\n\r\n" % (len(body),) + body)
+        return msg
+
+    def wait_for(self, accept, timeout=TIMEOUT):
+        for i, msg in enumerate(self._pending):
+            if accept(msg):
+                del self._pending[i]
+                return msg
+
+        timeout_at = time.time() + timeout
+        while True:
+            try:
+                msg = self._messages.get(timeout=max(timeout_at - time.time(), 0.01))
+            except queue.Empty:
+                raise BenchmarkError("Timed out waiting for message.")
+            if msg is None:
+                self._messages.put(None)
+                raise BenchmarkError("Connection with the debugger closed.")
+            if accept(msg):
+                return msg
+            self._pending.append(msg)
+
+    def request(self, command, arguments=None):
+        msg = {"type": "request", "command": command}
+        if arguments is not None:
+            msg["arguments"] = arguments
+        request_seq = self.write_message(msg)["seq"]
+        response = self.wait_for(lambda msg: msg.get("type") == "response" and msg.get("request_seq") == request_seq)
+        if not response.get("success"):
+            raise BenchmarkError("Request %s failed: %s" % (command, response.get("message")))
+        return response
+
+    def wait_for_stopped(self):
+        return self.wait_for(lambda msg: msg.get("type") == "event" and msg.get("event") == "stopped")
+
+    def close(self):
+        try:
+            self._sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._sock.close()
+
+
+def _get_time_from_output(stdout, stderr):
+    marker_start, marker_end = "TotalTime>>", "<<"
+    i = stdout.find(marker_start)
+    if i == -1:
+        raise BenchmarkError("TotalTime not found in output.\nstdout:\n%s\nstderr:\n%s" % (stdout, stderr[-3000:]))
+    i += len(marker_start)
+    return float(stdout[i : stdout.index(marker_end, i)])
+
+
+def _configure_scenario(client, scenario):
+    breakpoints = []  # list(tuple(filename, line, condition))
+    if scenario == "breakpoint_in_unrelated_file":
+        breakpoints.append((UNRELATED_FILE, get_line_with_content(UNRELATED_FILE, "Unreachable breakpoint here") + 1, None))
+    elif scenario == "breakpoint_in_hot_function":
+        breakpoints.append((TARGET_FILE, get_line_with_content(TARGET_FILE, "Unreachable breakpoint here") + 1, None))
+    elif scenario == "conditional_breakpoint":
+        breakpoints.append((TARGET_FILE, get_line_with_content(TARGET_FILE, "Conditional breakpoint here"), "i < 0"))
+    elif scenario == "step_over_in_loop":
+        breakpoints.append((TARGET_FILE, get_line_with_content(TARGET_FILE, "Step over breakpoint here"), None))
+
+    filename_to_breakpoints = {}
+    for filename, line, condition in breakpoints:
+        bp = {"line": line}
+        if condition:
+            bp["condition"] = condition
+        filename_to_breakpoints.setdefault(filename, []).append(bp)
+
+    for filename, bps in filename_to_breakpoints.items():
+        client.request("setBreakpoints", {"source": {"path": filename}, "breakpoints": bps})
+
+    exception_filters = ["uncaught", "userUnhandled"] if scenario == "exception_heavy" else []
+    client.request("setExceptionBreakpoints", {"filters": exception_filters})
+
+
+def run_without_debugger(scenario):
+    process = subprocess.Popen(
+        [sys.executable, TARGET_FILE, scenario],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+    )
+    stdout, stderr = process.communicate(timeout=TIMEOUT)
+    return _get_time_from_output(stdout, stderr)
+
+
+def _accept(server, process):
+    timeout_at = time.time() + TIMEOUT
+    while time.time() < timeout_at:
+        try:
+            return server.accept()[0]
+        except socket.timeout:
+            if process.poll() is not None:
+                raise BenchmarkError("The debuggee exited (code: %s) before connecting." % (process.returncode,))
+    raise BenchmarkError("The debugger did not connect.")
+
+
+def run_with_debugger(backend, scenario):
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    server.settimeout(0.5)
+    port = server.getsockname()[1]
+
+    env = os.environ.copy()
+    env.update(BACKEND_TO_ENV[backend])
+    env["PYTHONUNBUFFERED"] = "1"
+    cmdline = [
+        sys.executable,
+        PYDEVD_FILE,
+        "--client",
+        "127.0.0.1",
+        "--port",
+        str(port),
+        "--debug-mode",
+        "debugpy-dap",
+        "--json-dap-http",
+        "--file",
+        TARGET_FILE,
+        scenario,
+    ]
+    process = subprocess.Popen(cmdline, env=env, stdout=subprocess.PIPE, stderr=subprocess.PIPE, universal_newlines=True)
+    output = []
+
+    def read_output():
+        output.extend(process.communicate())
+
+    output_thread = threading.Thread(target=read_output, name="Benchmark output reader")
+    output_thread.daemon = True
+    output_thread.start()
+
+    client = None
+    try:
+        try:
+            sock = _accept(server, process)
+        finally:
+            server.close()
+        sock.settimeout(None)
+
+        client = _DapClient(sock)
+        client.request("initialize", {"adapterID": "pydevd_performance_check"})
+        client.request("launch", {"noDebug": False, "justMyCode": True})
+        _configure_scenario(client, scenario)
+        client.request("configurationDone")
+
+        if scenario == "step_over_in_loop":
+            thread_id = client.wait_for_stopped()["body"]["threadId"]
+            for _ in range(STEPS):
+                client.request("next", {"threadId": thread_id})
+                client.wait_for_stopped()
+            client.request("continue", {"threadId": thread_id})
+
+        output_thread.join(TIMEOUT)
+        if output_thread.is_alive():
+            raise BenchmarkError("Timed out waiting for the debuggee to finish.")
+    except:
+        process.kill()
+        raise
+    finally:
+        if client is not None:
+            client.close()
+
+    stdout, stderr = output
+    if process.returncode != 0:
+        raise BenchmarkError("Debuggee exited with code: %s\nstderr:\n%s" % (process.returncode, stderr[-3000:]))
+    return _get_time_from_output(stdout, stderr)
+
+
+def _median(values):
+    values = sorted(values)
+    middle = len(values) // 2
+    if len(values) % 2:
+        return values[middle]
+    return (values[middle - 1] + values[middle]) / 2.0
+
+
+def run_benchmarks(backends, scenarios, runs, on_result=lambda result: None):
+    results = []
+    for scenario in scenarios:
+        baseline_time = _median([run_without_debugger(scenario) for _ in range(runs)])
+        for backend in backends:
+            result = {"backend": backend, "scenario": scenario, "runs": runs, "baseline_time": baseline_time}
+            try:
+                debug_time = _median([run_with_debugger(backend, scenario) for _ in range(runs)])
+            except Exception as e:
+                result["error"] = str(e)
             else:
-                raise AssertionError("Wrong check: %s" % (writer_thread_class.CHECK))
-            for project_id in project_ids:
-                api = pyspeedtin.PySpeedTinApi(authorization_key=SPEEDTIN_AUTHORIZATION_KEY, project_id=project_id)
-
-                benchmark_name = writer_thread_class.BENCHMARK_NAME
-
-                if writer_thread_class.CHECK == CHECK_BASELINE:
-                    version = "0.0.1_baseline"
-                    return  # No longer commit the baseline (it's immutable right now).
+                result["debug_time"] = debug_time
+                if scenario == "step_over_in_loop":
+                    # The time is dominated by the round-trips of the steps, so, the ratio
+                    # against the baseline isn't meaningful (the time per step is reported).
+                    result["ratio"] = None
+                    result["time_per_step"] = debug_time / STEPS
                 else:
-                    version = (pydevd.__version__,)
-
-                commit_id, branch, commit_date = api.git_commit_id_branch_and_date_from_path(pydevd.__file__)
-                api.add_benchmark(benchmark_name)
-                api.add_measurement(
-                    benchmark_name,
-                    value=time_when_debugged,
-                    version=version,
-                    released=False,
-                    branch=branch,
-                    commit_id=commit_id,
-                    commit_date=commit_date,
-                )
-                api.commit()
-
-        self.performance_msg = "%s: %.3fs " % (writer_thread_class.BENCHMARK_NAME, time_when_debugged)
-
-    def method_calls_with_breakpoint(self):
-        for writer in self.obtain_results("method_calls_with_breakpoint", "_performance_1.py"):
-            writer.write_add_breakpoint(17, "method")
-            writer.write_make_initial_run()
-            writer.finished_ok = True
-
-        return self.performance_msg
-
-    def method_calls_without_breakpoint(self):
-        for writer in self.obtain_results("method_calls_without_breakpoint", "_performance_1.py"):
-            writer.write_make_initial_run()
-            writer.finished_ok = True
-
-        return self.performance_msg
-
-    def method_calls_with_step_over(self):
-        for writer in self.obtain_results("method_calls_with_step_over", "_performance_1.py"):
-            writer.write_add_breakpoint(26, None)
-
-            writer.write_make_initial_run()
-            hit = writer.wait_for_breakpoint_hit("111")
-
-            writer.write_step_over(hit.thread_id)
-            hit = writer.wait_for_breakpoint_hit("108")
-
-            writer.write_run_thread(hit.thread_id)
-            writer.finished_ok = True
-
-        return self.performance_msg
-
-    def method_calls_with_exception_breakpoint(self):
-        for writer in self.obtain_results("method_calls_with_exception_breakpoint", "_performance_1.py"):
-            writer.write_add_exception_breakpoint("ValueError")
-            writer.write_make_initial_run()
-            writer.finished_ok = True
-
-        return self.performance_msg
-
-    def global_scope_1_with_breakpoint(self):
-        for writer in self.obtain_results("global_scope_1_with_breakpoint", "_performance_2.py"):
-            writer.write_add_breakpoint(writer.get_line_index_with_content("Breakpoint here"), None)
-            writer.write_make_initial_run()
-            writer.finished_ok = True
-
-        return self.performance_msg
-
-    def global_scope_2_with_breakpoint(self):
-        for writer in self.obtain_results("global_scope_2_with_breakpoint", "_performance_3.py"):
-            writer.write_add_breakpoint(17, None)
-            writer.write_make_initial_run()
-            writer.finished_ok = True
+                    result["ratio"] = debug_time / baseline_time if baseline_time > 0 else None
+            on_result(result)
+            results.append(result)
+    return results
+
+
+def _get_pydevd_version():
+    # Parsed instead of imported (importing pydevd would start the debugger machinery).
+    with open(PYDEVD_FILE, "r") as stream:
+        for line in stream:
+            if line.startswith("__version_info__ = "):
+                return ".".join(str(v) for v in ast.literal_eval(line.split("=", 1)[1].strip()))
+    return None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks the tracing overhead of pydevd.")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKEND_TO_ENV), default=get_default_backends())
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--runs", type=int, default=3, help="Runs for each measurement (the median is used).")
+    parser.add_argument("--output", help="File where the results are written as json.")
+    args = parser.parse_args(argv)
+
+    def on_result(result):
+        if "error" in result:
+            msg = "error: %s" % (result["error"].splitlines()[0],)
+        elif result["ratio"] is None:
+            msg = "%.3fs (baseline: %.3fs)" % (result["debug_time"], result["baseline_time"])
+        else:
+            msg = "%.3fs (baseline: %.3fs, ratio: %.2f)" % (result["debug_time"], result["baseline_time"], result["ratio"])
+        print("%s / %s: %s" % (result["scenario"], result["backend"], msg))
+        sys.stdout.flush()
 
-        return self.performance_msg
+    start_time = time.time()
+    results = run_benchmarks(args.backends, args.scenarios, args.runs, on_result)
+    contents = {
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(start_time)),
+        "total_time": time.time() - start_time,
+        "python_version": platform.python_version(),
+        "python_implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "pydevd_version": _get_pydevd_version(),
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as stream:
+            json.dump(contents, stream, indent=2)
+    print("Total time: %.2fs" % (contents["total_time"],))
+    return 0 if all("error" not in result for result in results) else 1
 
 
 if __name__ == "__main__":
-    # Python 3.10
-    # Checking: regular
-    # method_calls_with_breakpoint: 0.160s
-    # method_calls_without_breakpoint: 0.162s
-    # method_calls_with_step_over: 0.160s
-    # method_calls_with_exception_breakpoint: 0.159s
-    # global_scope_1_with_breakpoint: 0.382s
-    # global_scope_2_with_breakpoint: 0.141s
-    # Partial profile time: 43.90s
-    # Checking: cython
-    # method_calls_with_breakpoint: 0.094s
-    # method_calls_without_breakpoint: 0.094s
-    # method_calls_with_step_over: 0.094s
-    # method_calls_with_exception_breakpoint: 0.093s
-    # global_scope_1_with_breakpoint: 0.252s
-    # global_scope_2_with_breakpoint: 0.143s
-    # Partial profile time: 41.39s
-    # Checking: frame_eval
-    # method_calls_with_breakpoint: 0.095s
-    # method_calls_without_breakpoint: 0.094s
-    # method_calls_with_step_over: 0.096s
-    # method_calls_with_exception_breakpoint: 0.096s
-    # global_scope_1_with_breakpoint: 0.253s
-    # global_scope_2_with_breakpoint: 0.140s
-    # Partial profile time: 41.56s
-
-    # Python 3.12 (sys.monitoring)
-    # Checking: regular
-    # method_calls_with_breakpoint: 0.012s
-    # method_calls_without_breakpoint: 0.014s
-    # method_calls_with_step_over: 0.014s
-    # method_calls_with_exception_breakpoint: 0.013s
-    # global_scope_1_with_breakpoint: 0.058s
-    # global_scope_2_with_breakpoint: 0.078s
-    # Partial profile time: 42.59s
-    # Checking: cython
-    # method_calls_with_breakpoint: 0.012s
-    # method_calls_without_breakpoint: 0.014s
-    # method_calls_with_step_over: 0.014s
-    # method_calls_with_exception_breakpoint: 0.013s
-    # global_scope_1_with_breakpoint: 0.059s
-    # global_scope_2_with_breakpoint: 0.078s
-    # Partial profile time: 42.37s
-
-    # Python 3.12 (tracing)
-    # Checking: regular
-    # method_calls_with_breakpoint: 0.205s
-    # method_calls_without_breakpoint: 0.201s
-    # method_calls_with_step_over: 0.203s
-    # method_calls_with_exception_breakpoint: 0.203s
-    # global_scope_1_with_breakpoint: 0.499s
-    # global_scope_2_with_breakpoint: 0.137s
-    # Partial profile time: 44.55s
-    # Checking: cython
-    # method_calls_with_breakpoint: 0.112s
-    # method_calls_without_breakpoint: 0.113s
-    # method_calls_with_step_over: 0.113s
-    # method_calls_with_exception_breakpoint: 0.115s
-    # global_scope_1_with_breakpoint: 0.304s
-    # global_scope_2_with_breakpoint: 0.139s
-    # Partial profile time: 43.14s
-
-    debugger_unittest.SHOW_WRITES_AND_READS = False
-    debugger_unittest.SHOW_OTHER_DEBUG_INFO = False
-    debugger_unittest.SHOW_STDOUT = False
-
-    import time
-
-    start_time = time.time()
-
-    tmpdir = None
-
-    msgs = []
-    for check in (
-        # CHECK_BASELINE, -- Checks against the version checked out at X:\PyDev.Debugger.baseline.
-        CHECK_REGULAR,
-        CHECK_CYTHON,
-        # CHECK_FRAME_EVAL,
-    ):
-        partial_time = time.time()
-        PerformanceWriterThread.CHECK = check
-        msgs.append("Checking: %s" % (check,))
-        check_debugger_performance = CheckDebuggerPerformance(tmpdir)
-        msgs.append(check_debugger_performance.method_calls_with_breakpoint())
-        msgs.append(check_debugger_performance.method_calls_without_breakpoint())
-        msgs.append(check_debugger_performance.method_calls_with_step_over())
-        msgs.append(check_debugger_performance.method_calls_with_exception_breakpoint())
-        msgs.append(check_debugger_performance.global_scope_1_with_breakpoint())
-        msgs.append(check_debugger_performance.global_scope_2_with_breakpoint())
-        msgs.append("Partial profile time: %.2fs" % (time.time() - partial_time,))
-
-    for msg in msgs:
-        print(msg)
-    print("TotalTime for profile: %.2fs" % (time.time() - start_time,))
+    sys.exit(main())
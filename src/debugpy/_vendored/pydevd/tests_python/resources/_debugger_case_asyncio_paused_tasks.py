@@ -0,0 +1,23 @@
+import asyncio
+
+
+async def inner(event):
+    await event.wait()
+
+
+async def outer(event):
+    await inner(event)
+
+
+async def main():
+    event = asyncio.Event()
+    tasks = [asyncio.create_task(outer(event), name="waiter-%s" % (i,)) for i in range(3)]
+    await asyncio.sleep(0)  # Let the tasks start and wait for the event.
+    print("break here")
+    event.set()
+    await asyncio.gather(*tasks)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
+    print("TEST SUCEEDED!")
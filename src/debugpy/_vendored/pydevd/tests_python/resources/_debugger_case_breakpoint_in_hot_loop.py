@@ -0,0 +1,12 @@
+def hot_loop():
+    total = 0
+    for i in range(1000):
+        total += i
+        if i == 999:
+            total -= 1  # Break here
+    return total
+
+
+if __name__ == "__main__":
+    hot_loop()
+    print("TEST SUCEEDED!")
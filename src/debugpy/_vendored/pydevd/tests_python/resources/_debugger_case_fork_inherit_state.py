@@ -0,0 +1,15 @@
+import os
+
+
+def breaknow():
+    print('break here')
+
+
+if __name__ == '__main__':
+    pid = os.fork()
+    if pid == 0:
+        breaknow()
+    else:
+        os.waitpid(pid, 0)
+        breaknow()
+        print('TEST SUCEEDED!')
@@ -0,0 +1,18 @@
+class Leaked(object):
+    pass
+
+
+cache = {"key": Leaked()}
+holder = [cache["key"]]
+
+
+def main():
+    leaked = cache["key"]
+    print("break here")
+    grow = [Leaked() for _i in range(1000)]
+    print("break 2 here")
+
+
+if __name__ == "__main__":
+    main()
+    print("TEST SUCEEDED!")
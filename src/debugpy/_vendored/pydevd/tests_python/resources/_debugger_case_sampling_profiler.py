@@ -0,0 +1,32 @@
+import sys
+import time
+
+import pydevd
+from _pydevd_bundle.pydevd_constants import NO_FTRACE
+
+traced_calls = []
+
+
+def busy_work():
+    if sys.gettrace() not in (None, NO_FTRACE):
+        traced_calls.append(1)
+    total = 0
+    for i in range(10000):
+        total += i
+    return total
+
+
+def main():
+    py_db = pydevd.get_global_debugger()
+    print("start profiling")  # break here
+
+    # Busy until the profiler is stopped.
+    timeout = time.time() + 30
+    while py_db.sampling_profiler is not None and time.time() < timeout:
+        busy_work()
+
+    print("profiler stopped: %s, traced calls: %s" % (py_db.sampling_profiler is None, len(traced_calls)))
+    print("TEST SUCEEDED!")  # break 2 here
+
+
+main()
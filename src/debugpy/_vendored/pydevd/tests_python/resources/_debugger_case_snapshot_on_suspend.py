@@ -0,0 +1,19 @@
+import threading
+
+event = threading.Event()
+
+
+def blocked_in_wait():
+    event.wait()
+
+
+threads = [threading.Thread(target=blocked_in_wait, name="Blocked thread %s" % (i,)) for i in range(5)]
+for t in threads:
+    t.start()
+
+event.set()  # Break here
+
+for t in threads:
+    t.join()
+
+print("TEST SUCEEDED!")
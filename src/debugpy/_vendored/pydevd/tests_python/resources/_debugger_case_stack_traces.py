@@ -0,0 +1,18 @@
+import threading
+
+event = threading.Event()
+
+
+def wait_for_event():
+    event.wait()
+
+
+threads = [threading.Thread(target=wait_for_event, name="thread%s" % (i,)) for i in range(3)]
+for t in threads:
+    t.start()
+
+event.set()  # break here
+for t in threads:
+    t.join()
+
+print("TEST SUCEEDED!")
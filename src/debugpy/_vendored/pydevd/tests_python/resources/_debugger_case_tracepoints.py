@@ -0,0 +1,8 @@
+def trace_me(i):
+    return i  # tracepoint here
+
+
+for i in range(1000):
+    trace_me(i)
+
+print("TEST SUCEEDED!")  # break here
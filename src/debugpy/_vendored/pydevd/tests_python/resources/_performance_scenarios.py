@@ -0,0 +1,57 @@
+import sys
+import time
+
+
+def method2():
+    i = 1
+
+
+def hot_function(iterations):
+    for i in range(iterations):
+        method2()
+
+        if i < 0:
+            # Unreachable breakpoint here
+            pass
+
+
+def conditional_function(iterations):
+    for i in range(iterations):
+        method2()  # Conditional breakpoint here
+
+
+def step_over_function(iterations):
+    a = 0  # Step over breakpoint here
+    for i in range(iterations):
+        a += 1
+    return a
+
+
+def raise_and_catch():
+    try:
+        raise ValueError("expected")
+    except ValueError:
+        pass
+
+
+def exception_function(iterations):
+    for i in range(iterations):
+        raise_and_catch()
+
+
+SCENARIOS = {
+    "no_breakpoints": (hot_function, 200000),
+    "breakpoint_in_unrelated_file": (hot_function, 200000),
+    "breakpoint_in_hot_function": (hot_function, 200000),
+    "conditional_breakpoint": (conditional_function, 20000),
+    "step_over_in_loop": (step_over_function, 50),
+    "exception_heavy": (exception_function, 20000),
+}
+
+
+if __name__ == "__main__":
+    func, iterations = SCENARIOS[sys.argv[1]]
+    start_time = time.time()
+    func(iterations)
+    print("TotalTime>>%s<<" % (time.time() - start_time,))
+    print("TEST SUCEEDED")
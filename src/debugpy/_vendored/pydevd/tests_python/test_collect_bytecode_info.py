@@ -198,6 +198,112 @@ def test_collect_try_except_info(data_regression, pyfile):
     data_regression.check(method_to_info_from_source)
 
 
+def test_try_except_infos_index_cache(tmpdir):
+    from _pydevd_bundle.pydevd_collect_bytecode_info import get_try_except_infos_index
+    contents = """
+def method1():
+    try:
+        call()
+    except:
+        pass
+
+
+def method2():
+    try:
+        call()
+    except:
+        raise
+"""
+    filename = str(tmpdir.join('module_with_try_except.py'))
+    with open(filename, 'w') as stream:
+        stream.write(contents)
+
+    cache = {}
+    index = get_try_except_infos_index(filename, cache)
+    assert [info.try_line for info in index.get_in_line_range(2, 6)] == [3]
+    assert [info.try_line for info in index.get_in_line_range(9, 13)] == [10]
+    assert [info.try_line for info in index.get_in_line_range(1, 13)] == [3, 10]
+    assert index.get_in_line_range(6, 9) == []
+
+    # The file is only parsed again if it changed.
+    assert get_try_except_infos_index(filename, cache) is index
+
+    with open(filename, 'w') as stream:
+        stream.write(contents.replace('def method2', '\ndef method2'))
+    new_index = get_try_except_infos_index(filename, cache)
+    assert new_index is not index
+    assert [info.try_line for info in new_index.get_in_line_range(9, 14)] == [11]
+
+    # Files which can't be parsed are remembered too.
+    with open(filename, 'w') as stream:
+        stream.write('def method(:')
+    assert get_try_except_infos_index(filename, cache) is None
+    assert cache[filename][1] is None
+
+
+def test_try_except_infos_warm_cache(tmpdir, monkeypatch):
+    from _pydevd_bundle import pydevd_warm_cache
+    from _pydevd_bundle.pydevd_collect_bytecode_info import get_try_except_infos_index
+    monkeypatch.setattr(pydevd_warm_cache, '_cache_dir', str(tmpdir.mkdir('warm_cache')))
+
+    contents = """
+def method():
+    try:
+        call()
+    except:
+        if a:
+            raise
+        raise
+"""
+    filename = str(tmpdir.join('module_with_try_except.py'))
+    with open(filename, 'w') as stream:
+        stream.write(contents)
+
+    index = get_try_except_infos_index(filename, {})
+    assert pydevd_warm_cache.load(filename, 'tryexcept') is not None
+
+    # A new process (with an empty cache) loads the infos from the warm cache.
+    import _pydevd_bundle.pydevd_collect_bytecode_info as collect_bytecode_info
+
+    def collect_try_except_info_from_source(filename):
+        raise AssertionError('Should not parse the file.')
+
+    with monkeypatch.context() as m:
+        m.setattr(collect_bytecode_info, 'collect_try_except_info_from_source', collect_try_except_info_from_source)
+        warm_index = get_try_except_infos_index(filename, {})
+    assert str(warm_index.try_except_infos) == str(index.try_except_infos) == '[{try:3 except 5 end block 8 raises: 7, 8}]'
+
+    # Changing the file invalidates the entry.
+    with open(filename, 'w') as stream:
+        stream.write(contents.replace('def method', '\ndef method'))
+    assert pydevd_warm_cache.load(filename, 'tryexcept') is None
+    assert str(get_try_except_infos_index(filename, {}).try_except_infos) == '[{try:4 except 6 end block 9 raises: 8, 9}]'
+
+    # Corrupt entries are ignored.
+    for entry in tmpdir.join('warm_cache').listdir():
+        entry.write_binary(b'PDWC\x00')
+    assert pydevd_warm_cache.load(filename, 'tryexcept') is None
+
+
+def test_code_lines_warm_cache(tmpdir, monkeypatch):
+    from _pydevd_bundle import pydevd_api, pydevd_warm_cache
+
+    filename = str(tmpdir.join('module_with_lines.py'))
+    with open(filename, 'w') as stream:
+        stream.write('a = 1\n\ndef method():\n    return a\n')
+
+    # Without the warm cache the file isn't even stat'ed.
+    monkeypatch.setattr(pydevd_warm_cache, '_cache_dir', '')
+    with monkeypatch.context() as m:
+        m.setattr(pydevd_api.os, 'stat', None)
+        expected = sorted(set(pydevd_api._get_code_lines(filename)))
+    assert {1, 3, 4}.issubset(expected)
+
+    monkeypatch.setattr(pydevd_warm_cache, '_cache_dir', str(tmpdir.mkdir('warm_cache')))
+    assert list(pydevd_api._get_code_lines(filename)) == expected
+    assert list(pydevd_warm_cache.load(filename, 'lines')) == expected
+
+
 def test_collect_try_except_info2(exc_verifier):
 
     def method():
@@ -494,6 +494,54 @@ def test_source_mapping():
     assert source_mapping.map_to_client(filename, 12) == (filename, 12, False)
 
 
+def test_source_mapping_cache_invalidated_per_file():
+    from _pydevd_bundle.pydevd_source_mapping import SourceMapping, SourceMappingEntry
+
+    source_mapping = SourceMapping()
+    filename1 = "c:\\temp\\bar1.py" if IS_WINDOWS else "/temp/bar1.py"
+    filename2 = "c:\\temp\\bar2.py" if IS_WINDOWS else "/temp/bar2.py"
+
+    def set_mapping(filename, mapping):
+        for map_entry in mapping:
+            map_entry.source_filename = filename
+        assert source_mapping.set_source_mapping(filename, mapping) == ""
+
+    set_mapping(filename1, [SourceMappingEntry(line=1, end_line=2, runtime_line=1, runtime_source="<cell1>")])
+    set_mapping(
+        filename2,
+        [
+            SourceMappingEntry(line=1, end_line=2, runtime_line=1, runtime_source="<cell2>"),
+            SourceMappingEntry(line=20, end_line=21, runtime_line=10, runtime_source="<cell2>"),
+        ],
+    )
+
+    assert source_mapping.has_mapping_entry("<cell1>")
+    assert source_mapping.has_mapping_entry("<cell2>")
+    assert not source_mapping.has_mapping_entry("<cell3>")
+
+    assert source_mapping.map_to_client("<cell1>", 1) == (filename1, 1, True)
+    assert source_mapping.map_to_client("<cell2>", 2) == (filename2, 2, True)
+    assert source_mapping.map_to_client("<cell2>", 11) == (filename2, 21, True)
+    assert source_mapping.map_to_client("<cell3>", 1) == ("<cell3>", 1, False)
+
+    # Changing the mapping of one file only invalidates the cache of the runtime sources involved.
+    set_mapping(filename1, [SourceMappingEntry(line=5, end_line=6, runtime_line=1, runtime_source="<cell3>")])
+    assert "<cell2>" in source_mapping._cache
+    assert "<cell1>" not in source_mapping._cache
+    assert "<cell3>" not in source_mapping._cache
+
+    assert not source_mapping.has_mapping_entry("<cell1>")
+    assert source_mapping.has_mapping_entry("<cell3>")
+    assert source_mapping.map_to_client("<cell1>", 1) == ("<cell1>", 1, False)
+    assert source_mapping.map_to_client("<cell3>", 1) == (filename1, 5, True)
+    assert source_mapping.map_to_client("<cell2>", 11) == (filename2, 21, True)
+
+    # Removing the mapping for a file.
+    set_mapping(filename2, [])
+    assert not source_mapping.has_mapping_entry("<cell2>")
+    assert source_mapping.map_to_client("<cell2>", 11) == ("<cell2>", 11, False)
+
+
 @pytest.mark.skipif(IS_WINDOWS, reason="Linux/Mac-only test")
 def test_mapping_conflict_to_client():
     import pydevd_file_utils
@@ -58,6 +58,7 @@ from tests_python.debug_constants import TEST_CHERRYPY, TEST_DJANGO, TEST_FLASK,
 from tests_python.debugger_unittest import IS_JYTHON, IS_APPVEYOR, overrides, get_free_port, wait_for_condition
 from _pydevd_bundle.pydevd_utils import DAPGrouper
 import pydevd_file_utils
+import pydevd_tracing
 from _pydevd_bundle import pydevd_constants
 
 pytest_plugins = [
@@ -2033,6 +2034,42 @@ def test_modules(case_setup_dap):
         writer.finished_ok = True
 
 
+def test_modules_paged(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_import_main.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch(justMyCode=False)
+        imported_file = debugger_unittest._get_debugger_test_file("_debugger_case_import_imported.py")
+        json_facade.write_set_breakpoints(1, filename=imported_file)
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+        json_facade.get_stack_as_json_hit(json_hit.thread_id)
+
+        def get_modules(**kwargs):
+            response = json_facade.wait_for_response(json_facade.write_request(pydevd_schema.ModulesRequest(arguments=pydevd_schema.ModulesArguments(**kwargs))))
+            return response.body.modules, response.body.totalModules
+
+        all_modules, total_modules = get_modules()
+        assert total_modules == len(all_modules) >= 2
+        paths = [module["path"] for module in all_modules]
+        assert any(path.endswith("_debugger_case_import_main.py") for path in paths)
+        assert any(path.endswith("_debugger_case_import_imported.py") for path in paths)
+
+        paged_modules = []
+        for start_module in range(total_modules):
+            modules, total = get_modules(startModule=start_module, moduleCount=1)
+            assert total == total_modules
+            assert len(modules) == 1
+            paged_modules.extend(modules)
+        assert paged_modules == all_modules
+
+        assert get_modules(startModule=total_modules)[0] == []
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
 def test_dict_ordered(case_setup_dap):
     with case_setup_dap.test_file("_debugger_case_odict.py") as writer:
         json_facade = JsonFacade(writer)
@@ -2760,6 +2797,382 @@ def test_evaluate_unicode(case_setup_dap):
         writer.finished_ok = True
 
 
+def test_evaluate_many(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_local_variables.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_set_breakpoints(writer.get_line_index_with_content("Break 2 here"))
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+        json_hit = json_facade.get_stack_as_json_hit(json_hit.thread_id)
+
+        for _i in range(2):  # The second time the compiled expressions are cached.
+            response = json_facade.wait_for_response(
+                json_facade.write_request(
+                    pydevd_schema.PydevdEvaluateManyRequest(
+                        pydevd_schema.PydevdEvaluateManyArguments(
+                            expressions=["variable_for_test_1", "variable_for_test_3", "undefined_var", "a = 1"],
+                            frameId=json_hit.frame_id,
+                        )
+                    )
+                )
+            )
+            results = response.body.results
+            assert len(results) == 4
+
+            assert results[0]["result"] == "10"
+            assert results[0]["type"] == "int"
+            assert results[0]["success"]
+
+            assert results[1]["type"] == "dict"
+            assert results[1]["variablesReference"] > 0
+            assert results[1]["success"]
+
+            assert results[2]["result"] == "NameError: name 'undefined_var' is not defined"
+            assert not results[2]["success"]
+
+            # Statements aren't executed.
+            assert results[3]["result"].startswith("SyntaxError")
+            assert not results[3]["success"]
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+def test_prefetch_on_stop(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_local_variables.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch(prefetchOnStop=True)
+        json_facade.write_set_breakpoints(writer.get_line_index_with_content("Break 2 here"))
+        json_facade.write_make_initial_run()
+
+        # The prefetch event must arrive before the stopped event.
+        prefetch_event = json_facade.wait_for_json_message(pydevd_schema.PydevdPrefetchEvent)
+        stopped_event = json_facade.wait_for_json_message(StoppedEvent)
+        body = prefetch_event.body
+        assert body.threadId == stopped_event.body.threadId
+
+        json_hit = json_facade.get_stack_as_json_hit(body.threadId)
+        stack_frames = json_hit.stack_trace_response.body.stackFrames
+        assert body.stackFrames == stack_frames
+        assert body.totalFrames == json_hit.stack_trace_response.body.totalFrames
+
+        scopes_response = json_facade.wait_for_response(
+            json_facade.write_request(pydevd_schema.ScopesRequest(pydevd_schema.ScopesArguments(json_hit.frame_id)))
+        )
+        assert body.scopes == scopes_response.body.scopes
+
+        variables_response = json_facade.get_variables_response(scopes_response.body.scopes[0]["variablesReference"])
+        assert body.variables == variables_response.body.variables
+        assert [v["name"] for v in body.variables] == [
+            "variable_for_test_1",
+            "variable_for_test_2",
+            "variable_for_test_3",
+            "\u16a0",
+        ]
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+def test_stack_traces(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_stack_traces.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        # Note: the threads are blocked waiting for the event, so, their stacks are only
+        # available with a snapshot.
+        json_facade.write_launch(justMyCode=True, snapshotOnSuspend=True)
+        json_facade.write_set_breakpoints(writer.get_line_index_with_content("break here"))
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+
+        def get_stack_traces(**kwargs):
+            response = json_facade.wait_for_response(
+                json_facade.write_request(pydevd_schema.PydevdStackTracesRequest(pydevd_schema.PydevdStackTracesArguments(**kwargs)))
+            )
+            return dict((stack_trace["threadId"], stack_trace) for stack_trace in response.body.stackTraces)
+
+        thread_ids = [t["id"] for t in json_facade.write_list_threads().body.threads]
+        assert len(thread_ids) == 4
+
+        # All the threads are suspended (so, all the stacks are provided at once).
+        thread_id_to_stack_trace = get_stack_traces()
+        assert sorted(thread_id_to_stack_trace) == sorted(thread_ids)
+        for thread_id in thread_ids:
+            stack_trace_response = json_facade.get_stack_as_json_hit(thread_id).stack_trace_response
+            stack_trace = thread_id_to_stack_trace[thread_id]
+            assert stack_trace["stackFrames"] == stack_trace_response.body.stackFrames
+            assert stack_trace["totalFrames"] == stack_trace_response.body.totalFrames
+
+        assert [frame["name"] for frame in thread_id_to_stack_trace[json_hit.thread_id]["stackFrames"]] == ["<module>"]
+
+        # Only the requested threads/levels are provided.
+        other_thread_id = next(thread_id for thread_id in thread_ids if thread_id != json_hit.thread_id)
+        thread_id_to_stack_trace = get_stack_traces(threadIds=[other_thread_id], levels=1)
+        assert list(thread_id_to_stack_trace) == [other_thread_id]
+        stack_frames = thread_id_to_stack_trace[other_thread_id]["stackFrames"]
+        assert [frame["name"] for frame in stack_frames] == ["wait_for_event"]
+
+        # The frame ids can be used in other requests.
+        json_facade.get_local_var(json_hit.frame_id, "threads")
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+def test_sampling_profiler(case_setup_dap):
+
+    def additional_output_checks(writer, stdout, stderr):
+        assert "profiler stopped: True" in stdout
+        # Tracing is turned off while profiling (with settrace, the helper lib is needed to
+        # change the tracing of the other threads).
+        if PYDEVD_USE_SYS_MONITORING or pydevd_tracing.get_python_helper_lib_filename() is not None:
+            assert "traced calls: 0" in stdout
+
+    with case_setup_dap.test_file("_debugger_case_sampling_profiler.py", additional_output_checks=additional_output_checks) as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch(justMyCode=True)
+        json_facade.write_set_breakpoints(
+            [writer.get_line_index_with_content("break here"), writer.get_line_index_with_content("break 2 here")]
+        )
+        json_facade.write_make_initial_run()
+        json_facade.wait_for_thread_stopped(line=writer.get_line_index_with_content("break here"))
+
+        def write_profile(**kwargs):
+            return json_facade.wait_for_response(
+                json_facade.write_request(pydevd_schema.PydevdProfileRequest(pydevd_schema.PydevdProfileArguments(**kwargs)))
+            )
+
+        # Note: the flush interval must be big enough so that no event is sent before we start waiting for them.
+        assert write_profile(action="start", samplesPerSecond=200, flushInterval=0.5).body.samples == 0
+        assert not write_profile(action="start").success  # Already running.
+        json_facade.write_continue()
+
+        frames = []
+        events = []
+
+        def accept_event(event):
+            frames.extend(event.body.frames)
+            events.append(event)
+            return any(frame["name"] == "busy_work" for frame in frames)
+
+        json_facade.wait_for_json_message(pydevd_schema.PydevdProfileEvent, accept_event)
+
+        response_request = json_facade.write_request(
+            pydevd_schema.PydevdProfileRequest(pydevd_schema.PydevdProfileArguments(action="stop"))
+        )
+        json_facade.wait_for_json_message(pydevd_schema.PydevdProfileEvent, lambda event: accept_event(event) and event.body.done)
+        samples = json_facade.wait_for_response(response_request).body.samples
+        assert samples == sum(event.body.samples for event in events)
+        assert [event.body.done for event in events] == [False] * (len(events) - 1) + [True]
+
+        # With justMyCode, only the frames of the test file are considered.
+        assert set(frame["path"] for frame in frames) == {writer.TEST_FILE}
+
+        # Check the stacks in the tree (the parent of a node always comes before it).
+        stacks = []
+        for event in events:
+            nodes = event.body.nodes
+            assert len(nodes) % 3 == 0
+            node_stacks = []
+            for parent_index, frame_index, node_samples in zip(nodes[::3], nodes[1::3], nodes[2::3]):
+                stack = [] if parent_index == -1 else list(node_stacks[parent_index])
+                stack.append(frames[frame_index]["name"])
+                node_stacks.append(stack)
+                if node_samples:
+                    stacks.append(stack)
+        assert ["<module>", "main", "busy_work"] in stacks
+
+        # Tracing is restored when the profiler is stopped.
+        json_facade.wait_for_thread_stopped(line=writer.get_line_index_with_content("break 2 here"))
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+def test_sampling_profiler_stopped_on_disconnect(case_setup_dap):
+
+    def additional_output_checks(writer, stdout, stderr):
+        assert "profiler stopped: True" in stdout
+
+    with case_setup_dap.test_file("_debugger_case_sampling_profiler.py", additional_output_checks=additional_output_checks) as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch(justMyCode=True)
+        json_facade.write_set_breakpoints(writer.get_line_index_with_content("break here"))
+        json_facade.write_make_initial_run()
+        json_facade.wait_for_thread_stopped(line=writer.get_line_index_with_content("break here"))
+
+        response = json_facade.wait_for_response(
+            json_facade.write_request(pydevd_schema.PydevdProfileRequest(pydevd_schema.PydevdProfileArguments(action="start")))
+        )
+        assert response.success
+
+        # Removes breakpoints, stops the profiler and proceeds running.
+        json_facade.write_disconnect()
+        writer.finished_ok = True
+
+
+def test_tracepoints_ring_buffer(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_tracepoints.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        # Note: big flush interval so that the hits are only sent when requested.
+        json_facade.write_launch(tracepoints={"bufferSize": 100, "sampleEvery": 2, "flushInterval": 60})
+        tracepoint_line = writer.get_line_index_with_content("tracepoint here")
+        response = json_facade.write_set_breakpoints(
+            [tracepoint_line, writer.get_line_index_with_content("break here")],
+            line_to_info={tracepoint_line: {"log_message": "i={i}"}},
+        )
+        breakpoint_id = next(b["id"] for b in response.body.breakpoints if b["line"] == tracepoint_line)
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped(line=writer.get_line_index_with_content("break here"))
+
+        request = json_facade.write_request(pydevd_schema.PydevdTracepointsRequest(pydevd_schema.PydevdTracepointsArguments()))
+        event = json_facade.wait_for_json_message(pydevd_schema.PydevdTracepointsEvent)
+        assert json_facade.wait_for_response(request).body.hits == 100
+
+        # 1 in every 2 hits is captured and only the last 100 captured fit in the buffer.
+        assert event.body.tracepoints == [{"breakpointId": breakpoint_id, "hits": 1000, "captured": 500, "dropped": 400}]
+        hits = event.body.hits
+        assert [hit["message"] for hit in hits] == ["i=%s" % (i,) for i in range(800, 1000, 2)]
+        assert set(hit["breakpointId"] for hit in hits) == {breakpoint_id}
+        assert set(hit["threadId"] for hit in hits) == {json_hit.thread_id}
+        timestamps = [hit["timestamp"] for hit in hits]
+        assert timestamps == sorted(timestamps)
+
+        # No output is sent for the tracepoint hits.
+        assert not json_facade.mark_messages(OutputEvent, lambda output_event: output_event.body.output.startswith("i="))
+
+        # Nothing is captured in the meanwhile.
+        request = json_facade.write_request(pydevd_schema.PydevdTracepointsRequest(pydevd_schema.PydevdTracepointsArguments()))
+        assert json_facade.wait_for_json_message(pydevd_schema.PydevdTracepointsEvent).body.hits == []
+        assert json_facade.wait_for_response(request).body.hits == 0
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+def test_tracepoints_rate_limit(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_tracepoints.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch(tracepoints={"maxHitsPerSecond": 5, "flushInterval": 0.1})
+        tracepoint_line = writer.get_line_index_with_content("tracepoint here")
+        json_facade.write_set_breakpoints(
+            [tracepoint_line, writer.get_line_index_with_content("break here")],
+            line_to_info={tracepoint_line: {"log_message": "i={i}"}},
+        )
+        json_facade.write_make_initial_run()
+
+        json_facade.wait_for_thread_stopped(line=writer.get_line_index_with_content("break here"))
+
+        # Sends any hit still not sent by the periodic flush.
+        request = json_facade.write_request(pydevd_schema.PydevdTracepointsRequest(pydevd_schema.PydevdTracepointsArguments()))
+        json_facade.wait_for_response(request)
+
+        events = json_facade.mark_messages(pydevd_schema.PydevdTracepointsEvent)
+        messages = [hit["message"] for event in events for hit in event.body.hits]
+        stats = events[-1].body.tracepoints
+        assert len(stats) == 1
+        assert stats[0]["hits"] == 1000
+        assert stats[0]["captured"] == len(messages)
+        assert stats[0]["captured"] + stats[0]["dropped"] == 1000
+        assert 5 <= len(messages) < 1000
+        assert messages[:5] == ["i=0", "i=1", "i=2", "i=3", "i=4"]
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
+def test_heap_snapshot(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_heap_snapshot.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_set_breakpoints(
+            [writer.get_line_index_with_content("break here"), writer.get_line_index_with_content("break 2 here")]
+        )
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped()
+        json_hit = json_facade.get_stack_as_json_hit(json_hit.thread_id)
+
+        def heap_snapshot(query, **kwargs):
+            return json_facade.wait_for_response(
+                json_facade.write_request(
+                    pydevd_schema.PydevdHeapSnapshotRequest(
+                        pydevd_schema.PydevdHeapSnapshotArguments(query=query, frameId=json_hit.frame_id, **kwargs)
+                    )
+                )
+            )
+
+        response = heap_snapshot("referrers", expression="leaked")
+        assert response.success
+        name_to_var = dict((var["name"], var) for var in response.body.variables)
+        assert set(name_to_var) == {"['key']", "[0]", "leaked"}
+        assert name_to_var["['key']"]["type"] == "dict"
+        assert name_to_var["[0]"]["type"] == "list"
+        assert name_to_var["leaked"]["type"] == "frame"
+        total_objects = response.body.totalObjects
+        assert total_objects > 0
+
+        # The results can be queried further (and expanded in the variables view).
+        response = heap_snapshot("referrers", variablesReference=name_to_var["['key']"]["variablesReference"])
+        assert "['cache']" in [var["name"] for var in response.body.variables]
+        assert response.body.totalObjects == total_objects  # i.e.: the same snapshot was used.
+
+        children = json_facade.get_variables_response(name_to_var["[0]"]["variablesReference"]).body.variables
+        assert [child["type"] for child in children if child["name"] == "0"] == ["Leaked"]
+
+        response = heap_snapshot("referents", expression="cache")
+        assert [var["type"] for var in response.body.variables if var["name"] == "['key']"] == ["Leaked"]
+
+        response = heap_snapshot("pathToRoot", expression="leaked")
+        path = response.body.variables
+        assert path[0]["type"] in ("module", "frame")
+        assert path[-1]["type"] == "Leaked"
+
+        response = heap_snapshot("typeStats", maxResults=100000)
+        type_to_stats = dict((stats["type"], stats) for stats in response.body.typeStats)
+        assert type_to_stats["__main__.Leaked"]["count"] == 1
+
+        response = heap_snapshot("release")
+        assert response.success
+
+        response = heap_snapshot("referrers", expression="undefined_var")
+        assert not response.success
+        assert "NameError" in response.message
+
+        response = heap_snapshot("diffTypeStats")
+        assert not response.success
+
+        response = heap_snapshot("recordTypeStats")
+        baseline_total_objects = response.body.totalObjects
+        assert baseline_total_objects > 0
+
+        # The recorded type stats are diffed in a later stop.
+        json_facade.write_continue()
+        json_hit = json_facade.wait_for_thread_stopped(line=writer.get_line_index_with_content("break 2 here"))
+        json_hit = json_facade.get_stack_as_json_hit(json_hit.thread_id)
+
+        response = heap_snapshot("diffTypeStats", maxSamples=2)
+        type_stats = response.body.typeStats[0]
+        assert type_stats["type"] == "__main__.Leaked"
+        assert type_stats["count"] == 1001
+        assert type_stats["countDelta"] == 1000
+        assert type_stats["sizeDelta"] > 0
+        assert [sample["type"] for sample in type_stats["samples"]] == ["Leaked", "Leaked"]
+        # The total is the one of the current objects (which include the new instances).
+        assert response.body.totalObjects > baseline_total_objects
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
 def test_evaluate_exec_unicode(case_setup_dap):
 
     def get_environ(writer):
@@ -3431,6 +3844,109 @@ def test_pause_and_continue(case_setup_dap):
         writer.finished_ok = True
 
 
+def test_snapshot_on_suspend(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_snapshot_on_suspend.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch(snapshotOnSuspend=True)
+        json_facade.write_set_breakpoints(writer.get_line_index_with_content("Break here"))
+        json_facade.write_make_initial_run()
+
+        json_facade.wait_for_thread_stopped()
+
+        response = json_facade.write_list_threads()
+        blocked_thread_ids = [t["id"] for t in response.body.threads if t["name"].startswith("Blocked thread")]
+        assert len(blocked_thread_ids) == 5
+
+        # The threads are blocked waiting for the event (so, they never actually suspend). Without
+        # the snapshot each request would wait for the thread to suspend before timing out.
+        initial_time = time.time()
+        for thread_id in blocked_thread_ids:
+            json_hit = json_facade.get_stack_as_json_hit(thread_id)
+            assert json_hit.stack_trace_response.body.stackFrames[0]["name"] == "blocked_in_wait"
+        assert time.time() - initial_time < 1.5
+
+        json_facade.write_continue()
+
+        writer.finished_ok = True
+
+
+def test_stack_trace_not_suspended_thread_latency(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_snapshot_on_suspend.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_set_breakpoints(writer.get_line_index_with_content("Break here"))
+        json_facade.write_make_initial_run()
+
+        json_facade.wait_for_thread_stopped()
+
+        response = json_facade.write_list_threads()
+        blocked_thread_id = [t["id"] for t in response.body.threads if t["name"].startswith("Blocked thread")][0]
+
+        # The thread never suspends: the stack is gotten by the command thread after the
+        # request times out waiting for it (0.5s) -- it must not wait for the next threads scan.
+        initial_time = time.time()
+        json_hit = json_facade.get_stack_as_json_hit(blocked_thread_id)
+        assert json_hit.stack_trace_response.body.stackFrames[0]["name"] == "blocked_in_wait"
+        assert time.time() - initial_time < 1.2
+
+        json_facade.write_continue()
+
+        writer.finished_ok = True
+
+
+def test_snapshot_on_suspend_variables(case_setup_dap):
+    with case_setup_dap.test_file("_debugger_case_snapshot_on_suspend.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        json_facade.write_launch(snapshotOnSuspend=True)
+        json_facade.write_set_breakpoints(writer.get_line_index_with_content("Break here"))
+        json_facade.write_make_initial_run()
+
+        json_facade.wait_for_thread_stopped()
+
+        response = json_facade.write_list_threads()
+        blocked_thread_id = [t["id"] for t in response.body.threads if t["name"].startswith("Blocked thread")][0]
+
+        json_hit = json_facade.get_stack_as_json_hit(blocked_thread_id)
+        frame_id = json_hit.frame_id
+
+        # The thread never actually suspends: the variables are gotten from the snapshot and
+        # requests which need to run code in the thread are rejected (instead of never being answered).
+        initial_time = time.time()
+        name_to_scope = json_facade.get_name_to_scope(frame_id)
+        name_to_var = json_facade.get_name_to_var(name_to_scope["Globals"].variablesReference)
+        assert "event" in name_to_var
+
+        response = json_facade.evaluate("event", frameId=frame_id, success=False)
+        assert "not suspended" in response.message
+
+        json_facade.write_set_variable(name_to_scope["Globals"].variablesReference, "event", "None", success=False)
+        assert time.time() - initial_time < 1.5
+
+        json_facade.write_continue()
+
+        writer.finished_ok = True
+
+
+def test_breakpoint_in_hot_loop(case_setup_dap):
+    # The lines of the loop without a breakpoint are executed many times before the
+    # breakpoint is hit (with sys.monitoring their line events are disabled).
+    with case_setup_dap.test_file("_debugger_case_breakpoint_in_hot_loop.py") as writer:
+        json_facade = JsonFacade(writer)
+
+        break_line = writer.get_line_index_with_content("Break here")
+        json_facade.write_set_breakpoints(break_line)
+        json_facade.write_make_initial_run()
+
+        json_hit = json_facade.wait_for_thread_stopped(line=break_line)
+        assert json_facade.get_local_var(json_hit.frame_id, "i").value == "999"
+
+        json_facade.write_continue()
+
+        writer.finished_ok = True
+
+
 @pytest.mark.parametrize("stepping_resumes_all_threads", [False, True])
 def test_step_out_multi_threads(case_setup_dap, stepping_resumes_all_threads):
     with case_setup_dap.test_file("_debugger_case_multi_threads_stepping.py") as writer:
@@ -3804,6 +4320,10 @@ def test_stack_levels(case_setup_dap):
                 )
             )
             stack_trace_response = json_facade.wait_for_response(stack_trace_request)
+            assert len(stack_trace_response.body.stackFrames) <= levels
+            # When not all frames are visited the total may be an estimate (but never less
+            # than the actual number of frames).
+            assert stack_trace_response.body.totalFrames >= total_frames
             received_frames += stack_trace_response.body.stackFrames
             startFrame += levels
 
@@ -4477,6 +4997,45 @@ def test_wait_for_attach_gevent(case_setup_remote_attach_to_dap):
         writer.finished_ok = True
 
 
+@pytest.mark.parametrize("show", [True, False])
+def test_asyncio_show_paused_tasks(case_setup_dap, show):
+    def get_environ(writer):
+        env = os.environ.copy()
+        if show:
+            env["PYDEVD_ASYNCIO_SHOW_PAUSED_TASKS"] = "True"
+        return env
+
+    with case_setup_dap.test_file("_debugger_case_asyncio_paused_tasks.py", get_environ=get_environ) as writer:
+        json_facade = JsonFacade(writer)
+
+        break1_line = writer.get_line_index_with_content("break here")
+        json_facade.write_set_breakpoints(break1_line)
+        json_facade.write_make_initial_run()
+        json_facade.wait_for_thread_stopped(line=break1_line)
+
+        response = json_facade.write_list_threads()
+        thread_name_to_id = dict((t["name"], t["id"]) for t in response.body.threads)
+        if show:
+            assert set(thread_name_to_id.keys()) == set(
+                ["MainThread"] + ["waiter-%s: inner - _debugger_case_asyncio_paused_tasks.py" % (i,) for i in range(3)]
+            )
+
+            stack_trace_request = json_facade.write_request(
+                pydevd_schema.StackTraceRequest(
+                    pydevd_schema.StackTraceArguments(threadId=thread_name_to_id["waiter-0: inner - _debugger_case_asyncio_paused_tasks.py"])
+                )
+            )
+            stack_trace_response = json_facade.wait_for_response(stack_trace_request)
+            stack_frames = stack_trace_response.body.stackFrames
+            assert [frame["name"] for frame in stack_frames[:2]] == ["inner", "outer"]
+            assert stack_frames[0]["line"] == writer.get_line_index_with_content("await event.wait()")
+        else:
+            assert list(thread_name_to_id.keys()) == ["MainThread"]
+
+        json_facade.write_continue()
+        writer.finished_ok = True
+
+
 @pytest.mark.skipif(not TEST_GEVENT, reason="Gevent not installed.")
 @pytest.mark.parametrize("show", [True, False])
 def test_gevent_show_paused_greenlets(case_setup_dap, show):
@@ -4523,6 +5082,40 @@ def test_gevent_show_paused_greenlets(case_setup_dap, show):
         writer.finished_ok = True
 
 
+@pytest.mark.skipif(not TEST_GEVENT, reason="Gevent not installed.")
+def test_gevent_paused_greenlets_stable_ids(case_setup_dap):
+
+    def get_environ(writer):
+        env = os.environ.copy()
+        env["GEVENT_SUPPORT"] = "True"
+        env["GEVENT_SHOW_PAUSED_GREENLETS"] = "True"
+        return env
+
+    with case_setup_dap.test_file("_debugger_case_gevent_simple.py", get_environ=get_environ) as writer:
+        json_facade = JsonFacade(writer)
+
+        break1_line = writer.get_line_index_with_content("break here")
+        json_facade.write_set_breakpoints(break1_line)
+        json_facade.write_make_initial_run()
+        json_hit = json_facade.wait_for_thread_stopped(line=break1_line)
+
+        response = json_facade.write_list_threads()
+        thread_name_to_id = dict((t["name"], t["id"]) for t in response.body.threads)
+
+        # The greenlets which are still paused after the step are shown with the same ids.
+        json_facade.write_step_next(json_hit.thread_id)
+        json_facade.wait_for_thread_stopped("step", line=break1_line + 1)
+
+        response = json_facade.write_list_threads()
+        new_thread_name_to_id = dict((t["name"], t["id"]) for t in response.body.threads)
+        assert "greenlet: <module> - _debugger_case_gevent_simple.py" in new_thread_name_to_id
+        for tname, tid in new_thread_name_to_id.items():
+            assert thread_name_to_id[tname] == tid
+
+        json_facade.write_continue(wait_for_response=False)
+        writer.finished_ok = True
+
+
 @pytest.mark.skipif(not TEST_GEVENT, reason="Gevent not installed.")
 @pytest.mark.skipif(sys.platform == "win32", reason="tput requires Linux.")
 def test_gevent_subprocess_not_python(case_setup_dap):
@@ -5531,6 +6124,66 @@ def test_subprocess_then_fork(case_setup_multiprocessing_dap):
         writer.finished_ok = True
 
 
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="Requires os.fork.")
+def test_fork_inherit_state(case_setup_multiprocessing_dap):
+    import threading
+    from tests_python.debugger_unittest import AbstractWriterThread
+
+    with case_setup_multiprocessing_dap.test_file("_debugger_case_fork_inherit_state.py") as writer:
+        json_facade = JsonFacade(writer)
+        json_facade.write_launch(justMyCode=False, inheritStateOnFork=True)
+
+        break_line = writer.get_line_index_with_content("break here")
+        json_facade.write_set_breakpoints([break_line])
+
+        server_socket = writer.server_socket
+
+        class SecondaryProcessWriterThread(AbstractWriterThread):
+            TEST_FILE = writer.get_main_filename()
+            _sequence = -1
+
+        class SecondaryProcessThreadCommunication(threading.Thread):
+            def run(self):
+                from tests_python.debugger_unittest import ReaderThread
+
+                server_socket.listen(1)
+                self.server_socket = server_socket
+                new_sock, addr = server_socket.accept()
+
+                reader_thread = ReaderThread(new_sock)
+                reader_thread.name = "  *** Multiprocess Reader Thread"
+                reader_thread.start()
+
+                writer2 = SecondaryProcessWriterThread()
+                writer2.reader_thread = reader_thread
+                writer2.sock = new_sock
+                json_facade2 = JsonFacade(writer2)
+
+                # The forked process stops at the breakpoint it inherited from the parent (without
+                # receiving any configuration).
+                json_facade2.wait_for_thread_stopped(line=break_line)
+
+                info_request = json_facade2.write_request(pydevd_schema.PydevdSystemInfoRequest(pydevd_schema.PydevdSystemInfoArguments()))
+                info_response = json_facade2.wait_for_response(info_request)
+                assert info_response.to_dict()["body"]["pydevd"]["inheritedStateOnFork"] is True
+
+                json_facade2.write_continue()
+
+        secondary_process_thread_communication = SecondaryProcessThreadCommunication()
+        secondary_process_thread_communication.start()
+        time.sleep(0.1)
+        json_facade.write_make_initial_run()
+
+        secondary_process_thread_communication.join(20)
+        if secondary_process_thread_communication.is_alive():
+            raise AssertionError("The SecondaryProcessThreadCommunication did not finish")
+
+        json_facade.wait_for_thread_stopped(line=break_line)
+        json_facade.write_continue()
+
+        writer.finished_ok = True
+
+
 @pytest.mark.parametrize("apply_multiprocessing_patch", [True])
 def test_no_subprocess_patching(case_setup_multiprocessing_dap, apply_multiprocessing_patch):
     import threading
@@ -5658,6 +6311,7 @@ def test_pydevd_systeminfo(case_setup_dap):
 
         assert "usingCython" in body["pydevd"]
         assert "usingFrameEval" in body["pydevd"]
+        assert body["pydevd"]["inheritedStateOnFork"] is False
 
         use_cython = os.getenv("PYDEVD_USE_CYTHON")
         if use_cython is not None:
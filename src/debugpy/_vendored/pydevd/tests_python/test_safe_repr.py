@@ -674,3 +674,93 @@ def test_no_repr():
     my_bytes = MyBytes(obj)
     raw_value_repr = safe_repr(my_bytes)
     assert not my_bytes.errored
+
+
+def test_slow_repr_type():
+    import time
+
+    class SlowRepr(object):
+        def __repr__(self):
+            time.sleep(0.2)
+            return "SlowRepr"
+
+    safe_repr = SafeRepr()
+    safe_repr.time_budget = 0.1
+    safe_repr.use_cheap_repr_for_slow_types = True
+
+    obj = SlowRepr()
+    assert safe_repr(obj) == "SlowRepr"
+    assert SlowRepr in SafeRepr.slow_repr_types
+
+    # Once the type is known to be slow its repr is no longer computed.
+    assert safe_repr(obj) == object.__repr__(obj)
+
+    # Unless the full value is requested.
+    safe_repr.use_cheap_repr_for_slow_types = False
+    assert safe_repr(obj) == "SlowRepr"
+
+
+def test_slow_repr_type_expires():
+    import time
+
+    class SlowRepr(object):
+        def __repr__(self):
+            time.sleep(0.2)
+            return "SlowRepr"
+
+    safe_repr = SafeRepr()
+    safe_repr.time_budget = 0.1
+    safe_repr.use_cheap_repr_for_slow_types = True
+    safe_repr.slow_repr_retry_after = 2
+
+    obj = SlowRepr()
+    assert safe_repr(obj) == "SlowRepr"
+    assert safe_repr(obj) == object.__repr__(obj)
+    assert safe_repr(obj) == object.__repr__(obj)
+
+    # After some cheap reprs its repr is computed (and measured) again.
+    assert safe_repr(obj) == "SlowRepr"
+    assert SlowRepr in SafeRepr.slow_repr_types
+    assert safe_repr(obj) == object.__repr__(obj)
+
+    # A bigger time budget makes it fast again.
+    safe_repr.time_budget = 1
+    assert safe_repr(obj) == "SlowRepr"
+    assert SlowRepr not in SafeRepr.slow_repr_types
+
+
+def test_repr_deadline():
+    import time
+
+    class CustomRepr(object):
+        def __repr__(self):
+            return "CustomRepr"
+
+    safe_repr = SafeRepr()
+    safe_repr.deadline = time.time() - 1
+    safe_repr.use_cheap_repr_for_slow_types = True
+
+    obj = CustomRepr()
+    assert safe_repr(obj) == object.__repr__(obj)
+    assert safe_repr([1, 2]) == "[...]"
+    assert safe_repr({1: 2}) == "{...}"
+    assert safe_repr(10) == "10"
+    assert CustomRepr not in SafeRepr.slow_repr_types
+
+
+def test_repr_deadline_full_value():
+    import time
+
+    class CustomRepr(object):
+        def __repr__(self):
+            return "CustomRepr"
+
+    safe_repr = SafeRepr()
+    safe_repr.deadline = time.time() - 1
+    safe_repr.time_budget = 0.0001
+
+    # The full value (i.e.: for the repl/clipboard) isn't limited by the deadline/time budget.
+    obj = CustomRepr()
+    assert safe_repr(obj) == "CustomRepr"
+    assert safe_repr([1, 2]) == "[1, 2]"
+    assert safe_repr({1: 2}) == "{1: 2}"
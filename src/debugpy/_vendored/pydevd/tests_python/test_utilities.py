@@ -114,6 +114,32 @@ def test_find_thread():
     assert pydevd_find_thread_by_id(get_current_thread_id(threading.current_thread())) is threading.current_thread()
 
 
+def test_find_thread_registry():
+    from _pydevd_bundle.pydevd_constants import get_thread_id, get_thread_by_id, set_thread_id, clear_cached_thread_id
+
+    event = threading.Event()
+    t = threading.Thread(target=event.wait)
+    t.start()
+    try:
+        thread_id = get_thread_id(t)
+        assert get_thread_by_id(thread_id) is t
+        assert pydevd_find_thread_by_id(thread_id) is t
+        assert pydevd_find_thread_by_id("some_prefix|" + thread_id) is t
+    finally:
+        event.set()
+        t.join()
+
+    # Threads which are no longer alive are not found (and are removed from the registry).
+    assert pydevd_find_thread_by_id(thread_id) is None
+    assert get_thread_by_id(thread_id) is None
+
+    t = threading.Thread()
+    set_thread_id(t, "custom_thread_id")
+    assert get_thread_by_id("custom_thread_id") is t
+    clear_cached_thread_id(t)
+    assert get_thread_by_id("custom_thread_id") is None
+
+
 def check_dap_log_message(log_message, expected, evaluated, eval_locals=None):
     ret = convert_dap_log_message_to_expression(log_message)
     assert ret == expected
@@ -530,3 +556,41 @@ def test_import_token_from_module():
 
     assert import_attr_from_module("sys.settrace") == sys.settrace
     assert import_attr_from_module("threading.Thread.start") == threading.Thread.start
+
+
+def test_file_type_cache_does_not_keep_code_alive():
+    import gc
+    import weakref
+    import pydevd
+    from _pydevd_bundle.pydevd_constants import GlobalDebuggerHolder
+
+    curr = GlobalDebuggerHolder.global_dbg
+    try:
+        py_db = pydevd.PyDB()
+
+        def get_frame_and_code_ref(filename):
+            namespace = {}
+            exec(compile("def func():\n    return sys._getframe()\n", filename, "exec"), {"sys": sys}, namespace)
+            frame = namespace["func"]()
+            return frame, weakref.ref(frame.f_code)
+
+        # Regular files are cached by path (the code object is not referenced by the cache).
+        frame, code_ref = get_frame_and_code_ref("<generated-code>")
+        assert py_db.get_file_type(frame) is None
+        assert pydevd._CACHE_FILE_TYPE["<generated-code>"] is None
+        del frame
+        gc.collect()
+        assert code_ref() is None
+
+        # '<string>' is cached by code object (while it's alive).
+        frame, code_ref = get_frame_and_code_ref("<string>")
+        assert py_db.get_file_type(frame) == LIB_FILE
+        assert code_ref() in pydevd._CACHE_CODE_FILE_TYPE
+        assert "<string>" not in pydevd._CACHE_FILE_TYPE
+        cache_size = len(pydevd._CACHE_CODE_FILE_TYPE)
+        del frame
+        gc.collect()
+        assert code_ref() is None
+        assert len(pydevd._CACHE_CODE_FILE_TYPE) == cache_size - 1
+    finally:
+        GlobalDebuggerHolder.global_dbg = curr
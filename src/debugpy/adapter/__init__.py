@@ -12,3 +12,26 @@ __all__ = []
 
 access_token = None
 """Access token used to authenticate with this adapter."""
+
+use_asyncio = False
+"""Whether socket connections to this adapter are serviced by a shared asyncio event
+loop (debugpy.common.aio), rather than by dedicated threads for every connection.
+"""
+
+
+def serve(name, handler, host, port=0, **kwargs):
+    """Like debugpy.common.sockets.serve(), but honors use_asyncio."""
+
+    from debugpy.common import aio, sockets
+
+    serve = aio.serve if use_asyncio else sockets.serve
+    return serve(name, handler, host, port, **kwargs)
+
+
+def stream_from_socket(sock, name=None):
+    """Like JsonIOStream.from_socket(), but honors use_asyncio."""
+
+    from debugpy.common import aio, messaging
+
+    stream_type = aio.AsyncJsonIOStream if use_asyncio else messaging.JsonIOStream
+    return stream_type.from_socket(sock, name)
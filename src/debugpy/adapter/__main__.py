@@ -52,6 +52,7 @@ def main():
     log.describe_environment("debugpy.adapter startup environment:")
 
     servers.access_token = args.server_access_token
+    adapter.use_asyncio = args.asyncio
     if args.for_server is None:
         adapter.access_token = codecs.encode(os.urandom(32), "hex").decode("ascii")
 
@@ -184,6 +185,12 @@ def _parse_argv(argv):
         "--log-stderr", action="store_true", help="enable logging to stderr"
     )
 
+    parser.add_argument(
+        "--asyncio",
+        action="store_true",
+        help="service connections on a shared asyncio event loop instead of per-connection threads",
+    )
+
     args = parser.parse_args(argv[1:])
 
     if args.port is None:
@@ -54,7 +54,7 @@ class Client(components.Component):
             atexit.register(stdout.close)
         else:
             self.using_stdio = False
-            stream = messaging.JsonIOStream.from_socket(sock)
+            stream = adapter.stream_from_socket(sock)
 
         with sessions.Session() as session:
             super().__init__(session, stream)
@@ -80,6 +80,16 @@ class Client(components.Component):
             """The "initialize" request as received from the client, to propagate to the
             server later."""
 
+            self._initialize_arguments = None
+            """Arguments of the "initialize" request as received from the client, to
+            replay to subprocesses if "subProcessFastAttach" was specified."""
+
+            self._configuration_requests = {}
+            """Arguments of the last breakpoint configuration requests received from the
+            client, to replay to subprocesses if "subProcessFastAttach" was specified.
+            "setBreakpoints" is keyed on (command, source), and all others on command.
+            """
+
             self._deferred_events = []
             """Deferred events from the launcher and the server that must be propagated
             only if and when the "launch" or "attach" response is sent.
@@ -142,7 +152,76 @@ class Client(components.Component):
     # Generic request handler, used if there's no specific handler below.
     @message_handler
     def request(self, request):
-        return self.server.channel.delegate(request)
+        if request.command not in self._INSPECTION_REQUESTS:
+            # The request can change the state of the debuggee, so the data that was
+            # prefetched when it stopped can't be used anymore.
+            self.server.invalidate_prefetched()
+        result = self.server.channel.delegate(request)
+        if request.command in self._CONFIGURATION_REQUESTS:
+            self._remember_configuration_request(request)
+        return result
+
+    _CONFIGURATION_REQUESTS = {
+        "setBreakpoints",
+        "setExceptionBreakpoints",
+        "setFunctionBreakpoints",
+    }
+    """Requests that configure the debuggee, and apply to its subprocesses as well."""
+
+    def _remember_configuration_request(self, request):
+        if request.command == "setBreakpoints":
+            source = request("source", json.object())
+            key = (
+                request.command,
+                source("path", str, optional=True),
+                source("sourceReference", int, optional=True),
+            )
+        else:
+            key = request.command
+        self._configuration_requests[key] = request.arguments
+
+    _INSPECTION_REQUESTS = {
+        "completions",
+        "exceptionInfo",
+        "loadedSources",
+        "modules",
+        "pydevdEvaluateMany",
+        "pydevdSystemInfo",
+        "source",
+        "threads",
+    }
+    """Requests that don't change the state of the debuggee."""
+
+    # The requests that clients usually send right after a "stopped" event are answered
+    # without a round trip to the server if pydevd sent the data along with it (i.e.
+    # if "prefetchOnStop" was specified).
+    def _prefetched_or_delegate(self, request):
+        body = self.server.get_prefetched_response(request)
+        if body is None:
+            return self.server.channel.delegate(request)
+        log.debug("Responding to {0} with prefetched data.", request.describe())
+        return body
+
+    @message_handler
+    def stackTrace_request(self, request):
+        # If "bulkStackTraces" was specified, the stacks of all the suspended threads
+        # are requested at once when the first stack is requested after a pause, and
+        # the requests for the other threads are answered with them.
+        if (
+            self.start_request is not None
+            and self.start_request("bulkStackTraces", False)
+            and self.server.get_prefetched_response(request) is None
+        ):
+            self.server.prefetch_stack_traces(request)
+        return self._prefetched_or_delegate(request)
+
+    @message_handler
+    def scopes_request(self, request):
+        return self._prefetched_or_delegate(request)
+
+    @message_handler
+    def variables_request(self, request):
+        return self._prefetched_or_delegate(request)
 
     @message_handler
     def initialize_request(self, request):
@@ -153,6 +232,7 @@ class Client(components.Component):
         self.capabilities = self.Capabilities(self, request)
         self.expectations = self.Expectations(self, request)
         self._initialize_request = request
+        self._initialize_arguments = request.arguments
 
         exception_breakpoint_filters = [
             {
@@ -626,6 +706,8 @@ class Client(components.Component):
 
     @message_handler
     def evaluate_request(self, request):
+        if request("context", str, optional=True) not in ("watch", "hover", "clipboard"):
+            self.server.invalidate_prefetched()
         propagated_request = self.server.channel.propagate(request)
 
         def handle_response(response):
@@ -642,6 +724,7 @@ class Client(components.Component):
 
     @message_handler
     def continue_request(self, request):
+        self.server.invalidate_prefetched()
         request.arguments["threadId"] = "*"
 
         try:
@@ -773,6 +856,9 @@ class Client(components.Component):
                 _, port = sockets.get_address(listener)
             body["connect"]["port"] = port
 
+        if body.get("subProcessFastAttach", False):
+            self._preconfigure_subprocess(conn, body)
+
         if self.capabilities["supportsStartDebuggingRequest"]:
             self.channel.request("startDebugging", {
                 "request": "attach",
@@ -782,10 +868,34 @@ class Client(components.Component):
             body["request"] = "attach"
             self.channel.send_event("debugpyAttach", body)
 
+    def _preconfigure_subprocess(self, conn, body):
+        # Replay the handshake that the client would perform for the subprocess with
+        # the configuration of this session, so that the subprocess can start running
+        # right away instead of waiting for the client to attach to it. The client
+        # will still perform its own handshake later, which pydevd handles as a no-op
+        # except for applying any configuration changes.
+        with self.session:
+            requests = [
+                ("initialize", self._initialize_arguments),
+                ("attach", dict(body, request="attach")),
+            ]
+            requests += [
+                (key[0] if isinstance(key, tuple) else key, arguments)
+                for key, arguments in self._configuration_requests.items()
+            ]
+            requests.append(("configurationDone", None))
+
+        log.info("Preconfiguring {0} with configuration of {1}.", conn, self.session)
+        try:
+            conn.preconfigure(requests)
+        except Exception:
+            # The subprocess will wait for the client to configure it instead.
+            log.swallow_exception("Failed to preconfigure {0}:", conn, level="warning")
+
 
 def serve(host, port):
     global listener
-    listener = sockets.serve("Client", Client, host, port)
+    listener = adapter.serve("Client", Client, host, port)
     sessions.report_sockets()
     return sockets.get_address(listener)
 
@@ -4,7 +4,7 @@
 
 import functools
 
-from debugpy.common import json, log, messaging, util
+from debugpy.common import aio, json, log, messaging, util
 
 
 ACCEPT_CONNECTIONS_TIMEOUT = 60
@@ -46,7 +46,7 @@ class Component(util.Observable):
 
         if channel is None:
             stream.name = str(self)
-            channel = messaging.JsonMessageChannel(stream, self)
+            channel = aio.create_channel(stream, self)
             channel.start()
         else:
             channel.name = channel.stream.name = str(self)
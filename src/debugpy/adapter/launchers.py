@@ -94,11 +94,11 @@ def spawn_debuggee(
 
     def on_launcher_connected(sock):
         listener.close()
-        stream = messaging.JsonIOStream.from_socket(sock)
+        stream = adapter.stream_from_socket(sock)
         Launcher(session, stream)
 
     try:
-        listener = sockets.serve(
+        listener = adapter.serve(
             "Launcher", on_launcher_connected, adapter_host, backlog=1
         )
     except Exception as exc:
@@ -12,7 +12,7 @@ import time
 
 import debugpy
 from debugpy import adapter
-from debugpy.common import json, log, messaging, sockets
+from debugpy.common import aio, json, log, messaging, sockets
 from debugpy.adapter import components, sessions
 import traceback
 import io
@@ -58,6 +58,14 @@ class Connection(object):
 
     ppid: int | None
 
+    held_events: list[messaging.Event] | None
+    """Events received from a subprocess server before it was attached to a session,
+    to be handled by the Server once it is. A server may run user code before that
+    if it was preconfigured (see preconfigure()) or if it is a forked process that
+    inherited the configuration of its parent (as reported in "pydevdSystemInfo");
+    for any other server, this is None and such events are dropped.
+    """
+
     channel: messaging.JsonMessageChannel
 
     def __init__(self, sock):
@@ -71,8 +79,13 @@ class Connection(object):
 
         self.pid = None
 
-        stream = messaging.JsonIOStream.from_socket(sock, str(self))
-        self.channel = messaging.JsonMessageChannel(stream, self)
+        # A forked process that inherited the configuration of its parent can send
+        # events right away, so they are held until it reports whether it did; see
+        # below.
+        self.held_events = []
+
+        stream = adapter.stream_from_socket(sock, str(self))
+        self.channel = aio.create_channel(stream, self)
         self.channel.start()
 
         try:
@@ -83,6 +96,8 @@ class Connection(object):
             self.ppid = process_info("ppid", int, optional=True)
             if self.ppid == ():
                 self.ppid = None
+            pydevd_info = info("pydevd", json.object())
+            inherited_state = pydevd_info("inheritedStateOnFork", False)
             self.channel.name = stream.name = str(self)
 
             with _lock:
@@ -102,6 +117,10 @@ class Connection(object):
                 ):
                     raise KeyError(f"{self} is already connected to this adapter")
 
+                if not inherited_state:
+                    # The server doesn't run user code before the client configures
+                    # it (unless it is preconfigured), so there's nothing to hold.
+                    self.held_events = None
                 is_first_server = len(_connections) == 0
                 _connections.append(self)
                 _connections_changed.set()
@@ -160,6 +179,9 @@ class Connection(object):
         # will not start running user code until the client tells them to. Since there
         # isn't going to be a client without the notification, such subprocesses have
         # to be unblocked.
+        with _lock:
+            if self.server is None:
+                self.held_events = None
         if is_first_server:
             return
         log.info("No clients to wait for - unblocking {0}.", self)
@@ -191,7 +213,14 @@ class Connection(object):
         )
 
     def event(self, event):
-        pass
+        with _lock:
+            if self.server is None:
+                if self.held_events is not None:
+                    self.held_events.append(event)
+                return
+        # The connection was attached to a session after this event had already been
+        # dispatched to it, so let the Server handle it.
+        event._handle()
 
     def terminated_event(self, event):
         self.channel.close()
@@ -208,6 +237,28 @@ class Connection(object):
                 _connections.remove(self)
                 _connections_changed.set()
 
+    def preconfigure(self, requests):
+        """Sends the specified (command, arguments) requests to the server before it
+        is attached to a session, and waits for all of them to be handled.
+
+        The requests are pipelined, so this takes a single round trip regardless of
+        their number. Events that the server sends afterwards are held until it is
+        attached to a session.
+        """
+
+        with _lock:
+            if self.server is not None:
+                return
+            if self.held_events is None:
+                self.held_events = []
+
+        pending = [
+            self.channel.send_request(command, arguments)
+            for command, arguments in requests
+        ]
+        for request in pending:
+            request.wait_for_response()
+
     def attach_to_session(self, session):
         """Attaches this server to the specified Session as a Server component.
 
@@ -219,6 +270,15 @@ class Connection(object):
                 raise ValueError
             log.info("Attaching {0} to {1}", self, session)
             self.server = Server(session, self)
+            held_events = self.held_events
+            self.held_events = None
+
+        # Events are handled with the session locked, so these are guaranteed to be
+        # handled before any new events that the server sends from this point on.
+        with session:
+            for event in held_events or ():
+                log.debug("Handling held {0}", event.describe())
+                event._handle()
 
 
 class Server(components.Component):
@@ -277,6 +337,27 @@ class Server(components.Component):
                 )
             self.session.pid = self.pid
 
+            self._prefetched = {}
+            """Maps thread IDs to the body of the last "pydevdPrefetch" event for
+            that thread (or to the stack of that thread received in response to a
+            "pydevdStackTraces" request); see get_prefetched_response().
+            """
+
+            self._prefetched_generation = 0
+            """Incremented whenever the prefetched data is discarded, so that stale
+            responses to "pydevdStackTraces" requests are discarded too.
+            """
+
+            self._stack_traces_prefetched = False
+            """Whether the stacks of all the suspended threads were already requested
+            since the last "stopped" event; see prefetch_stack_traces().
+            """
+
+            self._process_event_propagated = False
+            """Whether the "process" event was propagated to the client already. A
+            preconfigured server sends another one when the client attaches to it.
+            """
+
             session.server = self
 
     @property
@@ -296,6 +377,98 @@ class Server(components.Component):
         request.wait_for_response()
         self.capabilities = self.Capabilities(self, request.response)
 
+    def get_prefetched_response(self, request):
+        """Returns the body of the response to a "stackTrace", "scopes", or "variables"
+        request if it can be computed from the data that the server sent in a
+        "pydevdPrefetch" event when the thread was stopped; otherwise, returns None.
+        """
+
+        args = request.arguments
+        if "format" in args:
+            return None
+
+        with _lock:
+            if request.command == "stackTrace":
+                body = self._prefetched.get(args.get("threadId"))
+                if body is None:
+                    return None
+                frames = body["stackFrames"]
+                total_frames = body.get("totalFrames", len(frames))
+                start = args.get("startFrame", 0)
+                levels = args.get("levels", 0)
+                end = start + levels if levels else total_frames
+                if min(end, total_frames) > len(frames):
+                    return None
+                return {"stackFrames": frames[start:end], "totalFrames": total_frames}
+
+            for body in self._prefetched.values():
+                frames = body["stackFrames"]
+                scopes = body.get("scopes")
+                if not frames or not scopes:
+                    continue
+                if request.command == "scopes":
+                    if args.get("frameId") == frames[0]["id"]:
+                        return {"scopes": scopes}
+                elif request.command == "variables":
+                    if (
+                        body.get("variables") is not None
+                        and args.get("variablesReference")
+                        == scopes[0]["variablesReference"]
+                        and not any(key in args for key in ("filter", "start", "count"))
+                    ):
+                        return {"variables": body["variables"]}
+
+        return None
+
+    def prefetch_stack_traces(self, request):
+        """Requests the stacks of all the suspended threads from the server in a single
+        "pydevdStackTraces" request, so that the "stackTrace" requests that clients send
+        for each thread after a pause can be answered with get_prefetched_response().
+
+        This is only done once after every "stopped" event, with as many frames per
+        thread as requested by the given "stackTrace" request.
+        """
+
+        args = request.arguments
+        if "format" in args:
+            return
+
+        with _lock:
+            if self._stack_traces_prefetched:
+                return
+            self._stack_traces_prefetched = True
+            generation = self._prefetched_generation
+
+        start = args.get("startFrame", 0)
+        levels = args.get("levels", 0)
+        try:
+            body = self.channel.request(
+                "pydevdStackTraces", {"levels": start + levels if levels else 0}
+            )
+            stack_traces = body("stackTraces", json.array(json.object()))
+        except messaging.MessageHandlingError:
+            log.swallow_exception(
+                "{0} failed to provide stacks of suspended threads:", self
+            )
+            return
+
+        with _lock:
+            if generation != self._prefetched_generation:
+                return
+            for stack_trace in stack_traces:
+                # It has the same "stackFrames" and "totalFrames" as a "pydevdPrefetch"
+                # event, which is kept if available, since it has the scopes too.
+                self._prefetched.setdefault(stack_trace["threadId"], stack_trace)
+
+    def invalidate_prefetched(self):
+        """Discards the data received in "pydevdPrefetch" events, since it may no
+        longer reflect the state of the debuggee.
+        """
+        with _lock:
+            self._prefetched.clear()
+            self._prefetched_generation += 1
+            self._stack_traces_prefetched = False
+
     # Generic request handler, used if there's no specific handler below.
     @message_handler
     def request(self, request):
@@ -321,11 +494,29 @@ class Server(components.Component):
     @message_handler
     def process_event(self, event):
         # If there is a launcher, it's handling the process event.
-        if not self.launcher:
+        if not self.launcher and not self._process_event_propagated:
+            self._process_event_propagated = True
             self.client.propagate_after_start(event)
 
+    @message_handler
+    def pydevdPrefetch_event(self, event):
+        # Sent right before "stopped" if "prefetchOnStop" was specified. This is only
+        # used by the adapter itself, so it's not propagated to the client.
+        with _lock:
+            self._prefetched[event("threadId", int)] = event.body
+
+    @message_handler
+    def stopped_event(self, event):
+        # The stacks of the threads that stopped since the last "pydevdStackTraces"
+        # request can only be prefetched with a new one.
+        with _lock:
+            self._stack_traces_prefetched = False
+        self.client.propagate_after_start(event)
+
     @message_handler
     def continued_event(self, event):
+        self.invalidate_prefetched()
+
         # https://github.com/microsoft/ptvsd/issues/1530
         #
         # DAP specification says that a step request implies that only the thread on
@@ -403,7 +594,7 @@ class Server(components.Component):
 
 def serve(host="127.0.0.1", port=0):
     global listener
-    listener = sockets.serve("Server", Connection, host, port)
+    listener = adapter.serve("Server", Connection, host, port)
     sessions.report_sockets()
     return sockets.get_address(listener)
 
@@ -0,0 +1,361 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+"""An asyncio-based implementation of the message loop for JSON message channels
+and of the listener sockets accepting connections for them.
+
+All streams, channels, and listeners created by this module share a single event
+loop running on a background thread, instead of having dedicated parser and accept
+threads each. Message handlers still run on ordinary threads, since they are allowed
+to block - e.g. waiting for a response to a request sent over another channel - but
+those threads come from a bounded pool shared by all channels.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import socket
+import threading
+
+from debugpy.common import log, messaging, sockets
+from debugpy.common.util import hide_thread_from_debugger
+
+
+_lock = threading.Lock()
+
+_loop = None
+"""The event loop shared by everything in this module; see get_loop()."""
+
+_loop_thread = None
+
+_executor = None
+"""Runs connection handlers for serve(), so that they can block."""
+
+_handler_executor = None
+"""Runs message handlers for all AsyncJsonMessageChannel instances."""
+
+MAX_HANDLER_WORKERS = 32
+"""The maximum number of threads running message handlers at the same time.
+
+Every channel only ever has a single batch of handlers running at a time, so this
+is also the maximum number of channels that can be handling messages concurrently.
+"""
+
+
+def get_loop():
+    """Returns the shared event loop, starting the thread that runs it if needed."""
+
+    global _loop, _loop_thread
+
+    with _lock:
+        if _loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(
+                target=loop.run_forever, name="debugpy.common.aio event loop"
+            )
+            thread.daemon = True
+            hide_thread_from_debugger(thread)
+            thread.start()
+            _loop, _loop_thread = loop, thread
+        return _loop
+
+
+def is_loop_thread():
+    """Whether the caller is running on the thread of the shared event loop."""
+    return _loop_thread is not None and threading.current_thread() is _loop_thread
+
+
+def run_soon(coro):
+    """Schedules the coroutine to run on the shared event loop.
+
+    Returns a concurrent.futures.Future for its result.
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_loop())
+
+
+def run(coro):
+    """Runs the coroutine on the shared event loop, and blocks until it completes.
+
+    Must not be called from the event loop thread itself.
+    """
+    assert not is_loop_thread()
+    return run_soon(coro).result()
+
+
+def _hide_worker_thread():
+    hide_thread_from_debugger(threading.current_thread())
+
+
+def _get_executor():
+    global _executor
+
+    with _lock:
+        if _executor is None:
+            _executor = concurrent.futures.ThreadPoolExecutor(
+                thread_name_prefix="debugpy.common.aio worker",
+                initializer=_hide_worker_thread,
+            )
+        return _executor
+
+
+def _get_handler_executor():
+    global _handler_executor
+
+    with _lock:
+        if _handler_executor is None:
+            _handler_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=MAX_HANDLER_WORKERS,
+                thread_name_prefix="debugpy.common.aio message handler",
+                initializer=_hide_worker_thread,
+            )
+        return _handler_executor
+
+
+class _TransportIO(object):
+    """Adapts an asyncio stream to the reader/writer interface that JsonIOStream
+    expects of its underlying byte streams.
+
+    Writes can be done from any thread. Outside of the event loop thread, they block
+    until the transport has drained its buffer, and raise if the data couldn't be
+    written; on the event loop thread, the data is buffered by the transport.
+    """
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    def write(self, data):
+        if is_loop_thread():
+            self.writer.write(data)
+        else:
+            run(self._write_async(data))
+        return len(data)
+
+    async def _write_async(self, data):
+        self.writer.write(data)
+        await self.writer.drain()
+
+    def flush(self):
+        pass
+
+    def close(self):
+        get_loop().call_soon_threadsafe(self.writer.close)
+
+
+class AsyncJsonIOStream(messaging.JsonIOStream):
+    """A JsonIOStream over a socket that is read by the shared event loop.
+
+    Messages are read with read_json_async() on the event loop thread, or with
+    read_json() from any other thread. Messages are written with write_json() as
+    usual, from any thread.
+    """
+
+    @classmethod
+    def from_socket(cls, sock, name=None):
+        """Creates a new instance that sends and receives messages over a socket."""
+
+        if name is None:
+            name = repr(sock)
+
+        async def open_connection():
+            return await asyncio.open_connection(sock=sock)
+
+        sock.setblocking(False)
+        reader, writer = run(open_connection())
+        transport_io = _TransportIO(reader, writer)
+        return cls(transport_io, transport_io, name)
+
+    def read_json(self, decoder=None):
+        """Like JsonIOStream.read_json(), but reads the message on the event loop
+        via read_json_async(), blocking until it is read.
+
+        Must not be called from the event loop thread itself.
+        """
+        return run(self.read_json_async(decoder))
+
+    async def read_json_async(self, decoder=None):
+        """Like read_json(), but reads the message asynchronously."""
+
+        reader = self._reader.reader
+        raw_chunks = []
+        headers = {}
+
+        while True:
+            try:
+                try:
+                    line = await reader.readuntil(b"\r\n")
+                except asyncio.IncompleteReadError as exc:
+                    if not exc.partial:
+                        raise messaging.NoMoreMessages(stream=self)
+                    raise messaging.NoMoreMessages(str(exc), stream=self)
+                except Exception as exc:
+                    raise messaging.NoMoreMessages(str(exc), stream=self)
+            except Exception:  # pragma: no cover
+                # Only log it if we have already read some headers; see read_json().
+                if headers:
+                    self._log_message_and_reraise_exception(
+                        raw_chunks, "Error while reading message headers:"
+                    )
+                else:
+                    raise
+
+            line = line[0:-2]
+            raw_chunks += [line, b"\n"]
+            if line == b"":
+                break
+
+            key, _, value = line.partition(b":")
+            headers[key] = value
+
+        length = self._get_content_length(headers, raw_chunks)
+
+        body_start = len(raw_chunks)
+        try:
+            raw_chunks.append(await reader.readexactly(length))
+        except Exception as exc:
+            # Not logged due to https://github.com/microsoft/ptvsd/issues/1699
+            raise messaging.NoMoreMessages(str(exc), stream=self)
+
+        return self._decode_body(raw_chunks, body_start, decoder)
+
+
+class AsyncJsonMessageChannel(messaging.JsonMessageChannel):
+    """A JsonMessageChannel that parses incoming messages on the shared event loop,
+    rather than on a dedicated parser thread.
+
+    Message handlers run on a worker from a pool shared by all channels, which is only
+    occupied by the channel while there are handlers to run.
+    """
+
+    _handler_thread_waits_when_idle = False
+
+    def __init__(self, stream, handlers=None, name=None):
+        assert isinstance(stream, AsyncJsonIOStream)
+        super().__init__(stream, handlers, name)
+        self._parser_done = threading.Event()
+
+    def start(self):
+        assert not self.started
+        self.started = True
+        run_soon(self._parse_incoming_messages_async())
+
+    def _join_parser(self):
+        if self.started:
+            self._parser_done.wait()
+
+    def _start_handler_thread(self):
+        self._handler_thread = _get_handler_executor().submit(self._run_handlers)
+
+    def _join_handlers(self):
+        handlers_done = self._handler_thread
+        if handlers_done is not None:
+            handlers_done.result()
+
+    async def _parse_incoming_messages_async(self):
+        log.debug("Starting message loop for channel {0}", self)
+        try:
+            while True:
+                decoder = self._create_message_decoder()
+                message_dict = await self.stream.read_json_async(decoder)
+                self._dispatch_incoming_message(message_dict)
+        except messaging.NoMoreMessages as exc:
+            self._handle_no_more_messages(exc)
+        finally:
+            self._parser_done.set()
+
+
+def create_channel(stream, handlers=None, name=None):
+    """Creates a message channel of the type appropriate for the stream."""
+
+    if isinstance(stream, AsyncJsonIOStream):
+        return AsyncJsonMessageChannel(stream, handlers, name)
+    else:
+        return messaging.JsonMessageChannel(stream, handlers, name)
+
+
+class _Listener(socket.socket):
+    """A listener socket that accepts connections on the shared event loop.
+
+    It can be used like any other socket; close() stops accepting connections.
+    """
+
+    def __init__(self, server, name, handler):
+        super().__init__(server.family, server.type, server.proto, server.detach())
+        self.setblocking(False)
+        self._name = name
+        self._handler = handler
+        self._accept_task = None
+        run(self._start())
+
+    async def _start(self):
+        self._accept_task = asyncio.ensure_future(self._accept_connections())
+
+    async def _accept_connections(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                sock, address = await loop.sock_accept(self)
+                other_host, other_port = address[:2]
+            except (OSError, socket.error):
+                # Listener socket has been closed.
+                break
+
+            log.info(
+                "Accepted incoming {0} connection from {1}:{2}.",
+                self._name,
+                other_host,
+                other_port,
+            )
+            loop.run_in_executor(_get_executor(), self._handle, sock)
+
+    def _handle(self, sock):
+        try:
+            self._handler(sock)
+        except Exception:
+            log.swallow_exception(
+                "Error handling incoming {0} connection:", self._name
+            )
+
+    async def _stop(self):
+        task = self._accept_task
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        super().close()
+
+    def close(self):
+        # The event loop must stop polling the socket before it is closed, since its
+        # file descriptor can be reused immediately afterwards.
+        if self.fileno() == -1:
+            return
+        if is_loop_thread():
+            asyncio.ensure_future(self._stop())
+        else:
+            run(self._stop())
+
+
+def serve(name, handler, host, port=0, backlog=socket.SOMAXCONN, timeout=None):
+    """Like sockets.serve(), but accepts connections on the shared event loop.
+
+    The handler is invoked on a worker thread, and is allowed to block.
+
+    Returns the created server socket.
+    """
+
+    assert backlog > 0
+
+    try:
+        server = sockets.create_server(host, port, backlog, timeout)
+    except Exception:  # pragma: no cover
+        log.reraise_exception(
+            "Error listening for incoming {0} connections on {1}:{2}:", name, host, port
+        )
+    listener = _Listener(server, name, handler)
+    host, port = sockets.get_address(listener)
+    log.info("Listening for incoming {0} connections on {1}:{2}...", name, host, port)
+    return listener
@@ -181,25 +181,9 @@ class JsonIOStream(object):
         if there are no more values to be read.
         """
 
-        decoder = decoder if decoder is not None else self.json_decoder_factory()
         reader = self._reader
         read_line = functools.partial(self._read_line, reader)
 
-        # If any error occurs while reading and parsing the message, log the original
-        # raw message data as is, so that it's possible to diagnose missing or invalid
-        # headers, encoding issues, JSON syntax errors etc.
-        def log_message_and_reraise_exception(format_string="", *args, **kwargs):
-            if format_string:
-                format_string += "\n\n"
-            format_string += "{name} -->\n{raw_lines}"
-
-            raw_lines = b"".join(raw_chunks).split(b"\n")
-            raw_lines = "\n".join(repr(line) for line in raw_lines)
-
-            log.reraise_exception(
-                format_string, *args, name=self.name, raw_lines=raw_lines, **kwargs
-            )
-
         raw_chunks = []
         headers = {}
 
@@ -212,8 +196,8 @@ class JsonIOStream(object):
                 # there's no message data to log in any case, and the caller might
                 # be anticipating the error - e.g. NoMoreMessages on disconnect.
                 if headers:
-                    log_message_and_reraise_exception(
-                        "Error while reading message headers:"
+                    self._log_message_and_reraise_exception(
+                        raw_chunks, "Error while reading message headers:"
                     )
                 else:
                     raise
@@ -225,15 +209,7 @@ class JsonIOStream(object):
             key, _, value = line.partition(b":")
             headers[key] = value
 
-        try:
-            length = int(headers[b"Content-Length"])
-            if not (0 <= length <= self.MAX_BODY_SIZE):
-                raise ValueError
-        except (KeyError, ValueError):  # pragma: no cover
-            try:
-                raise IOError("Content-Length is missing or invalid:")
-            except Exception:
-                log_message_and_reraise_exception()
+        length = self._get_content_length(headers, raw_chunks)
 
         body_start = len(raw_chunks)
         body_remaining = length
@@ -250,16 +226,56 @@ class JsonIOStream(object):
             body_remaining -= len(chunk)
         assert body_remaining == 0
 
+        return self._decode_body(raw_chunks, body_start, decoder)
+
+    def _log_message_and_reraise_exception(
+        self, raw_chunks, format_string="", *args, **kwargs
+    ):
+        """If any error occurs while reading and parsing the message, log the original
+        raw message data as is, so that it's possible to diagnose missing or invalid
+        headers, encoding issues, JSON syntax errors etc.
+        """
+
+        if format_string:
+            format_string += "\n\n"
+        format_string += "{name} -->\n{raw_lines}"
+
+        raw_lines = b"".join(raw_chunks).split(b"\n")
+        raw_lines = "\n".join(repr(line) for line in raw_lines)
+
+        log.reraise_exception(
+            format_string, *args, name=self.name, raw_lines=raw_lines, **kwargs
+        )
+
+    def _get_content_length(self, headers, raw_chunks):
+        """Returns the validated value of the Content-Length header."""
+
+        try:
+            length = int(headers[b"Content-Length"])
+            if not (0 <= length <= self.MAX_BODY_SIZE):
+                raise ValueError
+        except (KeyError, ValueError):  # pragma: no cover
+            try:
+                raise IOError("Content-Length is missing or invalid:")
+            except Exception:
+                self._log_message_and_reraise_exception(raw_chunks)
+        return length
+
+    def _decode_body(self, raw_chunks, body_start, decoder=None):
+        """Decodes the message body, which is raw_chunks[body_start:], as JSON."""
+
+        decoder = decoder if decoder is not None else self.json_decoder_factory()
+
         body = b"".join(raw_chunks[body_start:])
         try:
             body = body.decode("utf-8")
         except Exception:  # pragma: no cover
-            log_message_and_reraise_exception()
+            self._log_message_and_reraise_exception(raw_chunks)
 
         try:
             body = decoder.decode(body)
         except Exception:  # pragma: no cover
-            log_message_and_reraise_exception()
+            self._log_message_and_reraise_exception(raw_chunks)
 
         # If parsed successfully, log as JSON for readability.
         self._log_message("-->", body)
@@ -1095,6 +1111,11 @@ class JsonMessageChannel(object):
             channel.send_event(...)
     """
 
+    _handler_thread_waits_when_idle = True
+    """Whether the handler thread should stay around waiting for new handlers once
+    the queue is empty, rather than exiting and being respun on demand.
+    """
+
     def __init__(self, stream, handlers=None, name=None):
         self.stream = stream
         self.handlers = handlers
@@ -1159,19 +1180,21 @@ class JsonMessageChannel(object):
         """Waits for the message loop to terminate, and for all enqueued Response
         message handlers to finish executing.
         """
-        parser_thread = self._parser_thread
         try:
-            if parser_thread is not None:
-                parser_thread.join()
+            self._join_parser()
         except AssertionError:
             log.debug("Handled error joining parser thread.")
         try:
-            handler_thread = self._handler_thread
-            if handler_thread is not None:
-                handler_thread.join()
+            self._join_handlers()
         except AssertionError:
             log.debug("Handled error joining handler thread.")
 
+    def _join_parser(self):
+        """Waits for the message loop started by start() to terminate."""
+        parser_thread = self._parser_thread
+        if parser_thread is not None:
+            parser_thread.join()
+
     # Order of keys for _prettify() - follows the order of properties in
     # https://microsoft.github.io/debug-adapter-protocol/specification
     _prettify_order = (
@@ -1296,31 +1319,38 @@ class JsonMessageChannel(object):
                 self._parse_incoming_message()
 
         except NoMoreMessages as exc:
-            log.debug("Exiting message loop for channel {0}: {1}", self, exc)
-            with self:
-                # Generate dummy responses for all outstanding requests.
-                err_message = str(exc)
-
-                # Response._parse() will remove items from _sent_requests, so
-                # make a snapshot before iterating.
-                sent_requests = list(self._sent_requests.values())
-
-                for request in sent_requests:
-                    response_json = MessageDict(
-                        None,
-                        {
-                            "seq": -1,
-                            "request_seq": request.seq,
-                            "command": request.command,
-                            "success": False,
-                            "message": err_message,
-                        },
-                    )
-                    Response._parse(self, response_json, body=exc)
-                assert not len(self._sent_requests)
+            self._handle_no_more_messages(exc)
 
-                self._enqueue_handlers(Disconnect(self), self._handle_disconnect)
-                self.close()
+    def _handle_no_more_messages(self, exc):
+        """Invoked by the message loop once the stream has no more messages, to fail
+        all outstanding requests and to schedule the disconnect handler.
+        """
+
+        log.debug("Exiting message loop for channel {0}: {1}", self, exc)
+        with self:
+            # Generate dummy responses for all outstanding requests.
+            err_message = str(exc)
+
+            # Response._parse() will remove items from _sent_requests, so
+            # make a snapshot before iterating.
+            sent_requests = list(self._sent_requests.values())
+
+            for request in sent_requests:
+                response_json = MessageDict(
+                    None,
+                    {
+                        "seq": -1,
+                        "request_seq": request.seq,
+                        "command": request.command,
+                        "success": False,
+                        "message": err_message,
+                    },
+                )
+                Response._parse(self, response_json, body=exc)
+            assert not len(self._sent_requests)
+
+            self._enqueue_handlers(Disconnect(self), self._handle_disconnect)
+            self.close()
 
     _message_parsers = {
         "event": Event._parse,
@@ -1332,6 +1362,14 @@ class JsonMessageChannel(object):
         """Reads incoming messages, parses them, and puts handlers into the queue
         for _run_handlers() to invoke, until the channel is closed.
         """
+        decoder = self._create_message_decoder()
+        message_dict = self.stream.read_json(decoder)
+        self._dispatch_incoming_message(message_dict)
+
+    def _create_message_decoder(self):
+        """Returns a JSON decoder for a single incoming message, which creates
+        MessageDict instances for all JSON objects in it.
+        """
 
         # Set up a dedicated decoder for this message, to create MessageDict instances
         # for all JSON objects, and track them so that they can be later wired up to
@@ -1360,8 +1398,12 @@ class JsonMessageChannel(object):
                 del d.associate_with
 
         message_dicts = []
-        decoder = self.stream.json_decoder_factory(object_hook=object_hook)
-        message_dict = self.stream.read_json(decoder)
+        return self.stream.json_decoder_factory(object_hook=object_hook)
+
+    def _dispatch_incoming_message(self, message_dict):
+        """Parses a message that was decoded with _create_message_decoder(), and
+        puts the handlers for it into the queue.
+        """
         assert isinstance(message_dict, MessageDict)  # make sure stream used decoder
 
         msg_type = message_dict("type", json.enum("event", "request", "response"))
@@ -1407,12 +1449,26 @@ class JsonMessageChannel(object):
             # the enqueued response handlers, and it will exit as soon as it's out
             # of handlers to run.
             if len(self._handler_queue) and self._handler_thread is None:
-                self._handler_thread = threading.Thread(
-                    target=self._run_handlers,
-                    name=f"{self} message handler",
-                )
-                hide_thread_from_debugger(self._handler_thread)
-                self._handler_thread.start()
+                self._start_handler_thread()
+
+    def _start_handler_thread(self):
+        """Starts running _run_handlers() in the background. Must be called with the
+        channel locked.
+        """
+        self._handler_thread = threading.Thread(
+            target=self._run_handlers,
+            name=f"{self} message handler",
+        )
+        hide_thread_from_debugger(self._handler_thread)
+        self._handler_thread.start()
+
+    def _join_handlers(self):
+        """Waits for the background _run_handlers() started by _start_handler_thread()
+        to finish.
+        """
+        handler_thread = self._handler_thread
+        if handler_thread is not None:
+            handler_thread.join()
 
     def _run_handlers(self):
         """Runs enqueued handlers until the channel is closed, or until the handler
@@ -1425,12 +1481,17 @@ class JsonMessageChannel(object):
             if closed:
                 # Wait for the parser thread to wrap up and enqueue any remaining
                 # handlers, if it is still running.
-                self._parser_thread.join()
+                self._join_parser()
                 # From this point on, _enqueue_handlers() can only get called
                 # from Request.on_response().
 
             with self:
                 if not closed and not len(self._handler_queue):
+                    if not self._handler_thread_waits_when_idle:
+                        # Nothing to process; _enqueue_handlers() will spin up a new
+                        # handler thread once there is.
+                        self._handler_thread = None
+                        return
                     # Wait for something to process.
                     self._handlers_enqueued.wait()
 
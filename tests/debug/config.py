@@ -28,24 +28,29 @@ class DebugConfig(MutableMapping):
         # Common
         "breakOnSystemExitZero": False,
         "breakOnSystemExit": None,
+        "bulkStackTraces": False,
         "debugOptions": [],
         "django": False,
         "jinja": False,
         "justMyCode": False,
         "flask": False,
+        "inheritStateOnFork": False,
         "logToFile": False,
         "maxExceptionStackFrames": (),
         "name": (),
         "noDebug": False,
         "pathMappings": [],
         "postDebugTask": (),
+        "prefetchOnStop": False,
         "preLaunchTask": (),
         "pyramid": False,
         "redirectOutput": False,
         "rules": [],
         "showReturnValue": True,
+        "snapshotOnSuspend": False,
         "steppingResumesAllThreads": True,
         "subProcess": False,
+        "subProcessFastAttach": False,
         "successExitCodes": [0],
         "type": (),
         # Launch
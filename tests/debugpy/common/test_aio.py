@@ -0,0 +1,133 @@
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE in the project root
+# for license information.
+
+"""Tests for the asyncio-based message channels and listeners.
+"""
+
+import pytest
+import socket
+import threading
+
+from debugpy.common import aio, messaging, sockets
+
+
+# Default timeout for tests in this file.
+pytestmark = pytest.mark.timeout(5)
+
+
+class TestAsyncJsonIOStream(object):
+    def test_read_json(self):
+        sock, other_sock = socket.socketpair()
+        stream = aio.AsyncJsonIOStream.from_socket(sock, "async")
+        other_stream = messaging.JsonIOStream.from_socket(other_sock, "blocking")
+        try:
+            other_stream.write_json({"answer": 42})
+            assert stream.read_json() == {"answer": 42}
+
+            other_stream.close()
+            with pytest.raises(messaging.NoMoreMessages):
+                stream.read_json()
+        finally:
+            stream.close()
+
+    def test_write_json_fails_on_disconnect(self):
+        sock, other_sock = socket.socketpair()
+        stream = aio.AsyncJsonIOStream.from_socket(sock, "async")
+        try:
+            other_sock.close()
+            with pytest.raises(messaging.JsonIOError):
+                stream.write_json({"answer": 42})
+        finally:
+            stream.close()
+
+
+class TestAsyncJsonMessageChannel(object):
+    def test_requests_and_events(self):
+        connected = threading.Event()
+        server_channels = []
+
+        def handle_connection(sock):
+            stream = aio.AsyncJsonIOStream.from_socket(sock, "server")
+
+            def ping_request(request):
+                return {"pong": request("ping", int)}
+
+            handlers = messaging.MessageHandlers(ping_request=ping_request)
+            channel = aio.create_channel(stream, handlers)
+            assert isinstance(channel, aio.AsyncJsonMessageChannel)
+            channel.start()
+            server_channels.append(channel)
+            connected.set()
+
+        listener = aio.serve("Test", handle_connection, "127.0.0.1")
+        try:
+            host, port = sockets.get_address(listener)
+            sock = sockets.create_client()
+            sock.connect((host, port))
+
+            events = []
+            event_received = threading.Event()
+
+            def hello_event(event):
+                events.append(event.body)
+                event_received.set()
+
+            stream = aio.AsyncJsonIOStream.from_socket(sock, "client")
+            handlers = messaging.MessageHandlers(hello_event=hello_event)
+            client_channel = aio.create_channel(stream, handlers)
+            client_channel.start()
+
+            assert connected.wait(5)
+            for i in range(10):
+                response = client_channel.request("ping", {"ping": i})
+                assert response == {"pong": i}
+
+            server_channels[0].send_event("hello", {"answer": 42})
+            assert event_received.wait(5)
+            assert events == [{"answer": 42}]
+
+            client_channel.close()
+            client_channel.wait()
+            server_channels[0].wait()
+        finally:
+            listener.close()
+
+    def test_pending_requests_fail_on_disconnect(self):
+        def handle_connection(sock):
+            stream = aio.AsyncJsonIOStream.from_socket(sock, "server")
+            # Close the connection as soon as any request is received, without
+            # responding to it.
+            def request(request):
+                channel.close()
+                return messaging.NO_RESPONSE
+
+            handlers = messaging.MessageHandlers(request=request)
+            channel = aio.create_channel(stream, handlers)
+            channel.start()
+
+        listener = aio.serve("Test", handle_connection, "127.0.0.1")
+        try:
+            sock = sockets.create_client()
+            sock.connect(sockets.get_address(listener))
+            stream = aio.AsyncJsonIOStream.from_socket(sock, "client")
+            channel = aio.create_channel(stream, messaging.MessageHandlers())
+            channel.start()
+
+            with pytest.raises(messaging.NoMoreMessages):
+                channel.request("ping")
+            channel.wait()
+        finally:
+            listener.close()
+
+    def test_listener_close(self):
+        listener = aio.serve("Test", lambda sock: None, "127.0.0.1")
+        listener.close()
+        assert listener.fileno() == -1
+        listener.close()
+
+
+def test_create_channel_for_blocking_stream():
+    stream = messaging.JsonIOStream(None, None, "blocking")
+    channel = aio.create_channel(stream)
+    assert type(channel) is messaging.JsonMessageChannel
@@ -574,6 +574,60 @@ def test_set_variable(pyfile, target, run):
         assert backchannel.receive() == 1000
 
 
+def test_prefetch_on_stop(pyfile, target, run):
+    @pyfile
+    def code_to_debug():
+        import debuggee
+        from debuggee import backchannel
+
+        debuggee.setup()
+        a = 1
+        backchannel.send(a)  # @bp1
+        a = 2
+        backchannel.send(a)  # @bp2
+
+    with debug.Session() as session:
+        session.config["prefetchOnStop"] = True
+        backchannel = session.open_backchannel()
+        with run(session, target(code_to_debug)):
+            session.set_breakpoints(code_to_debug, all)
+
+        def get_a(stop):
+            scopes = session.request("scopes", {"frameId": stop.frame_id})["scopes"]
+            locals_ref = scopes[0]["variablesReference"]
+            vars = session.request("variables", {"variablesReference": locals_ref})[
+                "variables"
+            ]
+            (a,) = (v for v in vars if v["name"] == "a")
+            return locals_ref, a
+
+        stop = session.wait_for_stop(
+            expected_frames=[some.dap.frame(code_to_debug, "bp1")]
+        )
+        locals_ref, a = get_a(stop)
+        assert a == some.dict.containing({"type": "int", "value": "1"})
+
+        # Changing the variable must not leave stale prefetched data around.
+        session.request(
+            "setVariable",
+            {"variablesReference": locals_ref, "name": "a", "value": "1000"},
+        )
+        _, a = get_a(stop)
+        assert a == some.dict.containing({"type": "int", "value": "1000"})
+
+        session.request_continue()
+        assert backchannel.receive() == 1000
+
+        stop = session.wait_for_stop(
+            expected_frames=[some.dap.frame(code_to_debug, "bp2")]
+        )
+        _, a = get_a(stop)
+        assert a == some.dict.containing({"type": "int", "value": "2"})
+
+        session.request_continue()
+        assert backchannel.receive() == 2
+
+
 def test_set_expression(pyfile, target, run):
     @pyfile
     def code_to_debug():
@@ -5,7 +5,9 @@
 import os
 import psutil
 import pytest
+import re
 import sys
+import time
 
 import debugpy
 import tests
@@ -246,6 +248,115 @@ def test_subprocess(pyfile, target, run, subProcess, method):
             assert child_argv == [child, "--arg1", "--arg2", "--arg3"]
 
 
+def test_subprocess_fast_attach(pyfile, target, run):
+    @pyfile
+    def child():
+        import os
+        from debuggee import backchannel
+
+        backchannel.send(os.getpid())
+        print("child running")  # @bp
+
+    @pyfile
+    def parent():
+        import debuggee
+        import os
+        import subprocess
+        import sys
+
+        debuggee.setup()
+        args = [sys.executable, sys.argv[1]]
+        env = os.environ.copy()
+        subprocess.Popen(args, env=env).wait()
+
+    with debug.Session() as parent_session:
+        backchannel = parent_session.open_backchannel()
+        parent_session.config["subProcessFastAttach"] = True
+
+        with run(parent_session, target(parent, args=[child])):
+            parent_session.set_breakpoints(child, all)
+
+        # The child process should start running user code with the configuration
+        # of the parent session, before the client attaches to it.
+        child_pid = backchannel.receive()
+
+        child_config = parent_session.wait_for_next_event("debugpyAttach")
+        assert child_config["subProcessId"] == child_pid
+        parent_session.proceed()
+
+        with debug.Session(child_config) as child_session:
+            with child_session.start():
+                pass
+
+            # The breakpoint was hit before the client attached, so the "stopped"
+            # event should be reported once it does.
+            child_session.wait_for_stop(
+                "breakpoint",
+                expected_frames=[some.dap.frame(child, line="bp")],
+            )
+            child_session.request_continue()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="os.fork() is not available")
+def test_fork_inherit_state(pyfile, target, run):
+    @pyfile
+    def code_to_debug():
+        import debuggee
+        import os
+        from debuggee import backchannel
+
+        debuggee.setup()
+        pid = os.fork()
+        if pid == 0:
+            backchannel.send(os.getpid())
+            print("child running")  # @bp
+            os._exit(0)
+        os.waitpid(pid, 0)
+
+    with debug.Session() as parent_session:
+        backchannel = parent_session.open_backchannel()
+        parent_session.config["subProcess"] = True
+        parent_session.config["inheritStateOnFork"] = True
+
+        with run(parent_session, target(code_to_debug)):
+            parent_session.set_breakpoints(code_to_debug, all)
+
+        # The forked process runs user code with the configuration of the parent
+        # session right away, so it hits the breakpoint before the client attaches.
+        child_pid = backchannel.receive()
+
+        child_config = parent_session.wait_for_next_event("debugpyAttach")
+        assert child_config["subProcessId"] == child_pid
+        parent_session.proceed()
+
+        def adapter_log():
+            return "".join(
+                f.read_text("utf-8")
+                for f in parent_session.log_dir.listdir("debugpy.adapter-*.log")
+            )
+
+        # Don't attach before the adapter received the "stopped" event.
+        stopped_event = re.compile(
+            rf'Server\[pid={child_pid}\] --> \{{[^}}]*"event": "stopped"'
+        )
+        deadline = time.time() + 10
+        while not stopped_event.search(adapter_log()):
+            assert time.time() < deadline, "Breakpoint not hit in the forked process"
+            time.sleep(0.1)
+
+        with debug.Session(child_config) as child_session:
+            with child_session.start():
+                pass
+
+            # The "stopped" event should be reported once the client attaches.
+            child_session.wait_for_stop(
+                "breakpoint",
+                expected_frames=[some.dap.frame(code_to_debug, line="bp")],
+            )
+            assert re.search(r'Handling held #\d+ event "stopped"', adapter_log())
+            child_session.request_continue()
+
+
 @pytest.mark.parametrize("run", runners.all_launch)
 def test_autokill(pyfile, target, run):
     @pyfile
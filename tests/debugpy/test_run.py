@@ -48,6 +48,41 @@ def test_run(pyfile, target, run):
         session.proceed()
 
 
+@pytest.mark.parametrize("run", runners.all_launch)
+def test_run_asyncio_adapter(pyfile, target, run):
+    @pyfile
+    def code_to_debug():
+        import debuggee
+
+        debuggee.setup()
+        a = 1
+        print(a)  # @bp
+
+    with debug.Session() as session:
+        # Service the connections to the adapter on its shared asyncio event loop.
+        spawn_adapter = session.spawn_adapter
+
+        def spawn_asyncio_adapter(args=()):
+            spawn_adapter(args=[*args, "--asyncio"])
+
+        spawn_asyncio_adapter.env = spawn_adapter.env
+        session.spawn_adapter = spawn_asyncio_adapter
+
+        with run(session, target(code_to_debug)):
+            session.set_breakpoints(code_to_debug, all)
+        assert "--asyncio" in session.adapter.cmdline()
+
+        stop = session.wait_for_stop(
+            expected_frames=[some.dap.frame(code_to_debug, "bp")]
+        )
+        result = session.request(
+            "evaluate", {"expression": "a", "frameId": stop.frame_id}
+        )
+        assert result == some.dict.containing({"result": "1"})
+
+        session.request_continue()
+
+
 @pytest.mark.parametrize("run", [runners.launch["internalConsole"]])
 def test_run_relative_path(pyfile, run):
     @pyfile
@@ -3,6 +3,7 @@
 # for license information.
 
 import pytest
+import re
 import sys
 import time
 
@@ -48,6 +49,67 @@ def test_thread_count(pyfile, target, run, count):
         session.request_continue()
 
 
+def test_bulk_stack_traces(pyfile, target, run):
+    @pyfile
+    def code_to_debug():
+        import debuggee
+        import threading
+
+        debuggee.setup()
+        event = threading.Event()
+
+        def worker():
+            event.wait()
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        event.set()  # @bp
+        for thread in threads:
+            thread.join()
+
+    with debug.Session() as session:
+        # The workers are blocked, so, their stacks are only available with a snapshot.
+        session.config["bulkStackTraces"] = True
+        session.config["snapshotOnSuspend"] = True
+        with run(session, target(code_to_debug)):
+            session.set_breakpoints(code_to_debug, all)
+
+        stop = session.wait_for_stop(
+            expected_frames=[some.dap.frame(code_to_debug, "bp")]
+        )
+        threads = session.request("threads")["threads"]
+        assert len(threads) == 4
+
+        # The stack of the stopped thread is requested first (as clients do), which
+        # fetches all the stacks at once; the other threads are served from those.
+        for thread in sorted(threads, key=lambda t: t["id"] != stop.thread_id):
+            stack_trace = session.request(
+                "stackTrace", {"threadId": thread["id"], "levels": 20}
+            )
+            frames = stack_trace["stackFrames"]
+            if thread["id"] == stop.thread_id:
+                assert frames == [some.dap.frame(code_to_debug, "bp")]
+            else:
+                assert frames[0] == some.dict.containing({"name": "worker"})
+
+            # The frame ids can be used as usual.
+            assert session.request("scopes", {"frameId": frames[0]["id"]})["scopes"]
+
+        # All the stacks were fetched from the server with a single request.
+        adapter_log = "".join(
+            f.read_text("utf-8") for f in session.log_dir.listdir("debugpy.adapter-*.log")
+        )
+        server_requests = re.findall(
+            r'Server\[\d+\] <-- \{\s*"seq": \d+,\s*"type": "request",\s*"command": "(\w+)"',
+            adapter_log,
+        )
+        assert server_requests.count("pydevdStackTraces") == 1
+        assert "stackTrace" not in server_requests
+
+        session.request_continue()
+
+
 @pytest.mark.parametrize("resume", ["default", "resume_all", "resume_one"])
 def test_step_multi_threads(pyfile, target, run, resume):
     @pyfile